@@ -0,0 +1,151 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the time taken to find the auto complete matches by
+# scanning all the candidates (the earlier implementation) against looking
+# them up in the candidate index (the current one), using the synthetic
+# catalogs of the given number of objects.
+#
+# Usage:
+#   python benchmark_autocomplete_matcher.py --objects 1000 10000 100000
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web')
+)
+
+WORDS = ['customer', 'order', 'item', 'invoice', 'payment', 'address',
+         'product', 'stock', 'supplier', 'account', 'history', 'audit',
+         'user', 'role', 'event', 'log', 'status', 'created', 'updated']
+
+
+def generate_alias(tbl):
+    return "".join(
+        [letter for letter in tbl if letter.isupper()] or
+        [letter for letter, prev in zip(tbl, "_" + tbl)
+         if prev == "_" and letter != "_"]
+    )
+
+
+def synthetic_catalog(objects, seed):
+    rnd = random.Random(seed)
+    names = set()
+    while len(names) < objects:
+        name = '_'.join(rnd.sample(WORDS, rnd.randint(1, 3)))
+        name += '_' + ''.join(rnd.choice(string.digits) for _ in range(3))
+        if rnd.random() < 0.05:
+            name = '"' + name.title() + '"'
+        names.add(name)
+    return sorted(names)
+
+
+def unescape_name(name):
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+    return name
+
+
+def scan_matches(text, names, fuzzy):
+    """Find the matches the way the auto complete did before (scan all)"""
+    if fuzzy:
+        pat = re.compile("(%s)" % ".*?".join(map(re.escape, text)))
+
+        def _match(item):
+            if item.lower()[: len(text) + 1] in (text, text + " "):
+                return float("Infinity"), -1
+            r = pat.search(unescape_name(item.lower()))
+            if r:
+                return -len(r.group()), -r.start()
+    else:
+        match_end_limit = len(text)
+
+        def _match(item):
+            item = unescape_name(item.lower())
+            match_point = item.find(text, 0, match_end_limit)
+            if match_point >= 0:
+                return -float("Infinity"), -match_point
+
+    matches = []
+    for name in names:
+        synonyms = (name, generate_alias(name))
+        syn_matches = [m for m in (_match(x) for x in synonyms) if m]
+        if syn_matches:
+            matches.append((name, max(syn_matches)))
+    return matches
+
+
+def timed(func, repeat):
+    start = time.time()
+    for _ in range(repeat):
+        result = func()
+    return (time.time() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the auto complete candidate matching.'
+    )
+    parser.add_argument('--objects', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='number of the objects in the catalog')
+    parser.add_argument('--texts', nargs='+',
+                        default=['c', 'cust', 'order_it', 'pay_hist'],
+                        help='text typed by the user')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of times every lookup is repeated')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the synthetic catalog')
+    args = parser.parse_args()
+
+    from pgadmin.utils.sqlautocomplete.candidate_index import CandidateIndex
+
+    print('{0:>8} {1:>6} {2:>10} {3:>8} {4:>10} {5:>10} {6:>10}'.format(
+        'objects', 'mode', 'text', 'matches', 'build ms', 'scan ms',
+        'index ms'))
+
+    for objects in args.objects:
+        names = synthetic_catalog(objects, args.seed)
+
+        build_ms, index = timed(
+            lambda: CandidateIndex(
+                names, [(name, generate_alias(name)) for name in names]
+            ), 1
+        )
+
+        for fuzzy in (False, True):
+            for text in args.texts:
+                scan_ms, expected = timed(
+                    lambda: scan_matches(text, names, fuzzy), args.repeat
+                )
+                index_ms, result = timed(
+                    lambda: index.matches(text, fuzzy), args.repeat
+                )
+                if result != expected:
+                    raise Exception(
+                        'Mismatch in the matches of {0!r}'.format(text)
+                    )
+
+                print(
+                    '{0:>8} {1:>6} {2:>10} {3:>8} {4:>10.2f} {5:>10.2f} '
+                    '{6:>10.2f}'.format(
+                        objects, 'fuzzy' if fuzzy else 'strict', text,
+                        len(result), build_ms, scan_ms, index_ms
+                    )
+                )
+
+
+if __name__ == '__main__':
+    main()
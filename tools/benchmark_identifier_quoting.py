@@ -0,0 +1,165 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken to render the reverse engineered SQL
+# (the 'create.sql' template) of a table with many columns, which quotes the
+# names of the table, the columns, the constraints, and the types (several
+# times each), with the quoted identifiers computed for every render
+# ('uncached') against the memoized ones ('memoized').
+#
+# Every template directory of pgAdmin is registered as a blueprint, so that
+# the templates (and the macros) are searched the same way as they are in the
+# application.
+#
+# Usage:
+#   python benchmark_identifier_quoting.py --columns 300 --repeat 20
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web')
+)
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'web', 'pgadmin'
+)
+
+TYPES = ['integer', 'character varying', 'text', 'numeric', 'boolean',
+         'timestamp with time zone', 'double precision', 'jsonb', 'date']
+
+
+class Manager(object):
+    def __init__(self, sversion):
+        self.sversion = sversion
+        self.server_type = 'pg'
+
+
+class Connection(object):
+    def __init__(self, sversion):
+        self.manager = Manager(sversion)
+
+
+def template_dirs():
+    for root, dirs, _ in os.walk(WEB_DIR):
+        if 'templates' in dirs:
+            yield os.path.join(root, 'templates')
+
+
+def create_app():
+    from flask import Blueprint, Flask
+    from pgadmin.utils.versioned_template_loader import \
+        VersionedTemplateLoader
+    from pgadmin.utils.driver.psycopg2 import Driver
+
+    class App(Flask):
+        def create_global_jinja_loader(self):
+            return VersionedTemplateLoader(self)
+
+    app = App('benchmark')
+
+    for idx, template_dir in enumerate(template_dirs()):
+        app.register_blueprint(Blueprint(
+            'bp{0}'.format(idx), __name__, template_folder=template_dir
+        ))
+
+    app.jinja_env.filters['qtLiteral'] = Driver.qtLiteral
+    app.jinja_env.filters['qtIdent'] = Driver.qtIdent
+    app.jinja_env.filters['qtTypeIdent'] = Driver.qtTypeIdent
+    app.jinja_env.filters['qtIdents'] = Driver.qtIdents
+    app.jinja_env.filters['qtTypeIdents'] = Driver.qtTypeIdents
+
+    return app
+
+
+def table_data(num_columns):
+    """
+    Returns the properties of a table with the given number of columns (with
+    the mixed case, and the keyword names, which need quoting).
+    """
+    columns = []
+    for idx in range(num_columns):
+        if idx % 3 == 0:
+            name = 'Column_{0}'.format(idx)
+        elif idx % 7 == 0:
+            name = 'order_{0}'.format(idx)
+        else:
+            name = 'column_{0}'.format(idx)
+
+        columns.append(dict(
+            name=name, cltype=TYPES[idx % len(TYPES)],
+            attnotnull=idx % 2 == 0, description='Column {0}'.format(idx),
+            attstattarget=100 if idx % 5 == 0 else -1
+        ))
+
+    return dict(
+        name='Wide_Table', schema='public', relowner='postgres',
+        columns=columns,
+        primary_key=[dict(name='Wide_Table_pkey', columns=[
+            dict(column=columns[0]['name'])
+        ])],
+        unique_constraint=[dict(name='Wide_Table_uniq', columns=[
+            dict(column=c['name']) for c in columns[1:4]
+        ])],
+        description='Table with {0} columns'.format(num_columns),
+    )
+
+
+def render(app, sversion, data, repeat, clear_cache):
+    from flask import render_template
+    from pgadmin.utils.driver.psycopg2 import quoting
+
+    conn = Connection(sversion)
+    sql = None
+    with app.test_request_context():
+        start = time.time()
+        for _ in range(repeat):
+            if clear_cache:
+                quoting.clear_cache()
+            sql = render_template(
+                'tables/sql/#{0}#/create.sql'.format(sversion),
+                data=data, conn=conn
+            )
+        elapsed = time.time() - start
+
+    return elapsed, sql
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the identifier quoting of the SQL templates.'
+    )
+    parser.add_argument('--columns', type=int, default=300,
+                        help='number of columns of the table')
+    parser.add_argument('--version', type=int, default=120000,
+                        help='server version the template is rendered for')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='number of times the template is rendered')
+    args = parser.parse_args()
+
+    app = create_app()
+    data = table_data(args.columns)
+
+    # Warm up (the templates are compiled on the first render)
+    _, sql = render(app, args.version, data, 1, True)
+
+    print('{0:>10} {1:>10} {2:>12}'.format('mode', 'lines', 'ms/render'))
+
+    for mode, clear_cache in (('uncached', True), ('memoized', False)):
+        elapsed, sql = render(
+            app, args.version, data, args.repeat, clear_cache
+        )
+        print('{0:>10} {1:>10} {2:>12.3f}'.format(
+            mode, len(sql.splitlines()), elapsed * 1000 / args.repeat))
+
+
+if __name__ == '__main__':
+    main()
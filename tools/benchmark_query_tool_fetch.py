@@ -0,0 +1,117 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the throughput (rows/sec) and the peak RSS of the
+# query tool result fetching, i.e. building a dictionary per record and
+# transforming it back to a list (the earlier implementation) against
+# fetching the pages of the tuples from the cursor (the current one).
+#
+# Every run is made in a separate process, so that the peak RSS reported by
+# the operating system belongs to that run only.
+#
+# Usage:
+#   python benchmark_query_tool_fetch.py --dsn "host=... dbname=..." \
+#       --rows 10000 100000 1000000
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web')
+)
+
+QUERY = "SELECT i AS id, md5(i::text) AS name, now() AS created, " \
+        "i % 7 = 0 AS flag FROM generate_series(1, {0}) AS i"
+
+
+def fetch_dict_rows(cur, column_info, page_size):
+    """Fetch a page the way the query tool did before (dict per record)"""
+    result = []
+    for row in cur.fetchmany(page_size):
+        new_row = []
+        for col in column_info:
+            new_row.append(row[col['name']])
+        result.append(new_row)
+    return result
+
+
+def fetch_tuple_rows(cur, column_info, page_size):
+    """Fetch a page of the tuples as they are returned by the cursor"""
+    return cur.fetch_page(page_size)
+
+
+def run(dsn, rows, page_size, method, queue):
+    import psycopg2
+    from pgadmin.utils.driver.psycopg2.cursor import DictCursor
+
+    fetch = fetch_dict_rows if method == 'dict' else fetch_tuple_rows
+
+    conn = psycopg2.connect(dsn)
+    cur = conn.cursor(cursor_factory=DictCursor)
+    cur.execute(QUERY.format(rows))
+
+    column_info = [desc.to_dict() for desc in cur.ordered_description()]
+
+    fetched = 0
+    start = time.time()
+    while True:
+        page = fetch(cur, column_info, page_size)
+        if not page:
+            break
+        fetched += len(page)
+        json.dumps(page, default=str)
+    elapsed = time.time() - start
+
+    cur.close()
+    conn.close()
+
+    queue.put((
+        fetched, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the query tool result fetching.'
+    )
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the database')
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[10000, 100000, 1000000],
+                        help='number of rows in the result set')
+    parser.add_argument('--page-size', type=int, default=1000,
+                        help='number of rows fetched per page')
+    args = parser.parse_args()
+
+    print('{0:>10} {1:>8} {2:>14} {3:>14}'.format(
+        'rows', 'method', 'rows/sec', 'peak RSS (KB)'))
+
+    for rows in args.rows:
+        for method in ('dict', 'tuple'):
+            queue = multiprocessing.Queue()
+            proc = multiprocessing.Process(
+                target=run,
+                args=(args.dsn, rows, args.page_size, method, queue)
+            )
+            proc.start()
+            fetched, elapsed, max_rss = queue.get()
+            proc.join()
+
+            print('{0:>10} {1:>8} {2:>14.0f} {3:>14}'.format(
+                fetched, method, fetched / max(elapsed, 0.000001), max_rss
+            ))
+
+
+if __name__ == '__main__':
+    main()
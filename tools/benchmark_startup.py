@@ -0,0 +1,142 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the startup time of pgAdmin, i.e. the time taken to
+# import the pgadmin package, to create the application (which loads all the
+# modules), and to serve the first request (which also runs the 'before first
+# request' hooks of all the modules), by searching the packages for the
+# modules, against loading the modules listed in the module manifest
+# (MODULE_MANIFEST), and against adding the url rules of the browser nodes on
+# the first request to them (DEFER_NODE_URL_RULES).
+#
+# Every run is made in a new Python interpreter, as the startup of a server,
+# or of a WSGI worker, using a temporary configuration database.
+#
+# Usage:
+#   python benchmark_startup.py --repeat 5
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'web'
+)
+
+# Run in the new interpreter, with the arguments:
+#   <data directory> <module manifest, or ''> <manifest to be saved, or ''>
+#   <defer the url rules of the nodes, 1 or ''>
+STARTUP = """
+import json
+import os
+import sys
+import time
+
+start = time.time()
+import config
+from pgadmin import create_app
+from pgadmin.model import SCHEMA_VERSION
+imported = time.time()
+
+config.SETTINGS_SCHEMA_VERSION = SCHEMA_VERSION
+config.DATA_DIR = sys.argv[1]
+config.SQLITE_PATH = os.path.join(config.DATA_DIR, 'pgadmin4.db')
+config.LOG_FILE = os.path.join(config.DATA_DIR, 'pgadmin4.log')
+config.SESSION_DB_PATH = os.path.join(config.DATA_DIR, 'sessions')
+config.SESSION_SQLITE_PATH = os.path.join(config.DATA_DIR, 'sessions.db')
+config.QUERY_HISTORY_SQLITE_PATH = os.path.join(config.DATA_DIR,
+                                                'query_history.db')
+config.STORAGE_DIR = os.path.join(config.DATA_DIR, 'storage')
+config.MODULE_MANIFEST = sys.argv[2] or None
+config.DEFER_NODE_URL_RULES = bool(sys.argv[4])
+
+app = create_app()
+created = time.time()
+
+response = app.test_client().get('/misc/ping')
+served = time.time()
+
+if sys.argv[3]:
+    app.save_module_manifest(sys.argv[3])
+
+print(json.dumps({
+    'status': response.status_code,
+    'import': (imported - start) * 1000,
+    'create': (created - imported) * 1000,
+    'request': (served - created) * 1000,
+    'total': (served - start) * 1000,
+}))
+"""
+
+
+def run(data_dir, manifest='', save_manifest='', defer=''):
+    # The initial user of the server mode is not prompted for
+    env = dict(os.environ)
+    env.setdefault('PGADMIN_SETUP_EMAIL', 'benchmark@example.com')
+    env.setdefault('PGADMIN_SETUP_PASSWORD', 'benchmark')
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', STARTUP, data_dir,
+         manifest, save_manifest, defer],
+        cwd=WEB_DIR, env=env, stdin=subprocess.DEVNULL,
+        universal_newlines=True
+    )
+    # Logged messages may precede the result
+    res = json.loads(output.strip().splitlines()[-1])
+    if res['status'] != 200:
+        raise RuntimeError('The first request failed ({0})'.format(
+            res['status']))
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the startup of pgAdmin.'
+    )
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of startups of each mode')
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(tmp_dir, 'data')
+        os.mkdir(data_dir)
+        manifest = os.path.join(tmp_dir, 'modules.json')
+
+        # Create the configuration database, and build the manifest
+        run(data_dir, save_manifest=manifest)
+
+        print('{0:>10} {1:>12} {2:>12} {3:>12} {4:>12}'.format(
+            'mode', 'import ms', 'create ms', 'request ms', 'total ms'))
+
+        for mode, manifest_file, defer in (
+            ('scan', '', ''),
+            ('manifest', manifest, ''),
+            ('deferred', '', '1'),
+        ):
+            results = [
+                run(data_dir, manifest_file, defer=defer)
+                for _ in range(args.repeat)
+            ]
+            print('{0:>10} {1:>12.1f} {2:>12.1f} {3:>12.1f} {4:>12.1f}'.format(
+                mode, *[
+                    sum(r[key] for r in results) / len(results)
+                    for key in ('import', 'create', 'request', 'total')
+                ]
+            ))
+    finally:
+        shutil.rmtree(tmp_dir, True)
+
+
+if __name__ == '__main__':
+    main()
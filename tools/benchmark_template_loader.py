@@ -0,0 +1,159 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the time taken to load and render the versioned
+# 'properties.sql' templates of all the nodes, by resolving the version
+# directory of each template on every load (the earlier implementation, and
+# the behaviour in the auto reload mode) against using the memoized
+# resolution (the current one).
+#
+# Every template directory of pgAdmin is registered as a blueprint, so that
+# the templates are searched the same way as they are in the application.
+# The compiled templates are not cached by Jinja, as it happens for most of
+# the templates used by a request (there are many more templates than the
+# size of the Jinja cache).
+#
+# Usage:
+#   python benchmark_template_loader.py --versions 90600 120000 --repeat 5
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web')
+)
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'web', 'pgadmin'
+)
+
+
+def template_dirs():
+    for root, dirs, _ in os.walk(WEB_DIR):
+        if 'templates' in dirs:
+            yield os.path.join(root, 'templates')
+
+
+def properties_templates(dirs, server_type):
+    """
+    Returns the versioned names of the properties.sql templates, i.e.
+    'tables/sql/#{0}#/properties.sql'.
+    """
+    names = set()
+    for template_dir in dirs:
+        for root, _, files in os.walk(template_dir):
+            if 'properties.sql' not in files:
+                continue
+            # i.e. <template_dir>/tables/sql/12_plus/properties.sql
+            rel_dir = os.path.relpath(os.path.dirname(root), template_dir)
+            names.add('/'.join(
+                rel_dir.split(os.sep) + ['#' + server_type + '#{0}#',
+                                         'properties.sql']
+            ))
+    return sorted(names)
+
+
+def create_app(auto_reload):
+    from flask import Blueprint, Flask
+    from pgadmin.utils.versioned_template_loader import \
+        VersionedTemplateLoader
+
+    class App(Flask):
+        jinja_options = dict(Flask.jinja_options, cache_size=0)
+
+        def create_global_jinja_loader(self):
+            return VersionedTemplateLoader(self)
+
+    app = App('benchmark')
+    app.config['TEMPLATES_AUTO_RELOAD'] = auto_reload
+
+    for idx, template_dir in enumerate(template_dirs()):
+        app.register_blueprint(Blueprint(
+            'bp{0}'.format(idx), __name__, template_folder=template_dir
+        ))
+
+    return app
+
+
+def load_all(app, names, versions):
+    from jinja2 import TemplateNotFound
+
+    loader = app.jinja_env.loader
+    for version in versions:
+        for name in names:
+            try:
+                loader.get_source(app.jinja_env, name.format(version))
+            except TemplateNotFound:
+                pass
+
+
+def render_all(app, names, versions):
+    from flask import render_template
+
+    rendered = errors = 0
+    with app.test_request_context():
+        for version in versions:
+            for name in names:
+                try:
+                    render_template(
+                        name.format(version), did=1, scid=1, tid=1, fnid=1,
+                        foid=1, oid=1, conn=None, datlastsysoid=0,
+                        show_sysobj=False, show_system_objects=False
+                    )
+                    rendered += 1
+                except Exception:
+                    # Missing templates for the version, or templates
+                    # requiring more parameters (still loaded/resolved).
+                    errors += 1
+
+    return rendered, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the versioned template loading.'
+    )
+    parser.add_argument('--versions', type=int, nargs='+',
+                        default=[90600, 110000, 120000],
+                        help='server versions the templates are rendered for')
+    parser.add_argument('--server-type', default='pg',
+                        help='server type (pg, ppas, or gpdb)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of times every template is rendered')
+    args = parser.parse_args()
+
+    names = properties_templates(list(template_dirs()), args.server_type)
+
+    print('{0:>10} {1:>10} {2:>10} {3:>12} {4:>12}'.format(
+        'mode', 'templates', 'rendered', 'ms/load', 'ms/render'))
+
+    for mode, auto_reload in (('resolve', True), ('memoized', False)):
+        app = create_app(auto_reload)
+        # Warm up (the memoized resolution is built on the first render)
+        rendered, _ = render_all(app, names, args.versions)
+
+        start = time.time()
+        for _ in range(args.repeat):
+            load_all(app, names, args.versions)
+        load_ms = (time.time() - start) * 1000
+
+        start = time.time()
+        for _ in range(args.repeat):
+            render_all(app, names, args.versions)
+        render_ms = (time.time() - start) * 1000
+
+        total = len(names) * len(args.versions) * args.repeat
+        print('{0:>10} {1:>10} {2:>10} {3:>12.3f} {4:>12.3f}'.format(
+            mode, len(names), rendered, load_ms / total, render_ms / total))
+
+
+if __name__ == '__main__':
+    main()
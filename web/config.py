@@ -98,6 +98,21 @@ MODULE_BLACKLIST = ['test']
 # List of treeview browser nodes to skip when dynamically loading
 NODE_BLACKLIST = []
 
+# Path of the module manifest, built by 'setup.py --build-module-manifest'.
+# If set, only the modules listed in it are imported at the startup, instead
+# of searching every package of pgAdmin (and importing all of its modules).
+# The manifest must be rebuilt, when the modules are added, or blacklisted;
+# it is ignored (with a warning), if built by another version of pgAdmin.
+MODULE_MANIFEST = None
+
+# Add the url rules of the views of a browser node on the first request to it,
+# instead of at the startup. Compiling the url rules of all the nodes takes
+# a part of the startup time of pgAdmin (and of each of its WSGI workers), but
+# every request matches, and builds its urls under a lock, until the rules of
+# all the nodes have been added. Measure the startup (tools/
+# benchmark_startup.py), before enabling it. Ignored in the debug mode.
+DEFER_NODE_URL_RULES = False
+
 ##########################################################################
 # Server settings
 ##########################################################################
@@ -323,6 +338,31 @@ ALLOW_SAVE_PASSWORD = True
 # Maximum number of history queries stored per user/server/database
 MAX_QUERY_HIST_STORED = 20
 
+##########################################################################
+# Query history store
+#
+# QUERY_HISTORY_STORE (Default: 'database')
+##########################################################################
+#
+# 'database' - The query_history table of the configuration database, each
+#              query is saved by the request executing it.
+# 'sqlite'   - A separate SQLite database (in WAL mode) at
+#              QUERY_HISTORY_SQLITE_PATH. The queries are appended in batches
+#              by a background thread, and searched using the full-text
+#              search of SQLite, hence it is suitable for a large
+#              MAX_QUERY_HIST_STORED (i.e. tens of thousands).
+#
+# With 'sqlite', a query is saved to the history shortly after it has been
+# executed. The queries not yet written are written when pgAdmin exits
+# normally (waiting up to 5 seconds), but are lost if the process is killed
+# or crashes, i.e. at most the queries executed within the last moments
+# (usually, less than a second) before that.
+#
+##########################################################################
+QUERY_HISTORY_STORE = 'database'
+
+QUERY_HISTORY_SQLITE_PATH = os.path.join(DATA_DIR, 'query_history.db')
+
 ##########################################################################
 # Server-side session storage path
 #
@@ -345,6 +385,29 @@ MAX_QUERY_HIST_STORED = 20
 ##########################################################################
 SESSION_DB_PATH = os.path.join(DATA_DIR, 'sessions')
 
+##########################################################################
+# Server-side session store
+#
+# SESSION_STORE (Default: 'file')
+##########################################################################
+#
+# 'file'   - One file per session in SESSION_DB_PATH, the whole session is
+#            written every time it is changed.
+# 'sqlite' - A single SQLite database (in WAL mode) at SESSION_SQLITE_PATH.
+# 'memory' - The memory of the pgAdmin process. The sessions are lost on
+#            restart, hence use it only when pgAdmin is served by a single
+#            process.
+#
+# The 'sqlite' and 'memory' stores write only the keys of the session set
+# since it was last written, and only when their values have changed. The
+# query tool transactions are stored one per row, hence only the ones
+# changed are written (not all the transactions of the user).
+#
+##########################################################################
+SESSION_STORE = 'file'
+
+SESSION_SQLITE_PATH = os.path.join(DATA_DIR, 'sessions.db')
+
 SESSION_COOKIE_NAME = 'pga4_session'
 
 ##########################################################################
@@ -457,6 +520,126 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 ON_DEMAND_RECORD_COUNT = 1000
 
+##########################################################################
+# Number of records to fetch in one round trip from the server side cursor
+# while downloading the query result as a CSV/TXT file. Only these many
+# records are held in memory at a time for each download.
+##########################################################################
+QUERY_TOOL_DOWNLOAD_ITERSIZE = 2000
+
+##########################################################################
+# Stream the query result downloaded as a CSV/TXT file through a server side
+# cursor, when the query is a single SELECT statement, and the connection is
+# not in a transaction. Set it to False to run the query as it is (the whole
+# result is then held in memory during the download), i.e. for a connection
+# pooler not supporting the server side cursors.
+##########################################################################
+QUERY_TOOL_DOWNLOAD_SERVER_CURSOR = True
+
+##########################################################################
+# Number of seconds, the catalog information (schemas, tables, columns,
+# functions, etc.) used by the auto complete in the query tool is cached
+# for. It is refreshed earlier, when a DDL statement is executed from the
+# query tool.
+##########################################################################
+AUTOCOMPLETE_METADATA_CACHE_TTL = 300
+
+##########################################################################
+# Maximum number of the worker threads used by the schema diff to compare
+# the node types (and schemas) in parallel. Each worker uses its own
+# connections to the source and target databases (and one more connection
+# to each of them, to fetch the source and target objects at the same time).
+# Set it to 1 to compare them one after another on the thread of the job.
+#
+# The comparison runs in the background, in the process which started it,
+# and its results are polled from there. When serving pgAdmin by multiple
+# worker processes, set CONNECTION_BROKER_PATH, so that the requests of the
+# session are run by that process.
+##########################################################################
+SCHEMA_DIFF_MAX_WORKERS = 4
+
+##########################################################################
+# Restoring the connections
+#
+# The connections of all the servers saved in the session are reconnected
+# on the restart of pgAdmin (or when the lost connections are reconnected)
+# at the same time, by at most CONNECTION_RESTORE_MAX_WORKERS threads. A
+# connection not restored within CONNECTION_RESTORE_TIMEOUT seconds is
+# completed in the background, without holding up the request.
+##########################################################################
+CONNECTION_RESTORE_MAX_WORKERS = 8
+CONNECTION_RESTORE_TIMEOUT = 10
+
+##########################################################################
+# Server status
+#
+# The recovery state of the connected servers of a group is checked at the
+# same time (by at most SERVER_STATUS_MAX_WORKERS threads), and reused for
+# SERVER_STATUS_CACHE_TTL seconds by the refresh of the tree, and the
+# connection status checks. A server not responding within
+# SERVER_STATUS_TIMEOUT seconds is listed without its recovery state.
+##########################################################################
+SERVER_STATUS_MAX_WORKERS = 8
+SERVER_STATUS_TIMEOUT = 5
+SERVER_STATUS_CACHE_TTL = 10
+
+##########################################################################
+# Preferences cache
+#
+# The preferences of a user are loaded at once, and reused (by all the
+# threads) for PREFERENCES_CACHE_TTL seconds, or until changed. When pgAdmin
+# is served by multiple processes, a preference changed by one of those is
+# seen by the others once their snapshot expires. Set to 0 to read the
+# preferences from the configuration database every time.
+##########################################################################
+PREFERENCES_CACHE_TTL = 60
+
+##########################################################################
+# Capability cache
+#
+# The capabilities of a database probed when the nodes of the browser tree
+# are expanded (i.e. whether pgAgent is installed, or a table is
+# partitioned) are cached per server connection for CAPABILITY_CACHE_TTL
+# seconds, and dropped when the database is disconnected. Set to 0 to probe
+# the database every time.
+##########################################################################
+CAPABILITY_CACHE_TTL = 300
+
+##########################################################################
+# Search objects index
+#
+# When enabled, the objects of a database are searched in an in-memory index
+# of their names, instead of the database catalogs. The index is built in the
+# background on the first search of the database (which searches the
+# catalogs meanwhile), using a connection of its own, and it is checked for
+# changes of the catalogs at most every SEARCH_OBJECTS_INDEX_REFRESH seconds
+# while searched, hence a new object may be found a little later.
+##########################################################################
+SEARCH_OBJECTS_INDEX = False
+SEARCH_OBJECTS_INDEX_REFRESH = 10
+
+##########################################################################
+# Background processes
+#
+# At most BGPROCESS_MAX_JOBS utilities (backup, restore, maintenance,
+# import/export) run at the same time on the pgAdmin host, and at most
+# BGPROCESS_MAX_JOBS_PER_SERVER against the same server. The others are
+# queued, and started when the running ones are completed: the maintenance,
+# backup and restore jobs first, then the import/export jobs, and the jobs of
+# the users with the fewest running jobs first. Set to 0 for no limit.
+#
+# The jobs are queued in the pgAdmin process they were submitted to, and are
+# lost, if it is stopped.
+##########################################################################
+BGPROCESS_MAX_JOBS = 8
+BGPROCESS_MAX_JOBS_PER_SERVER = 2
+
+# The process watcher waits for the new output of a background process (on
+# the server) for at most BGPROCESS_STATUS_WAIT_TIMEOUT seconds, before
+# asking for it again. Keep it below the timeout of the requests (30 seconds)
+# of the client, and of the proxy (if any) in front of pgAdmin.
+BGPROCESS_STATUS_WAIT_TIMEOUT = 20
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
@@ -479,6 +662,29 @@ SESSION_SKIP_PATHS = [
     '/misc/ping'
 ]
 
+##########################################################################
+# Connection broker for multiple worker processes (server mode only)
+#
+# CONNECTION_BROKER_PATH (Default: None)
+##########################################################################
+#
+# The database connections of a session are kept in the memory of the
+# process serving it, hence pgAdmin must be served by a single (threaded)
+# process by default. To serve it by multiple WSGI worker processes (e.g.
+# gunicorn --workers 4), set this to a directory, where each worker will
+# create its Unix socket. The requests of a session are then run by the
+# worker owning its connections, the other workers forward them to it.
+#
+# The sessions must be stored in the 'file' or 'sqlite' SESSION_STORE. A
+# session is owned by the worker serving its first request (recorded in the
+# directory), hence starting more workers does not move the sessions. The
+# sessions of a stopped worker are taken over by the others, which reconnect
+# their connections, hence avoid restarting the workers (e.g. the max
+# requests option of gunicorn).
+#
+##########################################################################
+CONNECTION_BROKER_PATH = None
+
 ##########################################################################
 # Session expiration support
 ##########################################################################
@@ -35,6 +35,7 @@ else:
 import config
 from pgadmin import create_app
 from pgadmin.utils import u_encode, fs_encoding, file_quote
+from pgadmin.utils.connection_broker import ConnectionBroker
 # Get the config database schema version. We store this in pgadmin.model
 # as it turns out that putting it in the config files isn't a great idea
 from pgadmin.model import SCHEMA_VERSION
@@ -93,6 +94,11 @@ if not os.path.isfile(config.SQLITE_PATH):
 app = create_app()
 app.debug = False
 if config.SERVER_MODE:
+    if config.CONNECTION_BROKER_PATH:
+        app.wsgi_app = ConnectionBroker(
+            app, config.CONNECTION_BROKER_PATH,
+            config.SESSION_SKIP_PATHS + [app.static_url_path + '/']
+        )
     app.wsgi_app = ReverseProxied(app.wsgi_app)
 
 # Authentication sources
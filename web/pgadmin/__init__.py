@@ -9,11 +9,13 @@
 
 """The main pgAdmin module. This handles the application initialisation tasks,
 such as setup of logging, dynamic loading of modules etc."""
+import json
 import logging
 import os
 import sys
 import re
 import ipaddress
+from threading import RLock
 from types import MethodType
 from collections import defaultdict
 from importlib import import_module
@@ -29,6 +31,7 @@ from flask_security import Security, SQLAlchemyUserDatastore, current_user
 from flask_security.utils import login_user, logout_user
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.local import LocalProxy
+from werkzeug.routing import MapAdapter
 from werkzeug.utils import find_modules
 
 from pgadmin.model import db, Role, Server, SharedServer, ServerGroup, \
@@ -56,6 +59,33 @@ if os.name == 'nt':
     import winreg
 
 
+class _DeferredUrlRulesMapAdapter(MapAdapter):
+    """
+    URL adapter matching, and building the URLs under the lock of the deferred
+    url rules of the application, as the url map must not be read, while some
+    of them are being added to it (see PgAdmin.register_deferred_url_rules).
+    """
+    def __init__(self, app, adapter):
+        super(_DeferredUrlRulesMapAdapter, self).__init__(
+            adapter.map, adapter.server_name, adapter.script_name,
+            adapter.subdomain, adapter.url_scheme, adapter.path_info,
+            adapter.default_method, adapter.query_args
+        )
+        self.lock = app.deferred_url_rules_lock
+
+    def match(self, *args, **kwargs):
+        with self.lock:
+            return super(_DeferredUrlRulesMapAdapter, self).match(
+                *args, **kwargs
+            )
+
+    def build(self, *args, **kwargs):
+        with self.lock:
+            return super(_DeferredUrlRulesMapAdapter, self).build(
+                *args, **kwargs
+            )
+
+
 class PgAdmin(Flask):
     def __init__(self, *args, **kwargs):
         # Set the template loader to a postgres-version-aware loader
@@ -64,11 +94,147 @@ class PgAdmin(Flask):
             loader=VersionedTemplateLoader(self)
         )
         self.logout_hooks = []
+        # Names of the modules defining the pgAdmin modules, found in each
+        # package (see find_submodules, and save_module_manifest).
+        self.module_manifest = dict()
+        self._prebuilt_module_manifest = None
+        # The url rules of the modules (i.e. of the views of the browser
+        # nodes), added on the first request to them, by the module name.
+        self.deferred_url_rules = dict()
+        self.deferred_url_rules_lock = RLock()
 
         super(PgAdmin, self).__init__(*args, **kwargs)
 
+    @property
+    def prebuilt_module_manifest(self):
+        """
+        The module manifest (MODULE_MANIFEST) saved earlier by the same version
+        of pgAdmin, an empty one if not configured, missing, or outdated.
+        """
+        if self._prebuilt_module_manifest is not None:
+            return self._prebuilt_module_manifest
+
+        self._prebuilt_module_manifest = dict()
+        manifest_file = self.config.get('MODULE_MANIFEST', None)
+        if not manifest_file:
+            return self._prebuilt_module_manifest
+
+        try:
+            with open(manifest_file) as fp:
+                manifest = json.load(fp)
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                'Unable to load the module manifest %s: %s' %
+                (manifest_file, str(e))
+            )
+            return self._prebuilt_module_manifest
+
+        if manifest.get('version') != self.config['APP_VERSION']:
+            self.logger.warning(
+                'Ignoring the module manifest %s of pgAdmin version %s' %
+                (manifest_file, manifest.get('version'))
+            )
+        else:
+            self._prebuilt_module_manifest = manifest['modules']
+
+        return self._prebuilt_module_manifest
+
+    def save_module_manifest(self, manifest_file):
+        """
+        Save the modules found while creating the application, so that only
+        those are imported, without searching the packages (and importing
+        every module of them), by the application configured to use it
+        (MODULE_MANIFEST).
+        """
+        with open(manifest_file, 'w') as fp:
+            json.dump({
+                'version': self.config['APP_VERSION'],
+                'modules': self.module_manifest
+            }, fp, indent=4, sort_keys=True)
+
+    def defer_url_rules(self, state, rules):
+        """
+        Add the url rules of the module (given by its blueprint setup state) on
+        the first request to it, when DEFER_NODE_URL_RULES is set, instead of
+        at once. Adding a url rule compiles it, which takes most of the time
+        of creating the application, while a worker may never serve most of
+        the nodes.
+
+        The url rules are always added at once in the debug mode, as Flask
+        does not allow to add them after the first request.
+        """
+        if not self.config.get('DEFER_NODE_URL_RULES', False) or \
+                self.config.get('DEBUG', False):
+            self._add_url_rules(state, rules)
+            return
+
+        self.deferred_url_rules[state.blueprint.name] = (state, rules)
+
+    @staticmethod
+    def _add_url_rules(state, rules):
+        for rule, endpoint, view_func, options in rules:
+            state.add_url_rule(rule, endpoint, view_func, **options)
+
+    def register_deferred_url_rules(self, path=None, endpoint=None):
+        """
+        Add the deferred url rules of the module serving the given path, or
+        the given endpoint.
+        """
+        if not self.deferred_url_rules:
+            return
+
+        with self.deferred_url_rules_lock:
+            if endpoint is not None:
+                names = [endpoint.rsplit('.', 1)[0]]
+            else:
+                names = [
+                    name for name, (state, rules) in
+                    self.deferred_url_rules.items()
+                    if state.url_prefix and (
+                        path == state.url_prefix or
+                        path.startswith(state.url_prefix + '/')
+                    )
+                ]
+
+            for name in names:
+                if name not in self.deferred_url_rules:
+                    continue
+
+                self._add_url_rules(*self.deferred_url_rules[name])
+                # Sort the rules, while the url map is not read
+                self.url_map.update()
+                del self.deferred_url_rules[name]
+
+    def create_url_adapter(self, request):
+        if request is not None:
+            self.register_deferred_url_rules(path=request.path)
+
+        adapter = super(PgAdmin, self).create_url_adapter(request)
+
+        if adapter is not None and self.deferred_url_rules:
+            adapter = _DeferredUrlRulesMapAdapter(self, adapter)
+
+        return adapter
+
+    def inject_url_defaults(self, endpoint, values):
+        if not self.deferred_url_rules:
+            return super(PgAdmin, self).inject_url_defaults(endpoint, values)
+
+        # The url defaults functions may look for the rules of the endpoint
+        with self.deferred_url_rules_lock:
+            self.register_deferred_url_rules(endpoint=endpoint)
+            super(PgAdmin, self).inject_url_defaults(endpoint, values)
+
     def find_submodules(self, basemodule):
-        for module_name in find_modules(basemodule, True):
+        prebuilt = self.prebuilt_module_manifest
+        if basemodule in prebuilt:
+            module_names = prebuilt[basemodule]
+        else:
+            module_names = find_modules(basemodule, True)
+
+        found = self.module_manifest.setdefault(basemodule, [])
+
+        for module_name in module_names:
             if module_name in self.config['MODULE_BLACKLIST']:
                 self.logger.info(
                     'Skipping blacklisted module: %s' % module_name
@@ -78,6 +244,8 @@ class PgAdmin(Flask):
             module = import_module(module_name)
             for key in list(module.__dict__.keys()):
                 if isinstance(module.__dict__[key], PgAdminModule):
+                    if module_name not in found:
+                        found.append(module_name)
                     yield module.__dict__[key]
 
     @property
@@ -128,13 +296,16 @@ class PgAdmin(Flask):
                 return url
 
         # Fetch all endpoints and their respective url
-        for rule in current_app.url_map.iter_rules('static'):
-            yield rule.endpoint, get_full_url_path(rule.rule)
+        with self.deferred_url_rules_lock:
+            rules = list(current_app.url_map.iter_rules('static'))
 
-        for module in self.submodules:
-            for endpoint in module.exposed_endpoints:
-                for rule in current_app.url_map.iter_rules(endpoint):
-                    yield rule.endpoint, get_full_url_path(rule.rule)
+            for module in self.submodules:
+                for endpoint in module.exposed_endpoints:
+                    self.register_deferred_url_rules(endpoint=endpoint)
+                    rules.extend(current_app.url_map.iter_rules(endpoint))
+
+        for rule in rules:
+            yield rule.endpoint, get_full_url_path(rule.rule)
 
     @property
     def javascripts(self):
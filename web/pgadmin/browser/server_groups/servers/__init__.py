@@ -7,6 +7,11 @@
 #
 ##########################################################################
 
+import time
+from concurrent.futures import TimeoutError
+from threading import Lock
+from weakref import WeakKeyDictionary
+
 import simplejson as json
 import pgadmin.browser.server_groups as sg
 from flask import render_template, request, make_response, jsonify, \
@@ -17,6 +22,7 @@ from pgadmin.browser.server_groups.servers.types import ServerType
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, bad_request, forbidden, \
     make_response as ajax_response, internal_server_error, unauthorized, gone
+from pgadmin.utils.concurrency import run_concurrently
 from pgadmin.utils.crypto import encrypt, decrypt, pqencryptpassword
 from pgadmin.utils.menu import MenuItem
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
@@ -67,6 +73,113 @@ def recovery_state(connection, postgres_version):
     return status, result, in_recovery, wal_paused
 
 
+# Recovery state of the connected servers by their managers, i.e.
+# (checked at, in_recovery, wal_paused)
+_recovery_states = WeakKeyDictionary()
+_recovery_states_lock = Lock()
+
+
+def invalidate_recovery_state(manager):
+    with _recovery_states_lock:
+        _recovery_states.pop(manager, None)
+
+
+def _cache_recovery_state(manager, in_recovery, wal_paused):
+    with _recovery_states_lock:
+        _recovery_states[manager] = (time.time(), in_recovery, wal_paused)
+
+
+class _RecoveryProbe(object):
+    """
+    Recovery check of a server, run on the connection of the session. The
+    check is cancelled when timed out, so that the connection is not left
+    busy by it.
+    """
+    def __init__(self, manager, conn):
+        self.manager = manager
+        self.conn = conn
+        self.running = True
+        self._lock = Lock()
+
+    def __call__(self):
+        try:
+            return recovery_state(self.conn, self.manager.version)
+        finally:
+            with self._lock:
+                self.running = False
+
+    def cancel(self):
+        with self._lock:
+            if not self.running:
+                return
+
+            pg_conn = getattr(self.conn, 'conn', None)
+            try:
+                if pg_conn is not None and not pg_conn.closed:
+                    pg_conn.cancel()
+            except Exception as e:
+                current_app.logger.exception(e)
+
+
+def recovery_states(servers):
+    """
+    Returns the recovery state (as returned by recovery_state) of the given
+    connected servers. The servers not checked within the last
+    SERVER_STATUS_CACHE_TTL seconds are checked at the same time, a server
+    not responding within SERVER_STATUS_TIMEOUT seconds is returned without
+    its recovery state (and its check is cancelled).
+
+    :param servers: list of (manager, connection) of the servers
+    :return: list of (status, result, in_recovery, wal_paused)
+    """
+    results = [None] * len(servers)
+    probes = []
+    now = time.time()
+
+    with _recovery_states_lock:
+        for idx, (manager, conn) in enumerate(servers):
+            state = _recovery_states.get(manager, None)
+            if state is not None and \
+                    now - state[0] < config.SERVER_STATUS_CACHE_TTL:
+                results[idx] = (True, None, state[1], state[2])
+            else:
+                probes.append(idx)
+
+    probes = [(idx, _RecoveryProbe(*servers[idx])) for idx in probes]
+    states = run_concurrently(
+        [probe for idx, probe in probes],
+        config.SERVER_STATUS_MAX_WORKERS,
+        config.SERVER_STATUS_TIMEOUT
+    )
+
+    error = None
+    for (idx, probe), (status, res) in zip(probes, states):
+        manager = servers[idx][0]
+        if status:
+            results[idx] = res
+            if res[0]:
+                _cache_recovery_state(manager, res[2], res[3])
+            else:
+                invalidate_recovery_state(manager)
+        elif isinstance(res, TimeoutError):
+            current_app.logger.warning(
+                "Recovery state of the server (#{0}) could not be checked "
+                "within {1} seconds.".format(
+                    manager.sid, config.SERVER_STATUS_TIMEOUT)
+            )
+            probe.cancel()
+            # Do not check the hung server again, until the cache expires.
+            _cache_recovery_state(manager, None, None)
+            results[idx] = (True, None, None, None)
+        elif error is None:
+            error = res
+
+    if error is not None:
+        raise error
+
+    return results
+
+
 def get_preferences():
     """
     Get preferences setting
@@ -307,6 +420,8 @@ class ServerModule(sg.ServerGroupPluginModule):
             app.jinja_env.filters['qtLiteral'] = driver.qtLiteral
             app.jinja_env.filters['qtIdent'] = driver.qtIdent
             app.jinja_env.filters['qtTypeIdent'] = driver.qtTypeIdent
+            app.jinja_env.filters['qtIdents'] = driver.qtIdents
+            app.jinja_env.filters['qtTypeIdents'] = driver.qtTypeIdents
             app.jinja_env.filters['hasAny'] = has_any
 
         super(ServerModule, self).register(app, options, first_registration)
@@ -500,6 +615,7 @@ class ServerNode(PGChildNodeView):
             Server.servergroup_id == gid)
 
         driver = get_driver(PG_DEFAULT_DRIVER)
+        server_conns = []
 
         for server in servers:
             if server.shared and server.user_id != current_user.id:
@@ -509,15 +625,23 @@ class ServerNode(PGChildNodeView):
                                                               shared_server)
             manager = driver.connection_manager(server.id)
             conn = manager.connection()
-            connected = conn.connected()
+            server_conns.append((server, manager, conn, conn.connected()))
+
+        # Check the recovery state of the connected servers at once
+        states = iter(recovery_states([
+            (manager, conn)
+            for server, manager, conn, connected in server_conns
+            if connected
+        ]))
+
+        for server, manager, conn, connected in server_conns:
             errmsg = None
             in_recovery = None
             wal_paused = None
             server_type = 'pg'
             if connected:
                 server_type = manager.server_type
-                status, result, in_recovery, wal_paused =\
-                    recovery_state(conn, manager.version)
+                status, result, in_recovery, wal_paused = next(states)
                 if not status:
                     connected = False
                     manager.release()
@@ -576,6 +700,9 @@ class ServerNode(PGChildNodeView):
             )
 
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(server.id)
+        # The server node is being refreshed, hence its capabilities (i.e.
+        # the installed extensions) are probed again.
+        manager.refresh_capabilities()
         conn = manager.connection()
         connected = conn.connected()
         errmsg = None
@@ -583,7 +710,7 @@ class ServerNode(PGChildNodeView):
         wal_paused = None
         if connected:
             status, result, in_recovery, wal_paused =\
-                recovery_state(conn, manager.version)
+                recovery_states([(manager, conn)])[0]
             if not status:
                 connected = False
                 manager.release()
@@ -1228,7 +1355,7 @@ class ServerNode(PGChildNodeView):
         errmsg = None
         if connected:
             status, result, in_recovery, wal_paused =\
-                recovery_state(conn, manager.version)
+                recovery_states([(manager, conn)])[0]
 
             if not status:
                 connected = False
@@ -1441,8 +1568,9 @@ class ServerNode(PGChildNodeView):
                 %s - %s' % (server.id, server.name))
             # Update the recovery and wal pause option for the server
             # if connected successfully
+            invalidate_recovery_state(manager)
             _, _, in_recovery, wal_paused =\
-                recovery_state(conn, manager.version)
+                recovery_states([(manager, conn)])[0]
 
             return make_json_response(
                 success=1,
@@ -1472,6 +1600,7 @@ class ServerNode(PGChildNodeView):
 
         # Release Connection
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+        invalidate_recovery_state(manager)
 
         status = manager.release()
 
@@ -1703,6 +1832,7 @@ class ServerNode(PGChildNodeView):
 
             # Execute SQL to pause or resume WAL replay
             if conn.connected():
+                invalidate_recovery_state(manager)
                 if pause:
                     sql = "SELECT pg_xlog_replay_pause();"
                     if manager.version >= 100000:
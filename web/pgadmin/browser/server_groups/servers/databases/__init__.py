@@ -351,6 +351,10 @@ class DatabaseView(PGChildNodeView):
 
     @check_precondition(action="node")
     def node(self, gid, sid, did):
+        # The database node is being refreshed, hence its capabilities (i.e.
+        # the installed extensions) are probed again.
+        self.manager.refresh_capabilities(did=did)
+
         SQL = render_template(
             "/".join([self.template_path, self._NODES_SQL]),
             did=did, conn=self.conn, last_system_oid=0
@@ -284,6 +284,9 @@ class ExtensionView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Probe the capabilities provided by the extension again
+        self.manager.refresh_capabilities(did=did)
+
         status, res = get_extension_details(
             self.conn, data['name'],
             "/".join([self.template_path, self._PROPERTIES_SQL]))
@@ -318,6 +321,8 @@ class ExtensionView(PGChildNodeView, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            self.manager.refresh_capabilities(did=did)
+
             return jsonify(
                 node=self.blueprint.generate_browser_node(
                     eid,
@@ -378,6 +383,8 @@ class ExtensionView(PGChildNodeView, SchemaDiffObjectCompare):
                 if not status:
                     return internal_server_error(errormsg=res)
 
+                self.manager.refresh_capabilities(did=did)
+
             return make_json_response(
                 success=1,
                 info=gettext("Extension dropped")
@@ -431,9 +431,6 @@ It may have been removed by another user or moved to another schema.
 
         data = res['rows'][0]
 
-        # Get Type Length and Precision
-        data.update(self._parse_type(data['fulltype']))
-
         # Get Domain Constraints
         SQL = render_template("/".join([self.template_path,
                                         self._GET_CONSTRAINTS_SQL]),
@@ -442,7 +439,21 @@ It may have been removed by another user or moved to another schema.
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        data['constraints'] = res['rows']
+        return True, self._format_properties(did, data, res['rows'])
+
+    def _format_properties(self, did, data, constraints):
+        """
+        This function is used to format the properties fetched from the
+        database.
+        :param did:
+        :param data: domain properties
+        :param constraints: domain constraints
+        :return:
+        """
+        # Get Type Length and Precision
+        data.update(self._parse_type(data['fulltype']))
+
+        data['constraints'] = constraints
 
         # Get formatted Security Labels
         if 'seclabels' in data:
@@ -450,10 +461,10 @@ It may have been removed by another user or moved to another schema.
 
         # Set System Domain Status
         data['sysdomain'] = False
-        if doid <= self.manager.db_info[did]['datlastsysoid']:
+        if data['oid'] <= self.manager.db_info[did]['datlastsysoid']:
             data['sysdomain'] = True
 
-        return True, data
+        return data
 
     def _parse_type(self, basetype):
         """
@@ -580,6 +591,9 @@ AND relkind != 'c'))"""
         if not status:
             return internal_server_error(errormsg=res)
 
+        # The type names cached for the database are stale now.
+        self.manager.invalidate_type_names(did)
+
         # We need oid to to add object in tree at browser, below sql will
         # gives the same
         SQL = render_template("/".join([self.template_path,
@@ -662,6 +676,8 @@ AND relkind != 'c'))"""
             if not status:
                 return internal_server_error(errormsg=res)
 
+        self.manager.invalidate_type_names(did)
+
         return make_json_response(
             success=1,
             info=gettext("Domain dropped")
@@ -690,6 +706,8 @@ AND relkind != 'c'))"""
         if not status:
             return internal_server_error(errormsg=res)
 
+        self.manager.invalidate_type_names(did)
+
         # Get Schema Id
         SQL = render_template("/".join([self.template_path,
                                         self._OID_SQL]),
@@ -925,17 +943,27 @@ AND relkind != 'c'))"""
         :return:
         """
         res = dict()
+        # Fetch the properties, and the constraints of all the domains at
+        # once
         SQL = render_template("/".join([self.template_path,
-                                        self._NODE_SQL]), scid=scid)
-        status, rset = self.conn.execute_2darray(SQL)
+                                        self._PROPERTIES_SQL]), scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
 
-        for row in rset['rows']:
-            status, data = self._fetch_properties(did, scid, row['oid'])
+        SQL = render_template("/".join([self.template_path,
+                                        self._GET_CONSTRAINTS_SQL]),
+                              scid=scid)
+        status, cons = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=cons)
 
-            if status:
-                res[row['name']] = data
+        constraints = self.group_rows_by_oid(cons['rows'], 'contypid')
+
+        for row in rset['rows']:
+            res[row['name']] = self._format_properties(
+                did, row, constraints.get(row['oid'], [])
+            )
 
         return res
 
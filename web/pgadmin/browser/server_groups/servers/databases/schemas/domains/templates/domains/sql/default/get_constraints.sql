@@ -1,4 +1,7 @@
 SELECT
+{% if not doid %}
+    contypid,
+{% endif %}
     'DOMAIN' AS objectkind, c.oid as conoid, conname, typname as relname, nspname, description,
     regexp_replace(pg_get_constraintdef(c.oid, true), E'CHECK \\((.*)\\).*', E'\\1') as cons
 FROM
@@ -11,5 +14,9 @@ LEFT OUTER JOIN
     pg_description des ON (des.objoid=c.oid AND des.classoid='pg_constraint'::regclass)
 WHERE
     contype = 'c'
+{% if doid %}
     AND contypid =  {{doid}}::oid
+{% else %}
+    AND typnamespace = {{scid}}::oid
+{% endif %}
 ORDER BY conname;
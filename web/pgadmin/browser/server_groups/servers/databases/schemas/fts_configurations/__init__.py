@@ -1004,16 +1004,27 @@ class FtsConfigurationView(PGChildNodeView, SchemaDiffObjectCompare):
         :return:
         """
         res = dict()
+        # Fetch the properties, and the token/dictionary list of all the fts
+        # configurations at once
         SQL = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]), scid=scid)
-        status, fts_cfg = self.conn.execute_2darray(SQL)
+                                        self._PROPERTIES_SQL]), scid=scid)
+        status, fts_cfg = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=fts_cfg)
+
+        SQL = render_template(
+            "/".join([self.template_path, 'tokenDictList.sql']), scid=scid
+        )
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
+
+        tokens = self.group_rows_by_oid(rset['rows'], 'cfgid')
 
         for row in fts_cfg['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            row['is_sys_obj'] = (row['oid'] <= self.datlastsysoid)
+            row['tokens'] = tokens.get(row['oid'], [])
+            res[row['name']] = row
 
         return res
 
@@ -1,6 +1,9 @@
 {# Fetch token/dictionary list for FTS CONFIGURATION #}
-{% if cfgid %}
+{% if cfgid or scid %}
 SELECT
+{% if not cfgid %}
+    mapcfg AS cfgid,
+{% endif %}
     (
     SELECT
         t.alias
@@ -20,9 +23,17 @@ FROM
     LEFT OUTER JOIN pg_ts_dict ON mapdict = pg_ts_dict.oid
     LEFT OUTER JOIN pg_namespace pg_ns ON pg_ns.oid = pg_ts_dict.dictnamespace
 WHERE
+{% if cfgid %}
     mapcfg={{cfgid}}::OID
 GROUP BY
     token
 ORDER BY
     1
+{% else %}
+    pg_ts_config.cfgnamespace = {{scid}}::OID
+GROUP BY
+    mapcfg, token
+ORDER BY
+    1, 2
+{% endif %}
 {% endif %}
@@ -392,23 +392,29 @@ class FtsDictionaryView(PGChildNodeView, SchemaDiffObjectCompare):
                 "Could not find the FTS Dictionary node in the database node."
             ))
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self.datlastsysoid)
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, row):
+        """
+        This function is used to format the properties fetched from the
+        database.
+
+        :param row:
+        :return:
+        """
+        row['is_sys_obj'] = (row['oid'] <= self.datlastsysoid)
 
         # Handle templates and its schema name properly
-        if res['rows'][0]['template_schema'] is not None and \
-                res['rows'][0]['template_schema'] != "pg_catalog":
-            res['rows'][0]['template'] = self.qtIdent(
-                self.conn, res['rows'][0]['template_schema'],
-                res['rows'][0]['template']
+        if row['template_schema'] is not None and \
+                row['template_schema'] != "pg_catalog":
+            row['template'] = self.qtIdent(
+                self.conn, row['template_schema'], row['template']
             )
 
-        if res['rows'][0]['options'] is not None:
-            res['rows'][0]['options'] = self.tokenize_options(
-                res['rows'][0]['options']
-            )
+        if row['options'] is not None:
+            row['options'] = self.tokenize_options(row['options'])
 
-        return True, res['rows'][0]
+        return row
 
     @check_precondition
     def create(self, gid, sid, did, scid):
@@ -915,16 +921,15 @@ class FtsDictionaryView(PGChildNodeView, SchemaDiffObjectCompare):
         :return:
         """
         res = dict()
+        # Fetch the properties of all the fts dictionaries at once
         SQL = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]), scid=scid)
-        status, rset = self.conn.execute_2darray(SQL)
+                                        self._PROPERTIES_SQL]), scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
 
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            res[row['name']] = self._format_properties(row)
 
         return res
 
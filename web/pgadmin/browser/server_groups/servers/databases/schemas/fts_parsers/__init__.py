@@ -950,16 +950,16 @@ class FtsParserView(PGChildNodeView, SchemaDiffObjectCompare):
         :return:
         """
         res = dict()
+        # Fetch the properties of all the fts parsers at once
         SQL = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]), scid=scid)
-        status, rset = self.conn.execute_2darray(SQL)
+                                        self._PROPERTIES_SQL]), scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
 
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            row['is_sys_obj'] = (row['oid'] <= self.datlastsysoid)
+            res[row['name']] = row
 
         return res
 
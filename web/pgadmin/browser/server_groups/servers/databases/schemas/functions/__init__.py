@@ -28,11 +28,12 @@ from pgadmin.browser.server_groups.servers.databases.utils import \
     parse_sec_labels_from_db, parse_variables_from_db
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, get_nodes_window, \
+    nodes_window_result
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 
 
@@ -399,7 +400,8 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
     @check_precondition
     def nodes(self, gid, sid, did, scid, fnid=None):
         """
-        Returns all the Functions to generate the Nodes.
+        Returns all the Functions (of the window requested, see
+        get_nodes_window) to generate the Nodes.
 
         Args:
             gid: Server Group Id
@@ -407,12 +409,17 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             did: Database Id
             scid: Schema Id
         """
+        try:
+            window = get_nodes_window()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
 
         res = []
         sql = render_template(
             "/".join([self.sql_template_path, self._NODE_SQL]),
             scid=scid,
-            fnid=fnid
+            fnid=fnid,
+            **window
         )
         status, rset = self.conn.execute_2darray(sql)
 
@@ -452,6 +459,9 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(
+                window, rset['rows'], name_field='proname'
+            ),
             status=200
         )
 
@@ -1539,11 +1549,6 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         resp_data = res['rows'][0]
 
-        # Get formatted Arguments
-        frmtd_params, frmtd_proargs = self._format_arguments_from_db(resp_data)
-        resp_data.update(frmtd_params)
-        resp_data.update(frmtd_proargs)
-
         # Fetch privileges
         sql = render_template("/".join([self.sql_template_path,
                                         self._ACL_SQL]),
@@ -1552,8 +1557,26 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        return self._format_properties(did, resp_data, proaclres['rows'])
+
+    def _format_properties(self, did, resp_data, proacl):
+        """
+        Format the Function Properties fetched from the database.
+
+        Args:
+            did: Database Id
+            resp_data: Function Properties
+            proacl: Function Privileges
+        """
+        fnid = resp_data['oid']
+
+        # Get formatted Arguments
+        frmtd_params, frmtd_proargs = self._format_arguments_from_db(resp_data)
+        resp_data.update(frmtd_params)
+        resp_data.update(frmtd_proargs)
+
         # Get Formatted Privileges
-        resp_data.update(self._format_proacl_from_db(proaclres['rows']))
+        resp_data.update(self._format_proacl_from_db(proacl))
 
         # Set System Functions Status
         resp_data['sysfunc'] = False
@@ -1914,10 +1937,30 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            # Fetch the properties, and the privileges of all the functions
+            # of the schema at once
+            sql = render_template("/".join([self.sql_template_path,
+                                            self._PROPERTIES_SQL]),
+                                  scid=scid)
+            status, props = self.conn.execute_dict(sql)
+            if not status:
+                return internal_server_error(errormsg=props)
+
+            sql = render_template("/".join([self.sql_template_path,
+                                            self._ACL_SQL]),
+                                  scid=scid)
+            status, proaclres = self.conn.execute_dict(sql)
+            if not status:
+                return internal_server_error(errormsg=proaclres)
+
+            props = dict((row['oid'], row) for row in props['rows'])
+            proacl = self.group_rows_by_oid(proaclres['rows'])
+
             for row in rset['rows']:
-                data = self._fetch_properties(0, sid, did, scid, row['oid'])
-                if isinstance(data, dict):
-                    res[row['name']] = data
+                if row['oid'] in props:
+                    res[row['name']] = self._format_properties(
+                        did, props[row['oid']], proacl.get(row['oid'], [])
+                    )
         else:
             data = self._fetch_properties(0, sid, did, scid, oid)
             res = data
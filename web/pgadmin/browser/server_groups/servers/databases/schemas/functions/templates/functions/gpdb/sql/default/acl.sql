@@ -1,4 +1,7 @@
 SELECT
+{% if not fnid %}
+  NULL::oid AS oid,
+{% endif %}
   'PUBLIC' AS grantee,
   NULL     AS grantor,
   NULL     AS privileges,
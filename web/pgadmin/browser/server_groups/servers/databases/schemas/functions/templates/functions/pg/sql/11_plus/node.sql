@@ -1,5 +1,5 @@
 SELECT
-    pr.oid, pr.proname || '(' || COALESCE(pg_catalog.pg_get_function_identity_arguments(pr.oid), '') || ')' as name,
+    pr.oid, pr.proname, pr.proname || '(' || COALESCE(pg_catalog.pg_get_function_identity_arguments(pr.oid), '') || ')' as name,
     lanname, pg_get_userbyid(proowner) as funcowner, description
 FROM
     pg_proc pr
@@ -18,5 +18,11 @@ WHERE
     AND pronamespace = {{scid}}::oid
 {% endif %}
     AND typname NOT IN ('trigger', 'event_trigger')
+{% if prefix %}
+    AND proname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND (proname, pr.oid) > ({{ after_name|qtLiteral }}::name, {{ after }}::oid)
+{% endif %}
 ORDER BY
-    proname;
+    proname, pr.oid{% if limit %} LIMIT {{ limit }}{% endif %};
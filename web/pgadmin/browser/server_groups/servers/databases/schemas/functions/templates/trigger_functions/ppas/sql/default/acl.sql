@@ -1,10 +1,13 @@
 SELECT
+{% if not fnid %}
+    d.oid,
+{% endif %}
     COALESCE(gt.rolname, 'PUBLIC') AS grantee,
     g.rolname AS grantor, array_agg(privilege_type) AS privileges,
     array_agg(is_grantable) AS grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.oid, d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -22,14 +25,14 @@ FROM
         END AS privilege_type
     FROM
         (SELECT
-            (d).grantee AS grantee, (d).grantor AS grantor,
+            oid, (d).grantee AS grantee, (d).grantor AS grantor,
             (d).is_grantable AS is_grantable,
             (d).privilege_type AS privilege_type
         FROM
-            (SELECT aclexplode(db.proacl) AS d FROM pg_proc db
-            WHERE db.oid = {{fnid}}::OID) a ORDER BY privilege_type
+            (SELECT db.oid, aclexplode(db.proacl) AS d FROM pg_proc db
+            WHERE {% if fnid %}db.oid = {{fnid}}::OID{% else %}db.pronamespace = {{scid}}::OID{% endif %}) a ORDER BY privilege_type
         ) d
     ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname;
+GROUP BY {% if not fnid %}d.oid, {% endif %}g.rolname, gt.rolname;
@@ -21,11 +21,12 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, get_nodes_window, \
+    nodes_window_result
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 
 
@@ -196,13 +197,20 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
           scid: Schema ID
 
         Returns:
-
+          JSON of the sequence nodes (of the window requested, see
+          get_nodes_window)
         """
+        try:
+            window = get_nodes_window()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
         res = []
         SQL = render_template(
             "/".join([self.template_path, self._NODES_SQL]),
             scid=scid,
-            seid=seid
+            seid=seid,
+            **window
         )
         status, rset = self.conn.execute_dict(SQL)
         if not status:
@@ -234,6 +242,7 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(window, rset['rows']),
             status=200
         )
 
@@ -305,27 +314,14 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         elif len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self.datlastsysoid)
-
-        for row in res['rows']:
-            sql = render_template(
-                "/".join([self.template_path, 'get_def.sql']),
-                data=row
-            )
-            status, rset1 = self.conn.execute_dict(sql)
-            if not status:
-                return False, internal_server_error(errormsg=rset1)
-
-            row['current_value'] = rset1['rows'][0]['last_value']
-            row['minimum'] = rset1['rows'][0]['min_value']
-            row['maximum'] = rset1['rows'][0]['max_value']
-            row['increment'] = rset1['rows'][0]['increment_by']
-            row['start'] = rset1['rows'][0]['start_value']
-            row['cache'] = rset1['rows'][0]['cache_value']
-            row['cycled'] = rset1['rows'][0]['is_cycled']
-
-            self._add_securities_to_row(row)
+        row = res['rows'][0]
+        sql = render_template(
+            "/".join([self.template_path, 'get_def.sql']),
+            data=row
+        )
+        status, rset1 = self.conn.execute_dict(sql)
+        if not status:
+            return False, internal_server_error(errormsg=rset1)
 
         sql = render_template(
             "/".join([self.template_path, self._ACL_SQL]),
@@ -335,14 +331,39 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(priv)
+        return True, self._format_properties(
+            row, rset1['rows'][0], dataclres['rows']
+        )
+
+    def _format_properties(self, row, definition, acl):
+        """
+        This function is used to format the properties of a sequence fetched
+        from the database.
+        :param row: sequence properties
+        :param definition: row of the sequence definition (get_def.sql)
+        :param acl: sequence privileges
+        :return:
+        """
+        row['is_sys_obj'] = (row['oid'] <= self.datlastsysoid)
+
+        row['current_value'] = definition['last_value']
+        row['minimum'] = definition['min_value']
+        row['maximum'] = definition['max_value']
+        row['increment'] = definition['increment_by']
+        row['start'] = definition['start_value']
+        row['cache'] = definition['cache_value']
+        row['cycled'] = definition['is_cycled']
+
+        self._add_securities_to_row(row)
+
+        for acl_row in acl:
+            priv = parse_priv_from_db(acl_row)
+            if acl_row['deftype'] in row:
+                row[acl_row['deftype']].append(priv)
             else:
-                res['rows'][0][row['deftype']] = [priv]
+                row[acl_row['deftype']] = [priv]
 
-        return True, res['rows'][0]
+        return row
 
     def _add_securities_to_row(self, row):
         sec_lbls = []
@@ -919,16 +940,39 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         :return:
         """
         res = dict()
+        # Fetch the properties, the definitions, and the privileges of all
+        # the sequences at once. The sequences, which can not be read by the
+        # user, are skipped.
         sql = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]), scid=scid)
-        status, rset = self.conn.execute_2darray(sql)
+                                        self._PROPERTIES_SQL]),
+                              scid=scid, readable=True)
+        status, rset = self.conn.execute_dict(sql)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
+
+        if len(rset['rows']) == 0:
+            return res
+
+        sql = render_template("/".join([self.template_path, 'get_def.sql']),
+                              seqs=rset['rows'])
+        status, defs = self.conn.execute_dict(sql)
+        if not status:
+            return internal_server_error(errormsg=defs)
+
+        sql = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              scid=scid)
+        status, dataclres = self.conn.execute_dict(sql)
+        if not status:
+            return internal_server_error(errormsg=dataclres)
+
+        defs = dict((row['oid'], row) for row in defs['rows'])
+        acls = self.group_rows_by_oid(dataclres['rows'])
 
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            if row['oid'] in defs:
+                res[row['name']] = self._format_properties(
+                    row, defs[row['oid']], acls.get(row['oid'], [])
+                )
 
         return res
 
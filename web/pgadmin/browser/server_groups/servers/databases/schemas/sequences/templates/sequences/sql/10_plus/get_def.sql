@@ -1,3 +1,17 @@
+{% if seqs %}
+SELECT
+    seqrelid AS oid,
+    COALESCE(pg_sequence_last_value(seqrelid), seqstart) AS last_value,
+    seqmin AS min_value,
+    seqmax AS max_value,
+    seqstart AS start_value,
+    seqcache AS cache_value,
+    seqcycle AS is_cycled,
+    seqincrement AS increment_by,
+    pg_sequence_last_value(seqrelid) IS NOT NULL AS is_called
+FROM pg_sequence
+WHERE seqrelid IN ({% for data in seqs %}{{data.oid}}{% if not loop.last %}, {% endif %}{% endfor %})
+{% else %}
 SELECT
     last_value,
     seqmin AS min_value,
@@ -9,3 +23,4 @@ SELECT
     is_called
 FROM pg_sequence, {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
 WHERE seqrelid = {{data.oid}}
+{% endif %}
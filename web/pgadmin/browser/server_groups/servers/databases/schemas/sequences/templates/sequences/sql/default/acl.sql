@@ -1,7 +1,7 @@
-SELECT 'relacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, array_agg(privilege_type) as privileges, array_agg(is_grantable) as grantable
+SELECT {% if not seid %}d.oid, {% endif %}'relacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, array_agg(privilege_type) as privileges, array_agg(is_grantable) as grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.oid, d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -18,13 +18,18 @@ FROM
         ELSE 'UNKNOWN'
         END AS privilege_type
     FROM
-        aclexplode((SELECT relacl
+        (SELECT
+            oid, (d).grantee AS grantee, (d).grantor AS grantor,
+            (d).is_grantable AS is_grantable,
+            (d).privilege_type AS privilege_type
+        FROM
+            (SELECT cl.oid, aclexplode(relacl) AS d
             FROM pg_class cl
-            LEFT OUTER JOIN pg_description des ON (des.objoid=cl.oid AND des.classoid='pg_class'::regclass)
             WHERE relkind = 'S' AND relnamespace  = {{scid}}::oid
-            AND cl.oid = {{seid}}::oid )) d
+            {% if seid %}AND cl.oid = {{seid}}::oid {% endif %}) a
         ) d
+    ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname
+GROUP BY {% if not seid %}d.oid, {% endif %}g.rolname, gt.rolname
 ORDER BY grantee
@@ -1,3 +1,19 @@
+{% if seqs %}
+{% for data in seqs %}
+SELECT
+    {{data.oid}}::oid AS oid,
+    last_value,
+    min_value,
+    max_value,
+    start_value,
+    cache_value,
+    is_cycled,
+    increment_by,
+    is_called
+FROM {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
+{% if not loop.last %}UNION ALL{% endif %}
+{% endfor %}
+{% else %}
 SELECT 
     last_value, 
     min_value, 
@@ -7,4 +23,5 @@ SELECT
     is_cycled, 
     increment_by,
     is_called
-FROM {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
\ No newline at end of file
+FROM {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
+{% endif %}
@@ -8,4 +8,10 @@ WHERE
 {% if seid %}
     AND cl.oid = {{seid|qtLiteral}}::oid
 {% endif %}
-ORDER BY relname
+{% if prefix %}
+    AND relname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND (relname, cl.oid) > ({{ after_name|qtLiteral }}::name, {{ after }}::oid)
+{% endif %}
+ORDER BY relname, cl.oid{% if limit %} LIMIT {{ limit }}{% endif %}
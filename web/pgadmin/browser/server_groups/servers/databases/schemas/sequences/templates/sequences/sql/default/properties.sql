@@ -13,5 +13,6 @@ FROM pg_class cl
         AND des.classoid='pg_class'::regclass)
 WHERE relkind = 'S' AND relnamespace  = {{scid}}::oid
 {% if seid %}AND cl.oid = {{seid}}::oid {% endif %}
+{% if readable %}AND has_table_privilege(cl.oid, 'SELECT') {% endif %}
 ORDER BY relname
 {% endif %}
@@ -748,16 +748,16 @@ class SynonymView(PGChildNodeView, SchemaDiffObjectCompare):
         if self.manager.server_type != 'ppas':
             return res
 
+        # Fetch the properties of all the synonyms at once
         SQL = render_template("/".join([self.template_path,
                                         self._PROPERTIES_SQL]), scid=scid)
-        status, rset = self.conn.execute_2darray(SQL)
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
 
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            row['is_sys_obj'] = (row['oid'] <= self.datlastsysoid)
+            res[row['name']] = row
 
         return res
 
@@ -18,8 +18,9 @@ from flask_babelex import gettext
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule, DataTypeReader, VacuumSettings
 from pgadmin.browser.server_groups.servers.utils import parse_priv_to_db
+from pgadmin.browser.utils import get_nodes_window, nodes_window_result
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from .utils import BaseTableView
 from pgadmin.utils.preferences import Preferences
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
@@ -397,12 +398,18 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
             scid: Schema ID
 
         Returns:
-            JSON of available table nodes
+            JSON of available table nodes (of the window requested, see
+            get_nodes_window)
         """
+        try:
+            window = get_nodes_window()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
         res = []
         SQL = render_template(
             "/".join([self.table_template_path, self._NODES_SQL]),
-            scid=scid
+            scid=scid, **window
         )
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
@@ -425,6 +432,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(window, rset['rows']),
             status=200
         )
 
@@ -638,8 +646,21 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
             return False, gone(
                 gettext(self.not_found_error_msg()))
 
+        status, errmsg = self._format_properties(res['rows'][0])
+        if not status:
+            return False, errmsg
+
+        return True, res
+
+    def _format_properties(self, row):
+        """
+        This function is used to format the autovacuum, row level security
+        and row count properties of the table.
+        :param row: properties of the table
+        :return:
+        """
         # Update autovacuum properties
-        self.update_autovacuum_properties(res['rows'][0])
+        self.update_autovacuum_properties(row)
 
         # We will check the threshold set by user before executing
         # the query because that can cause performance issues
@@ -647,16 +668,16 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
         pref = Preferences.module('browser')
         table_row_count_pref = pref.preference('table_row_count_threshold')
         table_row_count_threshold = table_row_count_pref.get()
-        estimated_row_count = int(res['rows'][0].get('reltuples', 0))
+        estimated_row_count = int(row.get('reltuples', 0))
 
         # Check whether 'rlspolicy' in response as it supported for
         # version 9.5 and above
-        TableView._check_rlspolicy_support(res)
+        TableView._check_rlspolicy_support({'rows': [row]})
 
         # If estimated rows are greater than threshold then
         if estimated_row_count and \
                 estimated_row_count > table_row_count_threshold:
-            res['rows'][0]['rows_cnt'] = str(table_row_count_threshold) + '+'
+            row['rows_cnt'] = str(table_row_count_threshold) + '+'
 
         # If estimated rows is lower than threshold then calculate the count
         elif estimated_row_count and \
@@ -664,7 +685,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
             sql = render_template(
                 "/".join(
                     [self.table_template_path, 'get_table_row_count.sql']
-                ), data=res['rows'][0]
+                ), data=row
             )
 
             status, count = self.conn.execute_scalar(sql)
@@ -672,13 +693,13 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
             if not status:
                 return False, internal_server_error(errormsg=count)
 
-            res['rows'][0]['rows_cnt'] = count
+            row['rows_cnt'] = count
 
         # If estimated_row_count is zero then set the row count with same
         elif not estimated_row_count:
-            res['rows'][0]['rows_cnt'] = estimated_row_count
+            row['rows_cnt'] = estimated_row_count
 
-        return True, res
+        return True, None
 
     @BaseTableView.check_precondition
     def types(self, gid, sid, did, scid, tid=None, clid=None):
@@ -1425,8 +1446,9 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         # Now we have all list of columns which we need
         if 'columns' in data:
-            for c in data['columns']:
-                columns.append(self.qtIdent(self.conn, c['name']))
+            columns = self.qtIdents(
+                self.conn, [c['name'] for c in data['columns']]
+            )
 
         if len(columns) > 0:
             columns = ", ".join(columns)
@@ -1474,9 +1496,10 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         # Now we have all list of columns which we need
         if 'columns' in data:
-            for c in data['columns']:
-                columns.append(self.qtIdent(self.conn, c['name']))
-                values.append('?')
+            columns = self.qtIdents(
+                self.conn, [c['name'] for c in data['columns']]
+            )
+            values = ['?'] * len(columns)
 
         if len(columns) > 0:
             columns = ", ".join(columns)
@@ -1524,8 +1547,9 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         # Now we have all list of columns which we need
         if 'columns' in data:
-            for c in data['columns']:
-                columns.append(self.qtIdent(self.conn, c['name']))
+            columns = self.qtIdents(
+                self.conn, [c['name'] for c in data['columns']]
+            )
 
         if len(columns) > 0:
             if len(columns) == 1:
@@ -1681,19 +1705,30 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         else:
             res = dict()
-            sql = render_template("/".join([self.table_template_path,
-                                            self._NODES_SQL]), scid=scid)
-            status, tables = self.conn.execute_2darray(sql)
+            sql = render_template(
+                "/".join([self.table_template_path, self._PROPERTIES_SQL]),
+                did=did, scid=scid, datlastsysoid=self.datlastsysoid
+            )
+            status, tables = self.conn.execute_dict(sql)
             if not status:
                 current_app.logger.error(tables)
                 return False
 
+            sql = render_template("/".join([self.table_template_path,
+                                            self._ACL_SQL]), scid=scid)
+            status, acl = self.conn.execute_dict(sql)
+            if not status:
+                current_app.logger.error(acl)
+                return False
+            acl = self.group_rows_by_oid(acl['rows'])
+
             for row in tables['rows']:
-                status, data = self._fetch_properties(did, scid, row['oid'])
+                status, data = self._format_properties(row)
 
                 if status:
                     data = super(TableView, self).properties(
-                        0, sid, did, scid, row['oid'], res=data,
+                        0, sid, did, scid, row['oid'], res={'rows': [row]},
+                        acl={'rows': acl.get(row['oid'], [])},
                         return_ajax_response=False
                     )
 
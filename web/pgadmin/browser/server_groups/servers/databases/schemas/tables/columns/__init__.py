@@ -20,9 +20,10 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import DataTypeReader
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, get_nodes_window, \
+    nodes_window_result
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     columns import utils as column_utils
 from pgadmin.utils.driver import get_driver
@@ -266,14 +267,21 @@ class ColumnsView(PGChildNodeView, DataTypeReader):
             tid: Table ID
 
         Returns:
-            JSON of available schema child nodes
+            JSON of available schema child nodes (of the window requested,
+            see get_nodes_window)
         """
+        try:
+            window = get_nodes_window(by_name=False)
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
         res = []
         SQL = render_template(
             "/".join([self.template_path, self._NODES_SQL]),
             tid=tid,
             clid=clid,
-            show_sys_objects=self.blueprint.show_system_objects
+            show_sys_objects=self.blueprint.show_system_objects,
+            **window
         )
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
@@ -307,6 +315,7 @@ class ColumnsView(PGChildNodeView, DataTypeReader):
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(window, rset['rows'], name_field=None),
             status=200
         )
 
@@ -18,9 +18,10 @@ from flask_babelex import gettext
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     partitions import backend_supported
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, get_nodes_window, \
+    nodes_window_result
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
@@ -454,11 +455,18 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
             tid: Table ID
 
         Returns:
-            JSON of available schema child nodes
+            JSON of available schema child nodes (of the window requested,
+            see get_nodes_window)
         """
+        try:
+            window = get_nodes_window()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
         res = []
         SQL = render_template(
-            "/".join([self.template_path, self._NODES_SQL]), tid=tid
+            "/".join([self.template_path, self._NODES_SQL]), tid=tid,
+            **window
         )
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
@@ -475,6 +483,7 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(window, rset['rows']),
             status=200
         )
 
@@ -23,25 +23,35 @@ from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
     import BaseTableView
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.driver.probes import register_probe
 from pgadmin.browser.utils import PGChildModule
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
 
 
+@register_probe('partitioned_table')
+def probe_partitioned_table(manager, conn, tid):
+    """
+    Returns whether the given table is partitioned (which does not change for
+    a table).
+    """
+    template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
+        manager.server_type, manager.version
+    )
+    SQL = render_template("/".join(
+        [template_path, 'backend_support.sql']), tid=tid)
+    return conn.execute_scalar(SQL)
+
+
 def backend_supported(module, manager, **kwargs):
 
     if CollectionNodeModule.backend_supported(module, manager, **kwargs):
         if 'tid' not in kwargs:
             return True
 
-        conn = manager.connection(did=kwargs['did'])
-
-        template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
-            manager.server_type, manager.version
+        status, res = manager.probe(
+            'partitioned_table', kwargs['tid'], did=kwargs['did']
         )
-        SQL = render_template("/".join(
-            [template_path, 'backend_support.sql']), tid=kwargs['tid'])
-        status, res = conn.execute_scalar(SQL)
 
         # check if any errors
         if not status:
@@ -54,18 +54,14 @@ class SchemaDiffTableCompare(SchemaDiffObjectCompare):
 
         group_name = kwargs.get('group_name')
         source_schema_name = kwargs.get('source_schema_name', None)
-        source_tables = {}
-        target_tables = {}
-
         status, target_schema = self.get_schema(**target_params)
         if not status:
             return internal_server_error(errormsg=target_schema)
 
-        if 'scid' in source_params and source_params['scid'] is not None:
-            source_tables = self.fetch_tables(**source_params)
-
-        if 'scid' in target_params and target_params['scid'] is not None:
-            target_tables = self.fetch_tables(**target_params)
+        source_tables, target_tables = self.fetch_source_and_target(
+            'fetch_tables',
+            source_params if source_params['scid'] is not None else None,
+            target_params if target_params['scid'] is not None else None)
 
         # If both the dict have no items then return None.
         if not (source_tables or target_tables) or (
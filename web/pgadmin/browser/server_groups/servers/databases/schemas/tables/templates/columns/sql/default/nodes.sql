@@ -24,4 +24,10 @@ WHERE
     AND (att.attnum > 0 OR (att.attname = 'oid' AND att.attnum < 0))
 {% endif %}
     AND att.attisdropped IS FALSE
-ORDER BY att.attnum
+{% if prefix %}
+    AND att.attname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND att.attnum > {{ after }}
+{% endif %}
+ORDER BY att.attnum{% if limit %} LIMIT {{ limit }}{% endif %}
@@ -12,4 +12,10 @@ WHERE indrelid = {{tid}}::OID
 {% if idx %}
     AND cls.oid = {{ idx }}::OID
 {% endif %}
-    ORDER BY cls.relname
\ No newline at end of file
+{% if prefix %}
+    AND cls.relname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND cls.relname > {{ after_name|qtLiteral }}::name
+{% endif %}
+    ORDER BY cls.relname{% if limit %} LIMIT {{ limit }}{% endif %}
\ No newline at end of file
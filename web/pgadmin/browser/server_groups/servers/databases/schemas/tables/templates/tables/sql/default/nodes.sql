@@ -6,4 +6,10 @@ SELECT rel.oid, rel.relname AS name,
 FROM pg_class rel
     WHERE rel.relkind IN ('r','s','t') AND rel.relnamespace = {{ scid }}::oid
     {% if tid %} AND rel.oid = {{tid}}::OID {% endif %}
-    ORDER BY rel.relname;
+{% if prefix %}
+    AND rel.relname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND (rel.relname, rel.oid) > ({{ after_name|qtLiteral }}::name, {{ after }}::oid)
+{% endif %}
+    ORDER BY rel.relname, rel.oid{% if limit %} LIMIT {{ limit }}{% endif %};
@@ -104,6 +104,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             self.conn = self.manager.connection(did=kwargs['did'])
             self.qtIdent = driver.qtIdent
             self.qtTypeIdent = driver.qtTypeIdent
+            self.qtIdents = driver.qtIdents
             # We need datlastsysoid to check if current table is system table
             self.datlastsysoid = self.manager.db_info[
                 did
@@ -161,12 +162,13 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return wrap
 
-    def _formatter(self, did, scid, tid, data):
+    def _formatter(self, did, scid, tid, data, acl=None):
         """
         Args:
             data: dict of query result
             scid: schema oid
             tid: table oid
+            acl: privileges of the table, fetched when not given
 
         Returns:
             It will return formatted output of query result
@@ -182,12 +184,13 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             data['seclabels'] = seclabels
 
         # We need to parse & convert ACL coming from database to json format
-        sql = render_template("/".join([self.table_template_path,
-                                        self._ACL_SQL]),
-                              tid=tid, scid=scid)
-        status, acl = self.conn.execute_dict(sql)
-        if not status:
-            return internal_server_error(errormsg=acl)
+        if acl is None:
+            sql = render_template("/".join([self.table_template_path,
+                                            self._ACL_SQL]),
+                                  tid=tid, scid=scid)
+            status, acl = self.conn.execute_dict(sql)
+            if not status:
+                return internal_server_error(errormsg=acl)
 
         BaseTableView._set_privileges_for_properties(data, acl)
 
@@ -1465,7 +1468,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             'vacuum_settings_str'
         ].replace('=', ' = ')
 
-        data = self._formatter(did, scid, tid, data)
+        data = self._formatter(did, scid, tid, data, kwargs.get('acl'))
 
         # Fetch partition of this table if it is partitioned table.
         if 'is_partitioned' in data and data['is_partitioned']:
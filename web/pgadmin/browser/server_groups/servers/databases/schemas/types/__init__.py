@@ -484,6 +484,7 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         # Fetching type of type
         of_type = copy_dict['typtype']
         res = dict()
+        rows = []
 
         render_args = {'type': of_type}
         if of_type == 'c':
@@ -498,12 +499,26 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             status, rset = self.conn.execute_dict(SQL)
             if not status:
                 return internal_server_error(errormsg=res)
+            rows = rset['rows']
+
+        return self._format_additional_properties(copy_dict, rows)
+
+    def _format_additional_properties(self, copy_dict, rows):
+        """
+        Used by additional_properties internally to format the rows fetched
+        for the composite/enum/range type.
+        :param copy_dict: properties of the type
+        :param rows: rows fetched from additional_properties.sql
+        :return: additional properties of the type
+        """
+        of_type = copy_dict['typtype']
+        res = dict()
 
         # If type is of Composite then we need to add members list in our
         # output
         if of_type == 'c':
             # To display in properties
-            res = self._additional_properties_composite(rset['rows'])
+            res = self._additional_properties_composite(rows)
 
         # If type is of ENUM then we need to add labels in our output
         if of_type == 'e':
@@ -511,7 +526,7 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             properties_list = []
             # To display in enum grid
             enum_list = []
-            for row in rset['rows']:
+            for row in rows:
                 properties_list.append(row['enumlabel'])
                 enum_list.append({'label': row['enumlabel']})
 
@@ -522,7 +537,7 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         # If type is of Range then we need to add collation,subtype etc in our
         # output
         if of_type == 'r':
-            range_dict = dict(rset['rows'][0])
+            range_dict = dict(rows[0])
             res.update(range_dict)
 
         if 'seclabels' in copy_dict and copy_dict['seclabels'] is not None:
@@ -596,21 +611,69 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=acl)
 
+        copy_dict = self._format_properties(copy_dict, acl['rows'])
+
+        # Calling function to check and additional properties if available
+        copy_dict.update(self.additional_properties(copy_dict, tid))
+
+        return True, copy_dict
+
+    @staticmethod
+    def _format_properties(copy_dict, acl):
+        """
+        This function is used to add the privileges of the type to its
+        properties.
+        :param copy_dict: properties of the type
+        :param acl: privileges of the type
+        :return:
+        """
         # We will set get privileges from acl sql so we don't need
         # it from properties sql
         copy_dict['typacl'] = []
 
-        for row in acl['rows']:
+        for row in acl:
             priv = parse_priv_from_db(row)
             if row['deftype'] in copy_dict:
                 copy_dict[row['deftype']].append(priv)
             else:
                 copy_dict[row['deftype']] = [priv]
 
-        # Calling function to check and additional properties if available
-        copy_dict.update(self.additional_properties(copy_dict, tid))
+        return copy_dict
 
-        return True, copy_dict
+    def _fetch_additional_rows(self, rows):
+        """
+        This function is used to fetch the members of the composite types,
+        the labels of the enum types and the details of the range types of
+        the given types at once, grouped by the oid of the type.
+        :param rows: properties of the types
+        :return:
+        """
+        additional = dict()
+        for of_type, key in (('c', 'attrelid'), ('e', 'enumtypid'),
+                             ('r', 'rngtypid')):
+            render_args = {'type': of_type}
+            if of_type == 'c':
+                render_args['typrelids'] = [
+                    row['typrelid'] for row in rows if row['typtype'] == 'c']
+                oids = render_args['typrelids']
+            else:
+                render_args['tids'] = [
+                    row['oid'] for row in rows if row['typtype'] == of_type]
+                oids = render_args['tids']
+
+            if not oids:
+                continue
+
+            SQL = render_template("/".join([self.template_path,
+                                            'additional_properties.sql']),
+                                  **render_args)
+            status, rset = self.conn.execute_dict(SQL)
+            if not status:
+                return False, rset
+
+            additional.update(self.group_rows_by_oid(rset['rows'], key))
+
+        return True, additional
 
     @check_precondition
     def get_collations(self, gid, sid, did, scid, tid=None):
@@ -1010,6 +1073,9 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            # The type names cached for the database are stale now.
+            self.manager.invalidate_type_names(did)
+
             if 'schema' in data:
                 # we need scid to update in browser tree
                 SQL = render_template("/".join([self.template_path,
@@ -1064,6 +1130,8 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            self.manager.invalidate_type_names(did)
+
             SQL = render_template("/".join([self.template_path,
                                             'get_scid.sql']), tid=tid)
 
@@ -1158,6 +1226,8 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
                 if not status:
                     return internal_server_error(errormsg=res)
 
+            self.manager.invalidate_type_names(did)
+
             return make_json_response(
                 success=1,
                 info=gettext("Type dropped"),
@@ -1497,17 +1567,35 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         :return:
         """
         res = dict()
-        SQL = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]),
-                              scid=scid, datlastsysoid=self.datlastsysoid)
-        status, rset = self.conn.execute_2darray(SQL)
+        SQL = render_template(
+            "/".join([self.template_path,
+                      self._PROPERTIES_SQL]),
+            scid=scid, datlastsysoid=self.datlastsysoid
+        )
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
+
+        SQL = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              scid=scid)
+        status, acl = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=acl)
+        acl = self.group_rows_by_oid(acl['rows'])
+
+        status, additional = self._fetch_additional_rows(rset['rows'])
+        if not status:
+            return internal_server_error(errormsg=additional)
 
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            copy_dict = self._format_properties(
+                dict(row), acl.get(row['oid'], []))
+            of_type = copy_dict['typtype']
+            copy_dict.update(self._format_additional_properties(
+                copy_dict, additional.get(
+                    copy_dict['typrelid'] if of_type == 'c' else
+                    copy_dict['oid'], [])))
+            res[row['name']] = copy_dict
 
         return res
 
@@ -11,21 +11,29 @@ FROM pg_attribute att
     LEFT OUTER JOIN pg_type b ON t.typelem=b.oid
     LEFT OUTER JOIN pg_collation c ON att.attcollation=c.oid
     LEFT OUTER JOIN pg_namespace nspc ON c.collnamespace=nspc.oid
+{% if typrelids %}
+    WHERE att.attrelid IN ({{ typrelids|join(', ') }})
+{% else %}
     WHERE att.attrelid = {{typrelid}}::oid
+{% endif %}
     ORDER by attnum;
 {% endif %}
 
 {# The SQL given below will fetch enum type#}
 {% if type == 'e' %}
-SELECT enumlabel
+SELECT {% if tids %}enumtypid, {% endif %}enumlabel
 FROM pg_enum
+{% if tids %}
+    WHERE enumtypid IN ({{ tids|join(', ') }})
+{% else %}
     WHERE enumtypid={{tid}}::oid
+{% endif %}
     ORDER by enumsortorder
 {% endif %}
 
 {# The SQL given below will fetch range type#}
 {% if type == 'r' %}
-SELECT rngsubtype, st.typname,
+SELECT {% if tids %}rngtypid, {% endif %}rngsubtype, st.typname,
     rngcollation,
     CASE WHEN n.nspname IS NOT NULL THEN concat(quote_ident(n.nspname), '.', quote_ident(col.collname)) ELSE col.collname END AS collname,
     rngsubopc, opc.opcname,
@@ -35,5 +43,9 @@ FROM pg_range
     LEFT JOIN pg_collation col ON col.oid=rngcollation
     LEFT JOIN pg_namespace n ON col.collnamespace=n.oid
     LEFT JOIN pg_opclass opc ON opc.oid=rngsubopc
+{% if tids %}
+    WHERE rngtypid IN ({{ tids|join(', ') }});
+{% else %}
     WHERE rngtypid={{tid}}::oid;
 {% endif %}
+{% endif %}
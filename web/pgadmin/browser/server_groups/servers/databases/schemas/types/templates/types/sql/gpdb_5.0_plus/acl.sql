@@ -1,4 +1,7 @@
 SELECT
+{% if not tid %}
+  NULL::oid AS oid,
+{% endif %}
   'typacl' AS deftype,
   'PUBLIC' AS grantee,
   NULL     AS grantor,
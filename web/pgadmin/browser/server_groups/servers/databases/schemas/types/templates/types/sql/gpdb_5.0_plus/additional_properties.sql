@@ -9,26 +9,38 @@ FROM pg_attribute att
     JOIN pg_type t ON t.oid=atttypid
     JOIN pg_namespace nsp ON t.typnamespace=nsp.oid
     LEFT OUTER JOIN pg_type b ON t.typelem=b.oid
+{% if typrelids %}
+    WHERE att.attrelid IN ({{ typrelids|join(', ') }})
+{% else %}
     WHERE att.attrelid = {{typrelid}}::oid
+{% endif %}
     ORDER by attnum;
 {% endif %}
 
 {# The SQL given below will fetch enum type#}
 {% if type == 'e' %}
-SELECT enumlabel
+SELECT {% if tids %}enumtypid, {% endif %}enumlabel
 FROM pg_enum
+{% if tids %}
+    WHERE enumtypid IN ({{ tids|join(', ') }})
+{% else %}
     WHERE enumtypid={{tid}}::oid
+{% endif %}
     ORDER by enumsortorder
 {% endif %}
 
 {# The SQL given below will fetch range type#}
 {% if type == 'r' %}
-SELECT rngsubtype, st.typname,
+SELECT {% if tids %}rngtypid, {% endif %}rngsubtype, st.typname,
     rngcollation, NULL AS collname,
     rngsubopc, opc.opcname,
     rngcanonical, rngsubdiff
 FROM pg_range
     LEFT JOIN pg_type st ON st.oid=rngsubtype
     LEFT JOIN pg_opclass opc ON opc.oid=rngsubopc
+{% if tids %}
+    WHERE rngtypid IN ({{ tids|join(', ') }});
+{% else %}
     WHERE rngtypid={{tid}}::oid;
 {% endif %}
+{% endif %}
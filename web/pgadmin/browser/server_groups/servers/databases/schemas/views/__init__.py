@@ -23,9 +23,10 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
     SchemaChildModule, parse_rule_definition, VacuumSettings, get_schema
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, get_nodes_window, \
+    nodes_window_result
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
@@ -435,12 +436,18 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
-        Lists all views under the Views Collection node
+        Lists all views (of the window requested, see get_nodes_window)
+        under the Views Collection node
         """
+        try:
+            window = get_nodes_window()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
         res = []
         SQL = render_template("/".join(
             [self.template_path, self._SQL_PREFIX + self._NODES_SQL]),
-            scid=scid)
+            scid=scid, **window)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
@@ -457,6 +464,7 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
 
         return make_json_response(
             data=res,
+            result=nodes_window_result(window, rset['rows']),
             status=200
         )
 
@@ -498,11 +506,20 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
+        return True, self._format_properties(res['rows'][0],
+                                             dataclres['rows'])
 
-        result = res['rows'][0]
+    def _format_properties(self, result, acl):
+        """
+        This function is used to merge the privileges and the formatted
+        security labels & variables into the properties of the view.
+        :param result: properties of the view
+        :param acl: privileges of the view
+        :return:
+        """
+        for row in acl:
+            priv = parse_priv_from_db(row)
+            result.setdefault(row['deftype'], []).append(priv)
 
         # sending result to formtter
         frmtd_reslt = self.formatter(result)
@@ -510,7 +527,7 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
         # merging formated result with main result again
         result.update(frmtd_reslt)
 
-        return True, result
+        return result
 
     @staticmethod
     def formatter(result):
@@ -1664,17 +1681,25 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
 
         if not oid:
             SQL = render_template("/".join(
-                [self.template_path, self._SQL_PREFIX + self._NODES_SQL]),
-                did=did, scid=scid, datlastsysoid=self.datlastsysoid)
-            status, views = self.conn.execute_2darray(SQL)
+                [self.template_path, self._SQL_PREFIX + self._PROPERTIES_SQL]
+            ), scid=scid, datlastsysoid=self.datlastsysoid)
+            status, views = self.conn.execute_dict(SQL)
             if not status:
                 current_app.logger.error(views)
                 return False
 
+            SQL = render_template("/".join(
+                [self.template_path, self._SQL_PREFIX + self._ACL_SQL]),
+                scid=scid)
+            status, acl = self.conn.execute_dict(SQL)
+            if not status:
+                current_app.logger.error(acl)
+                return False
+            acl = self.group_rows_by_oid(acl['rows'])
+
             for row in views['rows']:
-                status, data = self._fetch_properties(scid, row['oid'])
-                if status:
-                    res[row['name']] = data
+                res[row['name']] = self._format_properties(
+                    row, acl.get(row['oid'], []))
         else:
             status, data = self._fetch_properties(scid, oid)
             if not status:
@@ -2081,83 +2106,84 @@ class MViewNode(ViewNode, VacuumSettings):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]), vid=vid)
+        status, dataclres = self.conn.execute_dict(SQL)
+        if not status:
+            return False, internal_server_error(errormsg=dataclres)
+
+        return True, self._format_mview_properties(res['rows'][0],
+                                                   dataclres['rows'])
+
+    def _format_mview_properties(self, result, acl):
+        """
+        This function is used to format the vacuum settings, privileges,
+        security labels & variables of the materialized view.
+        :param result: properties of the materialized view
+        :param acl: privileges of the materialized view
+        :return:
+        """
         # Set value based on
         # x: No set, t: true, f: false
-        res['rows'][0]['autovacuum_enabled'] = 'x' \
-            if res['rows'][0]['autovacuum_enabled'] is None else \
-            {True: 't', False: 'f'}[res['rows'][0]['autovacuum_enabled']]
+        result['autovacuum_enabled'] = 'x' \
+            if result['autovacuum_enabled'] is None else \
+            {True: 't', False: 'f'}[result['autovacuum_enabled']]
 
-        res['rows'][0]['toast_autovacuum_enabled'] = 'x' \
-            if res['rows'][0]['toast_autovacuum_enabled'] is None else \
-            {True: 't', False: 'f'}[res['rows'][0]['toast_autovacuum_enabled']]
+        result['toast_autovacuum_enabled'] = 'x' \
+            if result['toast_autovacuum_enabled'] is None else \
+            {True: 't', False: 'f'}[result['toast_autovacuum_enabled']]
 
         # Enable custom autovaccum only if one of the options is set
         # or autovacuum is set
-        res['rows'][0]['autovacuum_custom'] = any([
-            res['rows'][0]['autovacuum_vacuum_threshold'],
-            res['rows'][0]['autovacuum_vacuum_scale_factor'],
-            res['rows'][0]['autovacuum_analyze_threshold'],
-            res['rows'][0]['autovacuum_analyze_scale_factor'],
-            res['rows'][0]['autovacuum_vacuum_cost_delay'],
-            res['rows'][0]['autovacuum_vacuum_cost_limit'],
-            res['rows'][0]['autovacuum_freeze_min_age'],
-            res['rows'][0]['autovacuum_freeze_max_age'],
-            res['rows'][0]['autovacuum_freeze_table_age']]) \
-            or res['rows'][0]['autovacuum_enabled'] in ('t', 'f')
-
-        res['rows'][0]['toast_autovacuum'] = any([
-            res['rows'][0]['toast_autovacuum_vacuum_threshold'],
-            res['rows'][0]['toast_autovacuum_vacuum_scale_factor'],
-            res['rows'][0]['toast_autovacuum_analyze_threshold'],
-            res['rows'][0]['toast_autovacuum_analyze_scale_factor'],
-            res['rows'][0]['toast_autovacuum_vacuum_cost_delay'],
-            res['rows'][0]['toast_autovacuum_vacuum_cost_limit'],
-            res['rows'][0]['toast_autovacuum_freeze_min_age'],
-            res['rows'][0]['toast_autovacuum_freeze_max_age'],
-            res['rows'][0]['toast_autovacuum_freeze_table_age']]) \
-            or res['rows'][0]['toast_autovacuum_enabled'] in ('t', 'f')
-
-        res['rows'][0]['vacuum_settings_str'] = ''
-
-        if res['rows'][0]['reloptions'] is not None:
-            res['rows'][0]['vacuum_settings_str'] += '\n'.\
-                join(res['rows'][0]['reloptions'])
-
-        if res['rows'][0]['toast_reloptions'] is not None:
-            res['rows'][0]['vacuum_settings_str'] += '\n' \
-                if res['rows'][0]['vacuum_settings_str'] != "" else ""
-            res['rows'][0]['vacuum_settings_str'] += '\n'.\
+        result['autovacuum_custom'] = any([
+            result['autovacuum_vacuum_threshold'],
+            result['autovacuum_vacuum_scale_factor'],
+            result['autovacuum_analyze_threshold'],
+            result['autovacuum_analyze_scale_factor'],
+            result['autovacuum_vacuum_cost_delay'],
+            result['autovacuum_vacuum_cost_limit'],
+            result['autovacuum_freeze_min_age'],
+            result['autovacuum_freeze_max_age'],
+            result['autovacuum_freeze_table_age']]) \
+            or result['autovacuum_enabled'] in ('t', 'f')
+
+        result['toast_autovacuum'] = any([
+            result['toast_autovacuum_vacuum_threshold'],
+            result['toast_autovacuum_vacuum_scale_factor'],
+            result['toast_autovacuum_analyze_threshold'],
+            result['toast_autovacuum_analyze_scale_factor'],
+            result['toast_autovacuum_vacuum_cost_delay'],
+            result['toast_autovacuum_vacuum_cost_limit'],
+            result['toast_autovacuum_freeze_min_age'],
+            result['toast_autovacuum_freeze_max_age'],
+            result['toast_autovacuum_freeze_table_age']]) \
+            or result['toast_autovacuum_enabled'] in ('t', 'f')
+
+        result['vacuum_settings_str'] = ''
+
+        if result['reloptions'] is not None:
+            result['vacuum_settings_str'] += '\n'.\
+                join(result['reloptions'])
+
+        if result['toast_reloptions'] is not None:
+            result['vacuum_settings_str'] += '\n' \
+                if result['vacuum_settings_str'] != "" else ""
+            result['vacuum_settings_str'] += '\n'.\
                 join(map(lambda o: self.TOAST_STR + o,
-                         res['rows'][0]['toast_reloptions']))
+                         result['toast_reloptions']))
 
-        res['rows'][0]['vacuum_settings_str'] = res['rows'][0][
+        result['vacuum_settings_str'] = result[
             'vacuum_settings_str'
         ].replace('=', ' = ')
 
-        SQL = render_template("/".join(
-            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]), vid=vid)
-        status, dataclres = self.conn.execute_dict(SQL)
-        if not status:
-            return False, internal_server_error(errormsg=res)
-
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
-
-        result = res['rows'][0]
-
-        # sending result to formtter
-        frmtd_reslt = self.formatter(result)
-
-        # merging formated result with main result again
-        result.update(frmtd_reslt)
+        result = self._format_properties(result, acl)
 
         result['vacuum_table'] = self.parse_vacuum_data(
             self.conn, result, 'table')
         result['vacuum_toast'] = self.parse_vacuum_data(
             self.conn, result, 'toast')
 
-        return True, result
+        return result
 
     @check_precondition
     def refresh_data(self, gid, sid, did, scid, vid):
@@ -2296,16 +2322,23 @@ class MViewNode(ViewNode, VacuumSettings):
         """
         res = dict()
         SQL = render_template("/".join(
-            [self.template_path, self._SQL_PREFIX + self._NODES_SQL]),
+            [self.template_path, self._SQL_PREFIX + self._PROPERTIES_SQL]),
             did=did, scid=scid, datlastsysoid=self.datlastsysoid)
-        status, rset = self.conn.execute_2darray(SQL)
+        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=res)
+            return internal_server_error(errormsg=rset)
+
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]),
+            scid=scid)
+        status, acl = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=acl)
+        acl = self.group_rows_by_oid(acl['rows'])
 
         for row in rset['rows']:
-            status, data = self._fetch_mview_properties(did, scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            res[row['name']] = self._format_mview_properties(
+                row, acl.get(row['oid'], []))
 
         return res
 
@@ -17,8 +17,8 @@ SELECT
     description AS comment,
     pg_get_viewdef(c.oid) AS definition,
     {# ============= Checks if it is system view ================ #}
-    {% if vid and datlastsysoid %}
-    CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
+    {% if datlastsysoid %}
+    CASE WHEN c.oid <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
     {% endif %}
     array_to_string(c.relacl::text[], ', ') AS acl,
     (SELECT array_agg(provider || '=' || label) FROM pg_seclabels sl1 WHERE sl1.objoid=c.oid AND sl1.objsubid=0) AS seclabels,
@@ -1,5 +1,8 @@
 {# ============================ Get ACLs ========================= #}
 SELECT
+{% if not vid %}
+  NULL::oid AS oid,
+{% endif %}
   'datacl' AS deftype,
   'PUBLIC' AS grantee,
   NULL     AS grantor,
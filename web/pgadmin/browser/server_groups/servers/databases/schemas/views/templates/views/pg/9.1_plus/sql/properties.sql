@@ -11,8 +11,8 @@ SELECT
     pg_get_viewdef(c.oid) AS definition,
     array_to_string(c.relacl::text[], ', ') AS acl,
     {#=============Checks if it is system view================#}
-    {% if vid and datlastsysoid %}
-    CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
+    {% if datlastsysoid %}
+    CASE WHEN c.oid <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
     {% endif %}
     (SELECT
         array_agg(provider || '=' || label)
@@ -8,6 +8,12 @@ WHERE
     AND c.oid = {{vid}}::oid
 {% elif scid %}
     AND c.relnamespace = {{scid}}::oid
+{% if prefix %}
+    AND c.relname LIKE {{ prefix|qtLiteral }}
+{% endif %}
+{% if after %}
+    AND (c.relname, c.oid) > ({{ after_name|qtLiteral }}::name, {{ after }}::oid)
+{% endif %}
 ORDER BY
-    c.relname
+    c.relname, c.oid{% if limit %} LIMIT {{ limit }}{% endif %}
 {% endif %}
\ No newline at end of file
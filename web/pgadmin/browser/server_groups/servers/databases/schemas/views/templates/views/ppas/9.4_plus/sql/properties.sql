@@ -14,8 +14,8 @@ SELECT
     array_to_string(c.relacl::text[], ', ') AS acl,
     pg_get_viewdef(c.oid) AS definition,
     {# ===== Checks if it is system view ===== #}
-    {% if vid and datlastsysoid %}
-    CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
+    {% if datlastsysoid %}
+    CASE WHEN c.oid <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
     {% endif %}
     (SELECT
         array_agg(provider || '=' || label)
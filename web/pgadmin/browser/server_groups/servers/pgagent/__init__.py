@@ -23,11 +23,48 @@ from pgadmin.browser.server_groups import servers
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone, success_return
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.driver.probes import register_probe
 from pgadmin.utils.preferences import Preferences
 from pgadmin.browser.server_groups.servers.pgagent.utils \
     import format_schedule_data, format_step_data
 
 
+@register_probe('pgagent')
+def probe_pgagent(manager, conn):
+    """
+    Returns the pgAgent information ({'has_connstr': ...}) of the maintenance
+    database, None if pgAgent is not installed (or, the user is not allowed
+    to manage the jobs).
+    """
+    status, res = conn.execute_dict("""
+SELECT
+    has_table_privilege(
+      'pgagent.pga_job', 'INSERT, SELECT, UPDATE'
+    ) has_priviledge,
+    EXISTS(
+        SELECT 1 FROM information_schema.columns
+        WHERE
+            table_schema='pgagent' AND table_name='pga_jobstep' AND
+            column_name='jstconnstr'
+    ) has_connstr
+WHERE EXISTS(
+    SELECT has_schema_privilege('pgagent', 'USAGE')
+    WHERE EXISTS(
+        SELECT cl.oid FROM pg_class cl
+        LEFT JOIN pg_namespace ns ON ns.oid=relnamespace
+        WHERE relname='pga_job' AND nspname='pgagent'
+    )
+)
+""")
+    if not status:
+        return False, res
+
+    if not res['rows'] or not res['rows'][0]['has_priviledge']:
+        return True, None
+
+    return True, {'has_connstr': res['rows'][0]['has_connstr']}
+
+
 class JobModule(CollectionNodeModule):
     _NODE_TYPE = 'pga_job'
     _COLLECTION_LABEL = _("pgAgent Jobs")
@@ -51,35 +88,12 @@ class JobModule(CollectionNodeModule):
         if hasattr(self, 'show_node') and not self.show_node:
             return False
 
-        conn = manager.connection()
-
         if manager.server_type == 'gpdb':
             return False
 
-        status, res = conn.execute_scalar("""
-SELECT
-    has_table_privilege(
-      'pgagent.pga_job', 'INSERT, SELECT, UPDATE'
-    ) has_priviledge
-WHERE EXISTS(
-    SELECT has_schema_privilege('pgagent', 'USAGE')
-    WHERE EXISTS(
-        SELECT cl.oid FROM pg_class cl
-        LEFT JOIN pg_namespace ns ON ns.oid=relnamespace
-        WHERE relname='pga_job' AND nspname='pgagent'
-    )
-)
-""")
+        status, res = manager.probe('pgagent')
         if status and res:
-            status, res = conn.execute_dict("""
-SELECT EXISTS(
-        SELECT 1 FROM information_schema.columns
-        WHERE
-            table_schema='pgagent' AND table_name='pga_jobstep' AND
-            column_name='jstconnstr'
-    ) has_connstr""")
-
-            manager.db_info['pgAgent'] = res['rows'][0]
+            manager.db_info['pgAgent'] = res
             return True
         return False
 
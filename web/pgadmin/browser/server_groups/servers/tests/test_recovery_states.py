@@ -0,0 +1,102 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import threading
+import time
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups import servers
+
+
+class _Manager(object):
+    def __init__(self, sid):
+        self.sid = sid
+        self.version = 120000
+
+
+class _PgConnection(object):
+    closed = 0
+
+    def __init__(self, cancelled):
+        self.cancelled = cancelled
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+class _Connection(object):
+    def __init__(self, sid, cancelled):
+        self.sid = sid
+        self.conn = _PgConnection(cancelled)
+
+
+class TestRecoveryStates(BaseTestGenerator):
+    """ This class will test the recovery states of the server group. """
+
+    scenarios = [
+        ('Check the recovery state of the servers at once', dict(
+            hung=None)),
+        ('Hung server does not block the others', dict(hung=1)),
+    ]
+
+    def setUp(self):
+        self.cancelled = {}
+        self.checked = []
+
+    def tearDown(self):
+        for cancelled in self.cancelled.values():
+            cancelled.set()
+
+    def recovery_state(self, conn, version):
+        self.checked.append(conn.sid)
+        if conn.sid == self.hung:
+            self.cancelled[conn.sid].wait(5)
+        else:
+            time.sleep(0.05)
+        return True, None, conn.sid == 2, False
+
+    def runTest(self):
+        managers = [_Manager(sid) for sid in range(4)]
+        for manager in managers:
+            self.cancelled[manager.sid] = threading.Event()
+        probes = [(manager, _Connection(manager.sid,
+                                        self.cancelled[manager.sid]))
+                  for manager in managers]
+
+        with patch.object(servers, 'recovery_state', self.recovery_state), \
+                patch.object(config, 'SERVER_STATUS_TIMEOUT', 1), \
+                patch.object(config, 'SERVER_STATUS_CACHE_TTL', 60), \
+                self.app.test_request_context():
+            start = time.time()
+            states = servers.recovery_states(probes)
+            # Checked at the same time (the hung one is timed out)
+            self.assertTrue(time.time() - start < 2)
+
+            for sid, (status, res, in_recovery, wal_paused) in \
+                    enumerate(states):
+                self.assertTrue(status)
+                if sid == self.hung:
+                    self.assertIsNone(in_recovery)
+                else:
+                    self.assertEqual(in_recovery, sid == 2)
+
+            # Only the timed out check is cancelled
+            self.assertEqual(
+                [sid for sid in range(4) if self.cancelled[sid].is_set()],
+                [] if self.hung is None else [self.hung])
+
+            # The states are reused from the cache
+            self.assertEqual(servers.recovery_states(probes), states)
+            self.assertEqual(sorted(self.checked), list(range(4)))
+
+            # Checked again, once invalidated
+            servers.invalidate_recovery_state(managers[2])
+            servers.recovery_states(probes)
+            self.assertEqual(self.checked.count(2), 2)
@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.browser.utils import get_nodes_window, nodes_window_result
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class NodesWindowTestCase(BaseTestGenerator):
+    """ This class will test the window of the nodes of the collections. """
+
+    scenarios = [
+        ('All the nodes', dict(
+            query_string='', window=dict(), result=None)),
+        ('First window', dict(
+            query_string='limit=2', window=dict(limit=2),
+            result={'next': '2:b'})),
+        ('Next window', dict(
+            query_string='limit=2&after=16384%3Aa%3Ab',
+            window=dict(limit=2, after=16384, after_name='a:b'),
+            result={'next': '2:b'})),
+        ('Last window', dict(
+            query_string='limit=5&after=16384:a',
+            rows=[{'oid': 16390, 'name': 'c'}],
+            window=dict(limit=5, after=16384, after_name='a'),
+            result={'next': None})),
+        ('Nodes with the name prefix', dict(
+            query_string='limit=2&prefix=a_b%25c',
+            window=dict(limit=2, prefix='a\\_b\\%c%'),
+            result={'next': '2:b'})),
+        ('Nodes not ordered by the name', dict(
+            query_string='limit=2&after=5', by_name=False,
+            window=dict(limit=2, after=5), result={'next': '2'})),
+        ('Invalid limit', dict(
+            query_string='limit=0', window=None, result=None)),
+        ('Invalid id of the last node', dict(
+            query_string='limit=10&after=abc:a', window=None, result=None)),
+        ('Name of the last node missing', dict(
+            query_string='limit=10&after=16384', window=None, result=None)),
+    ]
+
+    def runTest(self):
+        rows = getattr(self, 'rows', [
+            {'oid': 1, 'name': 'a'}, {'oid': 2, 'name': 'b'}
+        ])
+        by_name = getattr(self, 'by_name', True)
+
+        with self.app.test_request_context(query_string=self.query_string):
+            if self.window is None:
+                self.assertRaises(ValueError, get_nodes_window, by_name)
+                return
+
+            window = get_nodes_window(by_name)
+
+        self.assertEqual(window, self.window)
+        self.assertEqual(
+            nodes_window_result(
+                window, rows, name_field='name' if by_name else None
+            ),
+            self.result
+        )
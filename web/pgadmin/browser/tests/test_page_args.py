@@ -0,0 +1,42 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.browser.utils import get_page_args
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class PageArgsTestCase(BaseTestGenerator):
+    """ This class will test the paging arguments of the requests. """
+
+    scenarios = [
+        ('Default values', dict(
+            query_string='', page=dict(limit=None, offset=0))),
+        ('Given values', dict(
+            query_string='limit=10&offset=20',
+            page=dict(limit=10, offset=20))),
+        ('Cursor', dict(
+            query_string='cursor=0', defaults=dict(limit=None, cursor=None),
+            page=dict(limit=None, cursor=0))),
+        ('Other arguments ignored', dict(
+            query_string='offset=5&after=[1]',
+            page=dict(limit=None, offset=5))),
+        ('Invalid limit', dict(query_string='limit=0', page=None)),
+        ('Invalid offset', dict(query_string='offset=-1', page=None)),
+        ('Not a number', dict(query_string='limit=abc', page=None)),
+    ]
+
+    def runTest(self):
+        defaults = getattr(self, 'defaults', dict(limit=None, offset=0))
+
+        with self.app.test_request_context(query_string=self.query_string):
+            if self.page is None:
+                self.assertRaises(ValueError, get_page_args, **defaults)
+                return
+
+            self.assertEqual(get_page_args(**defaults), self.page)
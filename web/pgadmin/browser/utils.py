@@ -85,6 +85,100 @@ def is_version_in_range(sversion, min_ver, max_ver):
     return False
 
 
+def get_page_args(**defaults):
+    """
+    Returns the paging arguments of the request, given with their default
+    values, i.e. get_page_args(limit=None, offset=0) for
+    ?limit=100&offset=200
+
+    - limit: maximum number of the items returned (at least 1)
+    - offset, cursor: number (or, position) of the items to be skipped
+
+    :raises ValueError: if the arguments are invalid
+    """
+    args = flask.request.args
+    page = dict(defaults)
+
+    for arg in defaults:
+        if arg not in args:
+            continue
+        if not args[arg].isdigit() or \
+                int(args[arg]) < (1 if arg == 'limit' else 0):
+            raise ValueError(
+                gettext("Invalid value for '{0}': {1}").format(arg, args[arg])
+            )
+        page[arg] = int(args[arg])
+
+    return page
+
+
+def get_nodes_window(by_name=True):
+    """
+    Returns the window of the nodes of a collection requested by the browser
+    tree, as the parameters of the nodes.sql template, i.e.
+    /nodes/[Parent URL]/?limit=1000&prefix=sales_&after=16384:sales_2019
+
+    - limit: maximum number of the nodes returned
+    - prefix: only the nodes, whose name starts with it (LIKE pattern)
+    - after: only the nodes after the last node of the previous window, as
+      returned in its result (see nodes_window_result), i.e. '<id>:<name>'
+      of that node, or only '<id>' for the nodes not ordered by their names
+      (by_name is False). The name is not looked up by the id, as the node
+      may have been dropped since.
+
+    An empty window (all the nodes) is returned without these arguments.
+
+    :raises ValueError: if the arguments are invalid
+    """
+    args = flask.request.args
+    window = dict()
+
+    def invalid(arg):
+        return ValueError(
+            gettext("Invalid value for '{0}': {1}").format(arg, args[arg])
+        )
+
+    limit = get_page_args(limit=None)['limit']
+    if limit is not None:
+        window['limit'] = limit
+
+    if 'after' in args:
+        node_id, sep, name = args['after'].partition(':')
+        if not node_id.isdigit() or (by_name and not sep):
+            raise invalid('after')
+        window['after'] = int(node_id)
+        if by_name:
+            window['after_name'] = name
+
+    prefix = args.get('prefix', None)
+    if prefix:
+        window['prefix'] = prefix.replace('\\', '\\\\').replace(
+            '%', '\\%').replace('_', '\\_') + '%'
+
+    return window
+
+
+def nodes_window_result(window, rows, id_field='oid', name_field='name'):
+    """
+    Returns the result for the response of a window of the nodes, i.e.
+    {'next': '<id>:<name>'} of the last node (only '<id>', if name_field is
+    None), to be passed as 'after' for the next window, if there may be more
+    nodes after this window, {'next': None} otherwise, and None if all the
+    nodes were requested.
+    """
+    if 'limit' not in window:
+        return None
+
+    if len(rows) < window['limit']:
+        return {'next': None}
+
+    last = rows[-1]
+    if name_field is None:
+        return {'next': str(last[id_field])}
+
+    return {'next': '{0}:{1}'.format(last[id_field], last[name_field])}
+
+
 class PGChildModule(object):
     """
     class PGChildModule
@@ -322,7 +416,7 @@ class NodeView(with_metaclass(MethodViewType, View)):
         for c in commands:
             cmd = c['cmd'].replace('.', '-')
             if c['with_id']:
-                blueprint.add_url_rule(
+                blueprint.add_deferred_url_rule(
                     '/{0}{1}'.format(
                         c['cmd'], id_url if c['req'] else url
                     ),
@@ -335,7 +429,7 @@ class NodeView(with_metaclass(MethodViewType, View)):
                     methods=c['methods']
                 )
             else:
-                blueprint.add_url_rule(
+                blueprint.add_deferred_url_rule(
                     '/{0}'.format(c['cmd']),
                     view_func=cls.as_view(
                         cmd, cmd=c['cmd']
@@ -13,6 +13,8 @@ the long running background-processes.
 """
 from flask import url_for
 from flask_security import login_required
+
+import config
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response, gone, success_return
 
@@ -44,7 +46,7 @@ class BGProcessModule(PgAdminModule):
         """
         return [
             'bgprocess.status', 'bgprocess.detailed_status',
-            'bgprocess.acknowledge', 'bgprocess.list',
+            'bgprocess.wait_status', 'bgprocess.acknowledge', 'bgprocess.list',
             'bgprocess.stop_process'
         ]
 
@@ -88,6 +90,35 @@ def status(pid, out=-1, err=-1):
         return gone(errormsg=str(lerr))
 
 
+@blueprint.route(
+    '/<pid>/<int:out>/<int:err>/wait/', methods=['GET'],
+    endpoint='wait_status'
+)
+@login_required
+def wait_status(pid, out, err):
+    """
+    Wait for the new output, or the completion of the process running in
+    background (at most BGPROCESS_STATUS_WAIT_TIMEOUT seconds), instead of
+    polling for it.
+
+    Args:
+        pid:  Process ID
+        out: position of the last stdout fetched
+        err: position of the last stderr fetched
+
+    Returns:
+        Status of the process and logs
+    """
+    try:
+        process = BatchProcess(id=pid)
+
+        return make_response(response=process.wait(
+            out, err, config.BGPROCESS_STATUS_WAIT_TIMEOUT
+        ))
+    except LookupError as lerr:
+        return gone(errormsg=str(lerr))
+
+
 @blueprint.route('/<pid>', methods=['PUT'], endpoint='acknowledge')
 @login_required
 def acknowledge(pid):
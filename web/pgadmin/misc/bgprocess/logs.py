@@ -0,0 +1,158 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Reading the stdout/stderr logs of the background processes, written by the
+process executor (process_executor.py).
+
+<stream> (i.e. 'out', or 'err') is a sequence of records, each made of the
+(timestamp, length) header, followed by the line, and <stream>.idx holds the
+end offset of each record, appended once the record has been written. The
+position of the client is the number of the records read, hence a batch of
+the records is read by two seeks, and two reads (of the index, and of the
+log), and only the records written completely are read.
+
+The logs of the processes started by the earlier versions of pgAdmin (i.e.
+lines of 'timestamp,line' in <stream>, without the index) are read by the
+byte offset.
+"""
+
+import os
+import re
+import struct
+
+LOG_RECORD_HEADER = struct.Struct('<qI')
+LOG_INDEX_ENTRY = struct.Struct('<Q')
+
+# Number of the lines returned by a status request (of each log)
+LOG_BATCH_SIZE = 8192
+
+# Interval (in seconds) between the checks for the new lines, while waiting
+LOG_WAIT_INTERVAL = 0.25
+
+_LEGACY_LOG_LINE = re.compile(r"(\d+),(.*$)")
+
+
+def _index_file(logfile):
+    return logfile + '.idx'
+
+
+def log_size(logfile):
+    """
+    Returns the position at the end of the log (the number of the records,
+    or the size of the log written by the earlier versions), None if the log
+    does not exist (yet).
+    """
+    try:
+        return os.stat(_index_file(logfile)).st_size // LOG_INDEX_ENTRY.size
+    except OSError:
+        pass
+
+    try:
+        return os.stat(logfile).st_size
+    except OSError:
+        return None
+
+
+def read_log(logfile, pos, ctime, ecode=None, enc='utf-8',
+             limit=LOG_BATCH_SIZE):
+    """
+    Reads the lines of the log from the given position.
+
+    :param logfile: path of the log
+    :param pos: position to read from (returned by the earlier call)
+    :param ctime: lines logged after this time (as an integer of
+        '%y%m%d%H%M%S%f') are not read, hence the lines of the stdout, and
+        stderr read at the same time can be merged in the order
+    :param ecode: exit code of the process (None, if still running)
+    :param enc: encoding of the lines
+    :param limit: maximum number of the lines read
+    :returns: (lines, position, completed), where lines is a list of
+        [timestamp, line], and completed is True, once the process has
+        exited, and all of its lines have been read
+    """
+    if not os.path.isfile(_index_file(logfile)):
+        return _read_legacy_log(logfile, pos, ctime, ecode, enc, limit)
+
+    lines = []
+
+    with open(_index_file(logfile), 'rb') as f:
+        # The end of the previous record is the start of the first one.
+        start_pos = max(pos - 1, 0)
+        f.seek(start_pos * LOG_INDEX_ENTRY.size)
+        data = f.read((pos - start_pos + limit) * LOG_INDEX_ENTRY.size)
+
+    data = data[:len(data) - len(data) % LOG_INDEX_ENTRY.size]
+    ends = [end for end, in LOG_INDEX_ENTRY.iter_unpack(data)]
+    start = ends.pop(0) if pos > 0 and ends else 0
+
+    if not ends:
+        return lines, pos, ecode is not None
+
+    with open(logfile, 'rb') as f:
+        f.seek(start)
+        data = f.read(ends[-1] - start)
+
+    completed = len(ends) < limit
+    offset = 0
+
+    for end in ends:
+        ts, length = LOG_RECORD_HEADER.unpack_from(data, offset)
+        if ts > ctime:
+            completed = False
+            break
+
+        offset += LOG_RECORD_HEADER.size
+        lines.append([
+            str(ts), data[offset:offset + length].decode(enc, 'replace')
+        ])
+        offset = end - start
+        pos += 1
+
+    return lines, pos, completed and ecode is not None
+
+
+def _read_legacy_log(logfile, pos, ctime, ecode, enc, limit):
+    lines = []
+    completed = True
+    idx = 0
+    ctime = str(ctime)
+
+    if not os.path.isfile(logfile):
+        return lines, 0, False
+
+    with open(logfile, 'rb') as f:
+        eofs = os.fstat(f.fileno()).st_size
+        f.seek(pos, 0)
+        if pos == eofs and ecode is None:
+            completed = False
+
+        while pos < eofs:
+            idx += 1
+            line = f.readline()
+            line = line.decode(enc, 'replace')
+            r = _LEGACY_LOG_LINE.split(line)
+            if len(r) < 3:
+                # ignore this line
+                pos = f.tell()
+                continue
+            if r[1] > ctime:
+                completed = False
+                break
+            lines.append([r[1], r[2]])
+            pos = f.tell()
+            if idx >= limit:
+                completed = False
+                break
+            if pos == eofs:
+                if ecode is None:
+                    completed = False
+                break
+
+    return lines, pos, completed
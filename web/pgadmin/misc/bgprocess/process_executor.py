@@ -33,6 +33,7 @@ OUTDIR - Output directory
 # To make print function compatible with python2 & python3
 import sys
 import os
+import struct
 from datetime import datetime, timedelta, tzinfo
 from subprocess import Popen, PIPE
 from threading import Thread
@@ -45,6 +46,15 @@ _fs_encoding = None
 _out_dir = None
 _log_file = None
 
+# Format of the stdout/stderr logs (see logs.py, this cannot be at common
+# place as this file executes separately from pgadmin).
+#
+# <stream>: records of the (timestamp, length) header, followed by the line
+# <stream>.idx: end offset of each record in <stream>, appended once the
+#               record is written, hence the indexed records are complete.
+_LOG_RECORD_HEADER = struct.Struct('<qI')
+_LOG_INDEX_ENTRY = struct.Struct('<Q')
+
 
 def _log(msg):
     with open(_log_file, 'a') as fp:
@@ -171,6 +181,8 @@ class ProcessLogger(Thread):
         self.process = None
         self.stream = None
         self.logger = open(os.path.join(_out_dir, stream_type), 'wb')
+        self.index = open(os.path.join(_out_dir, stream_type + '.idx'), 'wb')
+        self.offset = 0
 
     def attach_process_stream(self, process, stream):
         """
@@ -199,16 +211,25 @@ class ProcessLogger(Thread):
         # Write into log file
         if self.logger:
             if msg:
-                self.logger.write(
-                    get_current_time(
-                        format='%y%m%d%H%M%S%f'
-                    ).encode('utf-8')
-                )
-                self.logger.write(b',')
-                self.logger.write(
-                    msg.lstrip(b'\r\n' if _IS_WIN else b'\n')
-                )
-                self.logger.write(os.linesep.encode('utf-8'))
+                if not isinstance(msg, bytes):
+                    msg = msg.encode('utf-8')
+
+                ctime = int(get_current_time(format='%y%m%d%H%M%S%f'))
+                records = []
+                ends = []
+
+                for line in msg.splitlines() or [b'']:
+                    records.append(
+                        _LOG_RECORD_HEADER.pack(ctime, len(line)) + line
+                    )
+                    self.offset += len(records[-1])
+                    ends.append(_LOG_INDEX_ENTRY.pack(self.offset))
+
+                # The records are indexed, once written completely.
+                self.logger.write(b''.join(records))
+                self.logger.flush()
+                self.index.write(b''.join(ends))
+                self.index.flush()
 
             return True
         return False
@@ -228,6 +249,8 @@ class ProcessLogger(Thread):
         if self.logger:
             self.logger.close()
             self.logger = None
+            self.index.close()
+            self.index = None
 
 
 def update_status(**kw):
@@ -248,8 +271,12 @@ def update_status(**kw):
             if k in ('start_time', 'end_time', 'exit_code', 'pid')
         )
         _log('Updating the status:\n{0}'.format(json.dumps(status)))
-        with open(os.path.join(_out_dir, 'status'), 'w') as fp:
+        # Replace the status file at once, hence it is never read partially
+        # written, and pgAdmin detects the change by its inode.
+        status_file = os.path.join(_out_dir, 'status')
+        with open(status_file + '.tmp', 'w') as fp:
             json.dump(status, fp)
+        os.replace(status_file + '.tmp', status_file)
     else:
         raise ValueError("Please verify pid and db_file arguments.")
 
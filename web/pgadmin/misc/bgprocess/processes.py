@@ -14,6 +14,8 @@ Introduce a function to run the process executor in detached mode.
 import csv
 import os
 import sys
+import threading
+import time
 import psutil
 from abc import ABCMeta, abstractproperty, abstractmethod
 from datetime import datetime
@@ -34,11 +36,14 @@ from flask_security import current_user
 import config
 from pgadmin.model import Process, db
 from io import StringIO
+from .logs import log_size, read_log, LOG_WAIT_INTERVAL
+from .scheduler import Job, JobScheduler, PRIORITY_HIGH
 
 PROCESS_NOT_STARTED = 0
 PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
+PROCESS_QUEUED = 4
 PROCESS_NOT_FOUND = _("Could not find a process with the specified ID.")
 
 
@@ -52,6 +57,9 @@ def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
 
 
 class IProcessDesc(object, metaclass=ABCMeta):
+    # Priority of the process, when queued (see scheduler.py)
+    priority = PRIORITY_HIGH
+
     @abstractproperty
     def message(self):
         pass
@@ -321,7 +329,6 @@ class BatchProcess(object):
             python_binary_name = 'python{0}'.format(sys.version_info[0])
             interpreter = which(u_encode(python_binary_name), paths)
 
-        p = None
         cmd = [
             interpreter if interpreter is not None else 'python',
             executor, self.cmd
@@ -345,6 +352,57 @@ class BatchProcess(object):
         if cb is not None:
             cb(env)
 
+        def start_job():
+            if self.process_state == PROCESS_QUEUED:
+                self._start_queued(cmd, env)
+            else:
+                self._spawn(cmd, env)
+
+        get_scheduler().submit(
+            Job(
+                self.id, current_user.id, getattr(self.desc, 'sid', None),
+                getattr(self.desc, 'priority', PRIORITY_HIGH), start_job
+            ),
+            self._queued
+        )
+
+    def _queued(self, job):
+        """
+        Mark the process queued (the limits of the running processes have
+        been reached).
+        """
+        p = Process.query.filter_by(pid=self.id).first()
+        p.process_state = PROCESS_QUEUED
+        # Process id of the pgAdmin process holding the queue, until started
+        p.utility_pid = os.getpid()
+        db.session.commit()
+
+        self.process_state = PROCESS_QUEUED
+
+    def _start_queued(self, cmd, env):
+        """
+        Start the queued process (in the background, with no current user).
+        """
+        p = Process.query.filter_by(pid=self.id).first()
+
+        # Stopped by the user, while it was queued
+        if p is None or p.process_state != PROCESS_QUEUED:
+            return
+
+        p.utility_pid = None
+
+        try:
+            self._spawn(cmd, env)
+        except Exception:
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.process_state = PROCESS_FINISHED
+            db.session.commit()
+            raise
+
+    def _spawn(self, cmd, env):
+        p = None
+
         if os.name == 'nt':
             DETACHED_PROCESS = 0x00000008
             from subprocess import CREATE_NEW_PROCESS_GROUP
@@ -407,9 +465,7 @@ class BatchProcess(object):
             # There is no way to find out the error message from this process
             # as standard output, and standard error were redirected to
             # devnull.
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
+            p = Process.query.filter_by(pid=self.id).first()
             p.start_time = p.end_time = get_current_time()
             if not p.exit_code:
                 p.exit_code = self.ecode
@@ -417,16 +473,13 @@ class BatchProcess(object):
             db.session.commit()
         else:
             # Update the process state to "Started"
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
+            p = Process.query.filter_by(pid=self.id).first()
             p.process_state = PROCESS_STARTED
             db.session.commit()
+            self.process_state = PROCESS_STARTED
 
     def status(self, out=0, err=0):
-        import re
-
-        ctime = get_current_time(format='%Y%m%d%H%M%S%f')
+        ctime = int(get_current_time(format='%y%m%d%H%M%S%f'))
 
         stdout = []
         stderr = []
@@ -436,44 +489,6 @@ class BatchProcess(object):
         if enc == 'ascii':
             enc = 'utf-8'
 
-        def read_log(logfile, log, pos, ctime, ecode=None):
-            completed = True
-            idx = 0
-            c = re.compile(r"(\d+),(.*$)")
-
-            if not os.path.isfile(logfile):
-                return 0, False
-
-            with open(logfile, 'rb') as f:
-                eofs = os.fstat(f.fileno()).st_size
-                f.seek(pos, 0)
-                if pos == eofs and ecode is None:
-                    completed = False
-
-                while pos < eofs:
-                    idx += 1
-                    line = f.readline()
-                    line = line.decode(enc, 'replace')
-                    r = c.split(line)
-                    if len(r) < 3:
-                        # ignore this line
-                        pos = f.tell()
-                        continue
-                    if r[1] > ctime:
-                        completed = False
-                        break
-                    log.append([r[1], r[2]])
-                    pos = f.tell()
-                    if idx >= 1024:
-                        completed = False
-                        break
-                    if pos == eofs:
-                        if ecode is None:
-                            completed = False
-                        break
-
-            return pos, completed
-
         j = Process.query.filter_by(
             pid=self.id, user_id=current_user.id
         ).first()
@@ -487,6 +502,7 @@ class BatchProcess(object):
             self.stime = j.start_time
             self.etime = j.end_time
             self.ecode = j.exit_code
+            self.process_state = j.process_state
 
             if self.stime is not None:
                 stime = parser.parse(self.stime)
@@ -495,24 +511,28 @@ class BatchProcess(object):
                 execution_time = BatchProcess.total_seconds(etime - stime)
 
             if process_output:
-                out, out_completed = read_log(
-                    self.stdout, stdout, out, ctime, self.ecode
+                stdout, out, out_completed = read_log(
+                    self.stdout, out, ctime, self.ecode, enc
                 )
-                err, err_completed = read_log(
-                    self.stderr, stderr, err, ctime, self.ecode
+                stderr, err, err_completed = read_log(
+                    self.stderr, err, ctime, self.ecode, enc
                 )
-        else:
-            out_completed = err_completed = False
+
+        res = {
+            'start_time': self.stime,
+            'exit_code': self.ecode,
+            'execution_time': execution_time,
+            'process_state': self.process_state
+        }
+
+        # The start time of the process started after it was queued
+        if self.stime is not None:
+            res['stime'] = parser.parse(self.stime)
 
         if out == -1 or err == -1:
-            return {
-                'start_time': self.stime,
-                'exit_code': self.ecode,
-                'execution_time': execution_time,
-                'process_state': self.process_state
-            }
+            return res
 
-        return {
+        res.update({
             'out': {
                 'pos': out,
                 'lines': stdout,
@@ -522,12 +542,35 @@ class BatchProcess(object):
                 'pos': err,
                 'lines': stderr,
                 'done': err_completed
-            },
-            'start_time': self.stime,
-            'exit_code': self.ecode,
-            'execution_time': execution_time,
-            'process_state': self.process_state
-        }
+            }
+        })
+
+        return res
+
+    def wait(self, out, err, timeout):
+        """
+        Wait (at most timeout seconds) for the new lines of the stdout, or the
+        stderr after the given positions, or the completion of the process,
+        and returns the status (see status) of the process.
+        """
+        j = Process.query.filter_by(
+            pid=self.id, user_id=current_user.id
+        ).first()
+        deadline = time.time() + timeout
+
+        while j is not None and j.end_time is None and \
+                time.time() < deadline:
+            if (log_size(self.stdout) or 0) > out or \
+                    (log_size(self.stderr) or 0) > err:
+                break
+
+            time.sleep(LOG_WAIT_INTERVAL)
+
+            status, updated = BatchProcess.update_process_info(j)
+            if updated:
+                db.session.commit()
+
+        return self.status(out, err)
 
     @staticmethod
     def _check_start_time(p, data):
@@ -553,9 +596,18 @@ class BatchProcess(object):
     def update_process_info(p):
         if p.start_time is None or p.end_time is None:
             status = os.path.join(p.logdir, 'status')
-            if not os.path.isfile(status):
+            try:
+                st = os.stat(status)
+            except OSError:
                 return False, False
 
+            # The status file is replaced on every update, hence it has not
+            # changed since it was read for the process, which was started.
+            signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if p.start_time is not None and \
+                    _process_table.status_read(p.pid, signature):
+                return True, False
+
             with open(status, 'r') as fp:
                 import json
                 try:
@@ -567,6 +619,10 @@ class BatchProcess(object):
                     if 'pid' in data:
                         p.utility_pid = data['pid']
 
+                    _process_table.set_status_read(
+                        p.pid, signature if p.end_time is None else None
+                    )
+
                     return True, True
 
                 except ValueError as e:
@@ -615,62 +671,103 @@ class BatchProcess(object):
     def list():
         processes = Process.query.filter_by(user_id=current_user.id)
         changed = False
+        # Entries of the completed processes, as listed earlier
+        cached = _process_table.entries(current_user.id)
+        completed = dict()
+        servers = dict()
 
         res = []
         for p in processes:
+            if p.pid in cached:
+                sid, process = cached[p.pid]
+                if BatchProcess._operate_orphan_process(p, sid, servers):
+                    continue
+
+                completed[p.pid] = (sid, process)
+                res.append(dict(process, process_state=p.process_state))
+                continue
+
             status, updated = BatchProcess.update_process_info(p)
             if not status:
                 continue
             elif not changed:
                 changed = updated
 
-            if p.start_time is None or (
+            queued = p.process_state == PROCESS_QUEUED
+
+            if (p.start_time is None and not queued) or (
                 p.acknowledge is not None and p.end_time is None
             ):
                 continue
 
-            if BatchProcess._operate_orphan_process(p):
+            sid = loads(p.desc).sid if p.desc else None
+            if BatchProcess._operate_orphan_process(p, sid, servers):
                 continue
 
-            execution_time = None
-
-            stime = parser.parse(p.start_time)
-            etime = parser.parse(p.end_time or get_current_time())
-
-            execution_time = BatchProcess.total_seconds(etime - stime)
+            if queued and BatchProcess._operate_lost_queued_process(p):
+                changed = True
+                queued = False
 
             desc, details, type_desc, current_storage_dir = BatchProcess.\
                 _check_process_desc(p)
 
-            res.append({
+            process = {
                 'id': p.pid,
                 'desc': desc,
                 'type_desc': type_desc,
                 'details': details,
-                'stime': stime,
                 'etime': p.end_time,
                 'exit_code': p.exit_code,
                 'acknowledge': p.acknowledge,
-                'execution_time': execution_time,
                 'process_state': p.process_state,
                 'current_storage_dir': current_storage_dir,
-            })
+            }
+
+            # The queued processes have not been started yet.
+            if not queued:
+                stime = parser.parse(p.start_time)
+                etime = parser.parse(p.end_time or get_current_time())
+
+                process['stime'] = stime
+                process['execution_time'] = \
+                    BatchProcess.total_seconds(etime - stime)
+
+            res.append(process)
+
+            if p.end_time is not None:
+                completed[p.pid] = (sid, process)
 
         if changed:
             db.session.commit()
 
+        _process_table.set_entries(current_user.id, completed)
+
         return res
 
     @staticmethod
-    def _operate_orphan_process(p):
+    def _operate_orphan_process(p, sid=None, servers=None):
+        """
+        Acknowledge the process, when its server has been removed.
 
+        :param p: Process
+        :param sid: id of the server of the process (read from the process
+            description, if not given)
+        :param servers: existence of the servers checked by the caller
+            ({sid: exists}), to check each server once
+        """
         if p and p.desc:
-            desc = loads(p.desc)
-            if does_server_exists(desc.sid, current_user.id) is False:
+            if sid is None:
+                sid = loads(p.desc).sid
+            if servers is None:
+                servers = dict()
+            if sid not in servers:
+                servers[sid] = does_server_exists(sid, current_user.id)
+
+            if servers[sid] is False:
                 current_app.logger.warning(
                     _("Server with id '{0}' is either removed or does "
                       "not exists for the background process "
-                      "'{1}'").format(desc.sid, p.pid)
+                      "'{1}'").format(sid, p.pid)
                 )
                 try:
                     BatchProcess.acknowledge(p.pid)
@@ -684,6 +781,63 @@ class BatchProcess(object):
 
         return False
 
+    @staticmethod
+    def _operate_lost_queued_process(p):
+        """
+        Mark the queued process failed, when the pgAdmin process holding the
+        queue is not running anymore (i.e. pgAdmin was restarted).
+        """
+        if p.utility_pid == os.getpid():
+            # Queued by this pgAdmin process, unless it was restarted (with the
+            # same process id), or the process has been started meanwhile.
+            if p.pid in get_scheduler().queued():
+                return False
+            db.session.refresh(p)
+            if p.process_state != PROCESS_QUEUED:
+                return False
+        elif p.utility_pid and psutil.pid_exists(p.utility_pid):
+            return False
+
+        current_app.logger.warning(
+            _("The queued background process '{0}' was lost, when "
+              "pgAdmin was stopped.").format(p.pid)
+        )
+        p.start_time = p.end_time = get_current_time()
+        p.exit_code = -1
+        p.utility_pid = None
+        p.process_state = PROCESS_FINISHED
+
+        return True
+
+    @staticmethod
+    def _running_jobs():
+        """
+        Returns the list of (user id, server id) of the processes running
+        (started by any of the pgAdmin processes).
+        """
+        running = []
+        changed = False
+
+        for p in Process.query.filter_by(
+            process_state=PROCESS_STARTED, end_time=None
+        ):
+            status, updated = BatchProcess.update_process_info(p)
+            changed = changed or updated
+
+            if p.end_time is not None:
+                continue
+
+            # The process executor was killed (i.e. by a reboot).
+            if p.utility_pid and not psutil.pid_exists(p.utility_pid):
+                continue
+
+            running.append((p.user_id, getattr(loads(p.desc), 'sid', None)))
+
+        if changed:
+            db.session.commit()
+
+        return running
+
     @staticmethod
     def total_seconds(dt):
         return round(dt.total_seconds(), 2)
@@ -709,6 +863,7 @@ class BatchProcess(object):
             db.session.delete(p)
             import shutil
             shutil.rmtree(logdir, True)
+            _process_table.forget(current_user.id, _pid)
         else:
             p.acknowledge = get_current_time()
 
@@ -745,6 +900,17 @@ class BatchProcess(object):
         if p is None:
             raise LookupError(PROCESS_NOT_FOUND)
 
+        if p.process_state == PROCESS_QUEUED:
+            # Not started yet, remove it from the queue (if queued by another
+            # pgAdmin process, it will not be started by it).
+            get_scheduler().cancel(p.pid)
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.utility_pid = None
+            p.process_state = PROCESS_TERMINATED
+            db.session.commit()
+            return
+
         try:
             process = psutil.Process(p.utility_pid)
             process.terminate()
@@ -757,3 +923,80 @@ class BatchProcess(object):
                     p.utility_pid)
             )
             current_app.logger.exception(e)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """
+    Returns the scheduler of the background processes of this pgAdmin process.
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler(
+                current_app._get_current_object(),
+                BatchProcess._running_jobs
+            )
+
+    return _scheduler
+
+
+class _ProcessTable(object):
+    """
+    In-memory state of the background processes, which lets the process list
+    be refreshed by checking only the active processes:
+
+    - entries of the process list of the completed processes (per user),
+      which do not change anymore (but being acknowledged, i.e. deleted).
+    - signature (inode, modification time, size) of the status files of the
+      active processes, as last read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = dict()
+        self._status = dict()
+
+    def entries(self, user_id):
+        """
+        Returns the cached entries ({pid: (sid, entry)}) of the user.
+        """
+        with self._lock:
+            return dict(self._entries.get(user_id, dict()))
+
+    def set_entries(self, user_id, entries):
+        """
+        Replace the cached entries of the user (the ones of the processes not
+        listed anymore are removed).
+        """
+        with self._lock:
+            self._entries[user_id] = entries
+
+    def status_read(self, pid, signature):
+        """
+        Returns True, if the status file with the given signature was read.
+        """
+        with self._lock:
+            return self._status.get(pid) == signature
+
+    def set_status_read(self, pid, signature=None):
+        """
+        Record the signature of the status file read, or forget it, if None.
+        """
+        with self._lock:
+            if signature is None:
+                self._status.pop(pid, None)
+            else:
+                self._status[pid] = signature
+
+    def forget(self, user_id, pid):
+        with self._lock:
+            self._entries.get(user_id, dict()).pop(pid, None)
+            self._status.pop(pid, None)
+
+
+_process_table = _ProcessTable()
@@ -0,0 +1,201 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Scheduling of the background processes (i.e. backup, restore, maintenance,
+import/export).
+
+A process is started at once, unless the number of the processes running on
+the pgAdmin host (BGPROCESS_MAX_JOBS), or against the same database server
+(BGPROCESS_MAX_JOBS_PER_SERVER) has reached the limit. Otherwise, it is queued
+in the pgAdmin process, and started once the others are completed, the higher
+priority processes first, then the ones of the users with the least running
+processes, and the users, whose processes were started the least recently
+(in the order those were queued).
+"""
+
+import threading
+from collections import Counter
+
+import config
+
+# Maintenance, backup, and restore
+PRIORITY_HIGH = 0
+# Import/Export
+PRIORITY_LOW = 1
+
+
+class Job(object):
+    """
+    A background process waiting to be started.
+
+    :param id: id of the process
+    :param user_id: id of the user, who started the process
+    :param sid: id of the server, the process is run against
+    :param priority: PRIORITY_HIGH, or PRIORITY_LOW
+    :param start: function starting the process
+    """
+
+    def __init__(self, id, user_id, sid, priority, start):
+        self.id = id
+        self.user_id = user_id
+        self.sid = sid
+        self.priority = priority
+        self.start = start
+        self.seq = None
+
+
+class JobScheduler(object):
+    """
+    Queue of the background processes of the pgAdmin process.
+
+    :param app: pgAdmin application
+    :param running_jobs: function returning the list of (user id, server id)
+        of the processes running (of all the pgAdmin processes)
+    :param interval: interval (in seconds) between the checks of the
+        completed processes, while the processes are queued
+    """
+
+    def __init__(self, app, running_jobs, interval=1):
+        self.app = app
+        self.running_jobs = running_jobs
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._queue = []
+        self._seq = 0
+        # user id -> sequence number of the last job started for the user
+        self._user_started = dict()
+        self._thread = None
+        self._wakeup = threading.Event()
+
+    def submit(self, job, on_queued=None):
+        """
+        Start the job, or queue it, when the limits have been reached.
+
+        :param job: Job to be started
+        :param on_queued: function called with the job, when queued
+        :returns: True, if the job was started
+        """
+        with self._lock:
+            self._seq += 1
+            job.seq = self._seq
+            self._queue.append(job)
+
+            try:
+                self._dispatch(job)
+            except Exception:
+                if job in self._queue:
+                    self._queue.remove(job)
+                raise
+            finally:
+                if self._queue:
+                    self._start_thread()
+
+            if job in self._queue:
+                if on_queued is not None:
+                    on_queued(job)
+                return False
+
+        return True
+
+    def cancel(self, job_id):
+        """
+        Remove the job from the queue.
+
+        :returns: True, if the job was queued (by this pgAdmin process)
+        """
+        with self._lock:
+            for job in self._queue:
+                if job.id == job_id:
+                    self._queue.remove(job)
+                    return True
+        return False
+
+    def queued(self):
+        """
+        Returns the ids of the queued jobs (in the order those were queued).
+        """
+        with self._lock:
+            return [job.id for job in self._queue]
+
+    def wakeup(self):
+        """
+        Check for the jobs to be started now (i.e. a process was completed).
+        """
+        self._wakeup.set()
+
+    def _dispatch(self, submitted=None):
+        """
+        Start the queued jobs within the limits, the errors of the submitted
+        job are raised, the ones of the other jobs are logged.
+        """
+        max_jobs = getattr(config, 'BGPROCESS_MAX_JOBS', 0)
+        max_server_jobs = getattr(config, 'BGPROCESS_MAX_JOBS_PER_SERVER', 0)
+
+        running = []
+        if self._queue and (max_jobs or max_server_jobs):
+            running = self.running_jobs()
+
+        servers = Counter(sid for _, sid in running)
+        users = Counter(user_id for user_id, _ in running)
+        total = len(running)
+
+        while self._queue and (not max_jobs or total < max_jobs):
+            candidates = [
+                job for job in self._queue
+                if not max_server_jobs or servers[job.sid] < max_server_jobs
+            ]
+            if not candidates:
+                break
+
+            job = min(
+                candidates,
+                key=lambda j: (
+                    j.priority, users[j.user_id],
+                    self._user_started.get(j.user_id, 0), j.seq
+                )
+            )
+            self._queue.remove(job)
+            total += 1
+            servers[job.sid] += 1
+            users[job.user_id] += 1
+            self._seq += 1
+            self._user_started[job.user_id] = self._seq
+
+            try:
+                job.start()
+            except Exception as e:
+                if job is submitted:
+                    raise
+                self.app.logger.exception(e)
+
+    def _start_thread(self):
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name='pgadmin_bgprocess_scheduler'
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+            with self.app.app_context(), self._lock:
+                if not self._queue:
+                    self._thread = None
+                    return
+
+                try:
+                    self._dispatch()
+                except Exception as e:
+                    self.app.logger.exception(e)
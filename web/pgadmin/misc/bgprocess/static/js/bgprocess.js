@@ -61,7 +61,7 @@ define('misc.bgprocess', [
           details: false,
           notify: (_.isUndefined(notify) || notify),
           curr_status: null,
-          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated
+          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated, 4: Queued
           completed: false,
           current_storage_dir: null,
 
@@ -114,8 +114,9 @@ define('misc.bgprocess', [
         switch (type) {
         case 'status':
           if (this.details && this.out != -1 && this.err != -1) {
+            // Wait for the new logs on the server, instead of polling for it.
             return url_for(
-              'bgprocess.detailed_status', {
+              'bgprocess.wait_status', {
                 'pid': this.id,
                 'out': this.out,
                 'err': this.err,
@@ -270,6 +271,12 @@ define('misc.bgprocess', [
             );
           }
 
+          setTimeout(function() {
+            self.show.apply(self);
+          }, 10);
+        } else if (self.state === 4) {
+          self.curr_status = self.other_status_tpl({status_text:gettext('Queued...')});
+
           setTimeout(function() {
             self.show.apply(self);
           }, 10);
@@ -279,7 +286,7 @@ define('misc.bgprocess', [
           setTimeout(
             function() {
               self.status.apply(self);
-            }, 1000
+            }, (self.details && self.out != -1 && self.err != -1) ? 10 : 1000
           );
         }
       },
@@ -324,7 +331,7 @@ define('misc.bgprocess', [
               </div>
               <div class="card-body px-2">
                 <div class="py-1">${self.desc}</div>
-                <div class="py-1">${self.stime.toString()}</div>
+                <div class="py-1 pg-bg-stime"></div>
                 <div class="d-flex py-1">
                   <div class="my-auto mr-2">
                     <span class="fa fa-clock fa-lg" role="img"></span>
@@ -381,10 +388,14 @@ define('misc.bgprocess', [
             content.find('.bg-process-stop').off('click').on('click', self.stop_process.bind(this));
           }
 
+          self.container.find('.pg-bg-stime').text(
+            self.stime ? self.stime.toString() : ''
+          );
+
           // TODO:: Formatted execution time
           self.container.find('.pg-bg-etime').empty().append(
             $('<span></span>').text(
-              String(self.execution_time)
+              _.isNull(self.execution_time) ? '' : String(self.execution_time)
             )
           ).append(
             $('<span></span>').text(' ' + gettext('seconds'))
@@ -394,8 +405,8 @@ define('misc.bgprocess', [
           $status_bar.html(self.curr_status);
           var $btn_stop_process = $(self.container.find('.bg-process-stop'));
 
-          // Enable Stop Process button only when process is running
-          if (parseInt(self.state) === 1) {
+          // Enable Stop Process button only when process is running, or queued
+          if (parseInt(self.state) === 1 || parseInt(self.state) === 4) {
             $btn_stop_process.attr('disabled', false);
           } else {
             $btn_stop_process.attr('disabled', true);
@@ -444,8 +455,8 @@ define('misc.bgprocess', [
           $btn_storage_manager.off('click').on('click', self.storage_manager.bind(this));
         }
 
-        // Enable Stop Process button only when process is running
-        if (parseInt(self.state) === 1) {
+        // Enable Stop Process button only when process is running, or queued
+        if (parseInt(self.state) === 1 || parseInt(self.state) === 4) {
           $btn_stop_process.attr('disabled', false);
         } else {
           $btn_stop_process.attr('disabled', true);
@@ -477,7 +488,7 @@ define('misc.bgprocess', [
         // set bgprocess execution time
         $footer.find('.bg-process-exec-time p').empty().append(
           $('<span></span>').text(
-            String(self.execution_time)
+            _.isNull(self.execution_time) ? '' : String(self.execution_time)
           )
         ).append(
           $('<span></span>').text(' ' + gettext('seconds'))
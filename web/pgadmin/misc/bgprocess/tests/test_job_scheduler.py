@@ -0,0 +1,83 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import threading
+from functools import partial
+from unittest.mock import patch
+
+import config
+from pgadmin.misc.bgprocess.scheduler import Job, JobScheduler, \
+    PRIORITY_HIGH, PRIORITY_LOW
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestJobScheduler(BaseTestGenerator):
+    """ This class will test the scheduling of the background processes. """
+
+    # jobs: (user id, server id, priority) of the submitted jobs
+    # at_once: jobs started at once
+    # order: queued jobs started, as the running jobs are completed
+    scenarios = [
+        ('Jobs are started within the limit of the host', dict(
+            max_jobs=2, max_server_jobs=0,
+            jobs=[(1, 1, PRIORITY_HIGH), (1, 2, PRIORITY_HIGH),
+                  (2, 3, PRIORITY_HIGH)],
+            at_once=[0, 1], order=[2])),
+        ('Jobs are started within the limit of the server', dict(
+            max_jobs=0, max_server_jobs=1,
+            jobs=[(1, 1, PRIORITY_HIGH), (2, 1, PRIORITY_HIGH),
+                  (1, 2, PRIORITY_HIGH)],
+            at_once=[0, 2], order=[1])),
+        ('Queued jobs are started by priority, and user', dict(
+            max_jobs=1, max_server_jobs=0,
+            jobs=[(1, 1, PRIORITY_HIGH), (1, 2, PRIORITY_HIGH),
+                  (2, 3, PRIORITY_LOW), (1, 4, PRIORITY_HIGH),
+                  (3, 5, PRIORITY_HIGH)],
+            at_once=[0], order=[4, 1, 3, 2])),
+    ]
+
+    def setUp(self):
+        self.running = []
+        self.started = []
+        self.queued = []
+        self.job_started = threading.Event()
+
+    def start(self, idx, user_id, sid):
+        self.started.append(idx)
+        self.running.append((idx, user_id, sid))
+        self.job_started.set()
+
+    def running_jobs(self):
+        return [(user_id, sid) for _, user_id, sid in self.running]
+
+    def runTest(self):
+        scheduler = JobScheduler(self.app, self.running_jobs, interval=0.05)
+
+        with patch.object(config, 'BGPROCESS_MAX_JOBS', self.max_jobs), \
+                patch.object(config, 'BGPROCESS_MAX_JOBS_PER_SERVER',
+                             self.max_server_jobs):
+            for idx, (user_id, sid, priority) in enumerate(self.jobs):
+                scheduler.submit(
+                    Job(idx, user_id, sid, priority,
+                        partial(self.start, idx, user_id, sid)),
+                    lambda job: self.queued.append(job.id)
+                )
+
+            self.assertEqual(self.started, self.at_once)
+            self.assertEqual(scheduler.queued(), self.queued)
+            self.assertEqual(sorted(self.queued), sorted(self.order))
+
+            # Complete the running jobs one by one
+            while len(self.started) < len(self.jobs):
+                self.job_started.clear()
+                self.running.pop(0)
+                scheduler.wakeup()
+                self.assertTrue(self.job_started.wait(5))
+
+        self.assertEqual(self.started, self.at_once + self.order)
+        self.assertEqual(scheduler.queued(), [])
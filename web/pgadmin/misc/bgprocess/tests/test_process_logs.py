@@ -0,0 +1,88 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from pgadmin.misc.bgprocess import process_executor
+from pgadmin.misc.bgprocess.logs import log_size, read_log
+from pgadmin.utils.route import BaseTestGenerator
+
+LATER = 991231235959999999
+
+
+class TestProcessLogs(BaseTestGenerator):
+    """ This class will test the logs of the background processes. """
+
+    scenarios = [
+        ('Read the log in batches', dict(
+            legacy=False, limit=2, exit_code=0)),
+        ('Read the log of the running process', dict(
+            legacy=False, limit=100, exit_code=None)),
+        ('Read the log of the earlier versions', dict(
+            legacy=True, limit=2, exit_code=0)),
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.logfile = os.path.join(self.out_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, True)
+
+    def write_log(self, messages):
+        if self.legacy:
+            with open(self.logfile, 'wb') as f:
+                for msg in messages:
+                    if not isinstance(msg, bytes):
+                        msg = msg.encode('utf-8')
+                    for line in msg.splitlines():
+                        f.write(b'200101000000000000,' + line + b'\n')
+            return
+
+        with patch.object(process_executor, '_out_dir', self.out_dir):
+            logger = process_executor.ProcessLogger('out')
+            for msg in messages:
+                logger.log(msg)
+            logger.release()
+
+    def runTest(self):
+        self.assertIsNone(log_size(self.logfile))
+        self.assertEqual(read_log(self.logfile, 0, LATER)[1:], (0, False))
+
+        self.write_log([
+            b'pg_dump: reading schemas\n',
+            b'pg_dump: reading tables\npg_dump: reading \xc3\xa9\n',
+            'error'
+        ])
+        expected = [
+            'pg_dump: reading schemas', 'pg_dump: reading tables',
+            'pg_dump: reading \xe9', 'error'
+        ]
+
+        lines = []
+        pos = 0
+        completed = False
+        while not completed and len(lines) <= len(expected):
+            batch, pos, completed = read_log(
+                self.logfile, pos, LATER, self.exit_code, limit=self.limit
+            )
+            self.assertTrue(len(batch) <= self.limit)
+            lines.extend(line for _, line in batch)
+            if self.exit_code is None and not batch:
+                break
+
+        self.assertEqual(lines, expected)
+        self.assertEqual(log_size(self.logfile), pos)
+        self.assertEqual(completed, self.exit_code is not None)
+
+        # Lines logged after the given time are not read (yet).
+        batch, pos, completed = read_log(self.logfile, 0, 0, self.exit_code)
+        self.assertEqual((batch, pos, completed), ([], 0, False))
@@ -0,0 +1,67 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pgadmin.misc.bgprocess import process_executor
+from pgadmin.misc.bgprocess.processes import BatchProcess
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestProcessStatus(BaseTestGenerator):
+    """ This class will test reading the status of the background processes.
+    """
+
+    scenarios = [
+        ('Status file is read only when changed', dict(
+            start=dict(start_time='2020-01-01 00:00:00.000000 +0000',
+                       pid=1000),
+            end=dict(exit_code=0,
+                     end_time='2020-01-01 00:00:01.000000 +0000'))),
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, True)
+
+    def update_status(self, **kw):
+        with patch.object(process_executor, '_out_dir', self.out_dir), \
+                patch.object(process_executor, '_log_file',
+                             os.path.join(self.out_dir, 'log')):
+            process_executor.update_status(**kw)
+
+    def runTest(self):
+        p = SimpleNamespace(
+            pid='test_process_status', logdir=self.out_dir, start_time=None,
+            end_time=None, exit_code=None, utility_pid=None
+        )
+
+        # Not started yet
+        self.assertEqual(BatchProcess.update_process_info(p), (False, False))
+
+        self.update_status(**self.start)
+        self.assertEqual(BatchProcess.update_process_info(p), (True, True))
+        self.assertEqual(p.start_time, self.start['start_time'])
+        self.assertEqual(p.utility_pid, self.start['pid'])
+
+        # Not read again, until it is updated
+        self.assertEqual(BatchProcess.update_process_info(p), (True, False))
+
+        self.update_status(**dict(self.start, **self.end))
+        self.assertEqual(BatchProcess.update_process_info(p), (True, True))
+        self.assertEqual(p.exit_code, self.end['exit_code'])
+        self.assertEqual(p.end_time, self.end['end_time'])
+
+        # Not read anymore, once completed
+        self.assertEqual(BatchProcess.update_process_info(p), (True, False))
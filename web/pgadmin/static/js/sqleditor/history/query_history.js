@@ -11,6 +11,7 @@ export default class QueryHistory {
     this.editorPref = {};
 
     this.onCopyToEditorHandler = ()=>{};
+    this.onScrollEndHandler = ()=>{};
     this.histCollection.onAdd(this.onAddEntry.bind(this));
     this.histCollection.onReset(this.onResetEntries.bind(this));
   }
@@ -44,6 +45,14 @@ export default class QueryHistory {
     }
   }
 
+  onScrollEnd(onScrollEndHandler) {
+    this.onScrollEndHandler = onScrollEndHandler;
+
+    if(this.queryHistEntries) {
+      this.queryHistEntries.onScrollEnd(this.onScrollEndHandler);
+    }
+  }
+
   setEditorPref(editorPref) {
     this.editorPref = {
       ...this.editorPref,
@@ -84,6 +93,7 @@ export default class QueryHistory {
           this.queryHistDetails.setEntry(entry);
         }).bind(this)
       );
+      this.queryHistEntries.onScrollEnd(this.onScrollEndHandler);
       this.queryHistEntries.render();
 
       this.histCollection.historyList.map((entry)=>{
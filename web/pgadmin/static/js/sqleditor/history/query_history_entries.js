@@ -108,12 +108,26 @@ export class QueryHistoryEntries {
 
     this.$el = null;
     this.is_pgadmin_queries_shown = null;
+    this.onScrollEndHandler = null;
   }
 
   onSelectedChange(onSelectedChangeHandler) {
     this.onSelectedChangeHandler = onSelectedChangeHandler;
   }
 
+  onScrollEnd(onScrollEndHandler) {
+    this.onScrollEndHandler = onScrollEndHandler;
+  }
+
+  onScroll() {
+    let el = this.$entriesEl[0];
+    /* scrolled to the oldest entry */
+    if (this.onScrollEndHandler &&
+      el.scrollTop + el.clientHeight >= el.scrollHeight - 1) {
+      this.onScrollEndHandler();
+    }
+  }
+
   focus() {
     if (!this.$selectedItem) {
       this.setSelectedListItem(this.$entriesEl.find('.list-item').first());
@@ -253,7 +267,12 @@ export class QueryHistoryEntries {
         $groupEl.find('.query-entries').append(newItem.$el);
       }
     }
-    this.setSelectedListItem(newItem.$el);
+
+    /* Do not select the older entries, i.e. of the next page of the history */
+    if (!this.$selectedItem ||
+      entry.start_time >= this.$selectedItem.data('entrydata').start_time) {
+      this.setSelectedListItem(newItem.$el);
+    }
   }
 
   toggleGeneratedQueries() {
@@ -282,6 +301,7 @@ export class QueryHistoryEntries {
 
     self.$entriesEl = self.$el.find('#query_list');
     self.$entriesEl.on('keydown', this.navigateUpAndDown.bind(this));
+    self.$entriesEl.on('scroll', this.onScroll.bind(this));
 
     self.is_pgadmin_queries_shown = true;
 
@@ -34,6 +34,8 @@ from pgadmin.settings import get_setting
 from pgadmin.browser.utils import underscore_unescape
 from pgadmin.utils.exception import ObjectGone
 from pgadmin.tools.sqleditor.utils.macros import get_user_macros
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    get_command_obj, remove_command_obj
 from pgadmin.utils.constants import MIMETYPE_APP_JS, UNAUTH_REQ
 
 MODULE_NAME = 'datagrid'
@@ -92,6 +94,7 @@ class DataGridModule(PgAdminModule):
 
                 # Delete all grid data from session variable
                 del session['gridData']
+                session.pop('gridFetchedRows', None)
 
 
 blueprint = DataGridModule(MODULE_NAME, __name__, static_url_path='/static')
@@ -594,9 +597,8 @@ def close_query_tool_session(trans_id):
     :return:
     """
     if 'gridData' in session and str(trans_id) in session['gridData']:
-        cmd_obj_str = session['gridData'][str(trans_id)]['command_obj']
-        # Use pickle.loads function to get the command object
-        cmd_obj = pickle.loads(cmd_obj_str)
+        cmd_obj = get_command_obj(trans_id, session['gridData'][str(trans_id)])
+        remove_command_obj(trans_id)
 
         # if connection id is None then no need to release the connection
         if cmd_obj.conn_id is not None:
@@ -66,16 +66,18 @@ class DebuggerInstance(object):
 
     def update_session(self):
         with debugger_sessions_lock:
-            if '__debugger_sessions' not in session:
-                session['__debugger_sessions'] = dict()
-
-            session['__debugger_sessions'][str(self.trans_id)] = dict(
+            debugger_sessions = session.get('__debugger_sessions', dict())
+            debugger_sessions[str(self.trans_id)] = dict(
                 function_data=self.function_data,
                 debugger_data=self.debugger_data
             )
+            # Set again, so that the session is marked as modified
+            session['__debugger_sessions'] = debugger_sessions
 
     def clear(self):
         with debugger_sessions_lock:
             if '__debugger_sessions' in session and \
                     str(self.trans_id) in session['__debugger_sessions']:
-                session['__debugger_sessions'].pop(str(self.trans_id))
+                debugger_sessions = session['__debugger_sessions']
+                debugger_sessions.pop(str(self.trans_id))
+                session['__debugger_sessions'] = debugger_sessions
@@ -16,6 +16,7 @@ from flask import url_for, Response, render_template, request, current_app
 from flask_babelex import gettext as _
 from flask_security import login_required, current_user
 from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.scheduler import PRIORITY_LOW
 from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
     fs_short_path, document_dir, IS_WIN, does_utility_exist
 from pgadmin.utils.ajax import make_json_response, bad_request
@@ -72,6 +73,9 @@ class IEMessage(IProcessDesc):
 
     Defines the message shown for the import/export operation.
     """
+    # Queued after the maintenance, backup, and restore processes
+    priority = PRIORITY_LOW
+
     def __init__(self, *_args, **io_params):
         self.sid = io_params['sid']
         self.schema = io_params['schema']
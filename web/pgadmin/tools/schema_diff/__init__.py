@@ -19,10 +19,13 @@ from flask_security import current_user, login_required
 from flask_babelex import gettext
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_json_response, bad_request, \
-    make_response as ajax_response, internal_server_error
+    make_response as ajax_response, internal_server_error, gone
 from pgadmin.model import Server, SharedServer
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.compare_executor import SchemaDiffExecutor
+from pgadmin.tools.schema_diff.compare_job import start_job, get_job, \
+    remove_job
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS,\
@@ -249,6 +252,9 @@ def close(trans_id):
         return make_json_response(data={'status': True})
 
     try:
+        # Stop the comparison running in the background (if any)
+        remove_job(trans_id)
+
         # Remove the information of unique transaction id from the
         # session variable.
         schema_diff_data.pop(str(trans_id), None)
@@ -462,7 +468,8 @@ def schemas(sid, did):
 @login_required
 def compare_database(trans_id, source_sid, source_did, target_sid, target_did):
     """
-    This function will compare the two databases.
+    This function will start the comparison of the two databases in the
+    background, the result is fetched by polling.
     """
     # Check the pre validation before compare
     status, error_msg, diff_model_obj, session_obj = \
@@ -470,103 +477,62 @@ def compare_database(trans_id, source_sid, source_did, target_sid, target_did):
     if not status:
         return error_msg
 
-    comparison_result = []
-
-    diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
-    update_session_diff_transaction(trans_id, session_obj,
-                                    diff_model_obj)
-
     try:
         # Fetch all the schemas of source and target database
         # Compare them and get the status.
         schema_result = fetch_compare_schemas(source_sid, source_did,
                                               target_sid, target_did)
 
-        total_schema = len(schema_result['source_only']) + len(
-            schema_result['target_only']) + len(
-            schema_result['in_both_database'])
-
-        node_percent = 0
-        if total_schema > 0:
-            node_percent = round(100 / (total_schema * len(
-                SchemaDiffRegistry.get_registered_nodes())))
-        total_percent = 0
+        executor = SchemaDiffExecutor(
+            trans_id, [(source_sid, source_did), (target_sid, target_did)])
 
         # Compare Database objects
-        comparison_schema_result, total_percent = \
-            compare_database_objects(
-                trans_id=trans_id, session_obj=session_obj,
-                source_sid=source_sid, source_did=source_did,
-                target_sid=target_sid, target_did=target_did,
-                diff_model_obj=diff_model_obj, total_percent=total_percent,
-                node_percent=node_percent)
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        compare_database_objects(
+            executor=executor, source_sid=source_sid, source_did=source_did,
+            target_sid=target_sid, target_did=target_did)
 
         # Compare Schema objects
         if 'source_only' in schema_result and \
                 len(schema_result['source_only']) > 0:
             for item in schema_result['source_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
-                        source_sid=source_sid, source_did=source_did,
-                        source_scid=item['scid'], target_sid=target_sid,
-                        target_did=target_did, target_scid=None,
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        is_schema_source_only=True)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+                compare_schema_objects(
+                    executor=executor,
+                    source_sid=source_sid, source_did=source_did,
+                    source_scid=item['scid'], target_sid=target_sid,
+                    target_did=target_did, target_scid=None,
+                    schema_name=item['schema_name'],
+                    is_schema_source_only=True)
 
         if 'target_only' in schema_result and \
                 len(schema_result['target_only']) > 0:
             for item in schema_result['target_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
-                        source_sid=source_sid, source_did=source_did,
-                        source_scid=None, target_sid=target_sid,
-                        target_did=target_did, target_scid=item['scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+                compare_schema_objects(
+                    executor=executor,
+                    source_sid=source_sid, source_did=source_did,
+                    source_scid=None, target_sid=target_sid,
+                    target_did=target_did, target_scid=item['scid'],
+                    schema_name=item['schema_name'])
 
         # Compare the two schema present in both the databases
         if 'in_both_database' in schema_result and \
                 len(schema_result['in_both_database']) > 0:
             for item in schema_result['in_both_database']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
-                        source_sid=source_sid, source_did=source_did,
-                        source_scid=item['src_scid'], target_sid=target_sid,
-                        target_did=target_did, target_scid=item['tar_scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
-
-        msg = gettext("Successfully compare the specified databases.")
-        total_percent = 100
-        diff_model_obj.set_comparison_info(msg, total_percent)
-        # Update the message and total percentage done in session object
-        update_session_diff_transaction(trans_id, session_obj, diff_model_obj)
+                compare_schema_objects(
+                    executor=executor,
+                    source_sid=source_sid, source_did=source_did,
+                    source_scid=item['src_scid'], target_sid=target_sid,
+                    target_did=target_did, target_scid=item['tar_scid'],
+                    schema_name=item['schema_name'])
+
+        job = start_job(
+            trans_id, executor, COMPARE_MSG,
+            gettext("Successfully compare the specified databases."))
 
     except Exception as e:
         app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
 
-    return make_json_response(data=comparison_result)
+    return make_json_response(data=job.status())
 
 
 @blueprint.route(
@@ -579,7 +545,8 @@ def compare_database(trans_id, source_sid, source_did, target_sid, target_did):
 def compare_schema(trans_id, source_sid, source_did, source_scid,
                    target_sid, target_did, target_scid):
     """
-    This function will compare the two schema.
+    This function will start the comparison of the two schema in the
+    background, the result is fetched by polling.
     """
     # Check the pre validation before compare
     status, error_msg, diff_model_obj, session_obj = \
@@ -587,40 +554,26 @@ def compare_schema(trans_id, source_sid, source_did, source_scid,
     if not status:
         return error_msg
 
-    comparison_result = []
-
-    diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
-    update_session_diff_transaction(trans_id, session_obj,
-                                    diff_model_obj)
     try:
-        all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-        node_percent = round(100 / len(all_registered_nodes))
-        total_percent = 0
-
-        comparison_schema_result, total_percent = \
-            compare_schema_objects(
-                trans_id=trans_id, session_obj=session_obj,
-                source_sid=source_sid, source_did=source_did,
-                source_scid=source_scid, target_sid=target_sid,
-                target_did=target_did, target_scid=target_scid,
-                schema_name=gettext('Schema Objects'),
-                diff_model_obj=diff_model_obj,
-                total_percent=total_percent,
-                node_percent=node_percent)
-
-        comparison_result = \
-            comparison_result + comparison_schema_result
-
-        msg = gettext("Successfully compare the specified schemas.")
-        total_percent = 100
-        diff_model_obj.set_comparison_info(msg, total_percent)
-        # Update the message and total percentage done in session object
-        update_session_diff_transaction(trans_id, session_obj, diff_model_obj)
+        executor = SchemaDiffExecutor(
+            trans_id, [(source_sid, source_did), (target_sid, target_did)])
+
+        compare_schema_objects(
+            executor=executor,
+            source_sid=source_sid, source_did=source_did,
+            source_scid=source_scid, target_sid=target_sid,
+            target_did=target_did, target_scid=target_scid,
+            schema_name=gettext('Schema Objects'))
+
+        job = start_job(
+            trans_id, executor, COMPARE_MSG,
+            gettext("Successfully compare the specified schemas."))
 
     except Exception as e:
         app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
 
-    return make_json_response(data=comparison_result)
+    return make_json_response(data=job.status())
 
 
 @blueprint.route(
@@ -630,6 +583,8 @@ def compare_schema(trans_id, source_sid, source_did, source_scid,
 def poll(trans_id):
     """
     This function is used to check the schema comparison is completed or not.
+    It returns the progress, and the results of the comparison from the
+    offset (number of the results already fetched by the client).
     :param trans_id:
     :return:
     """
@@ -641,15 +596,17 @@ def poll(trans_id):
     if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
         return make_json_response(success=0, errormsg=error_msg, status=404)
 
-    msg, diff_percentage = diff_model_obj.get_comparison_info()
+    job = get_job(trans_id)
+    if job is None:
+        return gone(errormsg=gettext(
+            'Could not find the comparison, please compare again.'))
 
-    if diff_percentage == 100:
-        diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
-        update_session_diff_transaction(trans_id, session_obj,
-                                        diff_model_obj)
+    if job.completed and job.error is not None:
+        return internal_server_error(errormsg=job.error)
 
-    return make_json_response(data={'compare_msg': msg,
-                                    'diff_percentage': diff_percentage})
+    offset = request.args.get('offset', 0, type=int)
+
+    return make_json_response(data=job.status(offset))
 
 
 @blueprint.route(
@@ -753,21 +710,17 @@ def get_schemas(sid, did):
 
 def compare_database_objects(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to add the comparison of the database objects to
+    the executor.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
+    executor = kwargs.get('executor')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     target_sid = kwargs.get('target_sid')
     target_did = kwargs.get('target_did')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
-    comparison_result = []
 
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes(None,
                                                                    'Database')
@@ -776,34 +729,24 @@ def compare_database_objects(**kwargs):
         if hasattr(view, 'compare'):
             msg = gettext('Comparing {0}'). \
                 format(gettext(view.blueprint.collection_label))
-            app.logger.debug(msg)
-            diff_model_obj.set_comparison_info(msg, total_percent)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               group_name=gettext('Database Objects'))
 
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-
-    return comparison_result, total_percent
+            executor.add(msg, view.compare,
+                         source_sid=source_sid,
+                         source_did=source_did,
+                         target_sid=target_sid,
+                         target_did=target_did,
+                         group_name=gettext('Database Objects'))
 
 
 def compare_schema_objects(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to add the comparison of the specified schema and
+    their children to the executor.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
+    executor = kwargs.get('executor')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     source_scid = kwargs.get('source_scid')
@@ -811,17 +754,12 @@ def compare_schema_objects(**kwargs):
     target_did = kwargs.get('target_did')
     target_scid = kwargs.get('target_scid')
     schema_name = kwargs.get('schema_name')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
     is_schema_source_only = kwargs.get('is_schema_source_only', False)
     source_schema_name = None
     if is_schema_source_only:
         driver = get_driver(PG_DEFAULT_DRIVER)
         source_schema_name = driver.qtIdent(None, schema_name)
 
-    comparison_result = []
-
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
     for node_name, node_view in all_registered_nodes.items():
         view = SchemaDiffRegistry.get_node_view(node_name)
@@ -833,29 +771,16 @@ def compare_schema_objects(**kwargs):
                 msg = gettext('Comparing {0} of schema \'{1}\''). \
                     format(gettext(view.blueprint.collection_label),
                            gettext(schema_name))
-            app.logger.debug(msg)
-            diff_model_obj.set_comparison_info(msg, total_percent)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               source_scid=source_scid,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               target_scid=target_scid,
-                               group_name=gettext(schema_name),
-                               source_schema_name=source_schema_name)
-
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-        # if total_percent is more then 100 then set it to less then 100
-        if total_percent >= 100:
-            total_percent = 96
-
-    return comparison_result, total_percent
+
+            executor.add(msg, view.compare,
+                         source_sid=source_sid,
+                         source_did=source_did,
+                         source_scid=source_scid,
+                         target_sid=target_sid,
+                         target_did=target_did,
+                         target_scid=target_scid,
+                         group_name=gettext(schema_name),
+                         source_schema_name=source_schema_name)
 
 
 def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
@@ -14,6 +14,7 @@ from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import internal_server_error
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries
+from pgadmin.tools.schema_diff.compare_executor import run_side_by_side
 
 
 class SchemaDiffObjectCompare:
@@ -45,6 +46,53 @@ class SchemaDiffObjectCompare:
 
         return status, schema_name
 
+    @staticmethod
+    def group_rows_by_oid(rows, key='oid'):
+        """
+        This function will group the rows fetched for all the objects of a
+        schema (i.e. privileges, constraints) by the oid of the object they
+        belong to. The oid column is removed from the rows, so that they are
+        same as the rows fetched for a single object.
+
+        :param rows: rows returned by the query
+        :param key: column having the oid of the object
+        :return: dict of oid and the list of its rows
+        """
+        grouped = dict()
+        for row in rows:
+            grouped.setdefault(row.pop(key), []).append(row)
+
+        return grouped
+
+    def fetch_source_and_target(self, fetch_func, source_params,
+                                target_params):
+        """
+        This function will fetch the source and target objects using the
+        given fetch function of the view. The target objects are fetched by
+        another instance of the view, at the same time as the source objects
+        (when run by the schema diff executor).
+
+        :param fetch_func: name of the fetch function of the view
+        :param source_params: parameters to fetch the source objects, None
+            if there are no source objects
+        :param target_params: parameters to fetch the target objects, None
+            if there are no target objects
+        :return: tuple of the source and target objects
+        """
+        if source_params is None or target_params is None:
+            source = getattr(self, fetch_func)(**source_params) \
+                if source_params is not None else {}
+            target = getattr(self, fetch_func)(**target_params) \
+                if target_params is not None else {}
+            return source, target
+
+        target_view = self.__class__(cmd=self.cmd)
+
+        return run_side_by_side(
+            lambda: getattr(self, fetch_func)(**source_params),
+            lambda: getattr(target_view, fetch_func)(**target_params)
+        )
+
     def compare(self, **kwargs):
         """
         This function is used to compare all the objects
@@ -60,9 +108,6 @@ class SchemaDiffObjectCompare:
 
         group_name = kwargs.get('group_name')
         source_schema_name = kwargs.get('source_schema_name', None)
-        source = {}
-        target = {}
-
         status, target_schema = self.get_schema(kwargs.get('target_sid'),
                                                 kwargs.get('target_did'),
                                                 kwargs.get('target_scid'))
@@ -70,17 +115,16 @@ class SchemaDiffObjectCompare:
             return internal_server_error(errormsg=target_schema)
 
         if group_name == 'Database Objects':
-            source = self.fetch_objects_to_compare(**source_params)
-            target = self.fetch_objects_to_compare(**target_params)
+            source, target = self.fetch_source_and_target(
+                'fetch_objects_to_compare', source_params, target_params)
         else:
             source_params['scid'] = kwargs.get('source_scid')
             target_params['scid'] = kwargs.get('target_scid')
 
-            if 'scid' in source_params and source_params['scid'] is not None:
-                source = self.fetch_objects_to_compare(**source_params)
-
-            if 'scid' in target_params and target_params['scid'] is not None:
-                target = self.fetch_objects_to_compare(**target_params)
+            source, target = self.fetch_source_and_target(
+                'fetch_objects_to_compare',
+                source_params if source_params['scid'] is not None else None,
+                target_params if target_params['scid'] is not None else None)
 
         # If both the dict have no items then return None.
         if not (source or target) or (
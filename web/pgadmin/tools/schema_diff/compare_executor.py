@@ -0,0 +1,244 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Parallel execution of the schema diff comparison.
+
+The comparison of a node type (of the database, or of a schema) does not
+depend on the others, so they are run on a bounded pool of worker threads.
+Each worker runs the queries on its own connections to the source and
+target databases, and fetches the source and target objects at the same
+time, using one more connection to the target database. The connections
+are made by the request thread, as connecting updates the session, before
+the comparisons are started.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue
+
+from flask import copy_current_request_context, current_app as app
+from pgadmin.utils.driver import get_driver
+from config import PG_DEFAULT_DRIVER
+import config
+
+_worker = threading.local()
+
+
+def run_side_by_side(source_func, target_func):
+    """
+    This function will run the given functions (fetching the source and
+    target objects) at the same time, when called by a worker of the
+    comparison executor, otherwise one after another.
+
+    :param source_func: function to fetch the source objects
+    :param target_func: function to fetch the target objects
+    :return: tuple of the results of both the functions
+    """
+    executor = getattr(_worker, 'executor', None)
+    if executor is None:
+        return source_func(), target_func()
+
+    future = executor.submit_side_task(_worker.scope, target_func)
+    source = source_func()
+
+    return source, future.result()
+
+
+class SchemaDiffExecutor(object):
+    """
+    class SchemaDiffExecutor(object)
+
+        Runs the comparison of the node types on a bounded pool of worker
+        threads, and returns their results in the order they were added.
+
+    The progress is reported (on the request thread) as the comparisons are
+    completed. The connections of the workers are opened before, and
+    released after all of them are done (on the request thread too).
+
+    Methods:
+    -------
+    * add(msg, func, **kwargs)
+      - Add the comparison (func) to be run with the given arguments, msg is
+        reported as the progress message.
+
+    * run(progress_func, result_func=None)
+      - Run all the comparisons and return the list of their results.
+
+    * cancel()
+      - Skip the comparisons not started yet.
+    """
+
+    def __init__(self, trans_id, databases, max_workers=None):
+        """
+        Args:
+            trans_id: transaction id of the schema diff
+            databases: list of (sid, did) of the source and target databases
+            max_workers: maximum number of the worker threads
+        """
+        if max_workers is None:
+            max_workers = config.SCHEMA_DIFF_MAX_WORKERS
+
+        self.trans_id = trans_id
+        self.databases = list(dict.fromkeys(databases))
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.tasks = []
+
+        self._cancelled = threading.Event()
+        self._side_pool = None
+        self._connections = []
+
+    def add(self, msg, func, **kwargs):
+        self.tasks.append((msg, func, kwargs))
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self, progress_func, result_func=None):
+        """
+        Run all the comparisons, and return the list of their results.
+
+        :param progress_func: function called with the message and the
+            percentage done, as the comparisons are completed
+        :param result_func: function called with the result of each
+            comparison, as soon as it is completed
+        :return: list of the results
+        """
+        total = len(self.tasks)
+
+        if self.max_workers == 1 or total <= 1:
+            results = []
+            for idx, (msg, func, kwargs) in enumerate(self.tasks):
+                if self.cancelled:
+                    break
+                app.logger.debug(msg)
+                progress_func(msg, self._percentage(idx, total))
+                results.append(func(**kwargs))
+                if result_func is not None:
+                    result_func(results[-1])
+            return results
+
+        results = [None] * total
+        slots = Queue()
+        for slot in range(min(self.max_workers, total)):
+            slots.put(slot)
+
+        try:
+            for slot in range(slots.qsize()):
+                self._connect(self._scope(slot))
+                self._connect('{0}:side'.format(self._scope(slot)))
+
+            with ThreadPoolExecutor(slots.qsize()) as pool, \
+                    ThreadPoolExecutor(slots.qsize()) as side_pool:
+                self._side_pool = side_pool
+                futures = dict()
+                for idx, (msg, func, kwargs) in enumerate(self.tasks):
+                    future = pool.submit(
+                        copy_current_request_context(self._run_task),
+                        slots, func, kwargs
+                    )
+                    futures[future] = idx
+
+                done = 0
+                try:
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        results[idx] = future.result()
+                        done += 1
+                        if result_func is not None:
+                            result_func(results[idx])
+
+                        msg = self.tasks[idx][0]
+                        app.logger.debug(msg)
+                        progress_func(msg, self._percentage(done, total))
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self._side_pool = None
+            self._release_connections()
+
+        return results
+
+    def submit_side_task(self, scope, func):
+        """
+        Submit the function to be run alongside the task of a worker, with
+        its own connections.
+        """
+        return self._side_pool.submit(
+            copy_current_request_context(self._run_in_scope),
+            '{0}:side'.format(scope), func
+        )
+
+    @staticmethod
+    def _percentage(done, total):
+        # 100 is reported by the caller once the result is ready.
+        return min(round(done * 100 / total), 99) if total else 0
+
+    def _scope(self, slot):
+        return 'schema_diff:{0}:{1}'.format(self.trans_id, slot)
+
+    def _run_task(self, slots, func, kwargs):
+        if self.cancelled:
+            return None
+
+        slot = slots.get()
+        try:
+            return self._run_in_scope(
+                self._scope(slot), lambda: func(**kwargs)
+            )
+        finally:
+            slots.put(slot)
+
+    def _run_in_scope(self, scope, func):
+        driver = get_driver(PG_DEFAULT_DRIVER)
+
+        with driver.connection_scope(scope):
+            _worker.executor = self
+            _worker.scope = scope
+            try:
+                return func()
+            finally:
+                _worker.executor = None
+                _worker.scope = None
+
+    def _connect(self, scope):
+        """
+        Connect the dedicated connections of the scope to the source and
+        target databases, on the request thread, as the connection managers
+        update the session.
+        """
+        driver = get_driver(PG_DEFAULT_DRIVER)
+
+        with driver.connection_scope(scope):
+            for sid, did in self.databases:
+                manager = driver.connection_manager(sid)
+                conn = manager.connection(did=did)
+                self._connections.append((sid, conn.conn_id))
+
+                status, msg = conn.connect()
+                if not status:
+                    raise Exception(msg)
+
+    def _release_connections(self):
+        driver = get_driver(PG_DEFAULT_DRIVER)
+
+        for sid, conn_id in self._connections:
+            try:
+                manager = driver.connection_manager(sid)
+                manager.release(conn_id=conn_id[5:])
+            except Exception as e:
+                app.logger.exception(e)
+
+        self._connections = []
@@ -0,0 +1,249 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Background jobs of the schema diff comparison.
+
+The comparison of two databases may take minutes, hence it is run by a
+background thread instead of the request, which only starts it. The result
+of each node type is appended to the buffer of the job as soon as it is
+compared, and the client fetches the new results (along with the progress)
+while polling, so that the first differences are shown without waiting for
+the whole comparison.
+
+The thread outlives the request starting it, hence it does not use the
+context of that request (which is torn down, and its session saved, once the
+response is sent). It runs in a request context of its own instead, having a
+copy of the session and the user, so that the node views find the connection
+managers of the session. The source and target databases are passed to the
+executor, which opens its own connections to them.
+
+The jobs are kept in an in-process registry, keyed by the session id and the
+transaction id. Hence, a job is only visible to the process that started it.
+When pgAdmin is served by several worker processes, the connection broker
+must be enabled (see CONNECTION_BROKER_PATH in config.py), so that the polls of
+the session are run by the same process.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from flask import session, current_app as app
+from flask_security import current_user
+from pgadmin.tools.schema_diff.model import SchemaDiffModel
+
+# Completed job not polled for these many seconds will be evicted
+IDLE_TIMEOUT = 30 * 60
+
+
+class SchemaDiffJob(object):
+    """
+    class SchemaDiffJob(object)
+
+        Runs the comparisons of the executor in a background thread, and
+        buffers their results.
+
+    Methods:
+    -------
+    * start()
+      - Start the background thread.
+
+    * status(offset=0)
+      - Returns the progress, and the results from the given offset.
+
+    * cancel()
+      - Stop the comparison (the running comparisons are not interrupted).
+    """
+
+    def __init__(self, executor, msg, completed_msg):
+        """
+        Args:
+            executor: SchemaDiffExecutor with the comparisons to be run
+            msg: message to be reported, until the first comparison starts
+            completed_msg: message to be reported, once completed
+        """
+        self.executor = executor
+        self.completed_msg = completed_msg
+        self.diff_model_obj = SchemaDiffModel()
+        self.diff_model_obj.set_comparison_info(msg, 0)
+        self.results = []
+        self.completed = False
+        self.error = None
+        self.last_access = time.time()
+        self._lock = threading.Lock()
+
+    def start(self):
+        thread = threading.Thread(
+            target=self._run, args=(_job_request_context(),),
+            name='schema_diff_{0}'.format(self.executor.trans_id)
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, ctx):
+        with ctx:
+            try:
+                self.executor.run(self.set_progress, self.add_result)
+                self.set_progress(self.completed_msg, 100)
+            except Exception as e:
+                app.logger.exception(e)
+                self.error = str(e)
+            finally:
+                self.completed = True
+
+    def set_progress(self, msg, percentage):
+        with self._lock:
+            self.diff_model_obj.set_comparison_info(msg, percentage)
+
+    def add_result(self, result):
+        if result is not None:
+            with self._lock:
+                self.results.extend(result)
+
+    def status(self, offset=0):
+        # Read the completed flag first, so that the results appended before
+        # the job was completed are returned along with it.
+        completed = self.completed
+        self.last_access = time.time()
+
+        with self._lock:
+            msg, percentage = self.diff_model_obj.get_comparison_info()
+            return {
+                'compare_msg': msg,
+                'diff_percentage': percentage,
+                'diff_result': self.results[offset:],
+                'completed': completed
+            }
+
+    def cancel(self):
+        self.executor.cancel()
+
+
+class SchemaDiffJobRegistry(object):
+    """
+    class SchemaDiffJobRegistry(object)
+
+        Registry of the schema diff jobs, keyed by session id and transaction
+        id. Only one job is kept per transaction, completed jobs idle for more
+        than the idle timeout are evicted.
+
+    Methods:
+    -------
+    * start(sid, trans_id, job)
+      - Start the job of the transaction, cancels the earlier one.
+
+    * get(sid, trans_id)
+      - Returns the job of the given transaction, if any.
+
+    * remove(sid, trans_id)
+      - Cancel and remove the job of the given transaction.
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        for key, job in list(self._jobs.items()):
+            if job.completed and now - job.last_access >= self.idle_timeout:
+                del self._jobs[key]
+
+    def start(self, sid, trans_id, job):
+        key = (sid, str(trans_id))
+
+        with self._lock:
+            old_job = self._jobs.pop(key, None)
+            self._jobs[key] = job
+            self._evict(time.time())
+
+        if old_job is not None:
+            old_job.cancel()
+
+        job.start()
+
+    def get(self, sid, trans_id):
+        with self._lock:
+            return self._jobs.get((sid, str(trans_id)), None)
+
+    def remove(self, sid, trans_id):
+        with self._lock:
+            job = self._jobs.pop((sid, str(trans_id)), None)
+
+        if job is not None:
+            job.cancel()
+
+    def __len__(self):
+        return len(self._jobs)
+
+
+job_registry = SchemaDiffJobRegistry()
+
+
+def _session_id():
+    return getattr(session, 'sid', None)
+
+
+def _job_request_context():
+    """
+    Returns the request context for the background thread of a job, with a
+    copy of the session and the user of the current request. The values of
+    the session are copied one level deep, as the driver updates the
+    dictionary of the server managers in place.
+    """
+    ctx = app._get_current_object().test_request_context()
+
+    job_session = copy.copy(session._get_current_object())
+    for key, value in list(job_session.items()):
+        if isinstance(value, dict):
+            job_session[key] = copy.copy(value)
+
+    ctx.session = job_session
+    ctx.user = current_user._get_current_object()
+
+    return ctx
+
+
+def start_job(trans_id, executor, msg, completed_msg):
+    """
+    Start the comparisons of the executor as the background job of the given
+    transaction.
+
+    Args:
+        trans_id: unique transaction id
+        executor: SchemaDiffExecutor with the comparisons to be run
+        msg: message to be reported, until the first comparison starts
+        completed_msg: message to be reported, once completed
+    """
+    job = SchemaDiffJob(executor, msg, completed_msg)
+    job_registry.start(_session_id(), trans_id, job)
+
+    return job
+
+
+def get_job(trans_id):
+    """
+    Returns the job of the given transaction (None if not started).
+
+    Args:
+        trans_id: unique transaction id
+    """
+    return job_registry.get(_session_id(), trans_id)
+
+
+def remove_job(trans_id):
+    """
+    Cancel and remove the job of the given transaction.
+
+    Args:
+        trans_id: unique transaction id
+    """
+    job_registry.remove(_session_id(), trans_id)
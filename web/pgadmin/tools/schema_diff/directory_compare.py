@@ -10,12 +10,15 @@
 """Directory comparison"""
 
 import copy
+import itertools
 import string
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
 from flask import current_app
 from pgadmin.utils.preferences import Preferences
 
-count = 1
+# Unique ids of the compared objects (shared by the comparisons running in
+# parallel)
+_object_ids = itertools.count(1)
 
 list_keys_array = ['name', 'colname', 'argid', 'token', 'option', 'conname',
                    'member_name', 'label', 'attname', 'fdwoption',
@@ -38,7 +41,6 @@ def _get_source_list(**kwargs):
     source_schema_name = kwargs.get('source_schema_name')
     target_schema = kwargs.get('target_schema')
 
-    global count
     source_only = []
     for item in added:
         source_object_id = None
@@ -74,7 +76,7 @@ def _get_source_list(**kwargs):
                 show_system_objects=None, is_schema_diff=True)
 
         source_only.append({
-            'id': count,
+            'id': next(_object_ids),
             'type': node,
             'label': node_label,
             'title': item,
@@ -87,7 +89,6 @@ def _get_source_list(**kwargs):
             'dependencies': source_dependencies,
             'source_schema_name': source_schema_name
         })
-        count += 1
 
     return source_only
 
@@ -118,7 +119,6 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
     :param group_name: group name.
     :return: list of target dict.
     """
-    global count
     target_only = []
     for item in removed:
         target_object_id = None
@@ -148,7 +148,7 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
             diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
 
         target_only.append({
-            'id': count,
+            'id': next(_object_ids),
             'type': node,
             'label': node_label,
             'title': item,
@@ -160,7 +160,6 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
             'group_name': group_name,
             'dependencies': []
         })
-        count += 1
 
     return target_only
 
@@ -217,7 +216,6 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     :param other_param:
     :return: return list of identical and different dict.
     """
-    global count
     identical = []
     different = []
     dict1 = kwargs['dict1']
@@ -239,7 +237,7 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
 
         if are_dictionaries_identical(dict1[key], dict2[key], ignore_keys):
             identical.append({
-                'id': count,
+                'id': next(_object_ids),
                 'type': node,
                 'label': node_label,
                 'title': key,
@@ -312,7 +310,7 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
                 diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
 
             different.append({
-                'id': count,
+                'id': next(_object_ids),
                 'type': node,
                 'label': node_label,
                 'title': key,
@@ -326,7 +324,6 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
                 'group_name': group_name,
                 'dependencies': diff_dependencies
             })
-        count += 1
 
     return identical, different
 
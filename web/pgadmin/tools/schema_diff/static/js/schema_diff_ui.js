@@ -193,17 +193,20 @@ export default class SchemaDiffUI {
 
     self.render_grid([]);
     self.footer.render();
-    self.startDiffPoller();
+    self.stopDiffPoller();
+    $('#ddl_comp_fetching_data').addClass('d-none');
+    $('#diff_fetching_data').removeClass('d-none');
 
+    // The comparison runs in the background, the results are fetched
+    // node type by node type while polling.
     return $.ajax({
       url: baseUrl,
       method: 'GET',
       dataType: 'json',
       contentType: 'application/json',
     })
-      .done(function (res) {
-        self.stopDiffPoller();
-        self.render_grid(res.data);
+      .done(function () {
+        self.startDiffPoller();
       })
       .fail(function (xhr) {
         self.raise_error_on_fail(gettext('Schema compare error'), xhr);
@@ -468,11 +471,15 @@ export default class SchemaDiffUI {
     self.render_grid_data(data);
   }
 
+  sort_grid_data(data) {
+    data.sort((a, b) => (a.label > b.label) ? 1 : (a.label === b.label) ? ((a.title > b.title) ? 1 : -1) : -1);
+  }
+
   render_grid_data(data) {
     var self = this;
     self.grid.setSelectedRows([]);
     self.selected_row_count = self.grid.getSelectedRows().length;
-    data.sort((a, b) => (a.label > b.label) ? 1 : (a.label === b.label) ? ((a.title > b.title) ? 1 : -1) : -1);
+    self.sort_grid_data(data);
     self.dataView.beginUpdate();
     self.dataView.setItems(data);
     self.dataView.setFilter(self.filter.bind(self));
@@ -483,6 +490,19 @@ export default class SchemaDiffUI {
     self.resize_grid();
   }
 
+  append_grid_data(data) {
+    var self = this,
+      items = self.dataView.getItems().concat(data);
+
+    // The selected rows are kept, as the grid selection is synced with the
+    // data view by the item ids.
+    self.sort_grid_data(items);
+    self.dataView.beginUpdate();
+    self.dataView.setItems(items);
+    self.dataView.endUpdate();
+    self.dataView.refresh();
+  }
+
   handle_generate_button(){
     if (this.grid.getSelectedRows().length > 0 || (this.model.get('diff_ddl') != '' && !_.isUndefined(this.model.get('diff_ddl')))) {
       this.header.$el.find('button#generate-script').removeAttr('disabled');
@@ -502,7 +522,7 @@ export default class SchemaDiffUI {
     if (this.grid) this.grid.resizeCanvas();
   }
 
-  getCompareStatus() {
+  getCompareStatus(poller_id) {
     var self = this,
       url_params = {'trans_id': self.trans_id},
       baseUrl = url_for('schema_diff.poll', url_params);
@@ -512,8 +532,12 @@ export default class SchemaDiffUI {
       method: 'GET',
       dataType: 'json',
       contentType: 'application/json',
+      data: {'offset': self.diff_result_count},
     })
       .done(function (res) {
+        // Ignore the response, if the poller has been stopped/restarted
+        if (poller_id !== self.diff_poller_id) return;
+
         let msg = _.escape(res.data.compare_msg);
         if (res.data.diff_percentage != 100) {
           msg = msg + gettext(' (this may take a few minutes)...');
@@ -521,25 +545,40 @@ export default class SchemaDiffUI {
 
         msg = msg + '<br>' + gettext('%s completed.', res.data.diff_percentage + '%');
         $('#diff_fetching_data').find('.schema-diff-busy-text').html(msg);
+
+        if (res.data.diff_result.length > 0) {
+          self.diff_result_count += res.data.diff_result.length;
+          self.append_grid_data(res.data.diff_result);
+        }
+
+        if (res.data.completed) {
+          self.stopDiffPoller();
+        } else {
+          self.diff_poller_timeout_id = setTimeout(
+            self.getCompareStatus.bind(self, poller_id), 1000
+          );
+        }
       })
       .fail(function (xhr) {
+        if (poller_id !== self.diff_poller_id) return;
+
         self.raise_error_on_fail(gettext('Poll error'), xhr);
-        self.stopDiffPoller('fail');
+        self.stopDiffPoller();
       });
   }
 
   startDiffPoller() {
     $('#ddl_comp_fetching_data').addClass('d-none');
     $('#diff_fetching_data').removeClass('d-none');
-    /* Execute once for the first time as setInterval will not do */
-    this.getCompareStatus();
-    this.diff_poller_int_id = setInterval(this.getCompareStatus.bind(this), 1000);
+    this.diff_result_count = 0;
+    this.diff_poller_id = (this.diff_poller_id || 0) + 1;
+    /* Poll again, only once the previous poll is completed */
+    this.getCompareStatus(this.diff_poller_id);
   }
 
-  stopDiffPoller(status) {
-    clearInterval(this.diff_poller_int_id);
-    // The last polling for comparison
-    if (status !== 'fail') this.getCompareStatus();
+  stopDiffPoller() {
+    clearTimeout(this.diff_poller_timeout_id);
+    this.diff_poller_id = (this.diff_poller_id || 0) + 1;
 
     $('#diff_fetching_data').find('.schema-diff-busy-text').text('');
     $('#diff_fetching_data').addClass('d-none');
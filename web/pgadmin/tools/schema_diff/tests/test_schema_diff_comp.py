@@ -11,6 +11,7 @@ import uuid
 import json
 import os
 import random
+import time
 
 from pgadmin.utils.route import BaseTestGenerator
 from regression import parent_node_dict
@@ -116,9 +117,24 @@ class SchemaDiffTestCase(BaseTestGenerator):
                                    )
 
         response = self.tester.get(comp_url)
-
         self.assertEqual(response.status_code, 200)
-        return json.loads(response.data.decode('utf-8'))
+
+        # The comparison runs in the background, poll for the results until
+        # it is completed.
+        diff_result = []
+        while True:
+            response = self.tester.get(
+                'schema_diff/poll/{0}?offset={1}'.format(self.trans_id,
+                                                         len(diff_result)))
+            self.assertEqual(response.status_code, 200)
+            response_data = json.loads(response.data.decode('utf-8'))
+            diff_result.extend(response_data['data']['diff_result'])
+
+            if response_data['data']['completed']:
+                break
+            time.sleep(0.5)
+
+        return {'data': diff_result}
 
     def runTest(self):
         """ This function will test the schema diff."""
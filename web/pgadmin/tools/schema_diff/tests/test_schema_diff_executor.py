@@ -0,0 +1,90 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.compare_executor import SchemaDiffExecutor, \
+    run_side_by_side
+
+
+class SchemaDiffExecutorTestCase(BaseTestGenerator):
+    """ This class will test the schema diff comparison executor. """
+    scenarios = [
+        ('Run the comparisons one after another', dict(
+            max_workers=1, tasks=6)),
+        ('Run the comparisons on the worker threads', dict(
+            max_workers=3, tasks=6)),
+    ]
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def compare(self, idx):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        source, target = run_side_by_side(
+            lambda: threading.current_thread().ident,
+            lambda: threading.current_thread().ident
+        )
+        time.sleep(0.05)
+
+        with self.lock:
+            self.running -= 1
+
+        return [(idx, source, target)]
+
+    def runTest(self):
+        # There are no databases, hence no connections to be made.
+        executor = SchemaDiffExecutor(1, [], max_workers=self.max_workers)
+        for idx in range(self.tasks):
+            executor.add('Comparing {0}'.format(idx), self.compare, idx=idx)
+
+        connected = []
+        connect = executor._connect
+        executor._connect = lambda scope: connected.append(
+            (scope, threading.current_thread().ident)) or connect(scope)
+
+        progress = []
+        with self.app.test_request_context():
+            results = executor.run(
+                lambda msg, percentage: progress.append(percentage))
+
+        # Results are in the order the comparisons were added
+        self.assertEqual([res[0][0] for res in results],
+                         list(range(self.tasks)))
+        self.assertEqual(len(progress), self.tasks)
+        self.assertEqual(progress, sorted(progress))
+        self.assertTrue(self.max_running <= self.max_workers)
+
+        # The connections are made by the request thread, before the workers
+        # are started.
+        if self.max_workers == 1:
+            self.assertEqual(connected, [])
+        else:
+            self.assertEqual(sorted(scope for scope, _ in connected), [
+                'schema_diff:1:{0}{1}'.format(slot, side)
+                for slot in range(self.max_workers) for side in ('', ':side')
+            ])
+            self.assertEqual(
+                set(ident for _, ident in connected),
+                {threading.current_thread().ident}
+            )
+
+        for idx, source, target in (res[0] for res in results):
+            if self.max_workers == 1:
+                self.assertEqual(source, target)
+            else:
+                # The target objects are fetched by another thread
+                self.assertNotEqual(source, target)
@@ -0,0 +1,93 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+
+from flask import session
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.compare_executor import SchemaDiffExecutor
+from pgadmin.tools.schema_diff.compare_job import SchemaDiffJob, \
+    SchemaDiffJobRegistry
+
+
+class SchemaDiffJobTestCase(BaseTestGenerator):
+    """ This class will test the background schema diff job. """
+    scenarios = [
+        ('Stream the results of the comparisons', dict(
+            max_workers=2, tasks=4, cancel=False)),
+        ('Cancel the comparisons not started yet', dict(
+            max_workers=1, tasks=4, cancel=True)),
+    ]
+
+    def setUp(self):
+        self.blocked = threading.Event()
+        self.sessions = []
+
+    def compare(self, idx):
+        # The first comparison waits, until the test has seen its result
+        # missing from the job.
+        if idx == 0:
+            self.blocked.wait(5)
+        self.sessions.append(session._get_current_object())
+        return [{'id': idx}]
+
+    def wait_for(self, job):
+        for _ in range(100):
+            if job.completed:
+                break
+            time.sleep(0.05)
+
+    def runTest(self):
+        registry = SchemaDiffJobRegistry()
+
+        with self.app.test_request_context():
+            session['key'] = 'value'
+            request_session = session._get_current_object()
+
+            executor = SchemaDiffExecutor(1, [], max_workers=self.max_workers)
+            for idx in range(self.tasks):
+                executor.add('Comparing {0}'.format(idx), self.compare,
+                             idx=idx)
+
+            job = SchemaDiffJob(executor, 'Comparing...', 'Compared.')
+            registry.start('sid', 1, job)
+            self.assertIs(registry.get('sid', '1'), job)
+
+            status = job.status()
+            self.assertFalse(status['completed'])
+
+            if self.cancel:
+                registry.remove('sid', 1)
+                self.assertIsNone(registry.get('sid', 1))
+            self.blocked.set()
+            self.wait_for(job)
+
+        status = job.status()
+        self.assertTrue(status['completed'])
+        self.assertIsNone(job.error)
+
+        # The comparisons are run with a copy of the session, as the job
+        # outlives the request starting it.
+        for job_session in self.sessions:
+            self.assertIsNot(job_session, request_session)
+            self.assertEqual(job_session['key'], 'value')
+
+        if self.cancel:
+            # Only the running comparison is completed
+            self.assertEqual(status['diff_result'], [{'id': 0}])
+        else:
+            self.assertEqual(status['diff_percentage'], 100)
+            self.assertEqual(status['compare_msg'], 'Compared.')
+            self.assertEqual(
+                sorted(row['id'] for row in status['diff_result']),
+                list(range(self.tasks)))
+            # Only the results after the offset are returned
+            self.assertEqual(len(job.status(3)['diff_result']),
+                             self.tasks - 3)
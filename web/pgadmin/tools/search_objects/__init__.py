@@ -13,6 +13,7 @@ from flask import request
 from flask_babelex import gettext
 from flask_security import login_required
 
+from pgadmin.browser.utils import get_page_args
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_json_response, bad_request,\
     internal_server_error
@@ -73,15 +74,35 @@ def search(sid, did):
     URL args:
         text <required>: search text
         type <optional>: type of object to be searched.
+        prefix <optional>: search the names starting with the text.
+        limit <optional>: maximum number of the objects to be returned.
+        offset <optional>: number of the objects to be skipped.
     """
     text = request.args.get('text', None)
     obj_type = request.args.get('type', None)
+    prefix = request.args.get('prefix', 'false').lower() == 'true'
+
+    try:
+        window = get_page_args(limit=None, offset=0)
+    except ValueError as e:
+        return bad_request(errormsg=str(e))
+    limit, offset = window['limit'], window['offset']
 
     so_obj = SearchObjectsHelper(sid, did, blueprint.show_system_objects())
 
-    status, res = so_obj.search(text, obj_type)
+    # Fetch one more object to know whether there are more of them
+    status, res = so_obj.search(
+        text, obj_type, prefix,
+        limit=limit + 1 if limit is not None else None, offset=offset
+    )
 
     if not status:
         return internal_server_error(errormsg=res)
 
-    return make_json_response(data=res)
+    if limit is None:
+        return make_json_response(data=res)
+
+    return make_json_response(
+        data=res[:limit],
+        result={'next': offset + limit if len(res) > limit else None}
+    )
@@ -0,0 +1,300 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+In-memory index of the object names of the databases, searched instead of the
+database catalogs (see SEARCH_OBJECTS_INDEX).
+
+The index of a database is built in the background on the first search of it
+(which searches the catalogs meanwhile), using a connection of its own, which
+is kept open for the next refreshes (and, released with the other connections
+of the server). It is checked for changes of the catalogs at most every
+SEARCH_OBJECTS_INDEX_REFRESH seconds, while searched, by comparing the
+watermarks (number of rows, highest xmin, and highest oid) of the catalogs
+(and, of each kind of the relations), and only the object types of the changed
+catalogs are fetched again (all of them, when the schemas have been changed).
+
+The objects are ordered as the search.sql templates order them, by the code
+points of the type, lower case name, name, and path, so that the pages of a
+search are the same, whether the index or the catalogs are searched.
+
+The indexes are kept per server manager (i.e. per session and server),
+database, and 'show system objects' preference.
+"""
+
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from flask import current_app as app
+from flask_babelex import get_domain
+
+import config
+
+IndexedObject = namedtuple(
+    'IndexedObject', ['type', 'name', 'path', 'other_info', 'catalog_level']
+)
+
+_Snapshot = namedtuple(
+    '_Snapshot', ['objects', 'names', 'text', 'offsets', 'ranges']
+)
+
+# Object types searched for the (collection) type, other than itself
+_OBJ_TYPES = {
+    'constraints': [
+        'check_constraint', 'exclusion_constraint', 'foreign_key',
+        'primary_key', 'unique_constraint'
+    ]
+}
+
+# Separator of the object names in the text searched, which can not be a part
+# of a name.
+_SEPARATOR = '\0'
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_object_index(manager, did, show_system_objects):
+    """
+    Returns the object index (ObjectIndex) of the given database, and 'show
+    system objects' preference (created, if not exists).
+    """
+    with _indexes_lock:
+        indexes = _indexes.setdefault(manager, dict())
+        key = (did, show_system_objects)
+        if key not in indexes:
+            indexes[key] = ObjectIndex()
+        return indexes[key]
+
+
+class ObjectIndex(object):
+    """
+    class ObjectIndex(object)
+
+        Object names of a database, sorted by type, and (lower case) name,
+        which are also joined in a single text, so that a substring is found
+        by a single scan of the text, and a prefix by a binary search of the
+        names of each type.
+
+    Methods:
+    -------
+    * search(text, obj_type=None, prefix=False)
+      - Yields the objects (IndexedObject) of the given type, having the given
+        text in (or, at the beginning of) their names.
+
+    * refresh_in_background(helper)
+      - Start refreshing the index in a background thread, unless refreshed
+        recently (or, being refreshed).
+
+    * refresh(helper, conn, show_node_prefs=None, translations=None)
+      - Fetch the objects of the catalogs changed since the last refresh.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self.watermarks = None
+        self.refreshing = False
+        self.last_refresh = 0
+        self.error = None
+
+    @property
+    def ready(self):
+        return self._snapshot is not None
+
+    def search(self, text, obj_type=None, prefix=False):
+        """
+        Yields the objects (IndexedObject) of the given type, having the given
+        text in (or, at the beginning of) their names (case insensitively),
+        ordered by type and name.
+
+        :param text: text to be searched
+        :param obj_type: object type, None (or, 'all') for all of them
+        :param prefix: search the names starting with the text
+        """
+        snapshot = self._snapshot
+        text = text.lower()
+
+        if obj_type is None or obj_type == 'all':
+            ranges = sorted(snapshot.ranges.values())
+        else:
+            ranges = sorted(
+                snapshot.ranges[t]
+                for t in _OBJ_TYPES.get(obj_type, [obj_type])
+                if t in snapshot.ranges
+            )
+
+        if _SEPARATOR in text:
+            return
+
+        for first, last in ranges:
+            if prefix:
+                idx = bisect_left(snapshot.names, text, first, last)
+                while idx < last and snapshot.names[idx].startswith(text):
+                    yield snapshot.objects[idx]
+                    idx += 1
+                continue
+
+            end = snapshot.offsets[last] - 1 \
+                if last < len(snapshot.offsets) else len(snapshot.text)
+            pos = snapshot.text.find(text, snapshot.offsets[first], end)
+            while pos >= 0:
+                idx = bisect_right(snapshot.offsets, pos) - 1
+                yield snapshot.objects[idx]
+                if idx + 1 >= last:
+                    break
+                # Search the next names only, the object has been matched
+                pos = snapshot.text.find(
+                    text, snapshot.offsets[idx + 1], end
+                )
+
+    def _load(self, objects, watermarks):
+        # Same order as the 'COLLATE "C"' ordering of the search.sql templates
+        objects.sort(key=lambda o: (o.type, o.name.lower(), o.name, o.path))
+        names = [o.name.lower() for o in objects]
+
+        offsets = []
+        ranges = dict()
+        pos = 0
+        for idx, obj in enumerate(objects):
+            offsets.append(pos)
+            pos += len(names[idx]) + 1
+            first, _ = ranges.get(obj.type, (idx, idx))
+            ranges[obj.type] = (first, idx + 1)
+
+        self._snapshot = _Snapshot(
+            objects, names, _SEPARATOR.join(names), offsets, ranges
+        )
+        self.watermarks = watermarks
+
+    def refresh_in_background(self, helper):
+        """
+        Start refreshing the index in a background thread, unless it has been
+        refreshed (or, failed) within SEARCH_OBJECTS_INDEX_REFRESH seconds,
+        or, it is being refreshed.
+
+        The connection of the index is connected, and the preferences are read
+        by the request thread, as the user of the session is needed for them,
+        and the thread refreshes the index within an application context.
+
+        :param helper: SearchObjectsHelper of the database
+        """
+        now = time.time()
+        with self._lock:
+            if self.refreshing or now - self.last_refresh < \
+                    config.SEARCH_OBJECTS_INDEX_REFRESH:
+                return
+            self.refreshing = True
+            self.last_refresh = now
+
+        conn_id = 'search_objects_index_{0}'.format(helper.did)
+        try:
+            conn = helper.manager.connection(did=helper.did, conn_id=conn_id)
+            status, res = True, None
+            if not conn.connected():
+                status, res = conn.connect()
+            if not status:
+                self._failed(res)
+                return
+
+            thread = threading.Thread(
+                target=self._run,
+                args=(app._get_current_object(), helper, conn,
+                      helper.get_show_node_prefs(),
+                      get_domain().get_translations()),
+                name=conn_id
+            )
+            thread.daemon = True
+            thread.start()
+        except Exception as e:
+            app.logger.exception(e)
+            self._failed(str(e))
+
+    def _failed(self, error):
+        self.error = error
+        self.refreshing = False
+
+    def _run(self, flask_app, helper, conn, show_node_prefs, translations):
+        with flask_app.app_context():
+            try:
+                status, res = self.refresh(
+                    helper, conn, show_node_prefs, translations
+                )
+                self.error = None if status else res
+                if not status:
+                    app.logger.error(
+                        'Failed to refresh the object index: {0}'.format(res)
+                    )
+            except Exception as e:
+                app.logger.exception(e)
+                self.error = str(e)
+            finally:
+                self.refreshing = False
+
+    def refresh(self, helper, conn, show_node_prefs=None, translations=None):
+        """
+        Fetch the objects of the catalogs changed since the last refresh (or,
+        all of them, on the first one) using the given connection.
+
+        :param helper: SearchObjectsHelper of the database
+        :param conn: connection to the database
+        :param show_node_prefs: 'show node' preferences of the object types
+        :param translations: translations of the labels of the paths
+        :return: (status, error message)
+        """
+        # The watermarks are read first, so that the changes made while the
+        # objects are fetched are found on the next refresh.
+        status, res = conn.execute_dict(helper.get_sql('watermark.sql'))
+        if not status:
+            return False, res
+
+        watermarks = dict(
+            (row['catalog'], (row['watermark'], row['obj_types']))
+            for row in res['rows']
+        )
+
+        obj_types = None
+        if self.ready and self.watermarks is not None:
+            obj_types = set()
+            for catalog, (watermark, types) in watermarks.items():
+                last = self.watermarks.get(catalog, None)
+                if last is not None and last[0] == watermark:
+                    continue
+                if types is None:
+                    obj_types = None
+                    break
+                obj_types.update(types.split(','))
+
+            if obj_types is not None and len(obj_types) == 0:
+                self.watermarks = watermarks
+                return True, None
+
+        if obj_types is None:
+            status, objects = helper.fetch_objects(
+                conn, None, show_node_prefs, translations
+            )
+            if not status:
+                return False, objects
+        else:
+            objects = [
+                o for o in self._snapshot.objects if o.type not in obj_types
+            ]
+            for obj_type in sorted(obj_types):
+                status, res = helper.fetch_objects(
+                    conn, obj_type, show_node_prefs, translations
+                )
+                if not status:
+                    return False, res
+                objects.extend(o for o in res if o.type == obj_type)
+
+        self._load(objects, watermarks)
+        return True, None
@@ -0,0 +1,11 @@
+{# The watermark of a catalog changes, when a row is inserted (count, xmin, and oid), updated (xmin), or deleted (count). #}
+{# The watermark of pg_class is kept per the given kinds of the relations, named as 'pg_class:<relkinds>'. #}
+{% macro WATERMARK(catalog, obj_types, id_column='oid', has_xmin=true, relkinds=none) -%}
+    SELECT '{{ catalog }}{% if relkinds %}:{{ relkinds|join('') }}{% endif %}'::text AS catalog,
+    count(*)::text || ':' ||
+    {% if has_xmin %}COALESCE(max(xmin::text::bigint), 0)::text{% else %}''{% endif %} || ':' ||
+    COALESCE(max({{ id_column }})::text, '') AS watermark,
+    {% if obj_types %}'{{ obj_types|join(',') }}'{% else %}NULL{% endif %}::text AS obj_types
+    FROM {{ catalog }}
+    {%- if relkinds %} WHERE relkind IN ({% for relkind in relkinds %}'{{ relkind }}'{% if not loop.last %}, {% endif %}{% endfor %}){% endif %}
+{%- endmacro %}
@@ -0,0 +1,54 @@
+{% import 'search_objects/sql/macros/watermark.sql' as WATERMARK %}
+{{ WATERMARK.WATERMARK('pg_namespace', none) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['table', 'partition', 'column', 'index', 'trigger', 'rule', 'check_constraint', 'exclusion_constraint', 'foreign_key', 'primary_key', 'unique_constraint', 'row_security_policy'], relkinds=['r', 'p', 't']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['view', 'column', 'rule', 'trigger'], relkinds=['v']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['mview', 'column', 'index'], relkinds=['m']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['sequence'], relkinds=['S']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['foreign_table'], relkinds=['f']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['index'], relkinds=['i', 'I']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_class', ['type'], relkinds=['c']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_proc', ['trigger_function', 'function']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_type', ['type', 'domain', 'domain_constraints']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_constraint', ['check_constraint', 'foreign_key', 'primary_key', 'unique_constraint', 'exclusion_constraint', 'domain_constraints']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_trigger', ['trigger']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_rewrite', ['rule']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_attribute', ['column'], 'attrelid') }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_cast', ['cast']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_language', ['language']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_ts_config', ['fts_configuration']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_ts_dict', ['fts_dictionary']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_ts_parser', ['fts_parser']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_ts_template', ['fts_template']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_foreign_data_wrapper', ['foreign_data_wrapper', 'foreign_server', 'user_mapping']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_foreign_server', ['foreign_server', 'user_mapping']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_user_mappings', ['user_mapping'], 'umid', false) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_extension', ['extension']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_event_trigger', ['event_trigger']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_collation', ['collation']) }}
+UNION ALL
+{{ WATERMARK.WATERMARK('pg_policy', ['row_security_policy']) }}
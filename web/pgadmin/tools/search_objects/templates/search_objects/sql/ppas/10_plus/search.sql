@@ -3,6 +3,8 @@
 {% if obj_type == 'all' or obj_type is none %}
 {% set all_obj = true %}
 {% endif %}
+{# Ordered as the object index (see object_index.py), by the code points of the names. #}
+SELECT * FROM (
 SELECT obj_type, obj_name,
     REPLACE(obj_path, '/'||sn.schema_name||'/', '/'||{{ CATALOGS.LABELS_SCHEMACOL('sn.schema_name', _) }}||'/') AS obj_path,
     schema_name, show_node, other_info,
@@ -558,9 +560,13 @@ FROM (
 {% endif %}
 
 ) sn
-where lower(sn.obj_name) like '%{{ search_text }}%'
+where lower(sn.obj_name) like '{% if not prefix %}%{% endif %}{{ search_text }}%'
 {% if not show_system_objects %}
 AND NOT ({{ CATALOGS.IS_CATALOG_SCHEMA('sn.schema_name') }})
 AND (sn.schema_name IS NOT NULL AND sn.schema_name NOT LIKE 'pg\_%')
 {% endif %}
-ORDER BY 1, 2, 3
+) so
+ORDER BY so.obj_type COLLATE "C", lower(so.obj_name) COLLATE "C", so.obj_name COLLATE "C", so.obj_path COLLATE "C"
+{% if limit %}
+LIMIT {{ limit }} OFFSET {{ offset }}
+{% endif %}
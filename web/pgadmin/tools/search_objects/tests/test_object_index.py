@@ -0,0 +1,213 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+
+from flask import has_app_context, has_request_context, render_template
+
+from pgadmin.tools.search_objects.object_index import IndexedObject, \
+    ObjectIndex
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class _Connection(object):
+    def __init__(self, watermarks):
+        self.watermarks = watermarks
+        self.connects = 0
+
+    def connected(self):
+        return self.connects > 0
+
+    def connect(self):
+        self.connects += 1
+        return True, None
+
+    def execute_dict(self, query):
+        return True, {'rows': [
+            dict(catalog=catalog, watermark=watermark, obj_types=obj_types)
+            for catalog, (watermark, obj_types) in self.watermarks.items()
+        ]}
+
+
+class _Manager(object):
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connection(self, did=None, conn_id=None):
+        return self.conn
+
+
+class _Helper(object):
+    did = 1
+
+    def __init__(self, objects, conn=None):
+        self.objects = objects
+        self.fetched = []
+        self.manager = _Manager(conn)
+        self.contexts = []
+
+    def get_sql(self, sql_file, **kwargs):
+        return sql_file
+
+    def get_show_node_prefs(self):
+        return dict(table=True)
+
+    def fetch_objects(self, conn, obj_type=None, show_node_prefs=None,
+                      translations=None):
+        self.fetched.append(obj_type)
+        self.contexts.append(
+            (has_app_context(), has_request_context(), show_node_prefs,
+             translations is not None)
+        )
+        return True, [
+            IndexedObject(t, name, '/' + name, None, 'N')
+            for t, name in self.objects
+            if obj_type is None or t == obj_type
+        ]
+
+
+class ObjectIndexTestCase(BaseTestGenerator):
+    """ This class will test the in-memory index of the object names. """
+
+    scenarios = [
+        ('Substring of the names', dict(
+            text='ORD', obj_type=None, prefix=False,
+            expected=[('column', 'order_id'), ('function', 'add_order'),
+                      ('primary_key', 'orders_pkey'), ('table', 'Orders'),
+                      ('table', 'sales_orders')])),
+        ('Prefix of the names', dict(
+            text='ord', obj_type=None, prefix=True,
+            expected=[('column', 'order_id'), ('primary_key', 'orders_pkey'),
+                      ('table', 'Orders')])),
+        ('Names of a type', dict(
+            text='s', obj_type='table', prefix=False,
+            expected=[('table', 'Orders'), ('table', 'sales_orders')])),
+        ('Names of the constraint types', dict(
+            text='', obj_type='constraints', prefix=False,
+            expected=[('check_constraint', 'qty_check'),
+                      ('primary_key', 'orders_pkey')])),
+        ('All the names', dict(
+            text='', obj_type='all', prefix=True,
+            expected=[('check_constraint', 'qty_check'),
+                      ('column', 'order_id'), ('function', 'add_order'),
+                      ('primary_key', 'orders_pkey'), ('table', 'Orders'),
+                      ('table', 'sales_orders')])),
+        ('No matching names', dict(
+            text='xyz', obj_type=None, prefix=False, expected=[])),
+    ]
+
+    def runTest(self):
+        helper = _Helper([
+            ('table', 'sales_orders'), ('table', 'Orders'),
+            ('column', 'order_id'), ('function', 'add_order'),
+            ('primary_key', 'orders_pkey'), ('check_constraint', 'qty_check'),
+        ])
+        conn = _Connection({
+            'pg_namespace': ('5:100:2200', None),
+            'pg_class:rpt': ('10:100:16400',
+                             'table,column,primary_key,check_constraint'),
+            'pg_class:S': ('1:100:16390', 'sequence'),
+            'pg_proc': ('20:100:16410', 'function'),
+        })
+
+        index = ObjectIndex()
+        self.assertFalse(index.ready)
+        self.assertEqual(index.refresh(helper, conn), (True, None))
+        self.assertTrue(index.ready)
+        self.assertEqual(helper.fetched, [None])
+
+        self.assertEqual(
+            [(o.type, o.name) for o in index.search(
+                self.text, self.obj_type, self.prefix)],
+            self.expected
+        )
+
+        # Nothing is fetched, unless the catalogs have been changed
+        index.refresh(helper, conn)
+        self.assertEqual(helper.fetched, [None])
+
+        # Only the objects of the changed catalog are fetched
+        helper.objects.append(('function', 'ord_total'))
+        conn.watermarks['pg_proc'] = ('21:105:16420', 'function')
+        index.refresh(helper, conn)
+        self.assertEqual(helper.fetched, [None, 'function'])
+        self.assertEqual(
+            [o.name for o in index.search('ord', prefix=True)],
+            ['order_id', 'ord_total', 'orders_pkey', 'Orders']
+        )
+
+        # Only the types of the changed kind of the relations
+        helper.objects.remove(('table', 'Orders'))
+        conn.watermarks['pg_class:rpt'] = (
+            '9:110:16400', 'table,column,primary_key,check_constraint')
+        index.refresh(helper, conn)
+        self.assertEqual(helper.fetched, [
+            None, 'function', 'check_constraint', 'column', 'primary_key',
+            'table'
+        ])
+        self.assertEqual(
+            [o.name for o in index.search('orders')],
+            ['orders_pkey', 'sales_orders']
+        )
+
+        # All of them, when the schemas have been changed
+        conn.watermarks['pg_namespace'] = ('6:120:2200', None)
+        helper.fetched = []
+        index.refresh(helper, conn)
+        self.assertEqual(helper.fetched, [None])
+
+        # Ordered by the code points (as by 'COLLATE "C"' of the catalogs)
+        helper.objects.extend([
+            ('table', '_orders'), ('table', 'ORDERS'), ('table', 'Ärders')
+        ])
+        conn.watermarks['pg_namespace'] = ('7:130:2200', None)
+        index.refresh(helper, conn)
+        self.assertEqual(
+            [o.name for o in index.search('', 'table')],
+            ['_orders', 'ORDERS', 'sales_orders', 'Ärders']
+        )
+
+        # Refreshed in a thread within an application context
+        helper = _Helper([('table', 'Orders')], _Connection(conn.watermarks))
+        index = ObjectIndex()
+        with self.app.test_request_context():
+            index.refresh_in_background(helper)
+        for _ in range(100):
+            if not index.refreshing:
+                break
+            time.sleep(0.05)
+        self.assertTrue(index.ready)
+        self.assertIsNone(index.error)
+        self.assertEqual(helper.manager.conn.connects, 1)
+        self.assertEqual(
+            helper.contexts, [(True, False, dict(table=True), True)]
+        )
+
+        # The watermarks of the catalogs are fetched by the template
+        with self.app.test_request_context():
+            for server_type, version in (('pg', 100000), ('pg', 110000),
+                                         ('ppas', 120000)):
+                sql = render_template(
+                    'search_objects/sql/{0}/#{1}#/watermark.sql'.format(
+                        server_type, version))
+                self.assertIn("'pg_class:rpt'::text AS catalog", sql)
+                self.assertIn("'table,partition,column,", sql)
+                self.assertIn("FROM pg_class WHERE relkind IN ('r', 'p', 't')",
+                              sql)
+                self.assertIn("'row_security_policy'::text AS obj_types",
+                              sql)
+
+                sql = render_template(
+                    'search_objects/sql/{0}/#{1}#/search.sql'.format(
+                        server_type, version),
+                    obj_type='table', show_node_prefs=dict(table=True),
+                    search_text='', _=lambda s: s)
+                self.assertIn(
+                    'ORDER BY so.obj_type COLLATE "C", '
+                    'lower(so.obj_name) COLLATE "C"', sql)
@@ -7,10 +7,15 @@
 #
 ##########################################################################
 
+from itertools import islice
+
 from flask import current_app, render_template
 from flask_babelex import gettext
 
+import config
 from pgadmin.utils.driver import get_driver
+from pgadmin.tools.search_objects.object_index import IndexedObject, \
+    get_object_index
 from config import PG_DEFAULT_DRIVER
 
 
@@ -88,14 +93,15 @@ class SearchObjectsHelper:
             **kwargs
         )
 
-    def search(self, text, obj_type=None):
-        conn = self.manager.connection(did=self.did)
+    def _execute_search(self, conn, text, obj_type=None, prefix=False,
+                        limit=None, offset=0, show_node_prefs=None,
+                        translations=None):
         last_system_oid = (self.manager.db_info[self.did])['datlastsysoid'] \
             if self.manager.db_info is not None and self.did in \
             self.manager.db_info else 0
 
-        show_node_prefs = self.get_show_node_prefs()
-        node_labels = self.get_supported_types(skip_check=True)
+        if show_node_prefs is None:
+            show_node_prefs = self.get_show_node_prefs()
         # escape the single quote from search text
         text = text.replace("'", "''")
 
@@ -103,12 +109,87 @@ class SearchObjectsHelper:
         # N - Not a catalog schema
         # D - Catalog schema with DB support - pg_catalog
         # O - Catalog schema with object support only - info schema, dbo, sys
-        status, res = conn.execute_dict(
+        return conn.execute_dict(
             self.get_sql('search.sql',
                          search_text=text.lower(), obj_type=obj_type,
                          show_system_objects=self.show_system_objects,
-                         show_node_prefs=show_node_prefs, _=gettext,
-                         last_system_oid=last_system_oid)
+                         show_node_prefs=show_node_prefs,
+                         _=gettext if translations is None else
+                         translations.ugettext,
+                         last_system_oid=last_system_oid, prefix=prefix,
+                         limit=limit, offset=offset)
+        )
+
+    def fetch_objects(self, conn, obj_type=None, show_node_prefs=None,
+                      translations=None):
+        """
+        Returns (status, list of IndexedObject) of all the objects of the
+        given type (or, all of them) to be indexed.
+
+        The preferences, and the translations are to be given, when called
+        outside of a request.
+        """
+        status, res = self._execute_search(
+            conn, '', obj_type, show_node_prefs=show_node_prefs,
+            translations=translations
+        )
+        if not status:
+            return status, res
+
+        return True, [
+            IndexedObject(row['obj_type'], row['obj_name'], row['obj_path'],
+                          row['other_info'], row['catalog_level'])
+            for row in res['rows']
+        ]
+
+    def search(self, text, obj_type=None, prefix=False, limit=None,
+               offset=0):
+        """
+        Returns (status, list of the objects) having the given text in (or, at
+        the beginning of) their names, ordered by type and name.
+
+        The object index of the database is searched (and, refreshed in the
+        background), if enabled (SEARCH_OBJECTS_INDEX) and built, otherwise
+        the database catalogs.
+
+        :param text: text to be searched
+        :param obj_type: type of the objects to be searched
+        :param prefix: search the names starting with the text
+        :param limit: maximum number of the objects returned
+        :param offset: number of the matching objects to be skipped
+        """
+        show_node_prefs = self.get_show_node_prefs()
+        node_labels = self.get_supported_types(skip_check=True)
+
+        if config.SEARCH_OBJECTS_INDEX:
+            index = get_object_index(
+                self.manager, self.did, self.show_system_objects
+            )
+            index.refresh_in_background(self)
+
+            if index.ready:
+                objects = index.search(text, obj_type, prefix)
+                if limit is not None:
+                    objects = islice(objects, offset, offset + limit)
+                elif offset:
+                    objects = islice(objects, offset, None)
+
+                return True, [
+                    {
+                        'name': obj.name,
+                        'type': obj.type,
+                        'type_label': node_labels[obj.type],
+                        'path': obj.path,
+                        'show_node': show_node_prefs.get(obj.type, True),
+                        'other_info': obj.other_info,
+                        'catalog_level': obj.catalog_level,
+                    }
+                    for obj in objects
+                ]
+
+        conn = self.manager.connection(did=self.did)
+        status, res = self._execute_search(
+            conn, text, obj_type, prefix, limit, offset, show_node_prefs
         )
 
         if not status:
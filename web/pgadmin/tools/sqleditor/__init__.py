@@ -9,16 +9,17 @@
 
 """A blueprint module implementing the sqleditor frame."""
 import os
-import pickle
 import re
 from urllib.parse import unquote
 
 import simplejson as json
-from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT
+from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT, \
+    QUERY_TOOL_DOWNLOAD_ITERSIZE
 from flask import Response, url_for, render_template, session, current_app
 from flask import request, jsonify
 from flask_babelex import gettext
 from flask_security import login_required, current_user
+from pgadmin.browser.utils import get_page_args
 from pgadmin.misc.file_manager import Filemanager
 from pgadmin.tools.sqleditor.command import QueryToolCommand
 from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
@@ -27,6 +28,8 @@ from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    get_command_obj, save_command_obj, update_fetched_row_cnt
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
 from pgadmin.utils.ajax import make_json_response, bad_request, \
@@ -36,6 +39,7 @@ from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost, \
     CryptKeyMissing
 from pgadmin.utils.menu import MenuItem
 from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
+from pgadmin.utils.sqlautocomplete.metadata_cache import metadata_cache
 from pgadmin.tools.sqleditor.utils.query_tool_preferences import \
     register_query_tool_preferences
 from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
@@ -90,6 +94,7 @@ class SqlEditorModule(PgAdminModule):
         """
         return [
             'sqleditor.view_data_start',
+            'sqleditor.view_data_page',
             'sqleditor.query_tool_start',
             'sqleditor.poll',
             'sqleditor.fetch',
@@ -161,10 +166,9 @@ def check_transaction_status(trans_id):
     if str(trans_id) not in grid_data:
         return False, ERROR_MSG_TRANS_ID_NOT_FOUND, None, None, None
 
-    # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
+    # Fetch the live command object for the specified transaction id.
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = get_command_obj(trans_id, session_obj)
 
     try:
         manager = get_driver(
@@ -245,7 +249,7 @@ def start_view_data(trans_id):
         sql = trans_obj.get_sql(default_conn)
         pk_names, primary_keys = trans_obj.get_primary_keys(default_conn)
 
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
 
         has_oids = False
         if trans_obj.object_type == 'table':
@@ -260,6 +264,7 @@ def start_view_data(trans_id):
 
         can_edit = trans_obj.can_edit()
         can_filter = trans_obj.can_filter()
+        keyset_pagination = trans_obj.can_fetch_by_keys(primary_keys)
 
         # Store the primary keys to the session object
         session_obj['primary_keys'] = primary_keys
@@ -269,14 +274,22 @@ def start_view_data(trans_id):
 
         update_session_grid_transaction(trans_id, session_obj)
 
+        # Only the first page is fetched by the query, when the next pages
+        # are fetched by the ranges of the primary keys (see view_data_page),
+        # so that neither the whole table is read, nor its cursor is kept.
+        query = sql
+        if keyset_pagination:
+            query = trans_obj.get_page_sql(default_conn, primary_keys)
+
         # Execute sql asynchronously
-        status, result = conn.execute_async(sql)
+        status, result = conn.execute_async(query)
     else:
         status = False
         result = error_msg
         filter_applied = False
         can_edit = False
         can_filter = False
+        keyset_pagination = False
         sql = None
 
     return make_json_response(
@@ -285,11 +298,105 @@ def start_view_data(trans_id):
             'filter_applied': filter_applied,
             'limit': limit, 'can_edit': can_edit,
             'can_filter': can_filter, 'sql': sql,
+            'keyset_pagination': keyset_pagination,
             'info_notifier_timeout': blueprint.info_notifier_timeout.get()
         }
     )
 
 
+@blueprint.route(
+    '/view_data/page/<int:trans_id>',
+    methods=["GET"], endpoint='view_data_page'
+)
+@login_required
+def view_data_page(trans_id):
+    """
+    This method is used to fetch a page of the rows of a table ordered by its
+    primary keys, i.e. by the range of the keys (see 'keyset_pagination' of
+    view_data_start), without keeping the cursor of the query open.
+
+    Args:
+        trans_id: unique transaction id
+
+    URL args:
+        after <optional>: JSON array of the primary key values of the last
+                          row of the previous page ('next' of it)
+        offset <optional>: (estimated) position of the first row of the page
+        limit <optional>: maximum number of the rows to be returned
+    """
+    try:
+        page = get_page_args(offset=0, limit=ON_DEMAND_RECORD_COUNT)
+    except ValueError as e:
+        return bad_request(errormsg=str(e))
+
+    if 'after' in request.args:
+        try:
+            page['after'] = json.loads(request.args['after'])
+        except ValueError:
+            page['after'] = None
+        if not isinstance(page['after'], list):
+            return bad_request(errormsg=gettext(
+                "Invalid value for '{0}': {1}").format(
+                'after', request.args['after']))
+
+    # Check the transaction and connection status
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if not status or trans_obj is None or session_obj is None:
+        return make_json_response(
+            data={'status': 'NotConnected', 'result': error_msg}
+        )
+
+    # The rows are fetched using the default connection, as the connection
+    # attached to the trans id may be holding the cursor of the query.
+    try:
+        manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+            trans_obj.sid)
+        default_conn = manager.connection(did=trans_obj.did)
+        if not default_conn.connected():
+            status, msg = default_conn.connect()
+            if not status:
+                return make_json_response(
+                    data={'status': status, 'result': "{}".format(msg)}
+                )
+
+        _, primary_keys = trans_obj.get_primary_keys(default_conn)
+        if not trans_obj.can_fetch_by_keys(primary_keys):
+            return bad_request(errormsg=gettext(
+                "The rows can not be fetched by the ranges of the primary "
+                "keys."))
+
+        if 'after' in page and len(page['after']) != len(primary_keys):
+            return bad_request(errormsg=gettext(
+                "Invalid value for '{0}': {1}").format(
+                'after', request.args['after']))
+
+        result = trans_obj.fetch_page_by_keys(default_conn, **page)
+    except (ConnectionLost, SSHTunnelConnectionLost):
+        raise
+    except Exception as e:
+        current_app.logger.error(e)
+        return internal_server_error(errormsg=str(e))
+
+    return make_json_response(
+        data={
+            'status': 'Success',
+            'result': result['rows'],
+            'has_more_rows': result['next'] is not None,
+            'next': result['next'],
+            'estimated_rows': result['estimated_rows'],
+            'estimated': result['estimated']
+        },
+        encoding=default_conn.python_encoding
+    )
+
+
 @blueprint.route(
     '/query_tool/start/<int:trans_id>',
     methods=["PUT", "POST"], endpoint='query_tool_start'
@@ -377,6 +484,12 @@ def poll(trans_id):
             status = 'Success'
             rows_affected = conn.rows_affected()
 
+            # Objects created/altered/dropped by the query (if any) must not
+            # be served from the auto complete cache (anymore).
+            metadata_cache.invalidate_if_changed(
+                trans_obj.sid, conn.db, conn.status_message()
+            )
+
             # if transaction object is instance of QueryToolCommand
             # and transaction aborted for some reason then issue a
             # rollback to cleanup
@@ -413,8 +526,7 @@ def poll(trans_id):
                     pk_names, primary_keys = trans_obj.get_primary_keys()
                     session_obj['has_oids'] = trans_obj.has_oids()
                     # Update command_obj in session obj
-                    session_obj['command_obj'] = pickle.dumps(
-                        trans_obj, -1)
+                    save_command_obj(trans_id, session_obj, trans_obj)
                     # If primary_keys exist, add them to the session_obj to
                     # allow for saving any changes to the data
                     if primary_keys is not None:
@@ -439,16 +551,20 @@ def poll(trans_id):
                             columns[col['name']] = col_type
 
                 if columns:
-                    st, types = fetch_pg_types(columns, trans_obj)
+                    st, type_names = fetch_pg_types(columns, trans_obj)
 
                     if not st:
-                        return internal_server_error(types)
+                        return internal_server_error(type_names)
+
+                    types = [
+                        {'oid': oid, 'typname': typname}
+                        for oid, typname in sorted(type_names.items())
+                    ]
 
                     for col_name, col_info in columns.items():
-                        for col_type in types:
-                            if col_type['oid'] == col_info['type_code']:
-                                typname = col_type['typname']
-                                col_info['type_name'] = typname
+                        if col_info['type_code'] in type_names:
+                            col_info['type_name'] = \
+                                type_names[col_info['type_code']]
 
                         # Using characters %, (, ) in the argument names is not
                         # supported in psycopg2
@@ -465,12 +581,10 @@ def poll(trans_id):
 
                     if res_len > 0:
                         rows_fetched_from = trans_obj.get_fetched_row_cnt()
-                        trans_obj.update_fetched_row_cnt(
-                            rows_fetched_from + res_len)
+                        update_fetched_row_cnt(
+                            trans_id, trans_obj, rows_fetched_from + res_len)
                         rows_fetched_from += 1
                         rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                        session_obj['command_obj'] = pickle.dumps(
-                            trans_obj, -1)
 
                 # As we changed the transaction object we need to
                 # restore it and update the session variable.
@@ -558,11 +672,10 @@ def fetch(trans_id, fetch_all=None):
 
             if res_len:
                 rows_fetched_from = trans_obj.get_fetched_row_cnt()
-                trans_obj.update_fetched_row_cnt(rows_fetched_from + res_len)
+                update_fetched_row_cnt(
+                    trans_id, trans_obj, rows_fetched_from + res_len)
                 rows_fetched_from += 1
                 rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-                update_session_grid_transaction(trans_id, session_obj)
     else:
         status = 'NotConnected'
         result = error_msg
@@ -584,8 +697,13 @@ def fetch_pg_types(columns_info, trans_obj):
     This method is used to fetch the pg types, which is required
     to map the data type comes as a result of the query.
 
+    The type names are cached per database in the server manager, hence -
+    only the types not seen earlier are fetched from the server.
+
     Args:
         columns_info:
+
+    Returns: status and dictionary of type oid -> formatted type name
     """
 
     # get the default connection as current connection attached to trans id
@@ -595,27 +713,20 @@ def fetch_pg_types(columns_info, trans_obj):
     manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(trans_obj.sid)
     default_conn = manager.connection(did=trans_obj.did)
 
+    oids = [columns_info[col]['type_code'] for col in columns_info]
+
+    # Return from the cache, if all the types are already known.
+    type_names = manager.cached_type_names(default_conn.db)
+    if all(oid in type_names for oid in oids):
+        return True, dict((oid, type_names[oid]) for oid in oids)
+
     # Connect to the Server if not connected.
-    res = []
     if not default_conn.connected():
         status, msg = default_conn.connect()
         if not status:
             return status, msg
 
-    oids = [columns_info[col]['type_code'] for col in columns_info]
-
-    if oids:
-        status, res = default_conn.execute_dict(
-            "SELECT oid, format_type(oid, NULL) AS typname FROM pg_type "
-            "WHERE oid IN %s ORDER BY oid;", [tuple(oids)]
-        )
-
-        if not status:
-            return False, res
-
-        return status, res['rows']
-    else:
-        return True, []
+    return manager.get_type_names(default_conn, oids)
 
 
 def generate_client_primary_key_name(columns_info):
@@ -784,7 +895,7 @@ def append_filter_inclusive(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -840,7 +951,7 @@ def append_filter_exclusive(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -881,7 +992,7 @@ def remove_filter(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -925,7 +1036,7 @@ def set_limit(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -996,10 +1107,9 @@ def cancel_transaction(trans_id):
             errormsg=ERROR_MSG_TRANS_ID_NOT_FOUND,
             info='DATAGRID_TRANSACTION_REQUIRED', status=404)
 
-    # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
+    # Fetch the live command object for the specified transaction id.
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = get_command_obj(trans_id, session_obj)
 
     if trans_obj is not None and session_obj is not None:
 
@@ -1103,7 +1213,7 @@ def set_auto_commit(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1148,7 +1258,7 @@ def set_auto_rollback(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        save_command_obj(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1199,6 +1309,11 @@ def auto_complete(trans_id):
 
         # Get the auto completion suggestions.
         res = auto_complete_obj.get_completions(full_sql, text_before_cursor)
+
+        current_app.logger.debug(
+            "Auto complete metadata cache: {hits} hits, {misses} misses, "
+            "{entries} entries".format(**metadata_cache.stats())
+        )
     else:
         status = False
         res = error_msg
@@ -1350,7 +1465,7 @@ def start_query_download_tool(trans_id):
 
         # This returns generator of records.
         status, gen = sync_conn.execute_on_server_as_csv(
-            sql, records=2000
+            sql, records=QUERY_TOOL_DOWNLOAD_ITERSIZE
         )
 
         if not status:
@@ -1843,12 +1958,22 @@ def get_query_history(trans_id):
     Args:
         sid: server id
         did: database id
+
+    URL args:
+        limit <optional>: maximum number of the entries to be returned
+        cursor <optional>: 'next' of the previous page of the entries
+        search <optional>: only the entries having these words in the query
     """
+    try:
+        page = get_page_args(limit=None, cursor=None)
+    except ValueError as e:
+        return bad_request(errormsg=str(e))
 
     status, error_msg, conn, trans_obj, session_ob = \
         check_transaction_status(trans_id)
 
-    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db)
+    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db,
+                            search=request.args.get('search', None), **page)
 
 
 @blueprint.route(
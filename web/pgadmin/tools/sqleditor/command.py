@@ -24,7 +24,7 @@ from pgadmin.tools.sqleditor.utils.get_column_types import get_columns_types
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.exception import ObjectGone, ExecuteError
 from pgadmin.utils.constants import SERVER_CONNECTION_CLOSED
-from config import PG_DEFAULT_DRIVER
+from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT
 
 VIEW_FIRST_100_ROWS = 1
 VIEW_LAST_100_ROWS = 2
@@ -369,6 +369,9 @@ class GridCommand(BaseCommand, SQLFilter, FetchedRowTracker):
     def get_primary_keys(self, *args, **kwargs):
         return None, None
 
+    def can_fetch_by_keys(self, primary_keys):
+        return False
+
     def get_all_columns_with_order(self, default_conn):
         """
         Responsible for fetching columns from given object
@@ -553,6 +556,109 @@ class TableCommand(GridCommand):
 
         return pk_names, primary_keys
 
+    def can_fetch_by_keys(self, primary_keys):
+        """
+        This function returns whether the pages of the rows can be fetched by
+        the ranges of the primary keys, i.e. the table has a primary key, and
+        all the (filtered) rows are viewed, sorted by the primary keys (as the
+        first page is fetched by the query of the data).
+        """
+        if not primary_keys or self.limit > 0:
+            return False
+
+        data_sorting = self.get_data_sorting()
+        return bool(data_sorting) and [
+            (obj['name'], obj['order'].lower()) for obj in data_sorting
+        ] == [(pk, 'asc') for pk in primary_keys]
+
+    def get_page_sql(self, conn, primary_keys, after=None, seek_value=None,
+                     offset=0, limit=ON_DEMAND_RECORD_COUNT):
+        """
+        This function returns the query of a page of the (filtered) rows
+        ordered by the primary keys, i.e. the first page, when neither the
+        primary key values of the last row of the previous page, nor the
+        value of the first primary key to seek are given.
+
+        Args:
+            conn: Connection object
+            primary_keys: primary keys of the table (see get_primary_keys)
+            after: primary key values of the last row of the previous page
+            seek_value: value of the first primary key of the first row
+            offset: number of the rows to be skipped
+            limit: number of the rows in the page
+        """
+        return render_template(
+            "/".join([self.sql_path, 'keyset_page.sql']),
+            object_name=self.object_name, nsp_name=self.nsp_name,
+            has_oids=self.has_oids(conn), sql_filter=self.get_filter(),
+            primary_keys=primary_keys, after=after, seek_value=seek_value,
+            limit=limit, offset=offset
+        )
+
+    def fetch_page_by_keys(self, conn, after=None, offset=0,
+                           limit=ON_DEMAND_RECORD_COUNT):
+        """
+        This function fetches a page of the rows ordered by the primary keys,
+        i.e. the rows after the given primary key values (of the last row of
+        the previous page), or from the given offset.
+
+        The position of the offset is estimated using the statistics of the
+        first primary key column (and, the page is fetched by the range of it
+        from there), unless a filter is applied (or, the table has not been
+        analyzed yet). Every page is fetched by a single statement, hence -
+        neither a cursor, nor a transaction is kept open between the pages.
+
+        Args:
+            conn: Connection object (not the one of the transaction)
+            after: primary key values of the last row of the previous page
+            offset: position of the first row, when not after the given keys
+            limit: number of the rows in the page
+
+        Returns:
+            The result of execute_2darray, along with the primary key values
+            of the last row ('next', if there may be more rows), the estimated
+            number of the rows ('estimated_rows'), and whether the position of
+            the first row is estimated ('estimated').
+        """
+        pk_names, primary_keys = self.get_primary_keys(conn)
+        sql_filter = self.get_filter()
+
+        seek_value = None
+        estimated_rows = None
+        if after:
+            offset = 0
+        elif offset > 0 and sql_filter is None:
+            status, result = conn.execute_dict(render_template(
+                "/".join([self.sql_path, 'keyset_seek.sql']),
+                obj_id=self.obj_id, nsp_name=self.nsp_name,
+                object_name=self.object_name,
+                pk_name=next(iter(primary_keys)), offset=offset
+            ))
+            if not status:
+                raise ExecuteError(result)
+
+            if len(result['rows']) > 0:
+                estimated_rows = result['rows'][0]['estimated_rows']
+                seek_value = result['rows'][0]['seek_value']
+
+        status, result = conn.execute_2darray(self.get_page_sql(
+            conn, primary_keys, after=after, seek_value=seek_value,
+            limit=limit, offset=offset if seek_value is None else 0
+        ))
+        if not status:
+            raise ExecuteError(result)
+
+        result['next'] = None
+        if len(result['rows']) == limit:
+            names = [col['name'] for col in result['columns']]
+            result['next'] = [
+                result['rows'][-1][names.index(pk)] for pk in primary_keys
+            ]
+        result['estimated_rows'] = estimated_rows
+        result['estimated'] = seek_value is not None
+
+        return result
+
     def get_all_columns_with_order(self, default_conn=None):
         """
         It is overridden method specially for Table because we all have to
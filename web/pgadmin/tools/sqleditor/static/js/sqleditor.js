@@ -79,6 +79,9 @@ define('tools.querytool', [
 
   var is_query_running = false;
 
+  // Number of the query history entries fetched at a time
+  const QUERY_HISTORY_PAGE_SIZE = 100;
+
   const EMPTY_DATA_OUTPUT_CONTENT = '<div role="status" class="pg-panel-message">' +
     gettext('No data output. Execute a query to get output.') +
   '</div>';
@@ -1343,6 +1346,15 @@ define('tools.querytool', [
         collection[i] = item;
       }
       dataView.setItems(collection, self.client_primary_key);
+
+      // The next pages are fetched after the primary keys of the last row
+      if (self.handler.keyset_pagination && collection.length > 0) {
+        self.handler.keyset_next = _.map(
+          _.keys(self.handler.primary_keys), function(pk) {
+            return collection[collection.length - 1][pk];
+          }
+        );
+      }
     },
 
     fetch_next_all: function(cb) {
@@ -1365,6 +1377,17 @@ define('tools.querytool', [
           'pgadmin-sqleditor:loading-icon:show',
           gettext('Fetching all records...')
         );
+      }
+
+      if (self.handler.keyset_pagination) {
+        // Fetch the rows after the last one by the ranges of the primary
+        // keys, instead of the cursor of the query.
+        url = url_for('sqleditor.view_data_page', {
+          'trans_id': self.transId,
+        }) + '?' + $.param({
+          'after': JSON.stringify(self.handler.keyset_next),
+        });
+      } else if (fetch_all) {
         url = url_for('sqleditor.fetch_all', {
           'trans_id': self.transId,
           'fetch_all': 1,
@@ -1381,6 +1404,18 @@ define('tools.querytool', [
       })
         .done(function(res) {
           self.handler.has_more_rows = res.data.has_more_rows;
+
+          if (self.handler.keyset_pagination) {
+            self.handler.keyset_next = res.data.next;
+
+            // Fetch the pages one by one, until all the rows are fetched
+            if (fetch_all && self.handler.has_more_rows) {
+              self.update_grid_data(res.data.result);
+              self.fetch_next(fetch_all, cb);
+              return;
+            }
+          }
+
           $('#btn-flash').prop('disabled', false);
           $('#btn-download').prop('disabled', false);
           self.handler.trigger('pgadmin-sqleditor:loading-icon:hide');
@@ -1461,20 +1496,31 @@ define('tools.querytool', [
       }
     },
 
-    fetch_query_history: function() {
-      let self = this;
+    /* Fetch a page of the query history (the latest entries first), the next
+     * page is fetched on scrolling to the end of the history entries. */
+    fetch_query_history: function(cursor) {
+      let self = this,
+        params = {'limit': QUERY_HISTORY_PAGE_SIZE};
+
+      if (!_.isUndefined(cursor)) {
+        params['cursor'] = cursor;
+      }
+      /* Not fetched again, while being fetched */
+      self.history_next_cursor = null;
+
       $.ajax({
         url: url_for('sqleditor.get_query_history', {
           'trans_id': self.handler.transId,
         }),
         method: 'GET',
-        contentType: 'application/json',
+        data: params,
       }).done(function(res) {
         res.data.result.map((entry) => {
           let newEntry = JSON.parse(entry);
           newEntry.start_time = new Date(newEntry.start_time);
           self.history_collection.add(newEntry);
         });
+        self.history_next_cursor = res.data.next;
       }).fail(function() {
       /* history fetch fail should not affect query tool */
       });
@@ -1501,6 +1547,13 @@ define('tools.querytool', [
           }, 100);
         });
 
+        self.historyComponent.onScrollEnd(()=>{
+          if (!_.isNull(self.history_next_cursor) &&
+            !_.isUndefined(self.history_next_cursor)) {
+            self.fetch_query_history(self.history_next_cursor);
+          }
+        });
+
         self.historyComponent.render();
 
         self.history_panel.off(wcDocker.EVENT.VISIBILITY_CHANGED);
@@ -1890,6 +1943,7 @@ define('tools.querytool', [
           if (self.history_collection) {
             self.history_collection.reset();
           }
+          self.history_next_cursor = null;
 
           if(self.handler.is_query_tool) {
             $.ajax({
@@ -2776,6 +2830,8 @@ define('tools.querytool', [
 
         self.has_more_rows = false;
         self.fetching_rows = false;
+        self.keyset_pagination = false;
+        self.keyset_next = null;
 
         self.trigger(
           'pgadmin-sqleditor:loading-icon:show',
@@ -2803,6 +2859,7 @@ define('tools.querytool', [
             if (res.data.status) {
               self.can_edit = res.data.can_edit;
               self.can_filter = res.data.can_filter;
+              self.keyset_pagination = res.data.keyset_pagination;
               self.info_notifier_timeout = res.data.info_notifier_timeout;
 
               // Set the sql query to the SQL panel
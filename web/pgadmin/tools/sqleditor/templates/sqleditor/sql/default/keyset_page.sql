@@ -0,0 +1,10 @@
+{# ============= Fetch a page of the rows ordered by the primary keys ============= #}
+SELECT {% if has_oids %}oid, {% endif %}* FROM {{ conn|qtIdent(nsp_name, object_name) }}
+WHERE {% if sql_filter %}({{ sql_filter }}){% else %}true{% endif %}
+{% if after %}
+AND ({{ conn|qtIdents(primary_keys|list)|join(', ') }}) > ({% for value in after %}{{ value|qtLiteral }}{% if not loop.last %}, {% endif %}{% endfor %})
+{% elif seek_value is defined and seek_value is not none %}
+AND {{ conn|qtIdent(primary_keys|first) }} >= {{ seek_value|qtLiteral }}
+{% endif %}
+ORDER BY {{ conn|qtIdents(primary_keys|list)|join(', ') }}
+LIMIT {{ limit }}{% if offset %} OFFSET {{ offset }}{% endif %}
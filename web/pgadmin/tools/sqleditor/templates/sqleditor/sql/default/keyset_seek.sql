@@ -0,0 +1,16 @@
+{# ============= Estimate the number of the rows, and the value of the first primary key at the given offset (from the statistics) ============= #}
+SELECT rel.reltuples::bigint AS estimated_rows,
+    (SELECT s.bounds[1 + floor(
+        LEAST({{ offset }}::float8 / NULLIF(GREATEST(rel.reltuples, 0), 0), 1) *
+        (array_length(s.bounds, 1) - 1))::int]
+    FROM (
+        SELECT histogram_bounds::text::text[] AS bounds
+        FROM pg_stats
+        WHERE schemaname = {{ nsp_name|qtLiteral }} AND
+            tablename = {{ object_name|qtLiteral }} AND
+            attname = {{ pk_name|qtLiteral }} AND
+            {# The statistics of a partitioned table are of its partitions only (inherited) #}
+            inherited = (rel.relkind = 'p')
+    ) s) AS seek_value
+FROM pg_class rel
+WHERE rel.oid = {{ obj_id }}::oid
@@ -4,6 +4,7 @@ WHERE
 {% if has_oids %}
   oid = %(oid)s
 {% elif primary_keys|length > 0 %}
+  {% set pk_columns = conn|qtIdents(primary_keys|list) %}
   {% for pk in primary_keys %}
-    {% if not loop.first %} AND {% endif %}{{ conn|qtIdent(pk) }} = %({{ pgadmin_alias[pk] }})s{% endfor %}
+    {% if not loop.first %} AND {% endif %}{{ pk_columns[loop.index0] }} = %({{ pgadmin_alias[pk] }})s{% endfor %}
 {% endif %};
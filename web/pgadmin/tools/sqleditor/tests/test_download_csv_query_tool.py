@@ -65,6 +65,34 @@ class TestDownloadCSV(BaseTestGenerator):
                 filename='test.csv'
             )
         ),
+        (
+            'Download csv URL with result larger than one fetch batch',
+            dict(
+                sql='SELECT generate_series(1, 5000) AS "A";',
+                init_url='/datagrid/initialize/query_tool/{0}/{1}/{2}/{3}',
+                donwload_url="/sqleditor/query_tool/download/{0}",
+                output_columns='"A"',
+                output_values='4999',
+                is_valid_tx=True,
+                is_valid=True,
+                download_as_txt=False,
+                filename='test.csv'
+            )
+        ),
+        (
+            'Download csv URL with query not using server cursor',
+            dict(
+                sql='VALUES (1, 2, 3)',
+                init_url='/datagrid/initialize/query_tool/{0}/{1}/{2}/{3}',
+                donwload_url="/sqleditor/query_tool/download/{0}",
+                output_columns='"column1","column2","column3"',
+                output_values='1,2,3',
+                is_valid_tx=True,
+                is_valid=True,
+                download_as_txt=False,
+                filename='test.csv'
+            )
+        ),
         (
             'Download as txt without filename parameter',
             dict(
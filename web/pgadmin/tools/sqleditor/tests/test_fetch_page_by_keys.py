@@ -0,0 +1,139 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+from collections import OrderedDict
+
+from pgadmin.tools.sqleditor.command import TableCommand
+from pgadmin.utils.route import BaseTestGenerator
+from .test_view_data_templates import FakeApp
+
+
+class _Connection(object):
+    def __init__(self, seek_rows, rows):
+        self.seek_rows = seek_rows
+        self.rows = rows
+        self.queries = []
+
+    def _query(self, query):
+        query = re.sub(r'\s+', ' ', query).strip()
+        self.queries.append(query)
+        return query
+
+    def execute_dict(self, query):
+        self._query(query)
+        return True, {'rows': self.seek_rows}
+
+    def execute_2darray(self, query):
+        self._query(query)
+        return True, {
+            'columns': [{'name': 'name'}, {'name': 'seq'}, {'name': 'id'}],
+            'rows': self.rows
+        }
+
+
+class TestFetchPageByKeys(BaseTestGenerator):
+    """
+    This class will test fetching the pages of the table data by the ranges
+    of the primary keys.
+    """
+
+    scenarios = [
+        ('First page', dict(
+            kwargs=dict(limit=2), seek_rows=[],
+            rows=[['a', 1, 10], ['b', 2, 10]],
+            seek=False, page_sql='WHERE true ORDER BY id, seq LIMIT 2',
+            next=[10, 2], estimated=False, estimated_rows=None)),
+        ('Page after the keys of the last row', dict(
+            kwargs=dict(after=[10, 2], offset=5000, limit=2), seek_rows=[],
+            rows=[['c', 3, 10]], seek=False,
+            page_sql='WHERE true AND (id, seq) > (10, 2) '
+                     'ORDER BY id, seq LIMIT 2',
+            next=None, estimated=False, estimated_rows=None)),
+        ('Page at the position estimated by the statistics', dict(
+            kwargs=dict(offset=5000, limit=2),
+            seek_rows=[{'estimated_rows': 10000, 'seek_value': '5001'}],
+            rows=[['d', 1, 5001], ['e', 2, 5001]], seek=True,
+            page_sql="WHERE true AND id >= '5001' ORDER BY id, seq LIMIT 2",
+            next=[5001, 2], estimated=True, estimated_rows=10000)),
+        ('Page at the offset, without the statistics', dict(
+            kwargs=dict(offset=5000, limit=2),
+            seek_rows=[{'estimated_rows': 0, 'seek_value': None}],
+            rows=[['f', 1, 7]], seek=True,
+            page_sql='WHERE true ORDER BY id, seq LIMIT 2 OFFSET 5000',
+            next=None, estimated=False, estimated_rows=0)),
+        ('Page at the offset of the filtered rows', dict(
+            kwargs=dict(offset=5000, limit=2), row_filter='seq > 1',
+            seek_rows=[], rows=[['g', 2, 7]], seek=False,
+            page_sql='WHERE (seq > 1) ORDER BY id, seq LIMIT 2 OFFSET 5000',
+            next=None, estimated=False, estimated_rows=None)),
+    ]
+
+    def _command(self):
+        command = TableCommand.__new__(TableCommand)
+        command.sql_path = 'sqleditor/sql/default'
+        command.obj_id = 16384
+        command.nsp_name = 'test_schema'
+        command.object_name = 'test_table'
+        command.limit = -1
+        command._row_filter = getattr(self, 'row_filter', None)
+        command._data_sorting = None
+
+        command.get_primary_keys = lambda conn: (
+            'id, seq', OrderedDict([('id', 'int4'), ('seq', 'int4')])
+        )
+        command.has_oids = lambda conn: False
+        return command
+
+    def runTest(self):
+        command = self._command()
+        conn = _Connection(self.seek_rows, self.rows)
+
+        with FakeApp().app_context():
+            result = command.fetch_page_by_keys(conn, **self.kwargs)
+
+        self.assertEqual(len(conn.queries), 2 if self.seek else 1)
+        if self.seek:
+            self.assertIn("attname = 'id'", conn.queries[0])
+            self.assertIn("inherited = (rel.relkind = 'p')", conn.queries[0])
+            self.assertIn('rel.oid = 16384::oid', conn.queries[0])
+        self.assertTrue(conn.queries[-1].startswith(
+            'SELECT * FROM test_schema.test_table'))
+        self.assertTrue(conn.queries[-1].endswith(self.page_sql))
+
+        # The first page is fetched by the query of view_data_start too
+        if 'after' not in self.kwargs and 'offset' not in self.kwargs:
+            with FakeApp().app_context():
+                self.assertEqual(
+                    conn._query(command.get_page_sql(
+                        conn, command.get_primary_keys(conn)[1],
+                        limit=self.kwargs['limit'])),
+                    conn.queries[0]
+                )
+
+        self.assertEqual(result['rows'], self.rows)
+        self.assertEqual(result['next'], self.next)
+        self.assertEqual(result['estimated'], self.estimated)
+        self.assertEqual(result['estimated_rows'], self.estimated_rows)
+
+        # The rows are fetched by the keys, only if sorted by them
+        self.assertFalse(command.can_fetch_by_keys(
+            command.get_primary_keys(conn)[1]))
+        command._data_sorting = [
+            {'name': 'id', 'order': 'asc'}, {'name': 'seq', 'order': 'asc'}
+        ]
+        self.assertTrue(command.can_fetch_by_keys(
+            command.get_primary_keys(conn)[1]))
+        command._data_sorting[1]['order'] = 'desc'
+        self.assertFalse(command.can_fetch_by_keys(
+            command.get_primary_keys(conn)[1]))
+        command._data_sorting[1]['order'] = 'asc'
+        command.limit = 100
+        self.assertFalse(command.can_fetch_by_keys(
+            command.get_primary_keys(conn)[1]))
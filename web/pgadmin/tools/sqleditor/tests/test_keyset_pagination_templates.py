@@ -0,0 +1,114 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+
+from flask import render_template
+from collections import OrderedDict
+
+from pgadmin import VersionedTemplateLoader
+from pgadmin.utils.route import BaseTestGenerator
+from .test_view_data_templates import FakeApp
+
+
+class TestKeysetPaginationTemplates(BaseTestGenerator):
+    """
+    This class validates the template queries for fetching the pages of the
+    table data by the ranges of the primary keys.
+    """
+    primary_keys = OrderedDict([('id', 'int4'), ('seq', 'int4')])
+    scenarios = [
+        (
+            'When fetching the first page',
+            dict(
+                template_path='sqleditor/sql/default/keyset_page.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=False,
+                    sql_filter=None,
+                    primary_keys=primary_keys,
+                    limit=1000
+                ),
+                expected_return_value='SELECT * FROM test_schema.test_table'
+                                      ' WHERE true'
+                                      ' ORDER BY id, seq LIMIT 1000'
+            )
+        ),
+        (
+            'When fetching the page after the given keys',
+            dict(
+                template_path='sqleditor/sql/default/keyset_page.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=True,
+                    sql_filter='id > 10',
+                    primary_keys=primary_keys,
+                    after=[20, 3],
+                    limit=1000
+                ),
+                expected_return_value='SELECT oid, * FROM'
+                                      ' test_schema.test_table'
+                                      ' WHERE (id > 10)'
+                                      ' AND (id, seq) > (20, 3)'
+                                      ' ORDER BY id, seq LIMIT 1000'
+            )
+        ),
+        (
+            'When fetching the page from the estimated position',
+            dict(
+                template_path='sqleditor/sql/default/keyset_page.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=False,
+                    sql_filter=None,
+                    primary_keys=primary_keys,
+                    seek_value='5000',
+                    limit=1000,
+                    offset=0
+                ),
+                expected_return_value='SELECT * FROM test_schema.test_table'
+                                      ' WHERE true'
+                                      " AND id >= '5000'"
+                                      ' ORDER BY id, seq LIMIT 1000'
+            )
+        ),
+        (
+            'When fetching the page from the offset',
+            dict(
+                template_path='sqleditor/sql/default/keyset_page.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=False,
+                    sql_filter="name = 'x'",
+                    primary_keys=primary_keys,
+                    seek_value=None,
+                    limit=1000,
+                    offset=5000
+                ),
+                expected_return_value='SELECT * FROM test_schema.test_table'
+                                      " WHERE (name = 'x')"
+                                      ' ORDER BY id, seq'
+                                      ' LIMIT 1000 OFFSET 5000'
+            )
+        )
+    ]
+
+    def setUp(self):
+        self.loader = VersionedTemplateLoader(FakeApp())
+
+    def runTest(self):
+        with FakeApp().app_context():
+            result = render_template(self.template_path, **self.parameters)
+            self.assertEqual(
+                re.sub(' +', ' ', str(result).replace("\n", " ")).strip(),
+                self.expected_return_value)
@@ -191,6 +191,7 @@ class FakeApp(Flask):
         driver = get_driver(PG_DEFAULT_DRIVER, self)
         self.jinja_env.filters['qtLiteral'] = driver.qtLiteral
         self.jinja_env.filters['qtIdent'] = driver.qtIdent
+        self.jinja_env.filters['qtIdents'] = driver.qtIdents
         self.jinja_env.filters['qtTypeIdent'] = driver.qtTypeIdent
         self.jinja_loader = FileSystemLoader(
             os.path.join(
@@ -8,13 +8,14 @@
 ##########################################################################
 
 """Code to handle data sorting in view data mode."""
-import pickle
 import simplejson as json
 from flask_babelex import gettext
 from flask import current_app
 from pgadmin.utils.ajax import make_json_response, internal_server_error
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    save_command_obj
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
 from pgadmin.utils.constants import ERROR_MSG_TRANS_ID_NOT_FOUND
 
@@ -92,7 +93,7 @@ class FilterDialog(object):
             if status:
                 # As we changed the transaction object we need to
                 # restore it and update the session variable.
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+                save_command_obj(trans_id, session_obj, trans_obj)
                 update_session_grid_transaction(trans_id, session_obj)
                 res = gettext('Data sorting object updated successfully')
         else:
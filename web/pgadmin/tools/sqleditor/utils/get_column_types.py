@@ -27,11 +27,15 @@ def get_columns_types(is_query_tool, columns_info, table_oid, conn, has_oids):
     if not colst:
         raise ExecuteError(rset)
 
+    # Use the type names already known for the database, the remaining ones
+    # are fetched later (see fetch_pg_types).
+    type_names = conn.manager.cached_type_names(conn.db)
+
     column_types = dict()
     for key, col in enumerate(columns_info):
         col_type = dict()
         col_type['type_code'] = col['type_code']
-        col_type['type_name'] = None
+        col_type['type_name'] = type_names.get(col['type_code'], None)
         col_type['internal_size'] = col['internal_size']
         column_types[col['name']] = col_type
 
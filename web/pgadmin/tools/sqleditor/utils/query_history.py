@@ -1,31 +1,135 @@
+"""
+Query history of the query tool, per user, server, and database.
+
+The history is stored by one of the stores (see QUERY_HISTORY_STORE in
+config.py):
+  - 'database': the query_history table of the configuration database
+  - 'sqlite': a separate SQLite database (WAL mode) at
+    QUERY_HISTORY_SQLITE_PATH, written in batches by a background thread,
+    and searched using the full-text search of SQLite.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+from queue import Queue, Empty
+from threading import Condition, Lock, Thread, local
+
+from flask import current_app
+
+import config
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.model import db, QueryHistoryModel
-from config import MAX_QUERY_HIST_STORED
 
+# Maximum number of the history entries written in a single transaction
+HISTORY_BATCH_SIZE = 500
 
-class QueryHistory:
-    @staticmethod
-    def get(uid, sid, dbname):
+# Seconds to wait for the queued entries to be written on exit
+HISTORY_EXIT_TIMEOUT = 5
 
-        result = db.session \
-            .query(QueryHistoryModel.query_info) \
-            .filter(QueryHistoryModel.uid == uid,
-                    QueryHistoryModel.sid == sid,
-                    QueryHistoryModel.dbname == dbname) \
-            .all()
 
-        result = [rec.query_info for rec in list(result)]
+def _query_text(query_info):
+    """
+    Returns the query of the history entry (JSON), to be searched.
+    """
+    try:
+        info = json.loads(query_info)
+    except ValueError:
+        return query_info
 
-        return make_json_response(
-            data={
-                'status': True,
-                'msg': '',
-                'result': result
-            }
+    if isinstance(info, dict):
+        return info.get('query', None) or ''
+    return query_info
+
+
+class DatabaseQueryHistoryStore(object):
+    """
+    Stores the query history in the query_history table of the configuration
+    database, the entries are recycled (by their serial number) once
+    MAX_QUERY_HIST_STORED entries are stored.
+
+    The latest entries are returned first, i.e. from the last updated serial
+    number down to 1, and then from the highest one down to the last updated
+    one. The cursor of the pages is the serial number of the last entry read
+    (as the cursor of the SQLite store).
+
+    The entries are searched using LIKE on the stored JSON, and checked for
+    the query being matched after being loaded.
+    """
+
+    def _filter(self, query, uid, sid, dbname):
+        return query.filter(QueryHistoryModel.uid == uid,
+                            QueryHistoryModel.sid == sid,
+                            QueryHistoryModel.dbname == dbname)
+
+    def get(self, uid, sid, dbname, limit=None, cursor=None, search=None):
+        max_srno = self._filter(
+            db.session.query(db.func.max(QueryHistoryModel.srno)),
+            uid, sid, dbname
+        ).scalar()
+
+        if max_srno is None:
+            return [], None
+
+        last_srno = self._filter(
+            db.session.query(QueryHistoryModel.srno),
+            uid, sid, dbname
+        ).filter(QueryHistoryModel.last_updated_flag == 'Y').scalar()
+
+        if last_srno is None:
+            last_srno = max_srno
+
+        # Number of the entries saved after the entry (i.e. 0 for the latest)
+        age = db.case(
+            [(QueryHistoryModel.srno <= last_srno,
+              last_srno - QueryHistoryModel.srno)],
+            else_=last_srno - QueryHistoryModel.srno + max_srno
         )
 
-    @staticmethod
-    def update_history_dbname(uid, sid, old_dbname, new_dbname):
+        def age_of(srno):
+            return last_srno - srno + (0 if srno <= last_srno else max_srno)
+
+        query = self._filter(
+            db.session.query(QueryHistoryModel.srno,
+                             QueryHistoryModel.query_info),
+            uid, sid, dbname
+        ).order_by(age)
+
+        if search:
+            # The query is searched as encoded in the JSON of the entry
+            query = query.filter(QueryHistoryModel.query_info.ilike(
+                '%{0}%'.format(
+                    json.dumps(search, ensure_ascii=False)[1:-1].replace(
+                        '\\', '\\\\').replace('%', '\\%').replace(
+                        '_', '\\_')
+                ), escape='\\'
+            ))
+            search = search.lower()
+
+        result = []
+        # Fetched again, when some of the entries found by LIKE did not
+        # match the query
+        while True:
+            page = query
+            if cursor is not None:
+                page = page.filter(age > age_of(cursor))
+
+            # Fetch one more entry to know whether there are more of them
+            count = None if limit is None else limit - len(result) + 1
+            rows = page.limit(count).all()
+
+            for srno, query_info in rows:
+                if len(result) == limit:
+                    return result, cursor
+                if not search or search in _query_text(query_info).lower():
+                    result.append(query_info)
+                cursor = srno
+
+            if count is None or len(rows) < count:
+                return result, None
+
+    def update_dbname(self, uid, sid, old_dbname, new_dbname):
         try:
             db.session \
                 .query(QueryHistoryModel) \
@@ -39,8 +143,7 @@ class QueryHistory:
             db.session.rollback()
             # do not affect query execution if history clear fails
 
-    @staticmethod
-    def save(uid, sid, dbname, request):
+    def save(self, uid, sid, dbname, query_info):
         try:
             max_srno = db.session\
                 .query(db.func.max(QueryHistoryModel.srno)) \
@@ -71,26 +174,27 @@ class QueryHistory:
                     last_updated_rec.last_updated_flag = 'N'
 
                     # if max limit reached then recycle
-                    if new_srno > MAX_QUERY_HIST_STORED:
+                    if new_srno > config.MAX_QUERY_HIST_STORED:
                         new_srno = (
-                            last_updated_rec.srno % MAX_QUERY_HIST_STORED) + 1
+                            last_updated_rec.srno %
+                            config.MAX_QUERY_HIST_STORED) + 1
                 else:
                     new_srno = 1
 
                 # if the limit is lowered and number of records present is
                 # more, then cleanup
-                if max_srno > MAX_QUERY_HIST_STORED:
+                if max_srno > config.MAX_QUERY_HIST_STORED:
                     db.session.query(QueryHistoryModel)\
                         .filter(QueryHistoryModel.uid == uid,
                                 QueryHistoryModel.sid == sid,
                                 QueryHistoryModel.dbname == dbname,
                                 QueryHistoryModel.srno >
-                                MAX_QUERY_HIST_STORED)\
+                                config.MAX_QUERY_HIST_STORED)\
                         .delete()
 
             history_entry = QueryHistoryModel(
                 srno=new_srno, uid=uid, sid=sid, dbname=dbname,
-                query_info=request.data, last_updated_flag='Y')
+                query_info=query_info, last_updated_flag='Y')
 
             db.session.merge(history_entry)
 
@@ -99,15 +203,7 @@ class QueryHistory:
             db.session.rollback()
             # do not affect query execution if history saving fails
 
-        return make_json_response(
-            data={
-                'status': True,
-                'msg': 'Success',
-            }
-        )
-
-    @staticmethod
-    def clear_history(uid, sid, dbname=None):
+    def clear(self, uid, sid, dbname=None):
         try:
             if dbname is not None:
                 db.session.query(QueryHistoryModel) \
@@ -128,6 +224,381 @@ class QueryHistory:
             db.session.rollback()
             # do not affect query execution if history clear fails
 
+
+class SQLiteQueryHistoryStore(object):
+    """
+    Stores the query history in a separate SQLite database (in WAL mode,
+    hence the readers are not blocked by the writers).
+
+    The entries are only appended, numbered by a sequence per user, server,
+    and database, whose last number (the head of the ring) is kept in a table
+    of its own, so that an entry is appended without reading the history.
+    The entries older than the last MAX_QUERY_HIST_STORED ones are removed by
+    their sequence numbers.
+
+    The entries saved are queued, and written in batches (a transaction each)
+    by a background thread, instead of the requests. An entry failing to be
+    written is skipped, without the rest of its batch. The reads wait for the
+    queued entries of the same user, server, and database only to be written
+    first, and the queued entries are written on exit (within
+    HISTORY_EXIT_TIMEOUT seconds).
+
+    The queries are indexed by the full-text search (FTS5) of SQLite, if
+    available, otherwise those are searched using LIKE. The cursor of the
+    pages is the sequence number of the last entry returned (the latest
+    entries are returned first).
+    """
+
+    def __init__(self, path, logger=None, batch_size=HISTORY_BATCH_SIZE):
+        self.path = path
+        self.logger = logger
+        self.batch_size = batch_size
+        self._local = local()
+        self._queue = Queue()
+        # Number of the queued entries per (uid, sid, dbname)
+        self._pending = dict()
+        self._pending_cond = Condition()
+        self._writer = None
+        self._writer_lock = Lock()
+
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        conn = self._connection()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS history_head ('
+            'uid INTEGER, sid INTEGER, dbname TEXT, seq INTEGER, '
+            'PRIMARY KEY (uid, sid, dbname))'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS history ('
+            'id INTEGER PRIMARY KEY, uid INTEGER, sid INTEGER, dbname TEXT, '
+            'seq INTEGER, query_info TEXT, query TEXT)'
+        )
+        conn.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS history_seq '
+            'ON history (uid, sid, dbname, seq)'
+        )
+
+        try:
+            conn.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING '
+                'fts5(query, content=\'history\', content_rowid=\'id\')'
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS history_insert '
+                'AFTER INSERT ON history BEGIN '
+                'INSERT INTO history_fts (rowid, query) '
+                'VALUES (new.id, new.query); END'
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS history_delete '
+                'AFTER DELETE ON history BEGIN '
+                'INSERT INTO history_fts (history_fts, rowid, query) '
+                'VALUES (\'delete\', old.id, old.query); END'
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5
+            self.fts = False
+
+        atexit.register(self.flush, timeout=HISTORY_EXIT_TIMEOUT)
+
+    def _connection(self):
+        # SQLite connections can not be shared by the threads.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _start_writer(self):
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = Thread(
+                    target=self._write_queued, name='query_history_writer'
+                )
+                self._writer.daemon = True
+                self._writer.start()
+
+    def _write_queued(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            try:
+                self.write(batch)
+            except Exception as e:
+                # do not affect query execution if history saving fails
+                self._log_exception(e)
+            finally:
+                with self._pending_cond:
+                    for uid, sid, dbname, _ in batch:
+                        key = (uid, sid, dbname)
+                        self._pending[key] -= 1
+                        if self._pending[key] == 0:
+                            del self._pending[key]
+                    self._pending_cond.notify_all()
+
+    def _log_exception(self, e):
+        if self.logger is not None:
+            self.logger.exception(e)
+
+    def flush(self, uid=None, sid=None, dbname=None, timeout=None):
+        """
+        Wait for the queued entries of the given user, server, and database
+        (all of them for None) to be written.
+
+        :return: False, if not written within the given seconds
+        """
+        def written():
+            return not any(
+                (uid is None or uid == key[0]) and
+                (sid is None or sid == key[1]) and
+                (dbname is None or dbname == key[2])
+                for key in self._pending
+            )
+
+        with self._pending_cond:
+            return self._pending_cond.wait_for(written, timeout)
+
+    def write(self, entries):
+        """
+        Append the given entries ((uid, sid, dbname, query_info)) in a single
+        transaction, and remove the entries beyond the maximum number of
+        them. An entry failing to be inserted is skipped (and, logged).
+        """
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            heads = dict()
+            for uid, sid, dbname, query_info in entries:
+                key = (uid, sid, dbname)
+                if key not in heads:
+                    row = conn.execute(
+                        'SELECT seq FROM history_head '
+                        'WHERE uid = ? AND sid = ? AND dbname = ?', key
+                    ).fetchone()
+                    heads[key] = row[0] if row is not None else 0
+
+                conn.execute('SAVEPOINT entry')
+                try:
+                    conn.execute(
+                        'INSERT INTO history '
+                        '(uid, sid, dbname, seq, query_info, query) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        key + (heads[key] + 1, query_info,
+                               _query_text(query_info))
+                    )
+                except Exception as e:
+                    conn.execute('ROLLBACK TO entry')
+                    self._log_exception(e)
+                else:
+                    heads[key] += 1
+                finally:
+                    conn.execute('RELEASE entry')
+
+            for key, seq in heads.items():
+                conn.execute(
+                    'INSERT OR REPLACE INTO history_head '
+                    '(uid, sid, dbname, seq) VALUES (?, ?, ?, ?)',
+                    key + (seq,)
+                )
+                conn.execute(
+                    'DELETE FROM history '
+                    'WHERE uid = ? AND sid = ? AND dbname = ? AND seq <= ?',
+                    key + (seq - config.MAX_QUERY_HIST_STORED,)
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def get(self, uid, sid, dbname, limit=None, cursor=None, search=None):
+        self.flush(uid, sid, dbname)
+
+        sql = 'SELECT seq, query_info FROM history ' \
+              'WHERE uid = ? AND sid = ? AND dbname = ?'
+        params = [uid, sid, dbname]
+
+        if cursor is not None:
+            sql += ' AND seq < ?'
+            params.append(cursor)
+
+        if search and self.fts:
+            sql += ' AND id IN (' \
+                   'SELECT rowid FROM history_fts WHERE history_fts MATCH ?)'
+            # Search the words (as the prefixes) in the given order
+            params.append(' '.join(
+                '"{0}"*'.format(word.replace('"', '""'))
+                for word in search.split()
+            ))
+        elif search:
+            sql += ' AND lower(query) LIKE ? ESCAPE \'\\\''
+            params.append('%{0}%'.format(
+                search.lower().replace('\\', '\\\\').replace(
+                    '%', '\\%').replace('_', '\\_')
+            ))
+
+        sql += ' ORDER BY seq DESC'
+        if limit is not None:
+            # Fetch one more entry to know whether there are more of them
+            sql += ' LIMIT ?'
+            params.append(limit + 1)
+
+        rows = self._connection().execute(sql, params).fetchall()
+
+        if limit is None or len(rows) <= limit:
+            return [row[1] for row in rows], None
+
+        return [row[1] for row in rows[:limit]], rows[limit - 1][0]
+
+    def update_dbname(self, uid, sid, old_dbname, new_dbname):
+        self.flush(uid, sid, old_dbname)
+        self.flush(uid, sid, new_dbname)
+
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            heads = dict(conn.execute(
+                'SELECT dbname, seq FROM history_head '
+                'WHERE uid = ? AND sid = ? AND dbname IN (?, ?)',
+                (uid, sid, old_dbname, new_dbname)
+            ).fetchall())
+
+            if old_dbname in heads:
+                # Append the entries after the ones of the new name (if any)
+                offset = heads.get(new_dbname, 0)
+                conn.execute(
+                    'UPDATE history SET dbname = ?, seq = seq + ? '
+                    'WHERE uid = ? AND sid = ? AND dbname = ?',
+                    (new_dbname, offset, uid, sid, old_dbname)
+                )
+                conn.execute(
+                    'DELETE FROM history_head '
+                    'WHERE uid = ? AND sid = ? AND dbname = ?',
+                    (uid, sid, old_dbname)
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO history_head '
+                    '(uid, sid, dbname, seq) VALUES (?, ?, ?, ?)',
+                    (uid, sid, new_dbname, offset + heads[old_dbname])
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            # do not affect query execution if history update fails
+
+    def save(self, uid, sid, dbname, query_info):
+        with self._pending_cond:
+            key = (uid, sid, dbname)
+            self._pending[key] = self._pending.get(key, 0) + 1
+        self._queue.put((uid, sid, dbname, query_info))
+        self._start_writer()
+
+    def clear(self, uid, sid, dbname=None):
+        self.flush(uid, sid, dbname)
+
+        condition = 'uid = ? AND sid = ?'
+        params = (uid, sid)
+        if dbname is not None:
+            condition += ' AND dbname = ?'
+            params += (dbname,)
+
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'DELETE FROM history WHERE ' + condition, params
+            )
+            conn.execute(
+                'DELETE FROM history_head WHERE ' + condition, params
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            # do not affect query execution if history clear fails
+
+
+_stores = dict()
+_stores_lock = Lock()
+
+
+def get_query_history_store():
+    """
+    Returns the query history store configured by QUERY_HISTORY_STORE.
+    """
+    store = getattr(config, 'QUERY_HISTORY_STORE', 'database')
+
+    with _stores_lock:
+        if store == 'sqlite':
+            path = config.QUERY_HISTORY_SQLITE_PATH
+            if path not in _stores:
+                _stores[path] = SQLiteQueryHistoryStore(
+                    path, logger=current_app.logger
+                )
+            return _stores[path]
+
+        if store != 'database':
+            raise ValueError(
+                'Invalid QUERY_HISTORY_STORE: {0}'.format(store)
+            )
+
+        if store not in _stores:
+            _stores[store] = DatabaseQueryHistoryStore()
+        return _stores[store]
+
+
+class QueryHistory:
+    @staticmethod
+    def get(uid, sid, dbname, limit=None, cursor=None, search=None):
+        result, next_cursor = get_query_history_store().get(
+            uid, sid, dbname, limit, cursor, search
+        )
+
+        return make_json_response(
+            data={
+                'status': True,
+                'msg': '',
+                'result': result,
+                'next': next_cursor
+            }
+        )
+
+    @staticmethod
+    def update_history_dbname(uid, sid, old_dbname, new_dbname):
+        get_query_history_store().update_dbname(
+            uid, sid, old_dbname, new_dbname
+        )
+
+    @staticmethod
+    def save(uid, sid, dbname, request):
+        query_info = request.data
+        if isinstance(query_info, bytes):
+            query_info = query_info.decode('utf-8')
+
+        get_query_history_store().save(uid, sid, dbname, query_info)
+
+        return make_json_response(
+            data={
+                'status': True,
+                'msg': 'Success',
+            }
+        )
+
+    @staticmethod
+    def clear_history(uid, sid, dbname=None):
+        get_query_history_store().clear(uid, sid, dbname)
+
     @staticmethod
     def clear(uid, sid, dbname=None):
         QueryHistory.clear_history(uid, sid, dbname)
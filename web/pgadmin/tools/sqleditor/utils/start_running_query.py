@@ -21,6 +21,8 @@ from pgadmin.tools.sqleditor.utils.apply_explain_plan_wrapper import \
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
     TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    save_command_obj
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
 from pgadmin.utils.ajax import make_json_response, internal_server_error
@@ -28,6 +30,7 @@ from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.constants import ERROR_MSG_TRANS_ID_NOT_FOUND
+from pgadmin.utils.sqlautocomplete.metadata_cache import metadata_cache
 
 
 class StartRunningQuery:
@@ -136,6 +139,10 @@ class StartRunningQuery:
                                                              conn, sql):
             conn.execute_void("BEGIN;")
 
+        # The objects/search path cached for the auto complete may be changed
+        # by the query.
+        metadata_cache.invalidate_if_changed(conn.manager.sid, conn.db, sql)
+
         # Execute sql asynchronously with params is None
         # and formatted_error is True.
         status, result = conn.execute_async(sql)
@@ -166,7 +173,7 @@ class StartRunningQuery:
     def save_transaction_in_session(session, transaction_id, transaction):
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session['command_obj'] = pickle.dumps(transaction, -1)
+        save_command_obj(transaction_id, session, transaction)
         update_session_grid_transaction(transaction_id, session)
 
     @staticmethod
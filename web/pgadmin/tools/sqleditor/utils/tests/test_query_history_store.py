@@ -0,0 +1,173 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import config
+from pgadmin.tools.sqleditor.utils.query_history import \
+    DatabaseQueryHistoryStore, SQLiteQueryHistoryStore
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def _entry(query):
+    return json.dumps({'query': query, 'status': True})
+
+
+class TestSQLiteQueryHistoryStore(BaseTestGenerator):
+    """ This class will test the SQLite store of the query history. """
+
+    scenarios = [
+        ('Queries searched using the full-text search', dict(fts=True)),
+        ('Queries searched using LIKE', dict(fts=False)),
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def _queries(self, entries):
+        return [json.loads(entry)['query'] for entry in entries]
+
+    def runTest(self):
+        store = SQLiteQueryHistoryStore(
+            os.path.join(self.tmp_dir, 'history', 'query_history.db'),
+            batch_size=3
+        )
+        if not self.fts:
+            store.fts = False
+
+        with patch.object(config, 'MAX_QUERY_HIST_STORED', 5):
+            # Saved in the background, and written before the reads
+            for idx in range(7):
+                store.save(1, 1, 'postgres', _entry(
+                    'SELECT * FROM orders_{0}'.format(idx)))
+            store.save(1, 1, 'sales', _entry('SELECT 1'))
+            store.save(2, 1, 'postgres', _entry('SELECT 2'))
+
+            # Only the latest entries are kept, latest first
+            entries, next_cursor = store.get(1, 1, 'postgres')
+            self.assertEqual(self._queries(entries), [
+                'SELECT * FROM orders_{0}'.format(idx)
+                for idx in range(6, 1, -1)
+            ])
+            self.assertIsNone(next_cursor)
+
+            # Pages
+            entries, next_cursor = store.get(1, 1, 'postgres', limit=3)
+            self.assertEqual(len(entries), 3)
+            entries, next_cursor = store.get(
+                1, 1, 'postgres', limit=3, cursor=next_cursor)
+            self.assertEqual(self._queries(entries), [
+                'SELECT * FROM orders_3', 'SELECT * FROM orders_2'
+            ])
+            self.assertIsNone(next_cursor)
+
+            # Search
+            store.save(1, 1, 'postgres', _entry('UPDATE customers SET x = 1'))
+            entries, _ = store.get(1, 1, 'postgres', search='custom')
+            self.assertEqual(self._queries(entries),
+                             ['UPDATE customers SET x = 1'])
+            entries, _ = store.get(1, 1, 'postgres', search='orders_5')
+            self.assertEqual(self._queries(entries),
+                             ['SELECT * FROM orders_5'])
+
+            # Renamed database, appended after the existing entries
+            store.update_dbname(1, 1, 'postgres', 'sales')
+            entries, _ = store.get(1, 1, 'sales', limit=2)
+            self.assertEqual(self._queries(entries), [
+                'UPDATE customers SET x = 1', 'SELECT * FROM orders_6'
+            ])
+            self.assertEqual(store.get(1, 1, 'postgres'), ([], None))
+
+            # An entry failing to be written does not drop its batch
+            store.save(3, 1, 'postgres', _entry('SELECT 3'))
+            store.save(3, 1, 'postgres', object())
+            store.save(3, 1, 'postgres', _entry('SELECT 4'))
+            self.assertEqual(
+                self._queries(store.get(3, 1, 'postgres')[0]),
+                ['SELECT 4', 'SELECT 3']
+            )
+
+            # Only the queued entries of the same database are waited for
+            store._pending[(4, 1, 'postgres')] = 1
+            self.assertTrue(store.flush(3, 1, 'postgres', timeout=0.1))
+            self.assertFalse(store.flush(4, 1, timeout=0.1))
+            self.assertFalse(store.flush(timeout=0.1))
+            del store._pending[(4, 1, 'postgres')]
+
+            # Clear
+            store.clear(1, 1)
+            self.assertEqual(store.get(1, 1, 'sales'), ([], None))
+            self.assertEqual(
+                self._queries(store.get(2, 1, 'postgres')[0]), ['SELECT 2']
+            )
+
+
+class TestDatabaseQueryHistoryStore(BaseTestGenerator):
+    """ This class will test the configuration database store. """
+
+    scenarios = [
+        ('Queries paged, latest first', dict()),
+    ]
+
+    def _queries(self, entries):
+        return [json.loads(entry)['query'] for entry in entries]
+
+    def runTest(self):
+        store = DatabaseQueryHistoryStore()
+
+        with self.app.app_context(), \
+                patch.object(config, 'MAX_QUERY_HIST_STORED', 5):
+            store.clear(-1, -1)
+            self.assertEqual(store.get(-1, -1, 'postgres'), ([], None))
+
+            # The entries are recycled
+            for idx in range(7):
+                store.save(-1, -1, 'postgres', _entry(
+                    'SELECT * FROM orders_{0}'.format(idx)))
+
+            entries, next_cursor = store.get(-1, -1, 'postgres')
+            self.assertEqual(self._queries(entries), [
+                'SELECT * FROM orders_{0}'.format(idx)
+                for idx in range(6, 1, -1)
+            ])
+            self.assertIsNone(next_cursor)
+
+            # Pages are not shifted by the entries saved in between
+            entries, next_cursor = store.get(-1, -1, 'postgres', limit=3)
+            self.assertEqual(self._queries(entries), [
+                'SELECT * FROM orders_6', 'SELECT * FROM orders_5',
+                'SELECT * FROM orders_4'
+            ])
+            store.save(-1, -1, 'postgres', _entry('SELECT * FROM orders_7'))
+            entries, next_cursor = store.get(
+                -1, -1, 'postgres', limit=3, cursor=next_cursor)
+            self.assertEqual(self._queries(entries),
+                             ['SELECT * FROM orders_3'])
+            self.assertIsNone(next_cursor)
+
+            # Search, the entries not matching the query are skipped
+            store.save(-1, -1, 'postgres', _entry('SELECT \'"orders_"\''))
+            entries, next_cursor = store.get(
+                -1, -1, 'postgres', limit=1, search='"ORDERS_')
+            self.assertEqual(self._queries(entries),
+                             ['SELECT \'"orders_"\''])
+            self.assertIsNone(next_cursor)
+            self.assertEqual(
+                store.get(-1, -1, 'postgres', limit=1, search='status'),
+                ([], None)
+            )
+
+            store.clear(-1, -1)
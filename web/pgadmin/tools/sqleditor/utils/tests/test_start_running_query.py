@@ -430,7 +430,10 @@ class StartRunningQueryTest(BaseTestGenerator):
            '.internal_server_error')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.update_session_grid_transaction')
-    def runTest(self, update_session_grid_transaction_mock,
+    @patch('pgadmin.tools.sqleditor.utils.start_running_query'
+           '.save_command_obj')
+    def runTest(self, save_command_obj_mock,
+                update_session_grid_transaction_mock,
                 internal_server_error_mock, get_driver_mock, pickle_mock,
                 make_json_response_mock,
                 apply_explain_plan_wrapper_if_needed_mock):
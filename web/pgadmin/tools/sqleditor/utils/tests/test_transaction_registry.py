@@ -0,0 +1,98 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import pickle
+from unittest.mock import patch
+
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestTransactionRegistry(BaseTestGenerator):
+    """
+    Check that the TransactionRegistry reuses the live command objects, and
+    reloads/evicts them as intended
+    """
+
+    scenarios = [
+        ('When the pickled object is unchanged, it returns the live object',
+         dict(
+             replace_pickled=False,
+             max_transactions=10,
+             idle_timeout=60,
+             elapsed=0,
+             expected_live_object=True,
+         )),
+        ('When the pickled object is replaced, it returns the new object',
+         dict(
+             replace_pickled=True,
+             max_transactions=10,
+             idle_timeout=60,
+             elapsed=0,
+             expected_live_object=False,
+         )),
+        ('When the object is idle for too long, it is evicted',
+         dict(
+             replace_pickled=False,
+             max_transactions=10,
+             idle_timeout=60,
+             elapsed=120,
+             expected_live_object=False,
+         )),
+        ('When there are too many objects, the least recently used is '
+         'evicted',
+         dict(
+             replace_pickled=False,
+             max_transactions=1,
+             idle_timeout=60,
+             elapsed=0,
+             expected_live_object=False,
+         )),
+    ]
+
+    @patch('pgadmin.tools.sqleditor.utils.transaction_registry.time')
+    def runTest(self, time_mock):
+        time_mock.time.return_value = 1000
+        registry = TransactionRegistry(
+            max_transactions=self.max_transactions,
+            idle_timeout=self.idle_timeout
+        )
+
+        pickled = pickle.dumps({'fetched_rows': 0}, -1)
+        command_obj = registry.get('sid', 1, pickled)
+        command_obj['fetched_rows'] = 1000
+
+        time_mock.time.return_value = 1000 + self.elapsed
+        # Another transaction of the same session
+        registry.get('sid', 2, pickle.dumps({'fetched_rows': 0}, -1))
+
+        if self.replace_pickled:
+            pickled = pickle.dumps({'fetched_rows': 0, 'limit': 10}, -1)
+
+        result = registry.get('sid', 1, pickled)
+
+        if self.expected_live_object:
+            self.assertIs(result, command_obj)
+            self.assertEqual(result['fetched_rows'], 1000)
+        else:
+            self.assertIsNot(result, command_obj)
+            self.assertEqual(result['fetched_rows'], 0)
+
+        registry.remove('sid', 2)
+        self.assertEqual(len(registry), 1)
+
+        # on_load is called only when the command object is unpickled (i.e.
+        # to restore the fetched row counter kept in the session)
+        loaded = []
+        registry.remove('sid', 1)
+        result = registry.get('sid', 1, pickled, on_load=loaded.append)
+        self.assertEqual(loaded, [result])
+        registry.get('sid', 1, pickled, on_load=loaded.append)
+        self.assertEqual(loaded, [result])
@@ -0,0 +1,220 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+In-process registry of the live command objects of the query tool and the
+view data transactions.
+
+The command object of a transaction is stored (pickled) in the session, and
+it used to be unpickled on every request, and pickled back just to update
+the fetched row counters, which makes the session dirty and forces it to be
+written to the disk. The registry keeps the unpickled command object per
+session and transaction id, and it is used as long as the pickled object in
+the session has not been replaced. The command object is pickled into the
+session only on structural changes (i.e. executing a query, changing the
+filter, limit, auto-commit, etc.).
+
+The fetched row counter of a command object changes on every page of the
+rows, hence it is kept in the session separately (see 'gridFetchedRows'),
+and restored when the command object is unpickled again (i.e. after it has
+been evicted from the registry, or when the request is served by another
+process).
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from flask import session
+
+# Maximum number of the command objects kept in the registry
+MAX_TRANSACTIONS = 1000
+# Command object not used for these many seconds will be evicted
+IDLE_TIMEOUT = 30 * 60
+
+
+class _TransactionEntry(object):
+    """
+    Holds a live command object, and the pickled object (from the session)
+    it was loaded from (or saved as).
+    """
+
+    __slots__ = ('command_obj', 'pickled', 'last_access')
+
+    def __init__(self, command_obj, pickled):
+        self.command_obj = command_obj
+        self.pickled = pickled
+        self.last_access = time.time()
+
+
+class TransactionRegistry(object):
+    """
+    class TransactionRegistry(object)
+
+        LRU registry of the live command objects, keyed by session id and
+        transaction id. Entries idle for more than the idle timeout are
+        evicted too.
+
+    Methods:
+    -------
+    * get(sid, trans_id, pickled, on_load=None)
+      - Returns the live command object for the given transaction, if it was
+        loaded from/saved as the given pickled object, otherwise unpickles it
+        (calling on_load with it) and keeps it in the registry.
+
+    * put(sid, trans_id, command_obj, pickled)
+      - Keep the live command object for the given transaction.
+
+    * remove(sid, trans_id)
+      - Remove the command object of the given transaction.
+    """
+
+    def __init__(self, max_transactions=MAX_TRANSACTIONS,
+                 idle_timeout=IDLE_TIMEOUT):
+        self.max_transactions = max_transactions
+        self.idle_timeout = idle_timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        # Entries are ordered by their last access, hence - stop at the first
+        # entry, which has been accessed within the idle timeout.
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_transactions and \
+                    now - entry.last_access < self.idle_timeout:
+                break
+            del self._entries[key]
+
+    def get(self, sid, trans_id, pickled, on_load=None):
+        key = (sid, str(trans_id))
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            # Use the live object, only if the command object in the session
+            # has not been replaced since it was loaded/saved.
+            if entry is not None and (
+                entry.pickled is pickled or entry.pickled == pickled
+            ):
+                entry.last_access = now
+                self._entries[key] = entry
+                return entry.command_obj
+
+        command_obj = pickle.loads(pickled)
+        if on_load is not None:
+            on_load(command_obj)
+
+        with self._lock:
+            self._entries[key] = _TransactionEntry(command_obj, pickled)
+            self._evict(now)
+
+        return command_obj
+
+    def put(self, sid, trans_id, command_obj, pickled):
+        key = (sid, str(trans_id))
+        now = time.time()
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = _TransactionEntry(command_obj, pickled)
+            self._evict(now)
+
+    def remove(self, sid, trans_id):
+        with self._lock:
+            self._entries.pop((sid, str(trans_id)), None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+transaction_registry = TransactionRegistry()
+
+
+def _session_id():
+    return getattr(session, 'sid', None)
+
+
+def _restore_fetched_row_cnt(trans_id):
+    rows_cnt = session.get('gridFetchedRows', dict()).get(str(trans_id))
+
+    def _restore(command_obj):
+        if rows_cnt is not None:
+            command_obj.update_fetched_row_cnt(rows_cnt)
+
+    return _restore
+
+
+def _forget_fetched_row_cnt(trans_id):
+    fetched_rows = session.get('gridFetchedRows', None)
+    if fetched_rows is not None and str(trans_id) in fetched_rows:
+        del fetched_rows[str(trans_id)]
+        session['gridFetchedRows'] = fetched_rows
+
+
+def get_command_obj(trans_id, session_obj):
+    """
+    Returns the live command object of the given transaction.
+
+    Args:
+        trans_id: unique transaction id
+        session_obj: transaction data from session['gridData']
+    """
+    return transaction_registry.get(
+        _session_id(), trans_id, session_obj['command_obj'],
+        _restore_fetched_row_cnt(trans_id)
+    )
+
+
+def update_fetched_row_cnt(trans_id, command_obj, rows_cnt):
+    """
+    Update the fetched row counter of the live command object, and keep it in
+    the session (without pickling the command object again).
+
+    Args:
+        trans_id: unique transaction id
+        command_obj: command object of the transaction
+        rows_cnt: number of the rows fetched
+    """
+    command_obj.update_fetched_row_cnt(rows_cnt)
+
+    fetched_rows = session.get('gridFetchedRows', dict())
+    fetched_rows[str(trans_id)] = rows_cnt
+    session['gridFetchedRows'] = fetched_rows
+
+
+def save_command_obj(trans_id, session_obj, command_obj):
+    """
+    Pickle the command object into the transaction data (to be stored in the
+    session), and keep the live command object in the registry.
+
+    Args:
+        trans_id: unique transaction id
+        session_obj: transaction data from session['gridData']
+        command_obj: command object of the transaction
+    """
+    session_obj['command_obj'] = pickle.dumps(command_obj, -1)
+    transaction_registry.put(
+        _session_id(), trans_id, command_obj, session_obj['command_obj']
+    )
+    # The pickled command object has the current fetched row counter.
+    _forget_fetched_row_cnt(trans_id)
+
+
+def remove_command_obj(trans_id):
+    """
+    Remove the command object of the given transaction from the registry.
+
+    Args:
+        trans_id: unique transaction id
+    """
+    transaction_registry.remove(_session_id(), trans_id)
+    _forget_fetched_row_cnt(trans_id)
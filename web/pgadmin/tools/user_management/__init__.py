@@ -26,6 +26,7 @@ from pgadmin.utils.ajax import make_response as ajax_response, \
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.utils.validation_utils import validate_email
+from pgadmin.utils.preferences import invalidate_user_preferences
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting
 
@@ -348,6 +349,7 @@ def delete(uid):
         db.session.delete(usr)
 
         db.session.commit()
+        invalidate_user_preferences(uid)
 
         return make_json_response(
             success=1,
@@ -35,6 +35,7 @@ class PgAdminModule(Blueprint):
         kwargs.setdefault('static_folder', 'static')
         self.submodules = []
         self.parentmodules = []
+        self.deferred_url_rules = []
 
         super(PgAdminModule, self).__init__(name, import_name, **kwargs)
 
@@ -55,6 +56,14 @@ class PgAdminModule(Blueprint):
         # To be implemented by child classes
         pass
 
+    def add_deferred_url_rule(self, rule, endpoint=None, view_func=None,
+                              **options):
+        """
+        Like add_url_rule, but the rule may be added to the application only on
+        the first request to the module (see PgAdmin.defer_url_rules).
+        """
+        self.deferred_url_rules.append((rule, endpoint, view_func, options))
+
     def register(self, app, options, first_registration=False):
         """
         Override the default register function to automagically register
@@ -65,6 +74,12 @@ class PgAdminModule(Blueprint):
 
         super(PgAdminModule, self).register(app, options, first_registration)
 
+        if self.deferred_url_rules:
+            app.defer_url_rules(
+                self.make_setup_state(app, options, first_registration),
+                self.deferred_url_rules
+            )
+
         for module in self.submodules:
             if first_registration:
                 module.parentmodules.append(self)
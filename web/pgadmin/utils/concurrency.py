@@ -0,0 +1,123 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Run the independent blocking calls (i.e. connecting to, or querying the
+different database servers) at the same time, on a bounded number of threads,
+with a time limit for each of them.
+"""
+
+import threading
+import time
+from concurrent.futures import TimeoutError
+from queue import Queue, Empty
+
+from flask import copy_current_request_context, has_request_context
+
+# The call run by the current thread
+_current = threading.local()
+
+
+class _Call(object):
+    def __init__(self, idx, func, finished):
+        self.idx = idx
+        self.func = func
+        self.finished = finished
+        self.started = None
+        self.cancelled = False
+
+    def run(self):
+        _current.call = self
+        try:
+            result = (True, self.func())
+        except Exception as e:
+            result = (False, e)
+        self.finished.put((self, result))
+
+
+def run_concurrently(funcs, max_workers, timeout=None):
+    """
+    Run the given functions (without arguments) at the same time on at most
+    max_workers threads, with the current request context (if any).
+
+    A function not completed within the timeout (in seconds, since it was
+    started) is left running in the background, and the next one is started
+    in its place, hence the hung calls do not block the others. It is marked
+    as cancelled (see cancelled), before this returns.
+
+    :param funcs: list of the functions
+    :param max_workers: maximum number of the functions run at the same time
+    :param timeout: time limit of each function, None for no limit
+    :return: list of (status, result) in the order of the functions, where
+        result is the returned value, when status is True, otherwise the
+        exception raised (TimeoutError, if not completed in time).
+    """
+    results = [None] * len(funcs)
+    max_workers = max(int(max_workers or 1), 1)
+
+    # Nothing to gain from a thread, unless it is to be timed out.
+    if timeout is None and (max_workers == 1 or len(funcs) <= 1):
+        for idx, func in enumerate(funcs):
+            try:
+                results[idx] = (True, func())
+            except Exception as e:
+                results[idx] = (False, e)
+        return results
+
+    finished = Queue()
+    pending = [_Call(idx, func, finished) for idx, func in enumerate(funcs)]
+    pending.reverse()
+    running = set()
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            call = pending.pop()
+            target = call.run
+            if has_request_context():
+                target = copy_current_request_context(target)
+
+            thread = threading.Thread(
+                target=target, name='pgadmin_call_{0}'.format(call.idx)
+            )
+            thread.daemon = True
+            call.started = time.time()
+            running.add(call)
+            thread.start()
+
+        wait = None
+        if timeout is not None:
+            wait = max(
+                min(call.started for call in running) + timeout - time.time(),
+                0
+            )
+
+        try:
+            call, result = finished.get(timeout=wait)
+            if call in running:
+                running.remove(call)
+                results[call.idx] = result
+        except Empty:
+            now = time.time()
+            for call in list(running):
+                if call.started + timeout <= now:
+                    call.cancelled = True
+                    running.remove(call)
+                    results[call.idx] = (False, TimeoutError())
+
+    return results
+
+
+def cancelled():
+    """
+    Returns True, if the call run by the current thread (see
+    run_concurrently) has been timed out. The request of the call may have
+    been completed since, hence it must not be changed (i.e. its session).
+    """
+    call = getattr(_current, 'call', None)
+    return call is not None and call.cancelled
@@ -0,0 +1,361 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Connection broker, to serve pgAdmin by multiple WSGI worker processes.
+
+The database connections of a session (the server managers of the driver,
+along with the running queries of the query tool, debugger, etc.) live in
+the memory of the process serving it. The broker lets each worker listen on a
+Unix socket in the broker directory, and the requests of a session are run
+by the worker owning its connections. The other workers forward the requests
+to the owner, and stream back its responses, hence the connections are used
+by one process, irrespective of the worker the request lands on.
+
+The owner of a session is the worker, which served its first request. It is
+recorded in the 'owners' directory of the broker directory, hence it does not
+change, when the workers are started, or stopped.
+
+If the owner of a session has gone away, its sessions are taken over by the
+other workers, which restore the connections from the session (the same way
+as on the restart of pgAdmin).
+"""
+
+import atexit
+import hashlib
+import os
+import re
+import sys
+import threading
+from io import BytesIO
+from multiprocessing.connection import Client, Listener
+from uuid import uuid4
+
+from werkzeug.http import parse_cookie
+from werkzeug.wsgi import get_input_stream
+
+# Size of the chunks of the forwarded request body
+CHUNK_SIZE = 64 * 1024
+
+SOCKET_SUFFIX = '.sock'
+
+OWNERS_DIR = 'owners'
+
+# Only the session ids generated by pgAdmin (uuid4) are recorded
+SESSION_ID_RE = re.compile(r'^[0-9a-f-]{1,64}$')
+
+
+class _ForwardedResponse(object):
+    """
+    The start_response of a forwarded request, sends the status and headers
+    to the forwarding worker before the first chunk of the body.
+    """
+    def __init__(self, conn):
+        self.conn = conn
+        self.status = None
+        self.sent = False
+
+    def start_response(self, status, headers, exc_info=None):
+        if exc_info and self.sent:
+            raise exc_info[1].with_traceback(exc_info[2])
+        self.status = (status, headers)
+        return self.write
+
+    def write(self, data):
+        if not self.sent:
+            self.conn.send(self.status)
+            self.sent = True
+        if data:
+            self.conn.send_bytes(data)
+
+    def close(self):
+        self.write(b'')
+        # Marks the end of the body
+        self.conn.send_bytes(b'')
+
+
+class ConnectionBroker(object):
+    """
+    class ConnectionBroker(object)
+
+        WSGI middleware running the requests of a session on the worker
+        process owning its database connections.
+
+    Methods:
+    -------
+    * start()
+      - Start listening for the requests forwarded by the other workers (it
+        is started by the first request of the worker process).
+
+    * stop()
+      - Stop listening, the sessions of the worker are taken over by the
+        other workers.
+
+    * owner(sid)
+      - Returns the address of the worker owning the given session, this
+        worker claims the sessions not owned by a live worker.
+    """
+
+    def __init__(self, app, path, skip_paths=None):
+        """
+        Args:
+            app: Flask application
+            path: directory of the Unix sockets of the workers
+            skip_paths: paths of the requests run by any worker
+        """
+        self.app = app
+        self.wsgi_app = app.wsgi_app
+        self.path = path
+        self.cookie_name = app.config['SESSION_COOKIE_NAME']
+        self.authkey = hashlib.sha256(
+            app.config['SECRET_KEY'].encode()
+        ).digest()
+        self.skip_paths = [] if skip_paths is None else skip_paths
+
+        self.owners_path = os.path.join(path, OWNERS_DIR)
+
+        self.address = None
+        self._pid = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        # The application may be created before forking the workers, hence
+        # every worker starts its own listener.
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            if not os.path.exists(self.owners_path):
+                os.makedirs(self.owners_path, 0o700)
+
+            self.address = os.path.join(
+                self.path, uuid4().hex + SOCKET_SUFFIX
+            )
+            self._listener = Listener(
+                self.address, 'AF_UNIX', authkey=self.authkey
+            )
+
+            thread = threading.Thread(
+                target=self._serve, args=(self._listener,),
+                name='connection_broker'
+            )
+            thread.daemon = True
+            thread.start()
+
+            self._pid = os.getpid()
+            atexit.register(self.stop)
+
+    def stop(self):
+        with self._lock:
+            if self._listener is None:
+                return
+
+            try:
+                self._listener.close()
+            except Exception:
+                pass
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+
+            # The sessions of the worker are claimed by the workers serving
+            # their next requests.
+            for sid in os.listdir(self.owners_path):
+                if self._read_owner(sid) == self.address:
+                    self._remove_file(os.path.join(self.owners_path, sid))
+
+            self._listener = None
+            self._pid = None
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _remove_worker(self, address):
+        """Remove the socket of a worker, which has gone away."""
+        self._remove_file(address)
+
+    def _read_owner(self, sid):
+        try:
+            with open(os.path.join(self.owners_path, sid)) as f:
+                return f.read() or None
+        except (IOError, OSError):
+            return None
+
+    def owner(self, sid):
+        address = self._read_owner(sid)
+        if address is not None and os.path.exists(address):
+            return address
+
+        return self._claim(sid)
+
+    def _claim(self, sid):
+        """
+        Record this worker as the owner of the session, unless it has been
+        claimed by another live worker in the meantime.
+        """
+        import fcntl
+
+        # The claims of all the workers are serialised by the lock file.
+        with open(os.path.join(self.path, 'owners.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            address = self._read_owner(sid)
+            if address is not None and os.path.exists(address):
+                return address
+
+            record = os.path.join(self.owners_path, sid)
+            tmp_record = record + '.' + uuid4().hex
+            with open(tmp_record, 'w') as f:
+                f.write(self.address)
+            os.rename(tmp_record, record)
+
+        return self.address
+
+    def _session_id(self, environ):
+        path = environ.get('PATH_INFO', '')
+        for sp in self.skip_paths:
+            if path.startswith(sp):
+                return None
+
+        cookie_val = parse_cookie(environ).get(self.cookie_name)
+        if not cookie_val or '!' not in cookie_val:
+            return None
+
+        sid = cookie_val.split('!', 1)[0]
+        if not SESSION_ID_RE.match(sid):
+            return None
+
+        return sid
+
+    def __call__(self, environ, start_response):
+        self.start()
+
+        sid = self._session_id(environ)
+        if sid is None:
+            return self.wsgi_app(environ, start_response)
+
+        # The session is claimed again, when its owner has gone away (by
+        # this worker, or by another one at the same time).
+        for _ in range(2):
+            owner = self.owner(sid)
+            if owner == self.address:
+                break
+
+            try:
+                conn = Client(owner, 'AF_UNIX', authkey=self.authkey)
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._remove_worker(owner)
+                continue
+
+            return self._forward(conn, environ, start_response)
+
+        return self.wsgi_app(environ, start_response)
+
+    def _forward(self, conn, environ, start_response):
+        try:
+            # Only the CGI variables (and the url scheme) can be sent to the
+            # other process, the WSGI objects are recreated by the owner.
+            conn.send(dict(
+                (key, value) for key, value in environ.items()
+                if isinstance(value, str)
+            ))
+
+            stream = get_input_stream(environ)
+            while True:
+                data = stream.read(CHUNK_SIZE)
+                if not data:
+                    break
+                conn.send_bytes(data)
+            conn.send_bytes(b'')
+
+            status, headers = conn.recv()
+        except Exception:
+            conn.close()
+            raise
+
+        start_response(status, headers)
+
+        return self._iter_response(conn)
+
+    @staticmethod
+    def _iter_response(conn):
+        try:
+            while True:
+                data = conn.recv_bytes()
+                if not data:
+                    break
+                yield data
+        finally:
+            conn.close()
+
+    def _serve(self, listener):
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError:
+                # The listener has been closed
+                if self._listener is not listener:
+                    return
+                continue
+            except Exception:
+                # Failed authentication
+                continue
+
+            thread = threading.Thread(
+                target=self._run_forwarded, args=(conn,),
+                name='connection_broker_request'
+            )
+            thread.daemon = True
+            thread.start()
+
+    def _run_forwarded(self, conn):
+        try:
+            environ = conn.recv()
+
+            body = BytesIO()
+            while True:
+                data = conn.recv_bytes()
+                if not data:
+                    break
+                body.write(data)
+            body.seek(0)
+
+            environ.update({
+                'wsgi.input': body,
+                'wsgi.errors': sys.stderr,
+                'wsgi.version': (1, 0),
+                'wsgi.multithread': True,
+                'wsgi.multiprocess': True,
+                'wsgi.run_once': False,
+            })
+
+            response = _ForwardedResponse(conn)
+            result = self.wsgi_app(environ, response.start_response)
+            try:
+                for data in result:
+                    response.write(data)
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+
+            response.close()
+        except (EOFError, OSError):
+            # The forwarding worker has gone away (i.e. client disconnected)
+            pass
+        except Exception as e:
+            self.app.logger.exception(e)
+        finally:
+            conn.close()
@@ -0,0 +1,51 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Capability probes of the database servers, i.e. whether pgAgent is installed,
+or whether a table is partitioned, registered by the node modules. Those are
+run, and their results are cached by the server manager (see
+ServerManager.probe), so that expanding a node of the browser tree does not
+query the server again for the same capability.
+"""
+
+from collections import namedtuple
+
+Probe = namedtuple('Probe', ['name', 'func', 'ttl'])
+
+_probes = dict()
+
+
+def register_probe(name, ttl=None):
+    """
+    Decorator registering the capability probe with the given name.
+
+    The decorated function is called with the server manager, the connection
+    to the database, and the arguments given to ServerManager.probe, and
+    returns (status, result) (as execute_scalar does). Only the successful
+    results are cached.
+
+    :param name: name of the probe
+    :param ttl: number of seconds the result is cached for, defaults to
+        CAPABILITY_CACHE_TTL
+    """
+    def decorator(func):
+        _probes[name] = Probe(name, func, ttl)
+        return func
+
+    return decorator
+
+
+def get_probe(name):
+    """
+    Returns the probe (Probe) registered with the given name.
+
+    :raises KeyError: if not registered
+    """
+    return _probes[name]
@@ -14,7 +14,6 @@ object.
 
 """
 import datetime
-import re
 from flask import session
 from flask_login import current_user
 from werkzeug.exceptions import InternalServerError
@@ -24,10 +23,11 @@ from threading import Lock
 
 import config
 from pgadmin.model import Server
-from .keywords import scan_keyword
+from . import quoting
 from ..abstract import BaseDriver
 from .connection import Connection
-from .server_manager import ServerManager
+from .server_manager import ServerManager, connection_scope, \
+    restore_connections
 
 connection_restore_lock = Lock()
 
@@ -75,13 +75,24 @@ class Driver(BaseDriver):
             if '__pgsql_server_managers' in session:
                 session_managers = \
                     session['__pgsql_server_managers'].copy()
+                restored = []
+                tasks = []
                 for server in \
                     Server.query.filter_by(
                         user_id=current_user.id):
                     manager = managers[str(server.id)] = \
                         ServerManager(server)
                     if server.id in session_managers:
-                        manager._restore(session_managers[server.id])
+                        restored.append(manager)
+                        tasks.extend(manager._restore_tasks(
+                            session_managers[server.id]
+                        ))
+
+                # Reconnect the connections of all the servers at once
+                try:
+                    restore_connections(tasks)
+                finally:
+                    for manager in restored:
                         manager.update_session()
             return managers
 
@@ -197,6 +208,15 @@ class Driver(BaseDriver):
         """
         return self.connection_manager(sid).release(database, conn_id)
 
+    @staticmethod
+    def connection_scope(scope):
+        """
+        Returns a context manager, within which the connections requested
+        (without the connection id) by the current thread are dedicated to
+        the given scope, instead of the shared connection of the database.
+        """
+        return connection_scope(scope)
+
     def delete_manager(self, sid):
         """
         Delete manager for given server id.
@@ -275,140 +295,56 @@ class Driver(BaseDriver):
         return res
 
     @staticmethod
-    def ScanKeywordExtraLookup(key):
+    def ScanKeywordExtraLookup(key, conn=None):
         # UNRESERVED_KEYWORD      0
         # COL_NAME_KEYWORD        1
         # TYPE_FUNC_NAME_KEYWORD  2
         # RESERVED_KEYWORD        3
-        extra_keywords = {
-            'connect': 3,
-            'convert': 3,
-            'distributed': 0,
-            'exec': 3,
-            'log': 0,
-            'long': 3,
-            'minus': 3,
-            'nocache': 3,
-            'number': 3,
-            'package': 3,
-            'pls_integer': 3,
-            'raw': 3,
-            'return': 3,
-            'smalldatetime': 3,
-            'smallfloat': 3,
-            'smallmoney': 3,
-            'sysdate': 3,
-            'systimestap': 3,
-            'tinyint': 3,
-            'tinytext': 3,
-            'varchar2': 3
-        }
-
-        return extra_keywords.get(key, None) or scan_keyword(key)
+        return quoting.scan_keyword(
+            key, quoting.keyword_table(quoting.server_version(conn))
+        )
 
     @staticmethod
-    def needsQuoting(key, for_types):
-        value = key
-        val_noarray = value
-
-        # check if the string is number or not
-        if isinstance(value, int):
-            return True
-        # certain types should not be quoted even though it contains a space.
-        # Evilness.
-        elif for_types and value[-2:] == "[]":
-            val_noarray = value[:-2]
-
-        if for_types and val_noarray.lower() in [
-            'bit varying',
-            '"char"',
-            'character varying',
-            'double precision',
-            'timestamp without time zone',
-            'timestamp with time zone',
-            'time without time zone',
-            'time with time zone',
-            '"trigger"',
-            '"unknown"'
-        ]:
-            return False
-
-        # If already quoted?, If yes then do not quote again
-        if for_types and val_noarray and \
-                (val_noarray.startswith('"') or val_noarray.endswith('"')):
-            return False
-
-        if '0' <= val_noarray[0] <= '9':
-            return True
-
-        if re.search('[^a-z_0-9]+', val_noarray):
-            return True
-
-        # check string is keywaord or not
-        category = Driver.ScanKeywordExtraLookup(value)
-
-        if category is None:
-            return False
-
-        # UNRESERVED_KEYWORD
-        if category == 0:
-            return False
-
-        # COL_NAME_KEYWORD
-        if for_types and category == 1:
-            return False
-
-        return True
+    def needsQuoting(key, for_types, conn=None):
+        return quoting.needs_quoting(
+            key, for_types,
+            quoting.keyword_table(quoting.server_version(conn))
+        )
 
     @staticmethod
     def qtTypeIdent(conn, *args):
-        # We're not using the conn object at the moment, but - we will
-        # modify the
-        # logic to use the server version specific keywords later.
-        res = None
-        value = None
-
-        for val in args:
-            # DataType doesn't have len function then convert it to string
-            if not hasattr(val, '__len__'):
-                val = str(val)
-
-            if len(val) == 0:
-                continue
-            value = val
-
-            if Driver.needsQuoting(val, True):
-                value = value.replace("\"", "\"\"")
-                value = "\"" + value + "\""
-
-            res = ((res and res + '.') or '') + value
-
-        return res
+        # The keywords of the server version of the connection are used
+        # (the latest ones, if not known).
+        return quoting.quote_qualified(
+            args, True, quoting.keyword_table(quoting.server_version(conn))
+        )
 
     @staticmethod
     def qtIdent(conn, *args):
-        # We're not using the conn object at the moment, but - we will
-        # modify the logic to use the server version specific keywords later.
-        res = None
-        value = None
+        table = quoting.keyword_table(quoting.server_version(conn))
 
         for val in args:
             if isinstance(val, list):
-                return map(lambda w: Driver.qtIdent(conn, w), val)
-
-            # DataType doesn't have len function then convert it to string
-            if not hasattr(val, '__len__'):
-                val = str(val)
-
-            if len(val) == 0:
-                continue
+                return quoting.quote_list(val, False, table)
 
-            value = val
+        return quoting.quote_qualified(args, False, table)
 
-            if Driver.needsQuoting(val, False):
-                value = value.replace("\"", "\"\"")
-                value = "\"" + value + "\""
-
-            res = ((res and res + '.') or '') + value
+    @staticmethod
+    def qtIdents(conn, values):
+        """
+        Returns the list of the quoted (if required) identifiers, i.e. of
+        the columns, or the arguments.
+        """
+        return quoting.quote_list(
+            values, False, quoting.keyword_table(quoting.server_version(conn))
+        )
 
-        return res
+    @staticmethod
+    def qtTypeIdents(conn, values):
+        """
+        Returns the list of the quoted (if required) type names, i.e. of the
+        arguments.
+        """
+        return quoting.quote_list(
+            values, True, quoting.keyword_table(quoting.server_version(conn))
+        )
@@ -16,8 +16,10 @@ object.
 import random
 import select
 import datetime
-from collections import deque
+import time
+from collections import deque, OrderedDict
 import psycopg2
+import sqlparse
 from flask import g, current_app
 from flask_babelex import gettext
 from flask_security import current_user
@@ -145,6 +147,26 @@ class Connection(BaseConnection):
         gettext("Cursor could not be found for the async connection.")
     ARGS_STR = "{0}#{1}"
 
+    DB_INFO_COLUMNS = ('did', 'datname', 'datallowconn', 'serverencoding',
+                       'cancreate', 'datlastsysoid')
+    USER_INFO_COLUMNS = ('id', 'name', 'is_superuser', 'can_create_role',
+                         'can_create_db')
+    SERVER_INFO_QUERY = """
+SELECT
+    version() AS version,
+    db.oid as did, db.datname, db.datallowconn,
+    pg_encoding_to_char(db.encoding) AS serverencoding,
+    has_database_privilege(db.oid, 'CREATE') as cancreate, datlastsysoid,
+    r.oid as user_id, r.rolname as user_name, r.rolsuper as user_is_superuser,
+    CASE WHEN r.rolsuper THEN true ELSE r.rolcreaterole END as
+    user_can_create_role,
+    CASE WHEN r.rolsuper THEN true ELSE r.rolcreatedb END as
+    user_can_create_db
+FROM
+    pg_database db
+    LEFT JOIN pg_catalog.pg_roles r ON r.rolname = current_user
+WHERE db.datname = current_database()"""
+
     def __init__(self, manager, conn_id, db, auto_reconnect=True, async_=0,
                  use_binary_placeholder=False, array_to_string=False):
         assert (manager is not None)
@@ -492,7 +514,53 @@ class Connection(BaseConnection):
         if is_error:
             return False, errmsg
 
-        # Check database version every time on reconnection
+        # Check database version every time on reconnection, along with the
+        # database, and the user information in a single round trip.
+        status = self._execute(cur, self.SERVER_INFO_QUERY)
+
+        if status is None:
+            row = cur.fetchmany(1)[0] if cur.rowcount > 0 else None
+            if row is not None:
+                manager.ver = row['version']
+                manager.sversion = self.conn.server_version
+                self._set_db_info(manager, OrderedDict(
+                    (col, row[col]) for col in self.DB_INFO_COLUMNS
+                ))
+                if 'user' not in kwargs:
+                    manager.user_info = OrderedDict(
+                        (col, row['user_' + col])
+                        for col in self.USER_INFO_COLUMNS
+                    ) if row['user_id'] is not None else dict()
+        else:
+            # Fall back to the separate queries, i.e. when the catalogs are
+            # not accessible.
+            if self.async_ == 0 and not self.conn.autocommit:
+                self.conn.rollback()
+
+            status, cur = self.__cursor()
+            if not status:
+                return False, cur
+
+            status, errmsg = self._set_server_info(cur, manager, conn_id,
+                                                   **kwargs)
+            if not status:
+                return False, errmsg
+
+        self._set_server_type_and_password(kwargs, manager)
+
+        manager.update_session()
+
+        return True, None
+
+    def _set_server_info(self, cur, manager, conn_id, **kwargs):
+        """
+        Set the server version, the database and the user information using
+        the separate queries.
+        :param cur:
+        :param manager:
+        :param conn_id:
+        :return:
+        """
         status = self._execute(cur, "SELECT version()")
 
         if status is not None:
@@ -524,23 +592,27 @@ FROM
     pg_database db
 WHERE db.datname = current_database()""")
 
-        if status is None:
-            manager.db_info = manager.db_info or dict()
-            if cur.rowcount > 0:
-                res = cur.fetchmany(1)[0]
-                manager.db_info[res['did']] = res.copy()
-
-                # We do not have database oid for the maintenance database.
-                if len(manager.db_info) == 1:
-                    manager.did = res['did']
+        if status is None and cur.rowcount > 0:
+            self._set_db_info(manager, cur.fetchmany(1)[0].copy())
 
         self._set_user_info(cur, manager, **kwargs)
 
-        self._set_server_type_and_password(kwargs, manager)
+        return True, None
 
-        manager.update_session()
+    @staticmethod
+    def _set_db_info(manager, res):
+        """
+        Set the information of the connected database.
+        :param manager:
+        :param res: row of the database
+        :return:
+        """
+        manager.db_info = manager.db_info or dict()
+        manager.db_info[res['did']] = res
 
-        return True, None
+        # We do not have database oid for the maintenance database.
+        if len(manager.db_info) == 1:
+            manager.did = res['did']
 
     def _set_user_info(self, cur, manager, **kwargs):
         """
@@ -728,6 +800,67 @@ WHERE db.datname = current_database()""")
         if self.async_ == 1:
             self._wait(cur.connection)
 
+    def _can_stream_with_server_cursor(self, query):
+        """
+        Check whether the given query can be streamed through a server side
+        cursor, i.e. it is a single SELECT statement and the connection is
+        not in the middle of a transaction (so that a failure in declaring
+        the cursor can be rolled back safely).
+
+        Args:
+            query: SQL
+        Returns:
+            True if the server side cursor can be used, otherwise False.
+        """
+        if not config.QUERY_TOOL_DOWNLOAD_SERVER_CURSOR:
+            return False
+
+        if self.conn.get_transaction_status() != \
+                psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            return False
+
+        statements = [
+            stmt for stmt in sqlparse.parse(query)
+            if stmt.value.strip(' \t\r\n;')
+        ]
+
+        return len(statements) == 1 and statements[0].get_type() == 'SELECT'
+
+    def _declare_server_cursor(self, cur, query, params, cursor_name):
+        """
+        Declare a server side cursor for the given query, and fetch the
+        first batch of the records from it.
+
+        Returns:
+            True, if the cursor has been declared, otherwise False. In case of
+            failure, the transaction started for the cursor is rolled back,
+            and the caller should fallback to the normal execution.
+        """
+        query = query.strip().rstrip(';').rstrip()
+        try:
+            if self.conn.autocommit:
+                self.__internal_blocking_execute(cur, 'BEGIN', None)
+            self.__internal_blocking_execute(
+                cur,
+                'DECLARE {0} NO SCROLL CURSOR FOR {1}'.format(
+                    cursor_name, query
+                ),
+                params
+            )
+            return True
+        except psycopg2.Error as pe:
+            current_app.logger.warning(
+                "Failed to declare the server cursor for the server "
+                "#{server_id} - {conn_id}, falling back to the client side "
+                "cursor:\n{errmsg}".format(
+                    server_id=self.manager.sid,
+                    conn_id=self.conn_id,
+                    errmsg=str(pe)
+                )
+            )
+            self.__internal_blocking_execute(cur, 'ROLLBACK', None)
+            return False
+
     def execute_on_server_as_csv(self,
                                  query, params=None,
                                  formatted_exception_msg=False,
@@ -735,11 +868,17 @@ WHERE db.datname = current_database()""")
         """
         To fetch query result and generate CSV output
 
+        A single SELECT statement is executed through a server side cursor,
+        and only 'records' rows are fetched from it at a time, when the next
+        chunk of the response is requested by the WSGI server. Hence - the
+        memory used by a download does not depend on the size of the result.
+        Any other query is executed on the client side cursor.
+
         Args:
             query: SQL
             params: Additional parameters
             formatted_exception_msg: For exception
-            records: Number of initial records
+            records: Number of records to fetch in one round trip
         Returns:
             Generator response
         """
@@ -760,13 +899,35 @@ WHERE db.datname = current_database()""")
                 query_id=query_id
             )
         )
+
+        cursor_name = 'pga_download_{0}'.format(query_id)
+        own_transaction = False
         try:
             # Unregistering type casting for large size data types.
             unregister_numeric_typecasters(self.conn)
-            self.__internal_blocking_execute(cur, query, params)
+            if self._can_stream_with_server_cursor(query) and \
+                    self._declare_server_cursor(
+                        cur, query, params, cursor_name):
+                own_transaction = self.conn.autocommit
+            else:
+                cursor_name = None
+
+            if cursor_name is None:
+                self.__internal_blocking_execute(cur, query, params)
+            else:
+                self.__internal_blocking_execute(
+                    cur, 'FETCH FORWARD {0} FROM {1}'.format(
+                        records, cursor_name
+                    ), None
+                )
         except psycopg2.Error as pe:
-            cur.close()
             errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
+            if own_transaction and self.connected():
+                try:
+                    self.__internal_blocking_execute(cur, 'ROLLBACK', None)
+                except psycopg2.Error:
+                    pass
+            cur.close()
             current_app.logger.error(
                 "failed to execute query ((with server cursor) "
                 "for the server #{server_id} - {conn_id} "
@@ -786,6 +947,62 @@ WHERE db.datname = current_database()""")
             return False, \
                 gettext('The query executed did not return any data.')
 
+        # The generator runs outside of the request context, hence - keep
+        # the reference of the logger for reporting the throughput.
+        logger = current_app.logger
+
+        def fetch_next():
+            """
+            Fetch the next batch of the records, from the server side cursor
+            (if declared), otherwise from the client side cursor.
+            """
+            if cursor_name is not None:
+                self.__internal_blocking_execute(
+                    cur, 'FETCH FORWARD {0} FROM {1}'.format(
+                        records, cursor_name
+                    ), None
+                )
+            return cur.fetchmany(records)
+
+        def release_cursor():
+            """
+            Close the server side cursor (and the transaction started for
+            it), and the client side cursor.
+            """
+            if cur.closed:
+                return
+
+            try:
+                if cursor_name is not None and self.connected() and \
+                        not self.conn.isexecuting():
+                    if self.conn.get_transaction_status() == \
+                            psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+                        if own_transaction:
+                            self.__internal_blocking_execute(
+                                cur, 'ROLLBACK', None
+                            )
+                    else:
+                        self.__internal_blocking_execute(
+                            cur, 'CLOSE {0}'.format(cursor_name), None
+                        )
+                        if own_transaction:
+                            self.__internal_blocking_execute(
+                                cur, 'COMMIT', None
+                            )
+            except psycopg2.Error as pe:
+                logger.error(
+                    "Failed to close the server cursor for the server "
+                    "#{server_id} - {conn_id} (Query-id: {query_id}):\n"
+                    "{errmsg}".format(
+                        server_id=self.manager.sid,
+                        conn_id=self.conn_id,
+                        query_id=query_id,
+                        errmsg=str(pe)
+                    )
+                )
+            finally:
+                cur.close()
+
         def handle_null_values(results, replace_nulls_with):
             """
             This function is used to replace null values with the given string
@@ -814,8 +1031,7 @@ WHERE db.datname = current_database()""")
 
             results = cur.fetchmany(records)
             if not results:
-                if not cur.closed:
-                    cur.close()
+                release_cursor()
                 yield gettext('The query executed did not return any data.')
                 return
 
@@ -829,8 +1045,6 @@ WHERE db.datname = current_database()""")
                 if c.to_dict()['type_code'] in ALL_JSON_TYPES:
                     json_columns.append(column_name)
 
-            res_io = StringIO()
-
             if quote == 'strings':
                 quote = csv.QUOTE_NONNUMERIC
             elif quote == 'all':
@@ -838,42 +1052,63 @@ WHERE db.datname = current_database()""")
             else:
                 quote = csv.QUOTE_NONE
 
-            csv_writer = csv.DictWriter(
-                res_io, fieldnames=header, delimiter=field_separator,
-                quoting=quote,
-                quotechar=quote_char,
-                replace_nulls_with=replace_nulls_with
-            )
-
-            csv_writer.writeheader()
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
-            csv_writer.writerows(results)
+            start_time = time.time()
+            total_rows = 0
+            total_bytes = 0
+            write_header = True
 
-            yield res_io.getvalue()
-
-            while True:
-                results = cur.fetchmany(records)
+            try:
+                while results:
+                    res_io = StringIO()
+
+                    csv_writer = csv.DictWriter(
+                        res_io, fieldnames=header, delimiter=field_separator,
+                        quoting=quote,
+                        quotechar=quote_char,
+                        replace_nulls_with=replace_nulls_with
+                    )
 
-                if not results:
-                    if not cur.closed:
-                        cur.close()
-                    break
-                res_io = StringIO()
+                    if write_header:
+                        csv_writer.writeheader()
+                        write_header = False
 
-                csv_writer = csv.DictWriter(
-                    res_io, fieldnames=header, delimiter=field_separator,
-                    quoting=quote,
-                    quotechar=quote_char,
-                    replace_nulls_with=replace_nulls_with
+                    # Replace the null values with given string if configured.
+                    if replace_nulls_with is not None:
+                        results = handle_null_values(
+                            results, replace_nulls_with
+                        )
+                    csv_writer.writerows(results)
+                    total_rows += len(results)
+
+                    chunk = res_io.getvalue().encode('utf-8')
+                    total_bytes += len(chunk)
+
+                    # Release the batch, before waiting for the WSGI server
+                    # to consume the chunk.
+                    results = res_io = csv_writer = None
+                    yield chunk
+
+                    results = fetch_next()
+            finally:
+                release_cursor()
+
+                elapsed = max(time.time() - start_time, 0.000001)
+                logger.info(
+                    "Download for server #{server_id} - {conn_id} "
+                    "(Query-id: {query_id}): {rows} rows, {size} bytes in "
+                    "{elapsed:.3f} seconds ({rows_per_sec:.0f} rows/sec, "
+                    "{bytes_per_sec:.0f} bytes/sec)".format(
+                        server_id=self.manager.sid,
+                        conn_id=self.conn_id,
+                        query_id=query_id,
+                        rows=total_rows,
+                        size=total_bytes,
+                        elapsed=elapsed,
+                        rows_per_sec=total_rows / elapsed,
+                        bytes_per_sec=total_bytes / elapsed
+                    )
                 )
 
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
-                csv_writer.writerows(results)
-                yield res_io.getvalue()
         # Registering back type caster for large size data types to string
         # which was unregistered at starting
         register_string_typecasters(self.conn)
@@ -1238,22 +1473,16 @@ WHERE db.datname = current_database()""")
             )
 
         if self.row_count > 0:
-            result = []
             # For DDL operation, we may not have result.
             #
             # Because - there is not direct way to differentiate DML and
             # DDL operations, we need to rely on exception to figure
             # that out at the moment.
+            #
+            # The records are fetched as tuples in the order of the columns,
+            # and sent as they are, without building a dictionary per record.
             try:
-                if records == -1:
-                    res = cur.fetchall()
-                else:
-                    res = cur.fetchmany(records)
-                for row in res:
-                    new_row = []
-                    for col in self.column_info:
-                        new_row.append(row[col['name']])
-                    result.append(new_row)
+                result = cur.fetch_page(records)
             except psycopg2.ProgrammingError:
                 result = None
         else:
@@ -1519,19 +1748,13 @@ Failed to reset the connection to the server due to following error:
 
             self.row_count = cur.rowcount
             if not no_result and cur.rowcount > 0:
-                result = []
                 # For DDL operation, we may not have result.
                 #
                 # Because - there is not direct way to differentiate DML
                 # and DDL operations, we need to rely on exception to
                 # figure that out at the moment.
                 try:
-                    for row in cur:
-                        new_row = []
-                        for col in self.column_info:
-                            new_row.append(row[col['name']])
-                        result.append(new_row)
-
+                    result = cur.fetch_page()
                 except psycopg2.ProgrammingError:
                     result = None
 
@@ -134,6 +134,10 @@ class DictCursor(_cursor):
     * _ordered_description()
     - Generates the _WrapperColumn object from the description column, and
       identifies duplicate column name
+
+    * fetch_page(size)
+    - Fetch the next page of the records as tuples, without generating the
+      dictionary for each of them
     """
 
     def __init__(self, *args, **kwargs):
@@ -228,6 +232,16 @@ class DictCursor(_cursor):
         if tuples is not None:
             return [self._dict_tuple(t) for t in tuples]
 
+    def fetch_page(self, size=-1):
+        """
+        Fetch the next page of the records as tuples (in the same order as
+        the ordered description), without transforming them into the
+        dictionaries. Use size as -1 to fetch all the remaining records.
+        """
+        if size == -1:
+            return _cursor.fetchall(self)
+        return _cursor.fetchmany(self, size)
+
     def __iter__(self):
         it = _cursor.__iter__(self)
         try:
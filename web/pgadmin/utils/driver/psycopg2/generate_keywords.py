@@ -31,11 +31,22 @@ if __name__ == '__main__':
 #
 ##########################################################################
 """)
-    keywords_file.write('# ScanKeyword function for ' + version)
-    keywords_file.write('\n\ndef ScanKeyword(key):')
-    keywords_file.write('\n    keywordDict = {\n')
+    keywords_file.write('# Keywords (and their categories) of ' + version)
+    keywords_file.write("""
+#
+# UNRESERVED_KEYWORD      0
+# COL_NAME_KEYWORD        1
+# TYPE_FUNC_NAME_KEYWORD  2
+# RESERVED_KEYWORD        3
+#
+# Generated by generate_keywords.py, the keywords of the later versions are
+# maintained in quoting.py.
+
+from types import MappingProxyType
 
-    idx = 0
+
+KEYWORDS = MappingProxyType({
+""")
 
     with open(include_dir + "/postgresql/server/parser/kwlist.h", "rb") as ins:
 
@@ -49,15 +60,10 @@ if __name__ == '__main__':
             line = line.decode().rstrip()
             if line[0:11] == 'PG_KEYWORD(' and line[-1] == ')':
                 match = pattern.match(line[11:-1])
-                if idx != 0:
-                    keywords_file.write(", ")
-                else:
-                    keywords_file.write("        ")
                 keywords_file.write(
-                    '"' + match.group(1) + '": ' +
-                    str(keyword_types.index(match.group(2)))
+                    "    '" + match.group(1) + "': " +
+                    str(keyword_types.index(match.group(2))) + ",\n"
                 )
-                idx += 1
-    keywords_file.write('\n        }\n')
-    keywords_file.write(
-        '    return (key in keywordDict and keywordDict[key]) or None')
+    keywords_file.write('})\n\n\n')
+    keywords_file.write('def scan_keyword(key):\n')
+    keywords_file.write('    return KEYWORDS.get(key, None)\n')
@@ -0,0 +1,275 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Quoting of the identifiers and the type names, used by the qtIdent and
+qtTypeIdent filters of (nearly) every SQL template.
+
+The keyword tables are built once per server version, and the quoted
+identifiers are memoized (in a bounded cache) by the identifier, and the
+keyword table.
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+from .keywords import KEYWORDS
+
+UNRESERVED_KEYWORD = 0
+COL_NAME_KEYWORD = 1
+TYPE_FUNC_NAME_KEYWORD = 2
+RESERVED_KEYWORD = 3
+
+# Number of the quoted identifiers memoized
+QUOTE_CACHE_SIZE = 65536
+
+# Keywords of EDB Postgres Advanced Server (quoted for all the servers)
+EXTRA_KEYWORDS = {
+    'connect': RESERVED_KEYWORD,
+    'convert': RESERVED_KEYWORD,
+    'distributed': UNRESERVED_KEYWORD,
+    'exec': RESERVED_KEYWORD,
+    'log': UNRESERVED_KEYWORD,
+    'long': RESERVED_KEYWORD,
+    'minus': RESERVED_KEYWORD,
+    'nocache': RESERVED_KEYWORD,
+    'number': RESERVED_KEYWORD,
+    'package': RESERVED_KEYWORD,
+    'pls_integer': RESERVED_KEYWORD,
+    'raw': RESERVED_KEYWORD,
+    'return': RESERVED_KEYWORD,
+    'smalldatetime': RESERVED_KEYWORD,
+    'smallfloat': RESERVED_KEYWORD,
+    'smallmoney': RESERVED_KEYWORD,
+    'sysdate': RESERVED_KEYWORD,
+    'systimestap': RESERVED_KEYWORD,
+    'tinyint': RESERVED_KEYWORD,
+    'tinytext': RESERVED_KEYWORD,
+    'varchar2': RESERVED_KEYWORD
+}
+
+# Keywords added by the PostgreSQL versions after the one of keywords.py
+KEYWORD_CHANGES = (
+    (90600, {
+        'depends': UNRESERVED_KEYWORD,
+        'method': UNRESERVED_KEYWORD,
+        'parallel': UNRESERVED_KEYWORD,
+    }),
+    (100000, {
+        'attach': UNRESERVED_KEYWORD,
+        'columns': UNRESERVED_KEYWORD,
+        'detach': UNRESERVED_KEYWORD,
+        'generated': UNRESERVED_KEYWORD,
+        'new': UNRESERVED_KEYWORD,
+        'old': UNRESERVED_KEYWORD,
+        'overriding': UNRESERVED_KEYWORD,
+        'publication': UNRESERVED_KEYWORD,
+        'referencing': UNRESERVED_KEYWORD,
+        'schemas': UNRESERVED_KEYWORD,
+        'subscription': UNRESERVED_KEYWORD,
+        'xmltable': COL_NAME_KEYWORD,
+    }),
+    (110000, {
+        'call': UNRESERVED_KEYWORD,
+        'groups': UNRESERVED_KEYWORD,
+        'include': UNRESERVED_KEYWORD,
+        'others': UNRESERVED_KEYWORD,
+        'procedures': UNRESERVED_KEYWORD,
+        'routine': UNRESERVED_KEYWORD,
+        'routines': UNRESERVED_KEYWORD,
+        'ties': UNRESERVED_KEYWORD,
+    }),
+    (120000, {
+        'stored': UNRESERVED_KEYWORD,
+        'support': UNRESERVED_KEYWORD,
+    }),
+    (130000, {
+        'normalize': COL_NAME_KEYWORD,
+        'normalized': UNRESERVED_KEYWORD,
+    }),
+)
+
+
+def _build_keyword_tables():
+    tables = []
+    keywords = dict(KEYWORDS)
+    keywords.update(EXTRA_KEYWORDS)
+    tables.append((0, MappingProxyType(dict(keywords))))
+
+    for version, changes in KEYWORD_CHANGES:
+        keywords.update(changes)
+        # The keywords of the EDB Advanced Server take precedence.
+        keywords.update(EXTRA_KEYWORDS)
+        tables.append((version, MappingProxyType(dict(keywords))))
+
+    return tuple(tables)
+
+
+# (minimum server version, keywords) in the order of the version
+KEYWORD_TABLES = _build_keyword_tables()
+
+# Types which should not be quoted, even though those contain a space.
+UNQUOTED_TYPES = frozenset([
+    'bit varying',
+    '"char"',
+    'character varying',
+    'double precision',
+    'timestamp without time zone',
+    'timestamp with time zone',
+    'time without time zone',
+    'time with time zone',
+    '"trigger"',
+    '"unknown"'
+])
+
+_NEEDS_QUOTING = re.compile('[^a-z_0-9]')
+
+
+@lru_cache(maxsize=None)
+def keyword_table(sversion=None):
+    """
+    Returns the index of the keyword table for the given server version (the
+    latest one, if the version is not known).
+    """
+    if sversion is None:
+        return len(KEYWORD_TABLES) - 1
+
+    idx = 0
+    for table_idx, (version, _) in enumerate(KEYWORD_TABLES):
+        if version > sversion:
+            break
+        idx = table_idx
+
+    return idx
+
+
+def server_version(conn):
+    """
+    Returns the version of the server of the given connection (if known).
+    """
+    # Some of the templates do not pass the connection (jinja2 Undefined)
+    if not conn:
+        return None
+    return getattr(getattr(conn, 'manager', None), 'sversion', None)
+
+
+def scan_keyword(key, table=None):
+    """
+    Returns the category of the keyword (None, if not a keyword).
+    """
+    if table is None:
+        table = keyword_table()
+    return KEYWORD_TABLES[table][1].get(key, None)
+
+
+def needs_quoting(value, for_types, table=None):
+    # check if the string is number or not
+    if isinstance(value, int):
+        return True
+
+    val_noarray = value
+    # certain types should not be quoted even though it contains a space.
+    # Evilness.
+    if for_types and value[-2:] == "[]":
+        val_noarray = value[:-2]
+
+    if for_types and val_noarray.lower() in UNQUOTED_TYPES:
+        return False
+
+    # If already quoted?, If yes then do not quote again
+    if for_types and val_noarray and \
+            (val_noarray.startswith('"') or val_noarray.endswith('"')):
+        return False
+
+    if '0' <= val_noarray[0] <= '9':
+        return True
+
+    if _NEEDS_QUOTING.search(val_noarray):
+        return True
+
+    # check string is keyword or not
+    category = scan_keyword(value, table)
+
+    if category is None or category == UNRESERVED_KEYWORD:
+        return False
+
+    if for_types and category == COL_NAME_KEYWORD:
+        return False
+
+    return True
+
+
+def _quote(value, for_types, table):
+    if needs_quoting(value, for_types, table):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+_quote_cached = lru_cache(maxsize=QUOTE_CACHE_SIZE)(_quote)
+
+
+def quote(value, for_types=False, table=None):
+    """
+    Returns the (quoted, if required) identifier, or type name.
+
+    :param value: identifier, or type name (non-empty string)
+    :param for_types: True for the type names
+    :param table: index of the keyword table (see keyword_table)
+    """
+    if table is None:
+        table = keyword_table()
+
+    # Only the strings are memoized (i.e. not the Markup objects).
+    if type(value) is str:
+        return _quote_cached(value, for_types, table)
+    return _quote(value, for_types, table)
+
+
+def quote_qualified(args, for_types=False, table=None):
+    """
+    Returns the qualified name made of the given (quoted, if required) parts,
+    the empty parts are skipped. i.e. ('public', 'Table') -> public."Table"
+    """
+    res = None
+
+    for val in args:
+        # DataType doesn't have len function then convert it to string
+        if not hasattr(val, '__len__'):
+            val = str(val)
+
+        if len(val) == 0:
+            continue
+
+        value = quote(val, for_types, table)
+        res = ((res and res + '.') or '') + value
+
+    return res
+
+
+def quote_list(values, for_types=False, table=None):
+    """
+    Returns the list of the (quoted, if required) identifiers, or type names,
+    i.e. of the columns, or the arguments.
+    """
+    if table is None:
+        table = keyword_table()
+
+    res = []
+    for val in values:
+        # DataType doesn't have len function then convert it to string
+        if not hasattr(val, '__len__'):
+            val = str(val)
+        res.append(quote(val, for_types, table) if len(val) else None)
+
+    return res
+
+
+def clear_cache():
+    _quote_cached.cache_clear()
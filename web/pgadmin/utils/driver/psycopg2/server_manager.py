@@ -12,6 +12,12 @@ Implementation of ServerManager
 """
 import os
 import datetime
+import threading
+import time
+from concurrent.futures import TimeoutError
+from contextlib import contextmanager
+from functools import partial
+
 import config
 from flask import current_app, session
 from flask_security import current_user
@@ -19,6 +25,7 @@ from flask_babelex import gettext
 from werkzeug.exceptions import InternalServerError
 
 from pgadmin.utils import get_complete_file_path
+from pgadmin.utils.concurrency import cancelled, run_concurrently
 from pgadmin.utils.crypto import decrypt
 from pgadmin.utils.master_password import process_masterpass_disabled
 from .connection import Connection
@@ -27,10 +34,75 @@ from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.master_password import get_crypt_key
 from pgadmin.utils.exception import ObjectGone
+from pgadmin.utils.driver.probes import get_probe
 
 if config.SUPPORT_SSH_TUNNEL:
     from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
 
+_connection_scope = threading.local()
+# The managers of a session are updated by the concurrent restores
+_session_lock = threading.Lock()
+
+
+@contextmanager
+def connection_scope(scope):
+    """
+    Use a dedicated (synchronous) connection for each database, when the
+    connection is requested without the connection id by the current thread
+    within this context. The connection id is made of the given scope and the
+    database name.
+
+    This allows the worker threads (i.e. of the schema diff) to run the
+    queries of the node views in parallel, without sharing the database
+    connection of the session.
+    """
+    previous = getattr(_connection_scope, 'scope', None)
+    _connection_scope.scope = scope
+    try:
+        yield
+    finally:
+        _connection_scope.scope = previous
+
+
+def restore_connections(tasks):
+    """
+    Run the given reconnect tasks (of one or more server managers) at the
+    same time, on a bounded number of threads. The reconnects not completed
+    within the CONNECTION_RESTORE_TIMEOUT are left running in the background.
+
+    The first error (other than the timeout) is raised, once all the tasks
+    are done.
+
+    The reconnects left running in the background do not update the session
+    (see ServerManager.update_session), as it may have been saved by the
+    request already.
+    """
+    results = run_concurrently(
+        tasks, config.CONNECTION_RESTORE_MAX_WORKERS,
+        config.CONNECTION_RESTORE_TIMEOUT
+    )
+
+    # Wait for the timed out reconnects updating the session now, the later
+    # updates of the session by them are skipped.
+    with _session_lock:
+        pass
+
+    error = None
+    for status, res in results:
+        if status:
+            continue
+        if isinstance(res, TimeoutError):
+            current_app.logger.warning(
+                "Connection could not be restored within {0} seconds, it "
+                "will be completed in the background.".format(
+                    config.CONNECTION_RESTORE_TIMEOUT)
+            )
+        elif error is None:
+            error = res
+
+    if error is not None:
+        raise error
+
 
 class ServerManager(object):
     """
@@ -43,10 +115,19 @@ class ServerManager(object):
 
     def __init__(self, server):
         self.connections = dict()
+        # The connections of the manager are restored in parallel, but the
+        # SSH tunnel is to be created only once.
+        self._tunnel_lock = threading.Lock()
+        # Ids of the connections being reconnected, a reconnect timed out by
+        # one request keeps running, and must not be started again by the
+        # next requests.
+        self._reconnecting = set()
+        self._reconnect_lock = threading.Lock()
         self.local_bind_host = '127.0.0.1'
         self.local_bind_port = None
         self.tunnel_object = None
         self.tunnel_created = False
+        self._capabilities_lock = threading.Lock()
 
         self.update(server)
 
@@ -74,6 +155,11 @@ class ServerManager(object):
         self.ssl_mode = server.ssl_mode
         self.pinged = datetime.datetime.now()
         self.db_info = dict()
+        # Formatted type names by database name and type oid
+        self.type_names = dict()
+        # Results of the capability probes by (database id, probe name,
+        # arguments), as (expiry time, result)
+        self.capabilities = dict()
         self.server_types = None
         self.db_res = server.db_res
         self.passfile = server.passfile
@@ -150,9 +236,17 @@ class ServerManager(object):
             else:
                 res['tunnel_password'] = self.tunnel_password
 
+        # The server information found by the earlier connections, known
+        # before reconnecting on restore.
+        res['db_info'] = dict(
+            (did, dict(info)) for did, info in list(self.db_info.items())
+        )
+        if getattr(self, 'user_info', None) is not None:
+            res['user_info'] = dict(self.user_info)
+
         connections = res['connections'] = dict()
 
-        for conn_id in self.connections:
+        for conn_id in list(self.connections):
             conn = self.connections[conn_id].as_dict()
 
             if conn is not None:
@@ -233,6 +327,12 @@ WHERE db.oid = {0}""".format(did))
             else:
                 raise ConnectionLost(self.sid, None, None)
 
+        scope = getattr(_connection_scope, 'scope', None)
+        if conn_id is None and scope is not None:
+            conn_id = '{0}:{1}'.format(scope, database)
+            if async_ is None:
+                async_ = False
+
         my_id = ('CONN:{0}'.format(conn_id)) if conn_id is not None else \
             ('DB:{0}'.format(database))
 
@@ -282,57 +382,84 @@ WHERE db.oid = {0}""".format(did))
                     self.server_cls = st
                     break
 
-    def _check_and_reconnect_server(self, conn, conn_info, data):
+    def _reconnect(self, conn, was_connected, auto_reconnect,
+                   tunnel_password, **kwargs):
         """
-        Check and try to reconnect the server if server previously connected
-        and auto_reconnect is true.
-        :param conn:
-        :type conn:
-        :param conn_info:
-        :type conn_info:
-        :param data:
-        :type data:
-        :return:
-        :rtype:
+        Reconnect the connection, creating the SSH tunnel first (if
+        required). The connection is removed from the manager, if it could
+        not be reconnected.
+        :param conn: Connection to be reconnected
+        :param was_connected: connection status to be kept, if the crypt key
+            is missing
+        :param auto_reconnect: auto reconnect flag to be kept, if the crypt
+            key is missing
+        :param tunnel_password: SSH tunnel password
+        :param kwargs: arguments of the connect
         """
-        from pgadmin.browser.server_groups.servers.types import ServerType
-        if conn_info['wasConnected'] and conn_info['auto_reconnect']:
-            try:
-                # Check SSH Tunnel needs to be created
-                if self.use_ssh_tunnel == 1 and \
-                        not self.tunnel_created:
-                    status, error = self.create_ssh_tunnel(
-                        data['tunnel_password'])
+        try:
+            # Check SSH Tunnel needs to be created
+            if self.use_ssh_tunnel == 1:
+                with self._tunnel_lock:
+                    if not self.tunnel_created:
+                        status, error = self.create_ssh_tunnel(
+                            tunnel_password)
 
-                    # Check SSH Tunnel is alive or not.
-                    self.check_ssh_tunnel_alive()
+                        # Check SSH Tunnel is alive or not.
+                        self.check_ssh_tunnel_alive()
 
-                conn.connect(
-                    password=data['password'],
-                    server_types=ServerType.types()
-                )
-                # This will also update wasConnected flag in
-                # connection so no need to update the flag manually.
-            except CryptKeyMissing:
-                # maintain the status as this will help to restore once
-                # the key is available
-                conn.wasConnected = conn_info['wasConnected']
-                conn.auto_reconnect = conn_info['auto_reconnect']
-            except Exception as e:
-                current_app.logger.exception(e)
-                self.connections.pop(conn_info['conn_id'])
-                raise
+            conn.connect(**kwargs)
+            # This will also update wasConnected flag in
+            # connection so no need to update the flag manually.
+        except CryptKeyMissing:
+            # maintain the status as this will help to restore once
+            # the key is available
+            conn.wasConnected = was_connected
+            conn.auto_reconnect = auto_reconnect
+        except Exception as e:
+            current_app.logger.exception(e)
+            self.connections.pop(conn.conn_id, None)
+            raise
+        finally:
+            with self._reconnect_lock:
+                self._reconnecting.discard(conn.conn_id)
 
-    def _restore(self, data):
+    def _reconnect_task(self, conn, *args, **kwargs):
         """
-        Helps restoring to reconnect the auto-connect connections smoothly on
-        reload/restart of the app server..
+        Returns the task reconnecting the given connection, None if it is
+        already being reconnected (i.e. by a reconnect left running in the
+        background by an earlier request).
+        """
+        with self._reconnect_lock:
+            if conn.conn_id in self._reconnecting:
+                return None
+            self._reconnecting.add(conn.conn_id)
+
+        return partial(self._reconnect, conn, *args, **kwargs)
+
+    def _restore_tasks(self, data):
         """
-        # restore server version from flask session if flask server was
-        # restarted. As we need server version to resolve sql template paths.
+        Create the connections saved in the session (data), and returns the
+        tasks to reconnect the auto-connect connections. Used to reconnect
+        the connections smoothly on reload/restart of the app server.
+        """
+        from pgadmin.browser.server_groups.servers.types import ServerType
+
         masterpass_processed = process_masterpass_disabled()
 
         ServerManager._get_password_to_conn(data, masterpass_processed)
+
+        # restore server version, and the information of the databases from
+        # the flask session if flask server was restarted. As we need server
+        # version to resolve sql template paths.
+        if self.ver is None and data.get('ver'):
+            self.ver = data['ver']
+            self.sversion = data.get('sversion', None)
+        if not self.db_info and data.get('db_info'):
+            self.db_info = dict(data['db_info'])
+        if 'user_info' in data and \
+                getattr(self, 'user_info', None) is None:
+            self.user_info = data['user_info']
+
         # Get server type.
         self._get_server_type()
 
@@ -350,6 +477,7 @@ WHERE db.oid = {0}""".format(did))
             current_app.logger.exception(e)
 
         connections = data['connections']
+        tasks = []
 
         for conn_id in connections:
             conn_info = connections[conn_id]
@@ -365,39 +493,38 @@ WHERE db.oid = {0}""".format(did))
                 )
 
             # only try to reconnect
-            self._check_and_reconnect_server(conn, conn_info, data)
+            if conn_info['wasConnected'] and conn_info['auto_reconnect']:
+                tasks.append(self._reconnect_task(
+                    conn, conn_info['wasConnected'],
+                    conn_info['auto_reconnect'],
+                    data.get('tunnel_password', None),
+                    password=data['password'],
+                    server_types=ServerType.types()
+                ))
+
+        return [task for task in tasks if task is not None]
+
+    def _restore(self, data):
+        """
+        Helps restoring to reconnect the auto-connect connections smoothly on
+        reload/restart of the app server..
+        """
+        restore_connections(self._restore_tasks(data))
 
     def _restore_connections(self):
-        for conn_id in self.connections:
+        tasks = []
+        for conn_id in list(self.connections):
             conn = self.connections[conn_id]
             # only try to reconnect if connection was connected previously
             # and auto_reconnect is true.
-            wasConnected = conn.wasConnected
-            auto_reconnect = conn.auto_reconnect
-            if conn.wasConnected and conn.auto_reconnect:
-                try:
-                    # Check SSH Tunnel needs to be created
-                    if self.use_ssh_tunnel == 1 and \
-                       not self.tunnel_created:
-                        status, error = self.create_ssh_tunnel(
-                            self.tunnel_password
-                        )
+            if conn.wasConnected and conn.auto_reconnect and \
+                    (conn.conn is None or conn.conn.closed):
+                tasks.append(self._reconnect_task(
+                    conn, conn.wasConnected, conn.auto_reconnect,
+                    self.tunnel_password
+                ))
 
-                        # Check SSH Tunnel is alive or not.
-                        self.check_ssh_tunnel_alive()
-
-                    conn.connect()
-                    # This will also update wasConnected flag in
-                    # connection so no need to update the flag manually.
-                except CryptKeyMissing:
-                    # maintain the status as this will help to restore once
-                    # the key is available
-                    conn.wasConnected = wasConnected
-                    conn.auto_reconnect = auto_reconnect
-                except Exception as e:
-                    self.connections.pop(conn_id)
-                    current_app.logger.exception(e)
-                    raise
+        restore_connections([task for task in tasks if task is not None])
 
     def _stop_ssh_tunnel(self, did, database, conn_id):
         """
@@ -450,6 +577,7 @@ WHERE db.oid = {0}""".format(did))
                 del self.connections[my_id]
                 if did is not None:
                     del self.db_info[did]
+                    self.refresh_capabilities(did=did)
 
                 if len(self.connections) == 0:
                     self.ver = None
@@ -479,11 +607,120 @@ WHERE db.oid = {0}""".format(did))
         self.server_type = None
         self.server_cls = None
         self.password = None
+        self.type_names = dict()
+        self.refresh_capabilities()
 
         self.update_session()
 
         return True
 
+    def get_type_names(self, conn, oids):
+        """
+        Returns the formatted names of the given type oids (as a dictionary)
+        in the database of the given connection.
+
+        The names are cached per database, and only the oids missing from the
+        cache are fetched using the given connection.
+        """
+        type_names = self.type_names.setdefault(conn.db, dict())
+        missing_oids = tuple(set(
+            oid for oid in oids if oid not in type_names
+        ))
+
+        if missing_oids:
+            status, res = conn.execute_2darray(
+                "SELECT oid, format_type(oid, NULL) AS typname FROM pg_type "
+                "WHERE oid IN %s;", [missing_oids]
+            )
+
+            if not status:
+                return False, res
+
+            for row in res['rows']:
+                type_names[row['oid']] = row['typname']
+
+        return True, dict(
+            (oid, type_names[oid]) for oid in oids if oid in type_names
+        )
+
+    def cached_type_names(self, database):
+        """
+        Returns the cached formatted type names of the given database without
+        fetching the missing ones.
+        """
+        return self.type_names.get(database, dict())
+
+    def invalidate_type_names(self, did=None):
+        """
+        Remove the cached type names of the given database (or, all of them),
+        when a type has been created, altered or dropped.
+        """
+        if did is not None and did in self.db_info and \
+                'datname' in self.db_info[did]:
+            self.type_names.pop(self.db_info[did]['datname'], None)
+        else:
+            self.type_names = dict()
+
+    def probe(self, name, *args, **kwargs):
+        """
+        Returns (status, result) of the capability probe registered with the
+        given name (see pgadmin.utils.driver.probes), called with the given
+        arguments against the database did (the maintenance database, if not
+        given).
+
+        The successful results are cached per database, probe, and arguments
+        for the TTL of the probe, until refreshed (see refresh_capabilities).
+
+        :param name: name of the probe
+        :param args: arguments of the probe (i.e. the table id)
+        :param did: database id
+        """
+        did = kwargs.get('did', None)
+        probe = get_probe(name)
+        key = (did, name) + args
+        now = time.time()
+
+        with self._capabilities_lock:
+            cached = self.capabilities.get(key, None)
+        if cached is not None and cached[0] > now:
+            return True, cached[1]
+
+        status, res = probe.func(self, self.connection(did=did), *args)
+
+        ttl = config.CAPABILITY_CACHE_TTL if probe.ttl is None else probe.ttl
+        if status and ttl > 0:
+            with self._capabilities_lock:
+                # Drop the expired results, i.e. of the dropped tables
+                for k in [k for k, v in self.capabilities.items()
+                          if v[0] <= now]:
+                    del self.capabilities[k]
+                self.capabilities[key] = (now + ttl, res)
+
+        return status, res
+
+    def refresh_capabilities(self, name=None, did=None):
+        """
+        Remove the cached results of the capability probes, i.e. when an
+        extension has been installed, of the given probe and/or database (or,
+        all of them), so that those are probed again.
+
+        The results probed against the maintenance database (without the
+        database id) are removed along with the results of its database id.
+        """
+        dids = [did]
+        if did is not None and did == self.did:
+            dids.append(None)
+
+        with self._capabilities_lock:
+            if name is None and did is None:
+                self.capabilities = dict()
+                return
+
+            for key in list(self.capabilities.keys()):
+                if (name is None or key[1] == name) and \
+                        (did is None or key[0] in dids):
+                    del self.capabilities[key]
+
     def _update_password(self, passwd):
         self.password = passwd
         for conn_id in self.connections:
@@ -492,17 +729,24 @@ WHERE db.oid = {0}""".format(did))
                 conn.password = passwd
 
     def update_session(self):
-        managers = session['__pgsql_server_managers'] \
-            if '__pgsql_server_managers' in session else dict()
         updated_mgr = self.as_dict()
 
-        if not updated_mgr:
-            if self.sid in managers:
-                managers.pop(self.sid)
-        else:
-            managers[self.sid] = updated_mgr
-        session['__pgsql_server_managers'] = managers
-        session.force_write = True
+        with _session_lock:
+            # The reconnect of the manager has been timed out, and left
+            # running in the background (see restore_connections).
+            if cancelled():
+                return
+
+            managers = session['__pgsql_server_managers'] \
+                if '__pgsql_server_managers' in session else dict()
+
+            if not updated_mgr:
+                if self.sid in managers:
+                    managers.pop(self.sid)
+            else:
+                managers[self.sid] = updated_mgr
+            session['__pgsql_server_managers'] = managers
+            session.force_write = True
 
     def utility(self, operation):
         """
@@ -13,6 +13,8 @@ module within the system.
 """
 
 import decimal
+import threading
+import time
 import simplejson as json
 
 import dateutil.parser as dateutil_parser
@@ -20,11 +22,85 @@ from flask import current_app
 from flask_babelex import gettext
 from flask_security import current_user
 
+import config
 from pgadmin.model import db, Preferences as PrefTable, \
     ModulePreference as ModulePrefTable, UserPreference as UserPrefTable, \
     PreferenceCategory as PrefCategoryTbl
 
 
+class _UserPreferences(object):
+    """
+    In-process snapshot of the values of the preferences of each user, shared
+    by all the threads.
+
+    All the values of a user are loaded in one query, and reused for
+    PREFERENCES_CACHE_TTL seconds (unless a value of the user is changed),
+    hence the preferences read while expanding the tree, or running a query do
+    not query the configuration database every time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # uid -> (time loaded, {pid: value})
+        self._users = dict()
+        # Incremented on every invalidation, a snapshot loaded meanwhile is
+        # not kept (it may be missing the change).
+        self._generation = 0
+
+    def _load(self, uid):
+        return dict(
+            db.session.query(UserPrefTable.pid, UserPrefTable.value)
+            .filter_by(uid=uid).all()
+        )
+
+    def values(self, uid):
+        """
+        Returns the values of the preferences of the user (by the preference
+        id), the preferences not set by the user are not included.
+        """
+        ttl = getattr(config, 'PREFERENCES_CACHE_TTL', 0)
+
+        with self._lock:
+            snapshot = self._users.get(uid, None)
+            generation = self._generation
+
+        if snapshot is not None and time.time() - snapshot[0] < ttl:
+            return snapshot[1]
+
+        loaded = time.time()
+        values = self._load(uid)
+
+        if ttl > 0:
+            with self._lock:
+                if generation == self._generation:
+                    self._users[uid] = (loaded, values)
+
+        return values
+
+    def invalidate(self, uid=None):
+        """
+        Discard the snapshot of the user (all the users, if not given).
+        """
+        with self._lock:
+            self._generation += 1
+            if uid is None:
+                self._users.clear()
+            else:
+                self._users.pop(uid, None)
+
+
+_user_preferences = _UserPreferences()
+
+
+def invalidate_user_preferences(uid=None):
+    """
+    Discard the cached values of the preferences of the user (all the users,
+    if not given), must be called when those are changed in the configuration
+    database (other than by the Preferences).
+    """
+    _user_preferences.invalidate(uid)
+
+
 class _Preference(object):
     """
     Internal class representing module, and categoy bound preference.
@@ -101,33 +177,33 @@ class _Preference(object):
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        value = _user_preferences.values(current_user.id).get(
+            self.pid, None
+        )
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
         if self._type in ('boolean', 'switch', 'node'):
-            return res.value == 'True'
+            return value == 'True'
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return res.value
+                if 'value' in opt and opt['value'] == value:
+                    return value
             if self.select2 and self.select2['tags']:
-                return res.value
+                return value
             return self.default
         if self._type == 'select2':
-            if res.value:
-                res.value = res.value.replace('[', '')
-                res.value = res.value.replace(']', '')
-                res.value = res.value.replace('\'', '')
-                return [val.strip() for val in res.value.split(',')]
+            if value:
+                value = value.replace('[', '')
+                value = value.replace(']', '')
+                value = value.replace('\'', '')
+                return [val.strip() for val in value.split(',')]
             return None
-        if self._type == 'text' and res.value == '' and not self.allow_blanks:
+        if self._type == 'text' and value == '' and not self.allow_blanks:
             return self.default
 
         parser_map = {
@@ -138,11 +214,10 @@ class _Preference(object):
             'keyboardshortcut': json.loads
         }
         try:
-            return parser_map.get(self._type, lambda v: v)(res.value)
+            return parser_map.get(self._type, lambda v: v)(value)
         except Exception as e:
             current_app.logger.exception(e)
             return self.default
-        return res.value
 
     def set(self, value):
         """
@@ -207,6 +282,7 @@ class _Preference(object):
         else:
             pref.value = value
         db.session.commit()
+        _user_preferences.invalidate(current_user.id)
 
         return True, None
 
@@ -533,14 +609,7 @@ class Preferences(object):
         if pref is None:
             return None
 
-        user_pref = UserPrefTable.query.filter_by(
-            pid=pref.id
-        ).filter_by(uid=_user_id).first()
-
-        if user_pref is not None:
-            return user_pref.value
-
-        return None
+        return _user_preferences.values(_user_id).get(pref.id, None)
 
     @classmethod
     def module(cls, name, create=True):
@@ -13,6 +13,18 @@ Implements the server-side session management.
 Credit/Reference: http://flask.pocoo.org/snippets/109/
 
 Modified to support both Python 2.6+ & Python 3.x
+
+The sessions are stored by one of the session managers (see SESSION_STORE in
+config.py):
+  - 'file': one pickled file per session in SESSION_DB_PATH
+  - 'sqlite': a single SQLite database (WAL mode) in SESSION_SQLITE_PATH
+  - 'memory': the memory of the pgAdmin process
+
+The SQLite and memory stores keep each key of the session separately, and
+only write the keys whose (pickled) values have changed since the session
+was read or last written. The query tool transactions ('gridData') are
+stored one entry per transaction, hence only the transactions changed are
+written.
 """
 
 import base64
@@ -21,15 +33,16 @@ import hmac
 import hashlib
 import os
 import random
+import sqlite3
 import string
 import time
 import config
 from uuid import uuid4
-from threading import Lock
+from threading import Lock, local
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
 
-from pickle import dump, load
+from pickle import dump, dumps, load, loads
 from collections import OrderedDict
 
 from flask.sessions import SessionInterface, SessionMixin
@@ -46,9 +59,23 @@ def _calc_hmac(body, secret):
     ).decode()
 
 
-sess_lock = Lock()
 LAST_CHECK_SESSION_FILES = None
 
+# Number of the locks shared by the sessions (by their ids)
+SESSION_LOCK_STRIPES = 64
+
+
+class SessionLocks(object):
+    """
+    Striped locks, the operations on a session are serialised using the lock
+    chosen by its id, so that the other sessions are not blocked.
+    """
+    def __init__(self, stripes=SESSION_LOCK_STRIPES):
+        self._locks = [Lock() for _ in range(stripes)]
+
+    def __call__(self, sid):
+        return self._locks[hash(sid) % len(self._locks)]
+
 
 class ManagedSession(CallbackDict, SessionMixin):
     def __init__(self, initial=None, sid=None, new=False, randval=None,
@@ -56,6 +83,10 @@ class ManagedSession(CallbackDict, SessionMixin):
         def on_update(self):
             self.modified = True
 
+        # Keys set or removed since the session was read or last written by
+        # the store (the entries of the nested keys must be set again, when
+        # changed in place)
+        self.dirty_keys = set()
         CallbackDict.__init__(self, initial, on_update)
         self.sid = sid
         self.new = new
@@ -65,6 +96,41 @@ class ManagedSession(CallbackDict, SessionMixin):
         self.force_write = False
         self.hmac_digest = hmac_digest
         self.permanent = True
+        # Digests of the values of the keys, as last read/written by the
+        # store (used by the stores writing only the changed keys)
+        self.stored_digests = {}
+        # Entries of the nested keys, as last read/written by the store
+        self.stored_entries = {}
+
+    def __setitem__(self, key, value):
+        self.dirty_keys.add(key)
+        CallbackDict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.dirty_keys.add(key)
+        CallbackDict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        self.dirty_keys.add(key)
+        return CallbackDict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        self.dirty_keys.add(key)
+        return CallbackDict.pop(self, key, *args)
+
+    def popitem(self):
+        item = CallbackDict.popitem(self)
+        self.dirty_keys.add(item[0])
+        return item
+
+    def update(self, *args, **kwargs):
+        values = dict(*args, **kwargs)
+        self.dirty_keys.update(values)
+        CallbackDict.update(self, values)
+
+    def clear(self):
+        self.dirty_keys.update(self)
+        CallbackDict.clear(self)
 
     def sign(self, secret):
         if not self.hmac_digest:
@@ -96,6 +162,10 @@ class SessionManager(object):
         'Store a managed session'
         raise NotImplementedError
 
+    def cleanup(self, expiry):
+        'Remove the sessions not written for the given time (timedelta)'
+        pass
+
 
 class CachingSessionManager(SessionManager):
     def __init__(self, parent, num_to_store, skip_paths=None):
@@ -103,11 +173,15 @@ class CachingSessionManager(SessionManager):
         self.num_to_store = num_to_store
         self._cache = OrderedDict()
         self.skip_paths = [] if skip_paths is None else skip_paths
+        # The cache lock is only held while updating the cache, the reads and
+        # writes of the parent are serialised per session.
+        self._cache_lock = Lock()
+        self._session_locks = SessionLocks()
 
     def _normalize(self):
         if len(self._cache) > self.num_to_store:
             # Flush 20% of the cache
-            with sess_lock:
+            with self._cache_lock:
                 while len(self._cache) > (self.num_to_store * 0.8):
                     self._cache.popitem(False)
 
@@ -119,35 +193,32 @@ class CachingSessionManager(SessionManager):
             if request.path.startswith(sp):
                 return session
 
-        with sess_lock:
+        with self._cache_lock:
             self._cache[session.sid] = session
         self._normalize()
 
         return session
 
     def remove(self, sid):
-        with sess_lock:
+        with self._session_locks(sid):
             self.parent.remove(sid)
-            if sid in self._cache:
-                del self._cache[sid]
+            with self._cache_lock:
+                self._cache.pop(sid, None)
 
     def exists(self, sid):
-        with sess_lock:
+        with self._cache_lock:
             if sid in self._cache:
                 return True
-            return self.parent.exists(sid)
+        return self.parent.exists(sid)
 
     def get(self, sid, digest):
-        session = None
-        with sess_lock:
-            if sid in self._cache:
-                session = self._cache[sid]
+        with self._session_locks(sid):
+            with self._cache_lock:
+                # reset order in Dict
+                session = self._cache.pop(sid, None)
                 if session and session.hmac_digest != digest:
                     session = None
 
-                # reset order in Dict
-                del self._cache[sid]
-
             if not session:
                 session = self.parent.get(sid, digest)
 
@@ -156,13 +227,14 @@ class CachingSessionManager(SessionManager):
                 if request.path.startswith(sp):
                     return session
 
-            self._cache[sid] = session
+            with self._cache_lock:
+                self._cache[sid] = session
         self._normalize()
 
         return session
 
     def put(self, session):
-        with sess_lock:
+        with self._session_locks(session.sid):
             self.parent.put(session)
 
             # Do not store the session if skip paths
@@ -170,15 +242,14 @@ class CachingSessionManager(SessionManager):
                 if request.path.startswith(sp):
                     return
 
-            if session.sid in self._cache:
-                try:
-                    del self._cache[session.sid]
-                except Exception:
-                    pass
-
-            self._cache[session.sid] = session
+            with self._cache_lock:
+                self._cache.pop(session.sid, None)
+                self._cache[session.sid] = session
         self._normalize()
 
+    def cleanup(self, expiry):
+        self.parent.cleanup(expiry)
+
 
 class FileBackedSessionManager(SessionManager):
 
@@ -272,6 +343,337 @@ class FileBackedSessionManager(SessionManager):
                 f
             )
 
+    def cleanup(self, expiry):
+        """
+        Iterate through the session directory and delete the files not
+        modified for the expiry time.
+        """
+        for root, dirs, files in os.walk(self.path):
+            for file_name in files:
+                absolute_file_name = os.path.join(root, file_name)
+                st = os.stat(absolute_file_name)
+
+                # Get the last modified time of the session file
+                last_modified_time = \
+                    datetime.datetime.fromtimestamp(st.st_mtime)
+
+                # Calculate session file expiry time.
+                file_expiration_time = last_modified_time + expiry
+
+                if file_expiration_time <= datetime.datetime.now() and \
+                        os.path.exists(absolute_file_name):
+                    os.unlink(absolute_file_name)
+
+
+class KeyValueSessionManager(SessionManager):
+    """
+    Base class of the session managers storing each key of the session
+    separately. Only the keys having changed (pickled) values since the
+    session was last stored are written (including the values changed in
+    place), and the keys removed from the session are deleted.
+
+    The dictionaries of the NESTED_KEYS are stored one entry per key
+    ('<key>\x1f<entry key>'). Those are checked, only when set since the
+    session was last stored, and only their entries replaced by another
+    object are pickled, and written when changed.
+
+    The subclasses implement the storage using:
+      - _load(sid): returns (randval, hmac_digest, {key: pickled value}),
+        or None
+      - _store(sid, randval, hmac_digest, last_write, changed, removed)
+      - exists(sid), remove(sid), and cleanup(expiry)
+    """
+
+    NESTED_KEYS = ('gridData', 'gridFetchedRows')
+    NESTED_SEPARATOR = '\x1f'
+
+    def __init__(self, secret, disk_write_delay, skip_paths=None):
+        self.secret = secret
+        self.disk_write_delay = disk_write_delay
+        self.skip_paths = [] if skip_paths is None else skip_paths
+
+    def _load(self, sid):
+        raise NotImplementedError
+
+    def _store(self, sid, randval, hmac_digest, last_write, changed,
+               removed):
+        raise NotImplementedError
+
+    @staticmethod
+    def _digest(data):
+        return hashlib.sha1(data).digest()
+
+    def new_session(self):
+        return ManagedSession(sid=str(uuid4()))
+
+    def get(self, sid, digest):
+        'Retrieve a managed session by session-id, checking the HMAC digest'
+        stored = None
+        try:
+            stored = self._load(sid)
+        except Exception:
+            pass
+
+        if not stored:
+            return self.new_session()
+
+        randval, hmac_digest, values = stored
+
+        if not values or hmac_digest != digest:
+            return self.new_session()
+
+        data = dict()
+        stored_digests = dict()
+        stored_entries = dict()
+        for store_key, value in values.items():
+            try:
+                loaded = loads(value)
+            except Exception:
+                # The key is rewritten, or removed on next write
+                continue
+
+            stored_digests[store_key] = self._digest(value)
+            key, sep, entry = store_key.partition(self.NESTED_SEPARATOR)
+            if sep:
+                data.setdefault(key, dict())[entry] = loaded
+                stored_entries.setdefault(key, dict())[entry] = loaded
+            else:
+                data.setdefault(key, loaded)
+
+        session = ManagedSession(
+            data, sid=sid, randval=randval, hmac_digest=hmac_digest
+        )
+        session.stored_digests = stored_digests
+        session.stored_entries = stored_entries
+
+        return session
+
+    def put(self, session):
+        """Store the changed keys of a managed session"""
+        current_time = time.time()
+        if not session.hmac_digest:
+            session.sign(self.secret)
+        elif not session.force_write and session.last_write is not None and \
+            (current_time - float(session.last_write)) < \
+                self.disk_write_delay:
+            return
+
+        session.last_write = current_time
+        session.force_write = False
+
+        # Do not store the session if skip paths
+        for sp in self.skip_paths:
+            if request.path.startswith(sp):
+                return
+
+        # The session may be updated by the other requests of the user, the
+        # keys set after this point are written next time.
+        dirty_keys = set(session.dirty_keys)
+        session.dirty_keys.difference_update(dirty_keys)
+
+        # The values may have been changed in place (i.e. the dictionaries of
+        # the debugger sessions), hence all of them (other than the nested
+        # keys) are compared with their stored digests.
+        dirty_keys.update(
+            key for key in list(session.keys())
+            if key not in self.NESTED_KEYS
+        )
+
+        changed = dict()
+        removed = set()
+        digests = dict(session.stored_digests)
+        entries = dict(session.stored_entries)
+        for key in dirty_keys:
+            prefix = key + self.NESTED_SEPARATOR
+            old_keys = set(
+                store_key for store_key in session.stored_digests
+                if store_key == key or store_key.startswith(prefix)
+            )
+            entries.pop(key, None)
+
+            if key not in session:
+                removed.update(old_keys)
+                continue
+
+            value = session.get(key)
+            if key in self.NESTED_KEYS and isinstance(value, dict):
+                stored = session.stored_entries.get(key, dict())
+                new_values = dict(
+                    (prefix + str(entry), entry_value)
+                    for entry, entry_value in list(value.items())
+                    if stored.get(entry) is not entry_value
+                )
+                new_keys = set(prefix + str(entry) for entry in value)
+                entries[key] = dict(value)
+            else:
+                new_values = {key: value}
+                new_keys = set(new_values)
+
+            for store_key, store_value in new_values.items():
+                data = dumps(store_value, -1)
+                digest = self._digest(data)
+                if session.stored_digests.get(store_key) != digest:
+                    changed[store_key] = data
+                    digests[store_key] = digest
+
+            removed.update(old_keys - new_keys)
+
+        for store_key in removed:
+            digests.pop(store_key, None)
+
+        self._store(
+            session.sid, session.randval, session.hmac_digest, current_time,
+            changed, sorted(removed)
+        )
+        session.stored_digests = digests
+        session.stored_entries = entries
+
+
+class SQLiteSessionManager(KeyValueSessionManager):
+    """
+    Stores the sessions in a single SQLite database (in WAL mode, hence the
+    readers are not blocked by the writers), one row per key of the session.
+    """
+
+    def __init__(self, path, secret, disk_write_delay, skip_paths=None):
+        super(SQLiteSessionManager, self).__init__(
+            secret, disk_write_delay, skip_paths
+        )
+        self.path = path
+        self._local = local()
+
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        with self._connection() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS session ('
+                'sid TEXT PRIMARY KEY, randval TEXT, hmac_digest TEXT, '
+                'last_write REAL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS session_data ('
+                'sid TEXT, key TEXT, value BLOB, PRIMARY KEY (sid, key))'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS session_last_write '
+                'ON session (last_write)'
+            )
+
+    def _connection(self):
+        # SQLite connections can not be shared by the threads.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def exists(self, sid):
+        return self._connection().execute(
+            'SELECT 1 FROM session WHERE sid = ?', (sid,)
+        ).fetchone() is not None
+
+    def remove(self, sid):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM session_data WHERE sid = ?', (sid,))
+            conn.execute('DELETE FROM session WHERE sid = ?', (sid,))
+
+    def _load(self, sid):
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT randval, hmac_digest FROM session WHERE sid = ?', (sid,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        values = dict(conn.execute(
+            'SELECT key, value FROM session_data WHERE sid = ?', (sid,)
+        ).fetchall())
+
+        return row[0], row[1], values
+
+    def _store(self, sid, randval, hmac_digest, last_write, changed,
+               removed):
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO session '
+                '(sid, randval, hmac_digest, last_write) VALUES (?, ?, ?, ?)',
+                (sid, randval, hmac_digest, last_write)
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO session_data (sid, key, value) '
+                'VALUES (?, ?, ?)',
+                [(sid, key, sqlite3.Binary(value))
+                 for key, value in changed.items()]
+            )
+            conn.executemany(
+                'DELETE FROM session_data WHERE sid = ? AND key = ?',
+                [(sid, key) for key in removed]
+            )
+
+    def cleanup(self, expiry):
+        last_write = time.time() - expiry.total_seconds()
+        with self._connection() as conn:
+            conn.execute(
+                'DELETE FROM session_data WHERE sid IN ('
+                'SELECT sid FROM session WHERE last_write <= ?)',
+                (last_write,)
+            )
+            conn.execute(
+                'DELETE FROM session WHERE last_write <= ?', (last_write,)
+            )
+
+
+class MemorySessionManager(KeyValueSessionManager):
+    """
+    Stores the (pickled) keys of the sessions in the memory of the process,
+    hence the sessions are lost on restart, and are not shared by multiple
+    processes serving pgAdmin.
+    """
+
+    def __init__(self, secret, disk_write_delay, skip_paths=None):
+        super(MemorySessionManager, self).__init__(
+            secret, disk_write_delay, skip_paths
+        )
+        self._sessions = dict()
+        self._lock = Lock()
+
+    def exists(self, sid):
+        return sid in self._sessions
+
+    def remove(self, sid):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def _load(self, sid):
+        with self._lock:
+            stored = self._sessions.get(sid, None)
+            if stored is None:
+                return None
+            return stored['randval'], stored['hmac_digest'], \
+                dict(stored['values'])
+
+    def _store(self, sid, randval, hmac_digest, last_write, changed,
+               removed):
+        with self._lock:
+            stored = self._sessions.setdefault(sid, {'values': dict()})
+            stored['randval'] = randval
+            stored['hmac_digest'] = hmac_digest
+            stored['last_write'] = last_write
+            stored['values'].update(changed)
+            for key in removed:
+                stored['values'].pop(key, None)
+
+    def cleanup(self, expiry):
+        last_write = time.time() - expiry.total_seconds()
+        with self._lock:
+            for sid, stored in list(self._sessions.items()):
+                if stored['last_write'] <= last_write:
+                    del self._sessions[sid]
+
 
 class ManagedSessionInterface(SessionInterface):
     def __init__(self, manager):
@@ -319,15 +721,43 @@ class ManagedSessionInterface(SessionInterface):
         )
 
 
+def create_session_manager(app, skip_paths=[]):
+    """
+    Create the session manager of the store configured by SESSION_STORE.
+    """
+    store = app.config.get('SESSION_STORE', 'file')
+    disk_write_delay = app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10)
+
+    if store == 'sqlite':
+        return SQLiteSessionManager(
+            app.config['SESSION_SQLITE_PATH'],
+            app.config['SECRET_KEY'],
+            disk_write_delay,
+            skip_paths
+        )
+
+    if store == 'memory':
+        return MemorySessionManager(
+            app.config['SECRET_KEY'],
+            disk_write_delay,
+            skip_paths
+        )
+
+    if store != 'file':
+        raise ValueError('Invalid SESSION_STORE: {0}'.format(store))
+
+    return FileBackedSessionManager(
+        app.config['SESSION_DB_PATH'],
+        app.config['SECRET_KEY'],
+        disk_write_delay,
+        skip_paths
+    )
+
+
 def create_session_interface(app, skip_paths=[]):
     return ManagedSessionInterface(
         CachingSessionManager(
-            FileBackedSessionManager(
-                app.config['SESSION_DB_PATH'],
-                app.config['SECRET_KEY'],
-                app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
-                skip_paths
-            ),
+            create_session_manager(app, skip_paths),
             1000,
             skip_paths
         ))
@@ -367,9 +797,9 @@ def pga_unauthorised():
 
 def cleanup_session_files():
     """
-    This function will iterate through session directory and check the last
-    modified time, if it older than (session expiration time + 1) days then
-    delete that file.
+    This function will remove the sessions (i.e. the session files) not
+    written for more than (session expiration time + 1) days, from the
+    configured session store.
     """
     iterate_session_files = False
 
@@ -380,23 +810,10 @@ def cleanup_session_files():
         iterate_session_files = True
         LAST_CHECK_SESSION_FILES = datetime.datetime.now()
 
-    if iterate_session_files:
-        for root, dirs, files in os.walk(
-                current_app.config['SESSION_DB_PATH']):
-            for file_name in files:
-                absolute_file_name = os.path.join(root, file_name)
-                st = os.stat(absolute_file_name)
+    manager = getattr(current_app.session_interface, 'manager', None)
 
-                # Get the last modified time of the session file
-                last_modified_time = \
-                    datetime.datetime.fromtimestamp(st.st_mtime)
-
-                # Calculate session file expiry time.
-                file_expiration_time = \
-                    last_modified_time + \
-                    current_app.permanent_session_lifetime + \
-                    datetime.timedelta(days=1)
-
-                if file_expiration_time <= datetime.datetime.now() and \
-                        os.path.exists(absolute_file_name):
-                    os.unlink(absolute_file_name)
+    if iterate_session_files and manager is not None:
+        manager.cleanup(
+            current_app.permanent_session_lifetime +
+            datetime.timedelta(days=1)
+        )
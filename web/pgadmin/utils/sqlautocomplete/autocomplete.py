@@ -22,6 +22,8 @@ from .parseutils.meta import FunctionMetadata, ColumnMetadata, ForeignKey
 from .parseutils.utils import last_word
 from .parseutils.tables import TableReference
 from .prioritization import PrevalenceCounter
+from .metadata_cache import metadata_cache
+from .candidate_index import CandidateIndex, candidate_indexes
 from flask import render_template
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
@@ -128,7 +130,7 @@ class SQLAutoComplete(object):
             if keywords_in_uppercase:
                 query = render_template(
                     "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
-            status, res = self.conn.execute_dict(query)
+            status, res = metadata_cache.execute_dict(self.conn, query)
             if status:
                 for record in res['rows']:
                     # 'public' is a keyword in EPAS database server. Don't add
@@ -165,14 +167,15 @@ class SQLAutoComplete(object):
     def _set_search_path(self):
         query = render_template(
             "/".join([self.sql_path, 'schema.sql']), search_path=True)
-        status, res = self.conn.execute_dict(query)
+        status, res = metadata_cache.execute_dict(
+            self.conn, query, per_connection=True)
         if status:
             for record in res['rows']:
                 self.search_path.append(record['schema'])
 
     def _fetch_schema_name(self, schema_names):
         query = render_template("/".join([self.sql_path, 'schema.sql']))
-        status, res = self.conn.execute_dict(query)
+        status, res = metadata_cache.execute_dict(self.conn, query)
         if status:
             for record in res['rows']:
                 schema_names.append(record['schema'])
@@ -367,18 +370,21 @@ class SQLAutoComplete(object):
             {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
         self.all_completions = set(self.keywords + self.functions)
 
-    def find_matches(self, text, collection, mode="strict", meta=None):
+    def find_matches(self, text, collection, mode="strict", meta=None,
+                     make_candidate=None):
         """Find completion matches for the given text.
 
         Given the user's input text and a collection of available
         completions, find completions matching the last word of the
         text.
 
-        `collection` can be either a list of strings or a list of Candidate
-        namedtuples.
+        `collection` can be either a list of strings, a list of Candidate
+        namedtuples, or a CandidateIndex.
         `mode` can be either 'fuzzy', or 'strict'
             'fuzzy': fuzzy matching, ties broken by name prevalance
             `keyword`: start only matching, ties broken by keyword prevalance
+        `make_candidate` is called with the key of every matching entry of
+        the CandidateIndex to build its string or Candidate namedtuple.
 
         yields prompt_toolkit Completion instances for any matches found
         in the collection of available completions.
@@ -388,9 +394,12 @@ class SQLAutoComplete(object):
             collection:
             mode:
             meta:
+            make_candidate:
         """
         if not collection:
             return []
+        if not isinstance(collection, CandidateIndex):
+            collection = CandidateIndex.from_collection(collection)
         prio_order = [
             "keyword",
             "function",
@@ -424,53 +433,26 @@ class SQLAutoComplete(object):
             fuzzy = False
             priority_func = self.prioritizer.keyword_count
 
-        # Construct a `_match` function for either fuzzy or non-fuzzy matching
-        # The match function returns a 2-tuple used for sorting the matches,
-        # or None if the item doesn't match
+        # The index returns a 2-tuple used for sorting the matches.
+        # For the fuzzy matches, it is the negative length and the start of
+        # the matched group, or infinity for the exact match of the first
+        # word in the suggestion (to get exact alias matches to the top).
+        # Negative infinity is used to force the start only matches to sort
+        # after all fuzzy matches.
         # Note: higher priority values mean more important, so use negative
         # signs to flip the direction of the tuple
-        if fuzzy:
-            regex = ".*?".join(map(re.escape, text))
-            pat = re.compile("(%s)" % regex)
-
-            def _match(item):
-                if item.lower()[: len(text) + 1] in (text, text + " "):
-                    # Exact match of first word in suggestion
-                    # This is to get exact alias matches to the top
-                    # E.g. for input `e`, 'Entries E' should be on top
-                    # (before e.g. `EndUsers EU`)
-                    return float("Infinity"), -1
-                r = pat.search(self.unescape_name(item.lower()))
-                if r:
-                    return -len(r.group()), -r.start()
-
-        else:
-            match_end_limit = len(text)
-
-            def _match(item):
-                # Text starts with double quote; Remove quoting and
-                # match on everything that follows the double-quote.
-                item = self.unescape_name(item.lower())
-                match_point = item.find(text, 0, match_end_limit)
-                if match_point >= 0:
-                    # Use negative infinity to force keywords to sort after all
-                    # fuzzy matches
-                    return -float("Infinity"), -match_point
-
         matches = []
-        for cand in collection:
+        for cand, sort_key in collection.matches(text, fuzzy):
+            if make_candidate is not None:
+                cand = make_candidate(cand)
+
             if isinstance(cand, _Candidate):
                 item, prio, display_meta, synonyms, prio2, display = cand
                 if display_meta is None:
                     display_meta = meta
-                syn_matches = (_match(x) for x in synonyms)
-                # Nones need to be removed to avoid max() crashing in Python 3
-                syn_matches = [m for m in syn_matches if m]
-                sort_key = max(syn_matches) if syn_matches else None
             else:
                 item, display_meta, prio, prio2, display = \
                     cand, meta, 0, 0, cand
-                sort_key = _match(cand)
 
             if sort_key:
                 if display_meta and len(display_meta) > 50:
@@ -627,8 +609,17 @@ class SQLAutoComplete(object):
                 )
             ]
 
-        return self.find_matches(word_before_cursor, flat_cols(),
-                                 meta="column")
+        # Index the columns on their names (and aliases), and build the
+        # candidates for the matching columns only.
+        columns = candidate_indexes.get(
+            "columns",
+            [(t.ref, c.name) for t, cols in scoped_cols.items() for c in cols],
+            lambda col: (col[1], generate_alias(col[1]))
+        )
+        return self.find_matches(
+            word_before_cursor, columns, meta="column",
+            make_candidate=lambda col: make_cand(col[1], col[0])
+        )
 
     def alias(self, tbl, tbls):
         """Generate a unique table alias
@@ -781,12 +772,24 @@ class SQLAutoComplete(object):
         # Function overloading means we way have multiple functions of the same
         # name at this point, so keep unique names only
         all_functions = self.populate_functions(suggestion.schema, filt)
-        funcs = set(
-            self._make_cand(f, alias, suggestion, arg_mode)
-            for f in all_functions
+        funcs = candidate_indexes.get(
+            "functions", all_functions,
+            lambda f: (f.name, generate_alias(f.name))
         )
 
-        matches = self.find_matches(word_before_cursor, funcs, meta="function")
+        # The overloaded functions may result in the same candidate, hence -
+        # keep the unique ones only.
+        matches = []
+        seen = set()
+        for match in self.find_matches(
+            word_before_cursor, funcs, meta="function",
+            make_candidate=lambda f: self._make_cand(
+                f, alias, suggestion, arg_mode)
+        ):
+            key = (match.completion.text, match.completion.display)
+            if key not in seen:
+                seen.add(key)
+                matches.append(match)
 
         return matches
 
@@ -801,6 +804,9 @@ class SQLAutoComplete(object):
         if suggestion.quoted:
             schema_names = [self.escape_schema(s) for s in schema_names]
 
+        schema_names = candidate_indexes.get(
+            "schemas", schema_names, lambda s: (s,)
+        )
         return self.find_matches(word_before_cursor, schema_names,
                                  meta="schema")
 
@@ -900,8 +906,13 @@ class SQLAutoComplete(object):
         if not suggestion.schema and \
                 (not word_before_cursor.startswith("pg_")):
             tables = [t for t in tables if not t.name.startswith("pg_")]
-        tables = [self._make_cand(t, alias, suggestion) for t in tables]
-        return self.find_matches(word_before_cursor, tables, meta="table")
+        tables = candidate_indexes.get(
+            "tables", tables, lambda tbl: (tbl.name, generate_alias(tbl.name))
+        )
+        return self.find_matches(
+            word_before_cursor, tables, meta="table",
+            make_candidate=lambda tbl: self._make_cand(tbl, alias, suggestion)
+        )
 
     def get_view_matches(self, suggestion, word_before_cursor, alias=False):
         views = self.populate_schema_objects(suggestion.schema, "views")
@@ -909,8 +920,13 @@ class SQLAutoComplete(object):
         if not suggestion.schema and (
                 not word_before_cursor.startswith("pg_")):
             views = [v for v in views if not v.name.startswith("pg_")]
-        views = [self._make_cand(v, alias, suggestion) for v in views]
-        return self.find_matches(word_before_cursor, views, meta="view")
+        views = candidate_indexes.get(
+            "views", views, lambda v: (v.name, generate_alias(v.name))
+        )
+        return self.find_matches(
+            word_before_cursor, views, meta="view",
+            make_candidate=lambda v: self._make_cand(v, alias, suggestion)
+        )
 
     def get_alias_matches(self, suggestion, word_before_cursor):
         aliases = suggestion.aliases
@@ -918,18 +934,29 @@ class SQLAutoComplete(object):
                                  meta="table alias")
 
     def get_database_matches(self, _, word_before_cursor):
-        return self.find_matches(word_before_cursor, self.databases,
+        databases = candidate_indexes.get(
+            "databases", self.databases, lambda d: (d,)
+        )
+        return self.find_matches(word_before_cursor, databases,
                                  meta="database")
 
     def get_keyword_matches(self, suggestion, word_before_cursor):
-        return self.find_matches(word_before_cursor, self.keywords,
+        keywords = candidate_indexes.get(
+            "keywords", self.keywords, lambda k: (k,)
+        )
+        return self.find_matches(word_before_cursor, keywords,
                                  meta="keyword")
 
     def get_datatype_matches(self, suggestion, word_before_cursor):
         # suggest custom datatypes
         types = self.populate_schema_objects(suggestion.schema, "datatypes")
-        types = [self._make_cand(t, False, suggestion) for t in types]
-        matches = self.find_matches(word_before_cursor, types, meta="datatype")
+        types = candidate_indexes.get(
+            "datatypes", types, lambda t: (t.name, generate_alias(t.name))
+        )
+        matches = self.find_matches(
+            word_before_cursor, types, meta="datatype",
+            make_candidate=lambda t: self._make_cand(t, False, suggestion)
+        )
         return matches
 
     def get_word_before_cursor(self, word=False):
@@ -1136,7 +1163,7 @@ class SQLAutoComplete(object):
         query, in_clause = self._get_schema_obj_query(schema, obj_type)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = metadata_cache.execute_dict(self.conn, query)
             if status:
                 for record in res['rows']:
                     data.append(
@@ -1210,7 +1237,7 @@ class SQLAutoComplete(object):
         query, in_clause = self._get_function_sql(schema)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = metadata_cache.execute_dict(self.conn, query)
             if status:
                 self._get_function_meta_data(res, data)
 
@@ -1234,7 +1261,7 @@ class SQLAutoComplete(object):
                                     schema_names=schemas,
                                     object_name='view')
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = metadata_cache.execute_dict(self.conn, query)
             if status:
                 for row in res['rows']:
                     data.append((
@@ -1258,7 +1285,7 @@ class SQLAutoComplete(object):
                                 schema_names=schemas)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = metadata_cache.execute_dict(self.conn, query)
             if status:
                 for row in res['rows']:
                     data.append(ForeignKey(
@@ -0,0 +1,221 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Index of the auto complete candidates.
+
+Finding the matches used to scan every candidate on each call, lowering and
+unquoting all of their synonyms (and running a regular expression in the
+fuzzy mode). The index computes the lowered/unquoted synonyms once, keeps
+them in a sorted array for the prefix (strict) matching, and a per character
+posting list to filter the candidates for the fuzzy matching.
+
+The indexes of the collections fetched from the catalog (i.e. tables, views,
+columns, functions, datatypes, schemas, and databases), and of the keywords
+are kept in a small LRU cache, so that they are shared by the subsequent auto
+complete requests on the same catalog. Only the small collections built for
+the statement being completed (i.e. the aliases, and the joins) are indexed
+on every call.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+# Maximum number of the indexes kept in the cache
+MAX_INDEXES = 32
+
+
+def unescape_name(name):
+    """ Unquote a string."""
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+
+    return name
+
+
+class CandidateIndex(object):
+    """
+    class CandidateIndex(object)
+
+        Index of the auto complete candidates on their synonyms.
+
+    Every entry of the index has a key (i.e. a string, a Candidate, or any
+    object used by the caller to build the completion), and the list of the
+    synonyms, which are matched against the text typed by the user.
+
+    Methods:
+    -------
+    * matches(text, fuzzy=False)
+      - Returns the list of (key, sort_key) of the matching entries.
+    """
+
+    def __init__(self, keys, synonyms):
+        """
+        Args:
+            keys: list of the entry keys
+            synonyms: list of the synonyms (an iterable of strings) of each
+                entry
+        """
+        self.keys = keys
+        self._lowered = []
+        prefixes = []
+
+        for pos, names in enumerate(synonyms):
+            lowered = []
+            for name in names:
+                lower = name.lower()
+                unescaped = unescape_name(lower)
+                lowered.append((lower, unescaped))
+                prefixes.append((unescaped, pos))
+            self._lowered.append(lowered)
+
+        prefixes.sort()
+        self._prefixes = [p[0] for p in prefixes]
+        self._positions = [p[1] for p in prefixes]
+        self._chars = None
+
+    @classmethod
+    def from_collection(cls, collection):
+        """
+        Build the index from a collection of strings or Candidate
+        namedtuples.
+        """
+        return cls(
+            collection,
+            [
+                (cand,) if isinstance(cand, str) else cand.synonyms
+                for cand in collection
+            ]
+        )
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _char_postings(self):
+        # Built on the first fuzzy lookup only, as the strict mode is the
+        # default one.
+        if self._chars is None:
+            chars = {}
+            for pos, lowered in enumerate(self._lowered):
+                for char in set(''.join(lower for lower, _ in lowered)):
+                    chars.setdefault(char, set()).add(pos)
+            self._chars = chars
+        return self._chars
+
+    def _prefix_matches(self, text):
+        matches = set()
+        idx = bisect_left(self._prefixes, text)
+        while idx < len(self._prefixes) and \
+                self._prefixes[idx].startswith(text):
+            matches.add(self._positions[idx])
+            idx += 1
+        return [
+            (self.keys[pos], (-float("Infinity"), 0))
+            for pos in sorted(matches)
+        ]
+
+    def _fuzzy_matches(self, text):
+        if text:
+            chars = self._char_postings()
+            postings = sorted(
+                (chars.get(char, set()) for char in set(text)), key=len
+            )
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(len(self._lowered))
+
+        pat = re.compile("(%s)" % ".*?".join(map(re.escape, text)))
+        text_len = len(text)
+        matches = []
+
+        for pos in candidates:
+            sort_key = None
+            for lower, unescaped in self._lowered[pos]:
+                if lower[: text_len + 1] in (text, text + " "):
+                    # Exact match of first word in suggestion
+                    # This is to get exact alias matches to the top
+                    # E.g. for input `e`, 'Entries E' should be on top
+                    # (before e.g. `EndUsers EU`)
+                    key = (float("Infinity"), -1)
+                else:
+                    r = pat.search(unescaped)
+                    if not r:
+                        continue
+                    key = (-len(r.group()), -r.start())
+                if sort_key is None or key > sort_key:
+                    sort_key = key
+            if sort_key is not None:
+                matches.append((self.keys[pos], sort_key))
+
+        return matches
+
+    def matches(self, text, fuzzy=False):
+        """
+        Returns the list of (key, sort_key) for the entries matching the
+        given (lowered, and unquoted) text, in the order of the entries.
+
+        In the strict mode, one of the synonyms must start with the text,
+        while in the fuzzy mode, the characters of the text must appear in
+        the same order in one of the synonyms.
+        """
+        if fuzzy:
+            return self._fuzzy_matches(text)
+        return self._prefix_matches(text)
+
+
+class CandidateIndexCache(object):
+    """
+    class CandidateIndexCache(object)
+
+        LRU cache of the candidate indexes, keyed by the kind of the
+        candidates, and the tuple of the entry keys.
+
+    Methods:
+    -------
+    * get(kind, keys, synonyms_func)
+      - Returns the index of the given keys, builds it (using the
+        synonyms_func to get the synonyms of each key), if not cached.
+    """
+
+    def __init__(self, max_indexes=MAX_INDEXES):
+        self.max_indexes = max_indexes
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, kind, keys, synonyms_func):
+        cache_key = (kind, tuple(keys))
+
+        with self._lock:
+            index = self._indexes.pop(cache_key, None)
+            if index is not None:
+                self._indexes[cache_key] = index
+                return index
+
+        index = CandidateIndex(
+            list(keys), [synonyms_func(key) for key in keys]
+        )
+
+        with self._lock:
+            self._indexes[cache_key] = index
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(False)
+
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        return len(self._indexes)
+
+
+candidate_indexes = CandidateIndexCache()
@@ -0,0 +1,140 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Cache of the catalog query results used by the SQL auto complete.
+
+Every auto complete request creates a new SQLAutoComplete object, which
+fetches the keywords, search path, schemas, relations, columns, functions,
+etc. from the database server. The results are cached here per server,
+database and role, and shared by all the query tool tabs of the same
+database. The entries are refreshed after the configured time to live, or
+when they are invalidated explicitly (i.e. a DDL statement has been executed
+from the query tool).
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import config
+
+# Statements, which may change the metadata used by the auto complete.
+_METADATA_CHANGE_RE = re.compile(
+    r'\b(CREATE|ALTER|DROP|COMMENT|search_path)\b', re.IGNORECASE
+)
+
+
+class MetadataCache(object):
+    """
+    class MetadataCache(object)
+
+        LRU cache of the catalog query results, keyed by server id, database
+        name, role, and query.
+
+    Methods:
+    -------
+    * execute_dict(conn, query, per_connection=False)
+      - Returns the cached result of the query (if not expired), otherwise
+        executes it using the given connection and caches it.
+
+    * invalidate(sid, database=None)
+      - Remove the cached results of the given server (and database).
+
+    * stats()
+      - Returns the hits/misses counters.
+    """
+
+    def __init__(self, ttl=None, max_entries=1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def time_to_live(self):
+        if self.ttl is not None:
+            return self.ttl
+        return getattr(config, 'AUTOCOMPLETE_METADATA_CACHE_TTL', 300)
+
+    @staticmethod
+    def _key(conn, query, per_connection):
+        manager = conn.manager
+        user = None
+        if conn.conn is not None and not conn.conn.closed:
+            user = conn.conn.get_dsn_parameters().get('user', None)
+
+        return (
+            manager.sid, conn.db, user, manager.role,
+            conn.conn_id if per_connection else None,
+            query
+        )
+
+    def execute_dict(self, conn, query, per_connection=False):
+        """
+        Returns the result of the query as returned by the
+        Connection.execute_dict(...) function.
+
+        Args:
+            conn: Connection object
+            query: SQL query
+            per_connection: Cache the result for the given connection only
+                (i.e. the search path can be changed per connection).
+        """
+        key = self._key(conn, query, per_connection)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and now - entry[0] < self.time_to_live:
+                self._entries[key] = entry
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+
+        status, res = conn.execute_dict(query)
+
+        if status:
+            with self._lock:
+                self._entries[key] = (now, res)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(False)
+
+        return status, res
+
+    def invalidate(self, sid, database=None):
+        """
+        Remove the cached results of the given server id, and database (if
+        specified).
+        """
+        with self._lock:
+            for key in list(self._entries.keys()):
+                if key[0] == sid and (database is None or key[1] == database):
+                    del self._entries[key]
+
+    def invalidate_if_changed(self, sid, database, sql):
+        """
+        Remove the cached results of the given database, if the given SQL
+        may have changed the objects or the search path.
+        """
+        if sql and _METADATA_CHANGE_RE.search(sql):
+            self.invalidate(sid, database)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries)
+        }
+
+
+metadata_cache = MetadataCache()
@@ -0,0 +1,84 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.candidate_index import \
+    CandidateIndex, CandidateIndexCache
+
+
+class TestAutoCompleteCandidateIndex(BaseTestGenerator):
+    scenarios = [
+        (
+            'Strict mode matches the start of the synonyms',
+            dict(
+                text='cu',
+                fuzzy=False,
+                expected=[
+                    ('customer', (-float("Infinity"), 0)),
+                    ('"Customer_Items"', (-float("Infinity"), 0)),
+                ],
+            )
+        ),
+        (
+            'Strict mode matches the aliases',
+            dict(
+                text='ci',
+                fuzzy=False,
+                expected=[
+                    ('"Customer_Items"', (-float("Infinity"), 0)),
+                ],
+            )
+        ),
+        (
+            'Fuzzy mode matches the characters in order',
+            dict(
+                text='cms',
+                fuzzy=True,
+                expected=[
+                    ('"Customer_Items"', (-14, 0)),
+                ],
+            )
+        ),
+        (
+            'Fuzzy mode puts the exact match of the first word on top',
+            dict(
+                text='order',
+                fuzzy=True,
+                expected=[
+                    ('order', (float("Infinity"), -1)),
+                    ('order_line', (-5, 0)),
+                ],
+            )
+        ),
+        (
+            'Empty text matches everything',
+            dict(
+                text='',
+                fuzzy=False,
+                expected=[
+                    ('customer', (-float("Infinity"), 0)),
+                    ('order', (-float("Infinity"), 0)),
+                    ('order_line', (-float("Infinity"), 0)),
+                    ('"Customer_Items"', (-float("Infinity"), 0)),
+                ],
+            )
+        ),
+    ]
+
+    def runTest(self):
+        names = ['customer', 'order', 'order_line', '"Customer_Items"']
+        aliases = ['c', 'o', 'ol', 'CI']
+
+        cache = CandidateIndexCache(max_indexes=1)
+        index = cache.get(
+            'tables', names, lambda name: (name, aliases[names.index(name)])
+        )
+        self.assertIs(cache.get('tables', list(names), None), index)
+        self.assertIsInstance(index, CandidateIndex)
+
+        self.assertEqual(index.matches(self.text, self.fuzzy), self.expected)
@@ -0,0 +1,82 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import MagicMock
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.metadata_cache import MetadataCache
+
+
+class TestAutoCompleteMetadataCache(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the same query is executed twice, it is served from the '
+            'cache the second time',
+            dict(
+                ttl=300,
+                executed_sql=None,
+                expected_executions=1,
+                expected_hits=1,
+            )
+        ),
+        (
+            'When the entry is expired, the query is executed again',
+            dict(
+                ttl=0,
+                executed_sql=None,
+                expected_executions=2,
+                expected_hits=0,
+            )
+        ),
+        (
+            'When a DDL statement has been executed, the query is executed '
+            'again',
+            dict(
+                ttl=300,
+                executed_sql='CREATE TABLE t1(id int)',
+                expected_executions=2,
+                expected_hits=0,
+            )
+        ),
+        (
+            'When a DML statement has been executed, it is served from the '
+            'cache',
+            dict(
+                ttl=300,
+                executed_sql='UPDATE t1 SET id = 1',
+                expected_executions=1,
+                expected_hits=1,
+            )
+        ),
+    ]
+
+    def runTest(self):
+        cache = MetadataCache(ttl=self.ttl)
+
+        conn = MagicMock(db='postgres', conn_id='CONN:1')
+        conn.manager.sid = 1
+        conn.manager.role = None
+        conn.conn.closed = False
+        conn.conn.get_dsn_parameters.return_value = {'user': 'postgres'}
+        conn.execute_dict.return_value = (
+            True, {'rows': [{'schema': 'public'}]}
+        )
+
+        status, res = cache.execute_dict(conn, 'SELECT 1')
+        self.assertTrue(status)
+
+        if self.executed_sql:
+            cache.invalidate_if_changed(1, 'postgres', self.executed_sql)
+
+        status, res = cache.execute_dict(conn, 'SELECT 1')
+        self.assertTrue(status)
+        self.assertEqual(res['rows'], [{'schema': 'public'}])
+        self.assertEqual(
+            conn.execute_dict.call_count, self.expected_executions
+        )
+        self.assertEqual(cache.stats()['hits'], self.expected_hits)
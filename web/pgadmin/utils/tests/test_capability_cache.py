@@ -0,0 +1,103 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import threading
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.probes import register_probe
+from pgadmin.utils.driver.psycopg2.server_manager import ServerManager
+
+probed = []
+
+
+@register_probe('test_capability')
+def probe_test_capability(manager, conn, tid):
+    probed.append((conn, tid))
+    if tid < 0:
+        return False, 'invalid table'
+    return True, tid % 2 == 0
+
+
+class _ServerManagerTest(ServerManager):
+    def __init__(self):
+        self._capabilities_lock = threading.Lock()
+        self.capabilities = dict()
+        self.did = 1
+
+    def connection(self, did=None, **kwargs):
+        return did
+
+
+class TestCapabilityCache(BaseTestGenerator):
+    """ This class will test the cache of the capability probes. """
+
+    scenarios = [
+        ('Capabilities are probed once per database', dict(ttl=60)),
+        ('Capabilities are probed every time, when not cached', dict(ttl=0)),
+    ]
+
+    def runTest(self):
+        del probed[:]
+
+        with patch.object(config, 'CAPABILITY_CACHE_TTL', self.ttl):
+            manager = _ServerManagerTest()
+
+            for _ in range(3):
+                self.assertEqual(
+                    manager.probe('test_capability', 2, did=1), (True, True))
+                self.assertEqual(
+                    manager.probe('test_capability', 3, did=1), (True, False))
+                self.assertEqual(
+                    manager.probe('test_capability', 2, did=5), (True, True))
+
+            if self.ttl:
+                self.assertEqual(probed, [(1, 2), (1, 3), (5, 2)])
+            else:
+                self.assertEqual(probed, [(1, 2), (1, 3), (5, 2)] * 3)
+
+            # Failures are not cached
+            del probed[:]
+            for _ in range(2):
+                self.assertEqual(
+                    manager.probe('test_capability', -1, did=1),
+                    (False, 'invalid table'))
+            self.assertEqual(probed, [(1, -1), (1, -1)])
+
+            if not self.ttl:
+                return
+
+            # Refreshed results of the database are probed again
+            del probed[:]
+            manager.refresh_capabilities(did=1)
+            manager.probe('test_capability', 2, did=1)
+            manager.probe('test_capability', 2, did=5)
+            self.assertEqual(probed, [(1, 2)])
+
+            manager.refresh_capabilities('test_capability')
+            manager.probe('test_capability', 2, did=5)
+            self.assertEqual(probed, [(1, 2), (5, 2)])
+
+            # Expired results are probed again
+            with patch('pgadmin.utils.driver.psycopg2.server_manager.time.'
+                       'time', return_value=manager.capabilities[
+                           (5, 'test_capability', 2)][0]):
+                manager.probe('test_capability', 2, did=5)
+            self.assertEqual(probed, [(1, 2), (5, 2), (5, 2)])
+
+            # Results of the maintenance database are refreshed by its id
+            del probed[:]
+            manager.probe('test_capability', 2)
+            manager.refresh_capabilities(did=5)
+            manager.probe('test_capability', 2)
+            self.assertEqual(probed, [(None, 2)])
+
+            manager.refresh_capabilities(did=1)
+            manager.probe('test_capability', 2)
+            self.assertEqual(probed, [(None, 2), (None, 2)])
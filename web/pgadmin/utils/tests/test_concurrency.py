@@ -0,0 +1,85 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import threading
+import time
+from concurrent.futures import TimeoutError
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.concurrency import cancelled, run_concurrently
+
+
+class TestRunConcurrently(BaseTestGenerator):
+    scenarios = [
+        ('Run the calls one after another', dict(
+            max_workers=1, timeout=None, hung=None)),
+        ('Run the calls at the same time', dict(
+            max_workers=3, timeout=None, hung=None)),
+        ('Hung call does not block the others', dict(
+            max_workers=2, timeout=0.2, hung=1)),
+    ]
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.release = threading.Event()
+        self.cancelled = dict()
+        self.hung_done = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def call(self, idx):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        if idx == self.hung:
+            self.release.wait(5)
+        else:
+            time.sleep(0.02)
+
+        self.cancelled[idx] = cancelled()
+        if idx == self.hung:
+            self.hung_done.set()
+
+        with self.lock:
+            self.running -= 1
+
+        if idx == 4:
+            raise ValueError(idx)
+        return idx
+
+    def runTest(self):
+        funcs = [lambda idx=idx: self.call(idx) for idx in range(6)]
+
+        start = time.time()
+        results = run_concurrently(funcs, self.max_workers, self.timeout)
+        self.assertTrue(time.time() - start < 2)
+
+        for idx, (status, res) in enumerate(results):
+            if idx == self.hung:
+                self.assertFalse(status)
+                self.assertIsInstance(res, TimeoutError)
+            elif idx == 4:
+                self.assertFalse(status)
+                self.assertIsInstance(res, ValueError)
+            else:
+                self.assertEqual((status, res), (True, idx))
+
+        if self.hung is None:
+            self.assertTrue(self.max_running <= self.max_workers)
+        else:
+            # The hung call is told, it has been timed out
+            self.release.set()
+            self.assertTrue(self.hung_done.wait(2))
+
+        self.assertEqual(self.cancelled, dict(
+            (idx, idx == self.hung) for idx in range(6)
+        ))
@@ -0,0 +1,100 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import shutil
+import tempfile
+
+from flask import Flask
+from werkzeug.test import create_environ
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.connection_broker import ConnectionBroker
+
+
+class TestConnectionBroker(BaseTestGenerator):
+    scenarios = [
+        ('Request of the session owned by the worker', dict(
+            owned=True, owner_stopped=False)),
+        ('Request forwarded to the worker owning the session', dict(
+            owned=False, owner_stopped=False)),
+        ('Request of the session owned by a stopped worker', dict(
+            owned=False, owner_stopped=True)),
+    ]
+
+    sid = '0b8d3f0c-5a6e-4c1e-9d7a-2f4b6c8e0a13'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.workers = [self.create_worker(name) for name in ('A', 'B')]
+        for worker in self.workers:
+            worker.start()
+
+    def tearDown(self):
+        for worker in self.workers:
+            worker.stop()
+        shutil.rmtree(self.tmp_dir, True)
+
+    def create_worker(self, name):
+        app = Flask(name)
+        app.config['SECRET_KEY'] = 'secret'
+        app.config['SESSION_COOKIE_NAME'] = 'pga4_session'
+
+        def wsgi_app(environ, start_response):
+            body = environ['wsgi.input'].read()
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            return [name.encode(), b':', body]
+
+        app.wsgi_app = wsgi_app
+        return ConnectionBroker(app, self.tmp_dir)
+
+    def request(self, worker, sid):
+        headers = {}
+        if sid is not None:
+            headers['Cookie'] = 'pga4_session={0}!digest'.format(sid)
+
+        environ = create_environ(
+            '/sqleditor/query_tool/poll/1', method='POST', data=b'data',
+            headers=headers
+        )
+        response = []
+
+        def start_response(status, headers, exc_info=None):
+            response.append(status)
+
+        body = b''.join(worker(environ, start_response))
+        return response[0], body
+
+    def runTest(self):
+        worker, other = self.workers
+
+        # The session is owned by the worker serving its first request
+        status, body = self.request(worker if self.owned else other, self.sid)
+        self.assertEqual(status, '200 OK')
+
+        # Starting another worker does not move the session
+        new_worker = self.create_worker('C')
+        new_worker.start()
+        self.workers.append(new_worker)
+
+        if self.owner_stopped:
+            other.stop()
+
+        expected = b'A:data' if self.owned or self.owner_stopped \
+            else b'B:data'
+
+        status, body = self.request(worker, self.sid)
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(body, expected)
+
+        # The session is forwarded to its owner by the other workers
+        status, body = self.request(new_worker, self.sid)
+        self.assertEqual(body, expected)
+
+        # Requests without the session are run by the worker itself
+        status, body = self.request(worker, None)
+        self.assertEqual(body, b'A:data')
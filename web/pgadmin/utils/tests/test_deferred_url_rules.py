@@ -0,0 +1,77 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from flask import request, url_for
+
+from pgadmin import PgAdmin
+from pgadmin.utils import PgAdminModule
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestDeferredUrlRules(BaseTestGenerator):
+    """ This class will test adding the url rules of the modules lazily. """
+
+    scenarios = [
+        ('Url rules are added on the first request to the module', dict(
+            defer=True, debug=False, deferred=True)),
+        ('Url rules are added at once in the debug mode', dict(
+            defer=True, debug=True, deferred=False)),
+        ('Url rules are added at once, if not deferred', dict(
+            defer=False, debug=False, deferred=False)),
+    ]
+
+    def create_module(self, name):
+        module = PgAdminModule(
+            name, __name__, url_prefix='/test_deferred/' + name
+        )
+        module.add_deferred_url_rule(
+            '/obj/<int:oid>', view_func=lambda oid: 'obj %d' % oid,
+            endpoint='obj'
+        )
+        return module
+
+    def rules(self, app):
+        return sorted(
+            rule.rule for rule in app.url_map.iter_rules()
+            if rule.endpoint.endswith('.obj')
+        )
+
+    def runTest(self):
+        app = PgAdmin('test_deferred_url_rules')
+        app.config.update(
+            DEFER_NODE_URL_RULES=self.defer,
+            DEBUG=self.debug
+        )
+        app.find_submodules = lambda basemodule: iter([])
+
+        for name in ('table', 'view'):
+            app.register_blueprint(self.create_module(name))
+
+        if not self.deferred:
+            self.assertEqual(self.rules(app), [
+                '/test_deferred/table/obj/<int:oid>',
+                '/test_deferred/view/obj/<int:oid>'
+            ])
+            self.assertEqual(app.deferred_url_rules, dict())
+            return
+
+        self.assertEqual(self.rules(app), [])
+
+        with app.test_request_context('/test_deferred/table/obj/1'):
+            self.assertEqual(request.endpoint, 'table.obj')
+            self.assertEqual(request.view_args, dict(oid=1))
+        self.assertEqual(self.rules(app), [
+            '/test_deferred/table/obj/<int:oid>'
+        ])
+
+        # Added, when the url of the module is built
+        with app.test_request_context():
+            self.assertEqual(
+                url_for('view.obj', oid=2), '/test_deferred/view/obj/2'
+            )
+        self.assertEqual(app.deferred_url_rules, dict())
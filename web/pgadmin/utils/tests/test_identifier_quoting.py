@@ -0,0 +1,61 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from jinja2 import Undefined
+
+from pgadmin.utils.driver.psycopg2 import quoting
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestIdentifierQuoting(BaseTestGenerator):
+    scenarios = [
+        ('Identifiers of the latest server version', dict(
+            sversion=None, for_types=False,
+            values=['tbl', 'Tbl', '1tbl', 'my tbl', 'select', 'xmltable',
+                    'name', 'a"b', 'user'],
+            expected=['tbl', '"Tbl"', '"1tbl"', '"my tbl"', '"select"',
+                      '"xmltable"', 'name', '"a""b"', '"user"'])),
+        ('Identifiers of an older server version', dict(
+            sversion=90500, for_types=False,
+            values=['xmltable', 'normalize', 'select'],
+            expected=['xmltable', 'normalize', '"select"'])),
+        ('Type names', dict(
+            sversion=120000, for_types=True,
+            values=['integer', 'character varying', 'character varying[]',
+                    '"char"', 'my type', 'xmltable', 'Type[]', 'number'],
+            expected=['integer', 'character varying', 'character varying[]',
+                      '"char"', '"my type"', 'xmltable', '"Type[]"',
+                      '"number"'])),
+    ]
+
+    def runTest(self):
+        table = quoting.keyword_table(self.sversion)
+
+        quoting.clear_cache()
+        self.assertEqual(
+            [quoting.quote(val, self.for_types, table)
+             for val in self.values],
+            self.expected
+        )
+        # Memoized results are the same
+        self.assertEqual(
+            quoting.quote_list(self.values, self.for_types, table),
+            self.expected
+        )
+        self.assertEqual(
+            quoting.quote_list(['', 'a'], self.for_types, table), [None, 'a']
+        )
+        self.assertEqual(
+            quoting.quote_qualified(
+                ['public', '', self.values[1]], self.for_types, table
+            ),
+            'public.' + self.expected[1]
+        )
+        # The version is not known, without the connection
+        self.assertIsNone(quoting.server_version(None))
+        self.assertIsNone(quoting.server_version(Undefined(name='conn')))
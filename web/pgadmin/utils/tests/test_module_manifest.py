@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from werkzeug.utils import find_modules
+
+from pgadmin import PgAdmin
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestModuleManifest(BaseTestGenerator):
+    """ This class will test loading the modules from the module manifest. """
+
+    scenarios = [
+        ('Modules are loaded from the manifest', dict(
+            basemodule='pgadmin.misc', version=None, prebuilt=True)),
+        ('Manifest of another version is ignored', dict(
+            basemodule='pgadmin.misc', version='0.0', prebuilt=False)),
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.manifest_file = os.path.join(self.tmp_dir, 'modules.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def create_app(self, manifest_file=None):
+        app = PgAdmin('test_module_manifest')
+        app.config.update(
+            MODULE_BLACKLIST=self.app.config['MODULE_BLACKLIST'],
+            APP_VERSION=self.app.config['APP_VERSION'],
+            MODULE_MANIFEST=manifest_file
+        )
+        return app
+
+    def runTest(self):
+        # Search the package, and save the modules found
+        app = self.create_app()
+        modules = list(app.find_submodules(self.basemodule))
+        self.assertTrue(len(modules) > 0)
+        self.assertEqual(app.prebuilt_module_manifest, dict())
+        app.save_module_manifest(self.manifest_file)
+
+        if self.version is not None:
+            with open(self.manifest_file) as fp:
+                manifest = json.load(fp)
+            manifest['version'] = self.version
+            with open(self.manifest_file, 'w') as fp:
+                json.dump(manifest, fp)
+
+        app = self.create_app(self.manifest_file)
+        with patch('pgadmin.find_modules',
+                   wraps=find_modules) as find_modules_mock:
+            loaded = list(app.find_submodules(self.basemodule))
+
+        self.assertEqual(loaded, modules)
+        self.assertEqual(find_modules_mock.called, not self.prebuilt)
@@ -0,0 +1,65 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.preferences import _UserPreferences
+
+
+class _UserPreferencesTest(_UserPreferences):
+    def __init__(self, on_load=None):
+        super(_UserPreferencesTest, self).__init__()
+        self.loaded = []
+        self.on_load = on_load
+        self.stored = {1: {1: 'True', 2: '10'}, 2: {1: 'False'}}
+
+    def _load(self, uid):
+        self.loaded.append(uid)
+        if self.on_load:
+            self.on_load(self)
+        return dict(self.stored[uid])
+
+
+class TestPreferencesCache(BaseTestGenerator):
+    """ This class will test the snapshot of the user preferences. """
+
+    scenarios = [
+        ('Preferences are loaded once per user', dict(ttl=60)),
+        ('Preferences are loaded every time, when not cached', dict(ttl=0)),
+    ]
+
+    def runTest(self):
+        with patch.object(config, 'PREFERENCES_CACHE_TTL', self.ttl):
+            prefs = _UserPreferencesTest()
+
+            for _ in range(3):
+                self.assertEqual(prefs.values(1), {1: 'True', 2: '10'})
+                self.assertEqual(prefs.values(2), {1: 'False'})
+
+            if self.ttl:
+                self.assertEqual(prefs.loaded, [1, 2])
+            else:
+                self.assertEqual(prefs.loaded, [1, 2] * 3)
+
+            # Changed values are loaded again, only for that user
+            prefs.stored[1][2] = '20'
+            prefs.invalidate(1)
+            self.assertEqual(prefs.values(1), {1: 'True', 2: '20'})
+            prefs.values(2)
+            if self.ttl:
+                self.assertEqual(prefs.loaded, [1, 2, 1])
+
+            # The snapshot loaded while the values are changed is not kept
+            prefs = _UserPreferencesTest(
+                on_load=lambda p: p.loaded == [1] and p.invalidate(1)
+            )
+            prefs.values(1)
+            prefs.values(1)
+            self.assertEqual(prefs.loaded, [1, 1])
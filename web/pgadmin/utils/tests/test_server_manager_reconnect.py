@@ -0,0 +1,83 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import threading
+from unittest.mock import patch
+
+from flask import session
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg2.server_manager import ServerManager, \
+    restore_connections
+
+
+class FakeConnection(object):
+    def __init__(self, conn_id):
+        self.conn_id = conn_id
+        self.connects = 0
+
+    def connect(self, **kwargs):
+        self.connects += 1
+
+
+class TestServerManagerReconnect(BaseTestGenerator):
+    scenarios = [
+        ('Reconnect is not started again while in progress', dict()),
+    ]
+
+    def runTest(self):
+        manager = ServerManager.__new__(ServerManager)
+        manager.use_ssh_tunnel = 0
+        manager.connections = dict()
+        manager._reconnecting = set()
+        manager._reconnect_lock = threading.Lock()
+
+        conn = FakeConnection('DB:postgres')
+        manager.connections[conn.conn_id] = conn
+
+        task = manager._reconnect_task(conn, True, True, None)
+        self.assertIsNotNone(task)
+
+        # i.e. the reconnect was timed out, and is still running
+        self.assertIsNone(manager._reconnect_task(conn, True, True, None))
+
+        task()
+        self.assertEqual(conn.connects, 1)
+
+        # Once completed, the connection can be reconnected again
+        self.assertIsNotNone(manager._reconnect_task(conn, True, True, None))
+
+        # A reconnect timed out does not update the session, which may have
+        # been saved by the request already
+        release = threading.Event()
+        updated = threading.Event()
+
+        class HungConnection(FakeConnection):
+            def connect(self, **kwargs):
+                release.wait(5)
+                manager.update_session()
+                updated.set()
+
+        manager.sid = 1
+        manager.as_dict = lambda: dict(sid=1)
+        conn = HungConnection('DB:sales')
+        manager.connections[conn.conn_id] = conn
+
+        with self.app.test_request_context(), \
+                patch.object(config, 'CONNECTION_RESTORE_TIMEOUT', 0.1):
+            restore_connections([
+                manager._reconnect_task(conn, True, True, None)
+            ])
+            release.set()
+            self.assertTrue(updated.wait(2))
+            self.assertNotIn('__pgsql_server_managers', session)
+
+            manager.update_session()
+            self.assertEqual(session['__pgsql_server_managers'],
+                             {1: dict(sid=1)})
@@ -0,0 +1,144 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import datetime
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import MemorySessionManager, SQLiteSessionManager
+
+
+class TestSessionStore(BaseTestGenerator):
+    scenarios = [
+        ('SQLite session store', dict(store='sqlite')),
+        ('Memory session store', dict(store='memory')),
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def create_manager(self):
+        if self.store == 'sqlite':
+            manager = SQLiteSessionManager(
+                os.path.join(self.tmp_dir, 'sessions.db'), 'secret', 0
+            )
+        else:
+            manager = MemorySessionManager('secret', 0)
+
+        # Record the keys written by the store
+        self.written = []
+        store = manager._store
+
+        def _store(sid, randval, hmac_digest, last_write, changed, removed):
+            self.written.append((sorted(changed), sorted(removed)))
+            store(sid, randval, hmac_digest, last_write, changed, removed)
+
+        manager._store = _store
+        return manager
+
+    def runTest(self):
+        manager = self.create_manager()
+
+        session = manager.new_session()
+        session['grid1'] = {'command_obj': 'command 1'}
+        session['grid2'] = {'command_obj': 'command 2'}
+        session['user'] = 'postgres'
+        manager.put(session)
+        self.assertEqual(
+            self.written[-1], (['_permanent', 'grid1', 'grid2', 'user'], [])
+        )
+        self.assertTrue(manager.exists(session.sid))
+
+        # Only the changed and removed keys are written
+        session['grid2'] = {'command_obj': 'command 2 changed'}
+        del session['grid1']
+        manager.put(session)
+        self.assertEqual(self.written[-1], (['grid2'], ['grid1']))
+
+        loaded = manager.get(session.sid, session.hmac_digest)
+        self.assertEqual(dict(loaded), {
+            '_permanent': True,
+            'grid2': {'command_obj': 'command 2 changed'},
+            'user': 'postgres'
+        })
+
+        # Nothing changed since it was read
+        manager.put(loaded)
+        self.assertEqual(self.written[-1], ([], []))
+
+        # The query tool transactions are written one by one
+        loaded['gridData'] = {
+            '1': {'command_obj': 'command 1'},
+            '2': {'command_obj': 'command 2'}
+        }
+        manager.put(loaded)
+        self.assertEqual(
+            self.written[-1], (['gridData\x1f1', 'gridData\x1f2'], [])
+        )
+
+        grid_data = loaded['gridData']
+        grid_data['2'] = {'command_obj': 'command 2 changed'}
+        grid_data['3'] = {'command_obj': 'command 3'}
+        del grid_data['1']
+        loaded['gridData'] = grid_data
+        manager.put(loaded)
+        self.assertEqual(
+            self.written[-1],
+            (['gridData\x1f2', 'gridData\x1f3'], ['gridData\x1f1'])
+        )
+
+        reloaded = manager.get(session.sid, session.hmac_digest)
+        self.assertEqual(reloaded['gridData'], {
+            '2': {'command_obj': 'command 2 changed'},
+            '3': {'command_obj': 'command 3'}
+        })
+
+        # Only the keys set since it was read are written
+        reloaded['user'] = 'postgres2'
+        manager.put(reloaded)
+        self.assertEqual(self.written[-1], (['user'], []))
+
+        # The values changed in place are written too
+        reloaded['__debugger_sessions'] = dict()
+        manager.put(reloaded)
+        reloaded['__debugger_sessions']['1'] = {'conn_id': 1}
+        manager.put(reloaded)
+        self.assertEqual(self.written[-1], (['__debugger_sessions'], []))
+        reloaded['__debugger_sessions'].pop('1')
+        manager.put(reloaded)
+        self.assertEqual(self.written[-1], (['__debugger_sessions'], []))
+        self.assertEqual(
+            manager.get(session.sid, session.hmac_digest)[
+                '__debugger_sessions'], dict()
+        )
+
+        del reloaded['gridData']
+        manager.put(reloaded)
+        self.assertEqual(
+            self.written[-1], ([], ['gridData\x1f2', 'gridData\x1f3'])
+        )
+
+        # The digest must match
+        other = manager.get(session.sid, 'invalid')
+        self.assertNotEqual(other.sid, session.sid)
+        self.assertNotIn('user', other)
+
+        # Expired sessions are removed by the cleanup
+        manager.cleanup(datetime.timedelta(days=1))
+        self.assertTrue(manager.exists(session.sid))
+        manager.cleanup(datetime.timedelta(seconds=-1))
+        self.assertFalse(manager.exists(session.sid))
+
+        manager.put(session)
+        manager.remove(session.sid)
+        self.assertFalse(manager.exists(session.sid))
@@ -51,6 +51,14 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
         (
             "Raise error when version is gpdb but template does not exist",
             dict(scenario=8)
+        ),
+        (
+            "Use the memoized resolution when the template is loaded again",
+            dict(scenario=9)
+        ),
+        (
+            "Do not memoize the resolution when templates are auto reloaded",
+            dict(scenario=10)
         )
     ]
 
@@ -87,6 +95,10 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
             # test_raise_not_found_exception_when_the_version_is_gpdb_template
             # _not_exist
             self.test_raise_not_found_exception_when_the_version_is_gpdb()
+        if self.scenario == 9:
+            self.test_get_source_uses_memoized_resolution()
+        if self.scenario == 10:
+            self.test_get_source_does_not_memoize_in_auto_reload_mode()
 
     def test_get_source_returns_a_template(self):
         expected_content = "Some SQL" \
@@ -209,6 +221,36 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
         except TemplateNotFound:
             return
 
+    def test_get_source_uses_memoized_resolution(self):
+        """Use the memoized resolution when the template is loaded again"""
+        template = "some_feature/sql/#90300#/some_action.sql"
+        first = self.loader.get_source(None, template)
+        self.assertIn(template, self.loader._resolved)
+
+        template_path, loader = self.loader._resolved[template]
+        self.assertEqual(template_path, "some_feature/sql/9.2_plus/"
+                                        "some_action.sql")
+        self.assertEqual(first[:2], self.loader.get_source(None, template)[:2])
+
+        # The templates not found are memoized too
+        template = "some_feature/sql/#10100#/some_action.sql"
+        for _ in range(2):
+            with self.assertRaises(TemplateNotFound):
+                self.loader.get_source(None, template)
+        self.assertIn(template, self.loader._resolved)
+
+        self.loader.clear_resolution_cache()
+        self.assertEqual(len(self.loader._resolved), 0)
+
+    def test_get_source_does_not_memoize_in_auto_reload_mode(self):
+        """Do not memoize the resolution when templates are auto reloaded"""
+        self.loader.app.config['TEMPLATES_AUTO_RELOAD'] = True
+        content, filename, up_to_dateness = self.loader.get_source(
+            None, "some_feature/sql/#90300#/some_action.sql"
+        )
+        self.assertEqual("Some 9.2 SQL", str(content).replace("\r", ""))
+        self.assertEqual(len(self.loader._resolved), 0)
+
 
 class FakeApp(Flask):
     def __init__(self):
@@ -9,8 +9,39 @@
 from flask.templating import DispatchingJinjaLoader
 from jinja2 import TemplateNotFound
 
+# Memoized for the versioned templates not found in any version directory
+_NOT_FOUND = object()
+
 
 class VersionedTemplateLoader(DispatchingJinjaLoader):
+    """
+    Template loader, which resolves the versioned template names (i.e.
+    'tables/sql/#gpdb#80323#/properties.sql') to the template of the highest
+    version directory (not greater than the specified version) having it.
+
+    The resolved template name, and the (application or blueprint) loader
+    having it, are memoized for each versioned template name (i.e. the
+    template, server type and version), unless the templates are reloaded
+    automatically (i.e. in the debug mode), so that the version directories
+    and the loaders are not searched again.
+    """
+
+    def __init__(self, app):
+        super(VersionedTemplateLoader, self).__init__(app)
+        self._resolved = dict()
+
+    def _use_resolved(self):
+        if self.app.config.get('EXPLAIN_TEMPLATE_LOADING'):
+            return False
+
+        auto_reload = self.app.config.get('TEMPLATES_AUTO_RELOAD')
+        if auto_reload is None:
+            auto_reload = self.app.debug
+        return not auto_reload
+
+    def clear_resolution_cache(self):
+        self._resolved.clear()
+
     def get_source(self, environment, template):
         specified_version_number, exists = parse_version(template)
         if not exists:
@@ -18,27 +49,64 @@ class VersionedTemplateLoader(DispatchingJinjaLoader):
                 environment, template
             )
 
-        template_dir, file_name = parse_template(template)
-
-        for version_mapping in get_version_mapping(template):
-            if version_mapping['number'] > specified_version_number:
-                continue
-
-            template_path = '/'.join([
-                template_dir,
-                version_mapping['name'],
-                file_name
-            ])
-
+        if not self._use_resolved():
+            for template_path in get_template_paths(
+                    template, specified_version_number):
+                try:
+                    return super(VersionedTemplateLoader, self).get_source(
+                        environment, template_path
+                    )
+                except TemplateNotFound:
+                    continue
+            raise TemplateNotFound(template)
+
+        resolved = self._resolved.get(template, None)
+        if resolved is _NOT_FOUND:
+            raise TemplateNotFound(template)
+
+        if resolved is not None:
+            template_path, loader = resolved
             try:
-                return super(VersionedTemplateLoader, self).get_source(
-                    environment, template_path
-                )
+                return loader.get_source(environment, template_path)
             except TemplateNotFound:
-                continue
+                # Resolve it again, if the template has gone
+                self._resolved.pop(template, None)
+
+        for template_path in get_template_paths(
+                template, specified_version_number):
+            for _, loader in self._iter_loaders(template_path):
+                try:
+                    source = loader.get_source(environment, template_path)
+                except TemplateNotFound:
+                    continue
+                self._resolved[template] = (template_path, loader)
+                return source
+
+        self._resolved[template] = _NOT_FOUND
         raise TemplateNotFound(template)
 
 
+def get_template_paths(template, specified_version_number):
+    """
+    This function will return the template paths of the version directories
+    (highest version first) to look for the versioned template.
+    :param template:
+    :param specified_version_number:
+    :return:
+    """
+    template_dir, file_name = parse_template(template)
+
+    for version_mapping in get_version_mapping(template):
+        if version_mapping['number'] > specified_version_number:
+            continue
+
+        yield '/'.join([
+            template_dir,
+            version_mapping['name'],
+            file_name
+        ])
+
+
 def parse_version(template):
     template_path_parts = template.split("#", 3)
     if len(template_path_parts) == 1:
@@ -307,6 +307,27 @@ describe('QueryHistory', () => {
         });
       });
 
+      describe('when an older page of the history is fetched', () => {
+        beforeEach(() => {
+          historyCollection.add({
+            query: 'older sql statement',
+            start_time: new Date(2016, 10, 11, 1, 33, 5, 99),
+            status: true,
+            row_affected: 5,
+            total_time: '26 msec',
+            message: 'older sql message',
+          });
+
+          queryEntries = historyWrapper.find('#query_list .list-item');
+        });
+
+        it('keeps the most recent query selected', () => {
+          expect($(queryEntries[0]).hasClass('selected')).toBeTruthy();
+          expect($(queryEntries[2]).text()).toContain('older sql statement');
+          expect($(queryEntries[2]).hasClass('selected')).toBeFalsy();
+        });
+      });
+
       describe('when a fourth SQL query is executed', () => {
         beforeEach(() => {
           historyCollection.add({
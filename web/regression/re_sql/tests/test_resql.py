@@ -175,6 +175,7 @@ class ReverseEngineeredSQLTestCases(BaseTestGenerator):
         :return:
         """
         object_url = None
+        self.app.register_deferred_url_rules(endpoint=endpoint)
         for rule in self.app.url_map.iter_rules(endpoint):
             options = {}
             for arg in rule.arguments:
@@ -364,6 +364,24 @@ def load_servers(args):
         print_summary()
 
 
+def build_module_manifest(args):
+    """Save the manifest of the pgAdmin modules (see MODULE_MANIFEST).
+
+    Args:
+        args (ArgParser): The parsed command line options
+    """
+
+    # Search all the packages for the modules
+    config.MODULE_MANIFEST = None
+
+    app = create_app(config.APP_NAME + '-cli')
+    app.save_module_manifest(args.build_module_manifest)
+
+    print('Module manifest written to {0} ({1} packages).'.format(
+        args.build_module_manifest, len(app.module_manifest)
+    ))
+
+
 def setup_db():
     """Setup the configuration database."""
 
@@ -416,6 +434,12 @@ if __name__ == '__main__':
     imp_group.add_argument('--load-servers', metavar="INPUT_FILE",
                            help='Load servers into the DB', required=False)
 
+    man_group = parser.add_argument_group('Build module manifest')
+    man_group.add_argument('--build-module-manifest', metavar="OUTPUT_FILE",
+                           help='Save the manifest of the modules to be '
+                                'loaded at the startup (see MODULE_MANIFEST'
+                                ' in config.py)', required=False)
+
     # Common args
     parser.add_argument('--sqlite-path', metavar="PATH",
                         help='Dump/load with the specified pgAdmin config DB'
@@ -445,5 +469,10 @@ if __name__ == '__main__':
             load_servers(args)
         except Exception as e:
             print(str(e))
+    elif args.build_module_manifest is not None:
+        try:
+            build_module_manifest(args)
+        except Exception as e:
+            print(str(e))
     else:
         setup_db()